@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+from unittest import main, TestCase
+from random import seed
+from typing import Any
+
+from vacuumworld import VacuumWorld
+from vacuumworld.common.vwcoordinates import VWCoord
+from vacuumworld.common.vwcolour import VWColour
+from vacuumworld.common.vwdirection import VWDirection
+from vacuumworld.model.dirt.vwdirt_appearance import VWDirtAppearance
+from vacuumworld.model.environment.vwambient import VWAmbient
+from vacuumworld.model.environment.vwarray_ambient import VWArrayAmbient
+from vacuumworld.model.environment.vwenvironment import VWEnvironment
+from vacuumworld.vwconfig_manager import VWConfigManager
+
+
+class TestArrayAmbient(TestCase):
+    '''
+    This class tests that a `VWArrayAmbient` behaves exactly like a `VWAmbient`.
+    '''
+    def __init__(self, args: Any) -> None:
+        super(TestArrayAmbient, self).__init__(args)
+
+        self.__config: dict[str, Any] = VWConfigManager.load_config_from_file(config_file_path=VacuumWorld.CONFIG_FILE_PATH, load_additional_config=False)
+        self.__array_config: dict[str, Any] = self.__config | {"grid_engine": "array"}
+        self.__number_of_runs: int = 10
+        self.__number_of_cycles: int = 30
+
+    def test_conversion(self) -> None:
+        '''
+        Tests that converting the grid of a `VWAmbient` into a `VWArrayAmbient` preserves its content.
+        '''
+        for _ in range(self.__number_of_runs):
+            env, _ = VWEnvironment.generate_random_env_for_testing(config=self.__config, custom_grid_size=True)
+            ambient: VWAmbient = env.get_ambient()
+            array_ambient: VWArrayAmbient = VWArrayAmbient.from_grid(grid=ambient.get_grid())
+
+            self.assertEqual(array_ambient.get_grid_dim(), ambient.get_grid_dim())
+            self.assertEqual(list(array_ambient.get_grid()), list(ambient.get_grid()))
+            self.assertEqual(str(array_ambient), str(ambient))
+
+            for coord, location in ambient.get_grid().items():
+                self.assertEqual(array_ambient.get_grid()[coord].to_json(include_ids=True), location.to_json(include_ids=True))
+
+            self.assertFalse(VWCoord(x=-1, y=0) in array_ambient.get_grid())
+            self.assertFalse(VWCoord(x=0, y=ambient.get_grid_dim()) in array_ambient.get_grid())
+
+    def test_views_write_through(self) -> None:
+        '''
+        Tests that the changes made through the `VWLocationView` objects of a `VWArrayAmbient` are stored in its arrays.
+        '''
+        env, grid_size = VWEnvironment.generate_random_env_for_testing(config=self.__array_config, custom_grid_size=True)
+        ambient: VWAmbient = env.get_ambient()
+
+        self.assertIsInstance(ambient, VWArrayAmbient)
+
+        for actor_id in env.get_actors():
+            coord: VWCoord = env.get_actor_position(actor_id=actor_id)
+            orientation_before: Any = env.get_actor_orientation(actor_id=actor_id)
+
+            env.turn_actor(coord=coord, direction=VWDirection.left)
+
+            self.assertEqual(env.get_actor_orientation(actor_id=actor_id), orientation_before.get_left())
+            self.assertEqual(VWArrayAmbient.ORIENTATIONS[int(ambient.get_actor_orientations()[ambient.get_cell_index(coord=coord)])], orientation_before.get_left())
+
+        empty_coords: list[VWCoord] = [c for c, loc in ambient.get_grid().items() if loc.is_empty()]
+
+        for coord in empty_coords:
+            ambient.get_grid()[coord].add_dirt(dirt_appearance=VWDirtAppearance(dirt_id="test", progressive_id="0", colour=VWColour.green))
+
+            self.assertTrue(ambient.is_dirt_at(coord=coord))
+
+            ambient.remove_dirt(coord=coord)
+
+            self.assertFalse(ambient.is_dirt_at(coord=coord))
+
+        self.assertEqual(int((ambient.get_actor_slots() != VWArrayAmbient.NO_VALUE).sum()), len(env.get_actors()))
+        self.assertEqual(ambient.get_grid_dim(), grid_size)
+
+    def test_same_evolution(self) -> None:
+        '''
+        Tests that a `VWEnvironment` evolves in the same way, regardless of whether its grid is a `VWAmbient` or a `VWArrayAmbient`.
+        '''
+        for i in range(self.__number_of_runs):
+            env, _ = VWEnvironment.generate_random_env_for_testing(config=self.__config, custom_grid_size=True)
+            data: dict[str, Any] = env.to_json()
+            states: list[dict[str, Any]] = []
+
+            for config in (self.__config, self.__array_config):
+                seed(i)
+
+                loaded_env: VWEnvironment = VWEnvironment.from_json(data=data, config=config | {"total_cycles": self.__number_of_cycles})
+
+                while loaded_env.can_evolve():
+                    loaded_env.evolve()
+
+                states.append(loaded_env.to_json())
+
+            self.assertEqual(states[0], states[1])
+
+    def test_large_world_save_load(self) -> None:
+        '''
+        Tests that a large world only stores its non-default `VWLocation` objects, and that it is loaded back unchanged.
+        '''
+        large_world_config: dict[str, Any] = self.__array_config | {"large_world": True}
+        grid_dim: int = 4 * int(self.__config["max_environment_dim"])
+        env: VWEnvironment = VWEnvironment.generate_empty_env(config=large_world_config, forced_line_dim=grid_dim)
+        ambient: VWAmbient = env.get_ambient()
+        coords: list[VWCoord] = [VWCoord(x=1, y=2), VWCoord(x=grid_dim - 1, y=grid_dim - 1), VWCoord(x=grid_dim // 2, y=grid_dim // 3)]
+
+        for coord in coords:
+            ambient.get_grid()[coord].add_dirt(dirt_appearance=VWDirtAppearance(dirt_id="test", progressive_id="0", colour=VWColour.orange))
+
+        data: dict[str, Any] = env.to_json()
+
+        self.assertEqual(data["grid_dim"], grid_dim)
+        self.assertEqual(len(data["locations"]), len(coords))
+
+        loaded_env: VWEnvironment = VWEnvironment.from_json(data=data, config=large_world_config)
+
+        self.assertIsInstance(loaded_env.get_ambient(), VWArrayAmbient)
+        self.assertEqual(loaded_env.get_ambient().get_grid_dim(), grid_dim)
+        self.assertEqual(loaded_env.to_json(), data)
+        self.assertEqual(VWEnvironment.from_json(data=data, config=self.__config).to_json(), VWEnvironment.from_json(data=data, config=self.__array_config).to_json())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+from unittest import main, TestCase
+from typing import Any
+from csv import DictReader
+from tempfile import TemporaryDirectory
+
+from vacuumworld import VacuumWorld
+from vacuumworld.model.actions.vweffort import VWActionEffort
+from vacuumworld.model.actor.mind.surrogate.vwhysteretic_mind_surrogate import VWHystereticMindSurrogate
+from vacuumworld.model.environment.vwenvironment import VWEnvironment
+from vacuumworld.runner.vwbatch_runner import VWBatchRunner
+from vacuumworld.vwconfig_manager import VWConfigManager
+
+import os
+
+
+class TestBatch(TestCase):
+    '''
+    This class tests the batch experiments of VacuumWorld.
+    '''
+    def __init__(self, args: Any) -> None:
+        super(TestBatch, self).__init__(args)
+
+        self.__config: dict[str, Any] = VWConfigManager.load_config_from_file(config_file_path=VacuumWorld.CONFIG_FILE_PATH, load_additional_config=False)
+        self.__number_of_scenarios: int = 2
+        self.__seeds: list[int] = [0, 1, 2]
+        self.__number_of_cycles: int = 20
+
+    def test_batch(self) -> None:
+        '''
+        Tests that a batch experiment yields one row per run, in order, and that the rows do not depend on the number of workers.
+        '''
+        scenarios: dict[str, dict[str, Any]] = {f"scenario_{i}": VWEnvironment.generate_random_env_for_testing(config=self.__config, custom_grid_size=True)[0].to_json() for i in range(self.__number_of_scenarios)}
+        efforts: dict[str, dict[str, int]] = {"default": {}, "reasonable": VWActionEffort.REASONABLE_EFFORTS}
+        rows: list[list[dict[str, Any]]] = []
+
+        for max_workers in (1, 2):
+            runner: VWBatchRunner = VWBatchRunner(config=self.__config, scenarios=scenarios, seeds=self.__seeds, total_cycles=self.__number_of_cycles, minds=[VWHystereticMindSurrogate], efforts=efforts, max_workers=max_workers)
+
+            rows.append([{k: v for k, v in row.items() if k != "seconds"} for row in runner.run()])
+
+        self.assertEqual(rows[0], rows[1])
+        self.assertEqual(len(rows[0]), self.__number_of_scenarios * len(efforts) * len(self.__seeds))
+        self.assertEqual([row["seed"] for row in rows[0]], self.__seeds * self.__number_of_scenarios * len(efforts))
+        self.assertTrue(all(row["cycles"] == self.__number_of_cycles and row["mind"] == VWHystereticMindSurrogate.__name__ for row in rows[0]))
+        self.assertTrue(all(row["final_dirts"] == row["initial_dirts"] + row["dirt_dropped"] - row["dirt_cleaned"] for row in rows[0]))
+        self.assertEqual(VWActionEffort.EFFORTS, {action_name: 1 for action_name in VWActionEffort.REASONABLE_EFFORTS})
+
+        with TemporaryDirectory() as tmp:
+            path: str = os.path.join(tmp, "results.csv")
+
+            VWBatchRunner.write_csv(rows=runner.run(), path=path)
+
+            with open(path, "r", newline="") as f:
+                self.assertEqual(len(list(DictReader(f))), len(rows[0]))
+
+    def test_restore_default_efforts(self) -> None:
+        '''
+        Tests that overriding an effort does not alter the default efforts, which can be restored.
+        '''
+        defaults: dict[str, int] = dict(VWActionEffort.EFFORTS)
+
+        try:
+            for action_name, effort in VWActionEffort.REASONABLE_EFFORTS.items():
+                VWActionEffort.override_default_effort_for_action(action_name=action_name, new_effort=effort + 1)
+
+            self.assertNotEqual(VWActionEffort.EFFORTS, defaults)
+        finally:
+            VWActionEffort.restore_default_efforts()
+
+        self.assertEqual(VWActionEffort.EFFORTS, defaults)
+
+    def test_batch_defaults(self) -> None:
+        '''
+        Tests the jobs of a `VWBatchRunner` without minds or effort tables, and that the jobs do not depend on later changes to the effort tables.
+        '''
+        scenarios: dict[str, dict[str, Any]] = {"scenario": VWEnvironment.generate_random_env_for_testing(config=self.__config, custom_grid_size=True)[0].to_json()}
+        runner: VWBatchRunner = VWBatchRunner(config=self.__config, scenarios=scenarios, seeds=self.__seeds, total_cycles=self.__number_of_cycles)
+
+        self.assertTrue(all(job.get_efforts_name() == "default" and job.get_efforts() == {} for job in runner.get_jobs()))
+        self.assertEqual(len(runner.get_jobs()), len(self.__seeds))
+
+        efforts: dict[str, dict[str, int]] = {"reasonable": dict(VWActionEffort.REASONABLE_EFFORTS)}
+        runner = VWBatchRunner(config=self.__config, scenarios=scenarios, seeds=self.__seeds, total_cycles=self.__number_of_cycles, efforts=efforts)
+
+        efforts["reasonable"].clear()
+        efforts["other"] = {}
+
+        self.assertTrue(all(job.get_efforts() == VWActionEffort.REASONABLE_EFFORTS for job in runner.get_jobs()))
+        self.assertEqual(len(runner.get_jobs()), len(self.__seeds))
+
+    def test_illegal_batch_args(self) -> None:
+        '''
+        Tests various illegal arguments of a `VWBatchRunner`.
+        '''
+        scenarios: dict[str, dict[str, Any]] = {"scenario": VWEnvironment.generate_random_env_for_testing(config=self.__config, custom_grid_size=True)[0].to_json()}
+
+        self.assertRaises(ValueError, VWBatchRunner, config=self.__config, scenarios={}, seeds=self.__seeds, total_cycles=self.__number_of_cycles)
+        self.assertRaises(ValueError, VWBatchRunner, config=self.__config, scenarios=scenarios, seeds=[], total_cycles=self.__number_of_cycles)
+        self.assertRaises(ValueError, VWBatchRunner, config=self.__config, scenarios=scenarios, seeds=[True], total_cycles=self.__number_of_cycles)
+        self.assertRaises(ValueError, VWBatchRunner, config=self.__config, scenarios=scenarios, seeds=self.__seeds, total_cycles=0)
+        self.assertRaises(TypeError, VWBatchRunner, config=self.__config, scenarios=scenarios, seeds=self.__seeds, total_cycles=self.__number_of_cycles, minds=[VWHystereticMindSurrogate()])
+        self.assertRaises(ValueError, VWBatchRunner, config=self.__config, scenarios=scenarios, seeds=self.__seeds, total_cycles=self.__number_of_cycles, efforts={"bad": {"VWFlyAction": 1}})
+        self.assertRaises(ValueError, VWBatchRunner, config=self.__config, scenarios=scenarios, seeds=self.__seeds, total_cycles=self.__number_of_cycles, max_workers=-1)
+
+
+if __name__ == "__main__":
+    main()
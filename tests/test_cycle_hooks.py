@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+from unittest import main, TestCase
+from typing import Any
+from time import perf_counter, sleep
+
+from vacuumworld import VacuumWorld
+from vacuumworld.model.actor.vwactor import VWActor
+from vacuumworld.model.environment.vwcycle_hooks import VWCycleHooks
+from vacuumworld.model.environment.vwenvironment import VWEnvironment
+from vacuumworld.model.environment.vwrandomness import VWRandomEventTrigger
+from vacuumworld.vwconfig_manager import VWConfigManager
+
+
+class TestCycleHooks(TestCase):
+    '''
+    This class tests the registry of the per-cycle and per-actor hooks.
+    '''
+    def __init__(self, args: Any) -> None:
+        super(TestCycleHooks, self).__init__(args)
+
+        self.__config: dict[str, Any] = VWConfigManager.load_config_from_file(config_file_path=VacuumWorld.CONFIG_FILE_PATH, load_additional_config=False)
+        self.__number_of_cycles: int = 5
+
+    def setUp(self) -> None:
+        '''
+        Unregisters every hook (e.g., the `VWRandomEventTrigger` registered by a `VWRunner`).
+        '''
+        VWCycleHooks.clear()
+
+    def tearDown(self) -> None:
+        '''
+        Waits for the asynchronous hooks, and unregisters every hook.
+        '''
+        VWCycleHooks.wait_for_asynchronous_hooks()
+        VWCycleHooks.clear()
+
+    def test_hooks(self) -> None:
+        '''
+        Tests that the actor hooks are called with each `VWActor` at each cycle, and that the cycle hooks are called with the number of each cycle, both in sequence and concurrently with the minds.
+        '''
+        for mind_config in ({}, {"llm_concurrency": 1}):
+            actor_ids: list[str] = []
+            cycles: list[int] = []
+            env, _ = VWEnvironment.generate_random_env_for_testing(config=self.__config | mind_config, custom_grid_size=True)
+
+            VWCycleHooks.register_actor_hook(hook=lambda actor: actor_ids.append(actor.get_id()))
+            VWCycleHooks.register_cycle_hook(hook=cycles.append, asynchronous=True)
+
+            for _ in range(self.__number_of_cycles):
+                env.evolve()
+
+            VWCycleHooks.wait_for_asynchronous_hooks()
+
+            # The first call to `evolve()` only sends the initial perceptions.
+            self.assertEqual(actor_ids, list(env.get_actors()) * (self.__number_of_cycles - 1))
+            self.assertEqual(cycles, list(range(self.__number_of_cycles)))
+
+            VWCycleHooks.clear()
+
+    def test_asynchronous_hooks_do_not_block(self) -> None:
+        '''
+        Tests that the cycles do not wait for the asynchronous hooks, and that the failures of the asynchronous hooks do not stop the simulation.
+        '''
+        delay: float = 0.2
+        calls: list[int] = []
+        env, _ = VWEnvironment.generate_random_env_for_testing(config=self.__config, custom_grid_size=True)
+
+        def slow_hook(cycle: int) -> None:
+            sleep(delay)
+            calls.append(cycle)
+
+            raise ValueError("This failure is expected.")
+
+        VWCycleHooks.register_cycle_hook(hook=slow_hook, asynchronous=True)
+
+        start: float = perf_counter()
+
+        for _ in range(self.__number_of_cycles):
+            env.evolve()
+
+        self.assertLess(perf_counter() - start, delay)
+
+        VWCycleHooks.wait_for_asynchronous_hooks()
+
+        self.assertEqual(calls, list(range(self.__number_of_cycles)))
+
+    def test_registration(self) -> None:
+        '''
+        Tests that the hooks can be unregistered, and that the `VWRandomEventTrigger` is registered at most once.
+        '''
+        def actor_hook(_: VWActor) -> None:
+            pass
+
+        self.assertFalse(VWCycleHooks.HAS_ACTOR_HOOKS or VWCycleHooks.HAS_CYCLE_HOOKS)
+
+        VWCycleHooks.register_actor_hook(hook=actor_hook)
+        VWRandomEventTrigger.register()
+        VWRandomEventTrigger.register()
+
+        self.assertTrue(VWCycleHooks.HAS_ACTOR_HOOKS and VWCycleHooks.HAS_CYCLE_HOOKS)
+
+        VWRandomEventTrigger.unregister()
+
+        self.assertFalse(VWCycleHooks.HAS_CYCLE_HOOKS)
+        self.assertTrue(VWCycleHooks.HAS_ACTOR_HOOKS)
+
+        VWCycleHooks.unregister(hook=actor_hook)
+
+        self.assertFalse(VWCycleHooks.HAS_ACTOR_HOOKS)
+
+
+if __name__ == "__main__":
+    main()
@@ -242,6 +242,36 @@ class TestEnvironment(TestCase):
 
         # For the tests on the actor appearance, go to test_location_and_coordinates.py, test_actors.py, and test_dirt.py.
 
+    def test_actor_position_index(self) -> None:
+        '''
+        Tests that the actor position index of a `VWEnvironment` stays consistent with the grid when `VWActor` objects are moved around, and removed.
+        '''
+        for _ in range(10):
+            env, _ = VWEnvironment.generate_random_env_for_testing(config=self.__config, custom_grid_size=True)
+
+            # The grid has been modified directly, hence the index is rebuilt on the first lookup.
+            for actor_id in env.get_actors():
+                self.assertTrue(env.get_ambient().get_grid()[env.get_actor_position(actor_id=actor_id)].has_actor())
+
+            env.check_actor_position_index()
+
+            for actor_id in env.get_actors():
+                from_coord: VWCoord = env.get_actor_position(actor_id=actor_id)
+                free_coords: list[VWCoord] = [c for c in [from_coord.forward(orientation=o) for o in VWOrientation] if c in env.get_ambient().get_grid() and not env.get_ambient().is_actor_at(coord=c)]
+
+                if free_coords:
+                    env.move_actor(from_coord=from_coord, to_coord=free_coords[0])
+
+                    self.assertEqual(env.get_actor_position(actor_id=actor_id), free_coords[0])
+
+            env.check_actor_position_index()
+
+            for actor_id in list(env.get_actors()):
+                env.get_ambient().get_grid()[env.get_actor_position(actor_id=actor_id)].remove_actor()
+                env.remove_actor(actor_id=actor_id)
+
+            env.check_actor_position_index()
+
 
 if __name__ == "__main__":
     main()
@@ -8,6 +8,7 @@ from pyoptional.pyoptional import PyOptional
 from pystarworldsturbo.common.action_result import ActionResult
 from pystarworldsturbo.common.action_outcome import ActionOutcome
 from pystarworldsturbo.common.content_type import MessageContentType
+from pystarworldsturbo.environment.physics.action_executor import ActionExecutor
 
 from vacuumworld import VacuumWorld
 from vacuumworld.common.vwcoordinates import VWCoord
@@ -22,7 +23,7 @@ from vacuumworld.model.actions.vwclean_action import VWCleanAction
 from vacuumworld.model.actions.vwdrop_action import VWDropAction
 from vacuumworld.model.actions.vwmove_action import VWMoveAction
 from vacuumworld.model.actions.vwbroadcast_action import VWBroadcastAction
-from vacuumworld.model.actions.vwactions import VWCommunicativeAction
+from vacuumworld.model.actions.vwactions import VWAction, VWCommunicativeAction
 from vacuumworld.model.actor.vwactor import VWActor
 from vacuumworld.model.actor.appendices.vwsensors import VWObservationSensor
 from vacuumworld.model.actor.vwuser import VWUser
@@ -33,6 +34,7 @@ from vacuumworld.model.environment.physics.vwidle_executor import VWIdleExecutor
 from vacuumworld.model.environment.physics.vwmove_executor import VWMoveExecutor
 from vacuumworld.model.environment.physics.vwspeak_executor import VWSpeakExecutor
 from vacuumworld.model.environment.physics.vwturn_executor import VWTurnExecutor
+from vacuumworld.model.environment.physics.vwexecutor_factory import VWExecutorFactory
 from vacuumworld.model.dirt.vwdirt_appearance import VWDirtAppearance
 from vacuumworld.model.environment.vwlocation import VWLocation
 from vacuumworld.model.environment.vwenvironment import VWEnvironment
@@ -346,6 +348,42 @@ class TestExecutors(TestCase):
             else:
                 self.assertFalse(drop_executor.is_possible(env=env, action=drop_orange_dirt_action))
 
+    def test_executor_registry(self) -> None:
+        '''
+        Tests that `VWExecutorFactory` returns the same `ActionExecutor` for every `VWAction` of the same kind, and that custom `VWAction` subclasses can register (and unregister) their own `ActionExecutor`.
+        '''
+        action_pairs: list[tuple[VWAction, VWAction]] = [
+            (VWIdleAction(), VWIdleAction()),
+            (VWMoveAction(), VWMoveAction()),
+            (VWCleanAction(), VWCleanAction()),
+            (VWTurnAction(direction=VWDirection.left), VWTurnAction(direction=VWDirection.right)),
+            (VWDropAction(dirt_colour=VWColour.green), VWDropAction(dirt_colour=VWColour.orange))
+        ]
+
+        for first, second in action_pairs:
+            executor: ActionExecutor = VWExecutorFactory.get_executor_for(action=first).or_else_raise()
+
+            self.assertIs(VWExecutorFactory.get_executor_for(action=second).or_else_raise(), executor)
+
+        self.assertTrue(VWExecutorFactory.get_executor_for(action=WaitAction()).is_empty())
+
+        VWExecutorFactory.register_executor(action_type=WaitAction, executor=VWIdleExecutor())
+        self.addCleanup(VWExecutorFactory.unregister_executor, action_type=WaitAction)
+
+        self.assertIsInstance(VWExecutorFactory.get_executor_for(action=WaitAction()).or_else_raise(), VWIdleExecutor)
+        self.assertRaises(TypeError, VWExecutorFactory.register_executor, action_type=int, executor=VWIdleExecutor())
+        self.assertRaises(TypeError, VWExecutorFactory.register_executor, action_type=WaitAction, executor=VWIdleAction())
+
+        VWExecutorFactory.unregister_executor(action_type=WaitAction)
+
+        self.assertTrue(VWExecutorFactory.get_executor_for(action=WaitAction()).is_empty())
+
+
+class WaitAction(VWIdleAction):
+    '''
+    A custom `VWAction`, which is only used to test `VWExecutorFactory.register_executor()` and `VWExecutorFactory.unregister_executor()`.
+    '''
+
 
 if __name__ == '__main__':
     main()
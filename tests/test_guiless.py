@@ -46,6 +46,25 @@ class TestGUIless(TestCase):
                 if os.path.exists(os.path.join(os.getcwd(), "files", test_file)):
                     os.remove(os.path.join(os.getcwd(), "files", test_file))
 
+    def test_guiless_throughput_mode(self) -> None:
+        '''
+        Tests the GUI-less mode of operation of VacuumWorld at maximum throughput.
+        '''
+        for total_cycles in self.__list_of_max_cycles_per_run:
+            test_file: str = "".join([choice(ascii_letters + digits) for _ in range(10)]) + ".json"
+
+            try:
+                env, _ = VWEnvironment.generate_random_env_for_testing(config=self.__config, custom_grid_size=True)
+                manager: VWSaveStateManager = VWSaveStateManager()
+                manager.save_state(env=env, filename=test_file)
+
+                run(default_mind=VWHystereticMindSurrogate(), load=test_file, total_cycles=total_cycles, gui=False, throughput_mode=True, progress_interval=10, debug_enabled=False)
+            except Exception as e:
+                self.fail(e.args[0])
+            finally:
+                if os.path.exists(os.path.join(os.getcwd(), "files", test_file)):
+                    os.remove(os.path.join(os.getcwd(), "files", test_file))
+
 
 if __name__ == '__main__':
     main()
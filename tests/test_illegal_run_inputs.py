@@ -232,6 +232,96 @@ class TestIllegalRunInputs(TestCase):
         for value in [-1, -8.8, "whatever", ["foo", "bar"], {1: 1}, ("a", "b", "c")]:
             self.assertRaises(TypeError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, randomness_enabled=value)
 
+    def test_illegal_large_world_flag(self) -> None:
+        '''
+        Tests various illegal `large_world` values, and the illegal combination of `large_world=True` (either as an argument, or in the configuration file) and `gui=True`.
+        '''
+        for value in [-1, -8.8, "whatever", ["foo", "bar"], {1: 1}, ("a", "b", "c")]:
+            self.assertRaises(TypeError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, large_world=value)
+
+        self.assertRaises(ValueError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, large_world=True, gui=True)
+        self.assertRaises(ValueError, VWGUIlessRunner, config=self.__config | {"large_world": True}, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, gui=True)
+
+    def test_illegal_throughput_mode_args(self) -> None:
+        '''
+        Tests various illegal `throughput_mode` and `progress_interval` values, and the illegal combination of `throughput_mode=True` and `gui=True`.
+        '''
+        for value in [-1, -8.8, "whatever", ["foo", "bar"], {1: 1}, ("a", "b", "c")]:
+            self.assertRaises(TypeError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, throughput_mode=value)
+
+        for value in [True, -8.8, 0.1, "whatever", ["foo", "bar"], {1: 1}]:
+            self.assertRaises(TypeError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, progress_interval=value)
+
+        self.assertRaises(ValueError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, progress_interval=-1)
+        self.assertRaises(ValueError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, throughput_mode=True, gui=True)
+
+    def test_illegal_trace_args(self) -> None:
+        '''
+        Tests various illegal `trace_file` and `trace_format` values, and the illegal combination of `trace_file` and `gui=True`.
+        '''
+        for value in [True, -1, -8.8, ["foo", "bar"], {1: 1}, ("a", "b", "c")]:
+            self.assertRaises(TypeError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, trace_file=value)
+            self.assertRaises(TypeError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, trace_format=value)
+
+        for value in ["", "json", "csv", "JSONL"]:
+            self.assertRaises(ValueError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, trace_format=value)
+
+        self.assertRaises(ValueError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, trace_file="trace.jsonl", gui=True)
+
+    def test_illegal_profile_file(self) -> None:
+        '''
+        Tests various illegal `profile_file` values, and the illegal combination of `profile_file` and `gui=True`.
+        '''
+        for value in [True, -1, -8.8, ["foo", "bar"], {1: 1}, ("a", "b", "c")]:
+            self.assertRaises(TypeError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, profile_file=value)
+
+        self.assertRaises(ValueError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, profile_file="profile.json", gui=True)
+
+    def test_illegal_decide_time_budget(self) -> None:
+        '''
+        Tests various illegal `decide_time_budget` values.
+        '''
+        for value in [True, 1, "whatever", ["foo", "bar"], {1: 1}, ("a", "b", "c")]:
+            self.assertRaises(TypeError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, decide_time_budget=value)
+
+        self.assertRaises(ValueError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, decide_time_budget=-0.1)
+
+    def test_illegal_mind_workers(self) -> None:
+        '''
+        Tests various illegal `mind_workers` values, and the illegal combination of `mind_workers > 0` and `gui=True`.
+        '''
+        for value in [True, 1.0, "whatever", ["foo", "bar"], {1: 1}, ("a", "b", "c")]:
+            self.assertRaises(TypeError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, mind_workers=value)
+
+        self.assertRaises(ValueError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, mind_workers=-1)
+        self.assertRaises(ValueError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, mind_workers=2, gui=True)
+
+    def test_illegal_llm_dispatch_args(self) -> None:
+        '''
+        Tests various illegal `llm_concurrency`, `llm_deadline`, `llm_cache_file`, `llm_rate_limit`, and `llm_batching` values.
+        '''
+        for value in [True, 1.0, "whatever", ["foo", "bar"], {1: 1}, ("a", "b", "c")]:
+            self.assertRaises(TypeError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, llm_concurrency=value)
+
+        for value in [True, 1, "whatever", ["foo", "bar"], {1: 1}, ("a", "b", "c")]:
+            self.assertRaises(TypeError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, llm_deadline=value)
+
+        self.assertRaises(ValueError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, llm_concurrency=-1)
+        self.assertRaises(ValueError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, llm_deadline=-0.1)
+
+        for value in [True, 1, 1.0, ["foo", "bar"], {1: 1}, ("a", "b", "c")]:
+            self.assertRaises(TypeError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, llm_cache_file=value)
+
+        for value in [True, 1, "whatever", ["foo", "bar"], {1: 1}, ("a", "b", "c")]:
+            self.assertRaises(TypeError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, llm_rate_limit=value)
+
+        self.assertRaises(ValueError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, llm_rate_limit=-1.0)
+
+        for value in [1, 1.0, "whatever", ["foo", "bar"], {1: 1}, ("a", "b", "c")]:
+            self.assertRaises(TypeError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, llm_concurrency=1, llm_batching=value)
+
+        self.assertRaises(ValueError, VWGUIlessRunner, config=self.__config, minds=self.__minds, allowed_args=VacuumWorld.ALLOWED_RUN_ARGS, llm_batching=True)
+
     def test_illegal_minds_combination(self) -> None:
         '''
         Tests the `run()` function with various illegal combinations of `default_mind`, `green_mind`, `orange_mind`, and `white_mind`.
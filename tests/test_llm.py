@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+
+from unittest import main, TestCase
+from typing import Iterable, Any, cast
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps, loads
+from re import findall
+from tempfile import TemporaryDirectory
+from threading import Lock, Thread
+from time import perf_counter, sleep
+from pyoptional.pyoptional import PyOptional
+
+from google.genai.errors import ClientError
+from google.genai.types import GenerateContentResponse
+
+from vacuumworld import VacuumWorld
+from vacuumworld.common.vwcolour import VWColour
+from vacuumworld.common.vwcoordinates import VWCoord
+from vacuumworld.common.vworientation import VWOrientation
+from vacuumworld.gemini.batcher import GeminiBatcher
+from vacuumworld.gemini.cache import GeminiCache
+from vacuumworld.gemini.client import GeminiClient
+from vacuumworld.gemini.dispatcher import GeminiDispatcher
+from vacuumworld.gemini.rate_limiter import GeminiRateLimiter
+from vacuumworld.model.actions.vwactions import VWAction, VWPhysicalAction, VWCommunicativeAction
+from vacuumworld.model.actions.vwidle_action import VWIdleAction
+from vacuumworld.model.actions.vwmove_action import VWMoveAction
+from vacuumworld.model.actor.appearance.vwactor_appearance import VWActorAppearance
+from vacuumworld.model.actor.mind.surrogate.vw_llm_actor_mind_surrogate import VWLLMActorMindSurrogate
+from vacuumworld.model.actor.vwactor_factories import VWCleaningAgentsFactory
+from vacuumworld.model.environment.vwenvironment import VWEnvironment
+from vacuumworld.model.environment.vwlocation import VWLocation
+from vacuumworld.vwconfig_manager import VWConfigManager
+
+import os
+
+
+class FailingGeminiClient():
+    '''
+    This class stands in for a `GeminiClient` whose queries fail with a `ConnectionError`.
+    '''
+    def query(self, prompt: str) -> GenerateContentResponse:
+        '''
+        Raises a `ConnectionError`.
+        '''
+        raise ConnectionError("Unreachable.")
+
+
+class StubGeminiHandler(BaseHTTPRequestHandler):
+    '''
+    This class answers each `generateContent` request with `"VWMoveAction"`, after `LATENCY` seconds, and keeps track of the number of requests, and of the maximum number of requests in flight.
+
+    A batched request (see `GeminiBatcher`) is answered with a JSON object mapping each agent ID to `"VWMoveAction"`, except for the first `OMITTED_ANSWERS` agents.
+
+    The next `FAILURES` requests are immediately rejected with a `429` status code instead.
+    '''
+    LATENCY: float = 0.3
+    FAILURES: int = 0
+    OMITTED_ANSWERS: int = 0
+    REQUESTS: int = 0
+    IN_FLIGHT: int = 0
+    MAX_IN_FLIGHT: int = 0
+    LOCK: Lock = Lock()
+
+    def do_POST(self) -> None:
+        '''
+        Answers a `generateContent` request.
+        '''
+        prompt: str = loads(self.rfile.read(int(self.headers["Content-Length"])))["contents"][0]["parts"][0]["text"]
+        actor_ids: list[str] = findall(r"(?m)^## Agent (\S+)$", prompt)
+
+        with StubGeminiHandler.LOCK:
+            StubGeminiHandler.REQUESTS += 1
+            rejected: bool = StubGeminiHandler.FAILURES > 0
+
+            if rejected:
+                StubGeminiHandler.FAILURES -= 1
+            else:
+                StubGeminiHandler.IN_FLIGHT += 1
+                StubGeminiHandler.MAX_IN_FLIGHT = max(StubGeminiHandler.MAX_IN_FLIGHT, StubGeminiHandler.IN_FLIGHT)
+
+        if rejected:
+            self.__reply(status_code=429, body={"error": {"code": 429, "message": "Resource exhausted.", "status": "RESOURCE_EXHAUSTED"}})
+
+            return
+
+        sleep(StubGeminiHandler.LATENCY)
+
+        with StubGeminiHandler.LOCK:
+            StubGeminiHandler.IN_FLIGHT -= 1
+
+        text: str = dumps({actor_id: "VWMoveAction" for actor_id in actor_ids[StubGeminiHandler.OMITTED_ANSWERS:]}) if actor_ids else "VWMoveAction"
+
+        self.__reply(status_code=200, body={"candidates": [{"content": {"parts": [{"text": text}], "role": "model"}}]})
+
+    def __reply(self, status_code: int, body: dict[str, Any]) -> None:
+        payload: bytes = dumps(body).encode("utf-8")
+
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args: Any) -> None:
+        '''
+        This method does nothing, so that the requests are not logged.
+        '''
+        pass
+
+
+class StubLLMMind(VWLLMActorMindSurrogate):
+    '''
+    This class inherits from `VWLLMActorMindSurrogate`, and queries the stub server at `BASE_URL` at each cycle.
+    '''
+    BASE_URL: str = ""
+
+    def __init__(self) -> None:
+        super(StubLLMMind, self).__init__(dot_env_path="", base_url=StubLLMMind.BASE_URL)
+
+    def revise(self) -> None:
+        '''
+        This method does nothing.
+        '''
+        pass
+
+    def decide(self) -> Iterable[VWAction]:
+        '''
+        This method returns the physical action decided by the stub server.
+        '''
+        return [self.decide_physical_with_ai(prompt="Move.")]
+
+    def backup_decide_after_llm_error(self, original_prompt: str, error: ClientError, action_superclass: type[VWPhysicalAction | VWCommunicativeAction]) -> VWAction:
+        '''
+        This method always returns a `VWIdleAction`.
+        '''
+        return VWIdleAction()
+
+    def parse_gemini_response(self, response: GenerateContentResponse) -> VWAction:
+        '''
+        This method returns a `VWMoveAction` if the response says so, and a `VWIdleAction` otherwise.
+        '''
+        return VWMoveAction() if response.text == "VWMoveAction" else VWIdleAction()
+
+
+class TestLLM(TestCase):
+    '''
+    This class tests the concurrent dispatch of the queries of the LLM-capable minds, against a local stub server.
+    '''
+    def __init__(self, args: Any) -> None:
+        super(TestLLM, self).__init__(args)
+
+        self.__config: dict[str, Any] = VWConfigManager.load_config_from_file(config_file_path=VacuumWorld.CONFIG_FILE_PATH, load_additional_config=False)
+        self.__number_of_agents: int = 3
+        self.__number_of_cycles: int = 3
+
+    def setUp(self) -> None:
+        '''
+        Starts the stub server.
+        '''
+        self.__server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), StubGeminiHandler)
+
+        Thread(target=self.__server.serve_forever, daemon=True).start()
+
+        StubLLMMind.BASE_URL = f"http://127.0.0.1:{self.__server.server_address[1]}"
+        StubGeminiHandler.MAX_IN_FLIGHT = 0
+        StubGeminiHandler.FAILURES = 0
+        os.environ.setdefault("GEMINI_API_KEY", "stub")
+
+    def tearDown(self) -> None:
+        '''
+        Stops the stub server, disables the `GeminiDispatcher`, the `GeminiBatcher`, and the `GeminiCache`, and restores the default retry policy of the `GeminiClient`.
+        '''
+        self.__server.shutdown()
+        self.__server.server_close()
+
+        GeminiClient.MAX_RETRIES = 3
+        GeminiClient.RETRY_BASE_DELAY = 0.5
+        GeminiClient.RATE_LIMITER = PyOptional[GeminiRateLimiter].empty()
+
+        GeminiDispatcher.MAX_CONCURRENT_QUERIES = 0
+        GeminiBatcher.ENABLED = False
+        StubGeminiHandler.OMITTED_ANSWERS = 0
+        VWLLMActorMindSurrogate.DECISION_CACHE = PyOptional[GeminiCache].empty()
+
+    def test_concurrent_dispatch(self) -> None:
+        '''
+        Tests that the LLM-capable minds query concurrently, so that a cycle takes about as long as a single query, and that no more than `llm_concurrency` queries are in flight at once.
+        '''
+        for llm_concurrency in (self.__number_of_agents, 1):
+            env: VWEnvironment = self.__generate_env(llm_concurrency=llm_concurrency, llm_deadline=0.0)
+            start: float = perf_counter()
+
+            while env.can_evolve():
+                env.evolve()
+
+            seconds_per_cycle: float = (perf_counter() - start) / self.__number_of_cycles
+
+            self.assertEqual(StubGeminiHandler.MAX_IN_FLIGHT, llm_concurrency)
+            self.assertTrue(all(actor.get_mind().get_number_of_timeouts() == 0 for actor in env.get_actors().values()))
+
+            if llm_concurrency == self.__number_of_agents:
+                self.assertLess(seconds_per_cycle, 2 * StubGeminiHandler.LATENCY)
+            else:
+                self.assertGreaterEqual(seconds_per_cycle, self.__number_of_agents * StubGeminiHandler.LATENCY)
+
+            StubGeminiHandler.MAX_IN_FLIGHT = 0
+
+    def test_llm_deadline(self) -> None:
+        '''
+        Tests that a cycle does not wait for the LLM-capable minds beyond `llm_deadline`, and that the minds which miss it attempt a `VWIdleAction`.
+        '''
+        env: VWEnvironment = self.__generate_env(llm_concurrency=self.__number_of_agents, llm_deadline=StubGeminiHandler.LATENCY / 3)
+        start: float = perf_counter()
+
+        env.evolve()
+        env.evolve()
+
+        self.assertLess(perf_counter() - start, StubGeminiHandler.LATENCY)
+        self.assertTrue(all(actor.get_mind().has_timed_out() for actor in env.get_actors().values()))
+
+    def test_decision_cache(self) -> None:
+        '''
+        Tests that identical prompts are answered by the `GeminiCache`, also across runs, and that the cache statistics are kept.
+        '''
+        with TemporaryDirectory() as tmp:
+            path: str = os.path.join(tmp, "cache.sqlite")
+
+            for run in range(2):
+                VWLLMActorMindSurrogate.DECISION_CACHE = PyOptional[GeminiCache].of(GeminiCache(path=path))
+                StubGeminiHandler.REQUESTS = 0
+
+                env: VWEnvironment = self.__generate_env(llm_concurrency=0, llm_deadline=0.0)
+
+                while env.can_evolve():
+                    env.evolve()
+
+                statistics: dict[str, int] = VWLLMActorMindSurrogate.DECISION_CACHE.or_else_raise().get_statistics()
+
+                VWLLMActorMindSurrogate.DECISION_CACHE.or_else_raise().close()
+
+                # The minds decide one at a time, so only the very first prompt misses the cache.
+                self.assertEqual(StubGeminiHandler.REQUESTS, 1 - run)
+                self.assertEqual(statistics["misses"], 1 - run)
+                self.assertEqual(statistics["hits"], self.__number_of_agents * self.__number_of_cycles - 1 + run)
+
+    def test_cache_eviction_and_expiration(self) -> None:
+        '''
+        Tests that the least recently used response is evicted when a `GeminiCache` is full, that old responses expire, and that the prompts are normalised.
+        '''
+        response: GenerateContentResponse = GenerateContentResponse.model_validate({"candidates": [{"content": {"parts": [{"text": "VWMoveAction"}], "role": "model"}}]})
+        cache: GeminiCache = GeminiCache(path=":memory:", max_entries=2)
+
+        cache.put(model_name="model", prompt="a", response=response)
+        cache.put(model_name="model", prompt="b", response=response)
+
+        self.assertTrue(cache.get(model_name="model", prompt="  a\n").is_present())
+        self.assertTrue(cache.get(model_name="other_model", prompt="a").is_empty())
+
+        cache.put(model_name="model", prompt="c", response=response)
+
+        self.assertEqual(cache.get(model_name="model", prompt="a").or_else_raise().text, "VWMoveAction")
+        self.assertTrue(cache.get(model_name="model", prompt="b").is_empty())
+        self.assertEqual(cache.get_statistics(), {"hits": 2, "misses": 2, "evictions": 1, "expirations": 0})
+
+        cache = GeminiCache(path=":memory:", ttl=0.05)
+
+        cache.put(model_name="model", prompt="a", response=response)
+        sleep(0.1)
+
+        self.assertTrue(cache.get(model_name="model", prompt="a").is_empty())
+        self.assertEqual(cache.get_statistics()["expirations"], 1)
+        self.assertRaises(ValueError, GeminiCache, path=":memory:", max_entries=0)
+        self.assertRaises(ValueError, GeminiCache, path=":memory:", ttl=-1.0)
+
+    def test_retry_after_rate_limiting(self) -> None:
+        '''
+        Tests that the queries rejected for rate limiting are retried, and that the backup decision is only taken once the retries are exhausted.
+        '''
+        StubGeminiHandler.LATENCY = 0.0
+        GeminiClient.RETRY_BASE_DELAY = 0.01
+
+        try:
+            for max_retries, expected_action_type in ((2, VWMoveAction), (1, VWIdleAction)):
+                GeminiClient.MAX_RETRIES = max_retries
+                StubGeminiHandler.FAILURES = 2
+                StubGeminiHandler.REQUESTS = 0
+
+                self.assertIsInstance(StubLLMMind().decide_physical_with_ai(prompt="Move."), expected_action_type)
+                self.assertEqual(StubGeminiHandler.REQUESTS, max_retries + 1)
+        finally:
+            StubGeminiHandler.LATENCY = 0.3
+
+    def test_rate_limiter_and_shared_client(self) -> None:
+        '''
+        Tests that a `GeminiRateLimiter` spaces the queries beyond the burst size, and that the LLM-capable minds share their `GeminiClient`.
+        '''
+        rate_limiter: GeminiRateLimiter = GeminiRateLimiter(rate=20.0, burst=2)
+        start: float = perf_counter()
+
+        for _ in range(6):
+            rate_limiter.acquire()
+
+        self.assertGreaterEqual(perf_counter() - start, 4 / 20.0 - 0.01)
+        self.assertRaises(ValueError, GeminiRateLimiter, rate=0.0)
+        self.assertRaises(ValueError, GeminiRateLimiter, rate=1.0, burst=0)
+        self.assertIs(GeminiClient.get_shared_client(model_name="model", dot_env_path="", base_url=StubLLMMind.BASE_URL), GeminiClient.get_shared_client(model_name="model", dot_env_path="", base_url=StubLLMMind.BASE_URL))
+
+    def test_batched_prompts(self) -> None:
+        '''
+        Tests that the prompts of the LLM-capable minds are sent as a single query per cycle, and that a mind whose answer is missing from the batched response sends its prompt on its own.
+        '''
+        GeminiBatcher.ENABLED = True
+
+        for omitted_answers in (0, 1):
+            StubGeminiHandler.OMITTED_ANSWERS = omitted_answers
+            StubGeminiHandler.REQUESTS = 0
+
+            env: VWEnvironment = self.__generate_env(llm_concurrency=self.__number_of_agents, llm_deadline=0.0)
+
+            while env.can_evolve():
+                env.evolve()
+
+            self.assertEqual(StubGeminiHandler.REQUESTS, (1 + omitted_answers) * self.__number_of_cycles)
+            self.assertTrue(all(actor.get_mind().get_number_of_timeouts() == 0 for actor in env.get_actors().values()))
+
+    def test_batch_with_failing_query(self) -> None:
+        '''
+        Tests that, if the combined query of a `GeminiBatch` raises an exception other than `APIError`, every waiting thread (the sender included) is woken up with a missing answer.
+        '''
+        GeminiBatcher.ENABLED = True
+
+        client: FailingGeminiClient = FailingGeminiClient()
+        answers: list[PyOptional[GenerateContentResponse]] = []
+        threads: list[Thread] = [Thread(target=lambda actor_id=actor_id: answers.append(GeminiBatcher.query(client=cast(GeminiClient, client), actor_id=actor_id, prompt="prompt")), daemon=True) for actor_id in ("a", "b", "c")]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join(timeout=5.0)
+
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        self.assertEqual(len(answers), len(threads))
+        self.assertTrue(all(answer.is_empty() for answer in answers))
+
+    def __generate_env(self, llm_concurrency: int, llm_deadline: float) -> VWEnvironment:
+        GeminiDispatcher.MAX_CONCURRENT_QUERIES = llm_concurrency
+
+        config: dict[str, Any] = self.__config | {"llm_concurrency": llm_concurrency, "llm_deadline": llm_deadline, "total_cycles": self.__number_of_cycles}
+        env, grid_size = VWEnvironment.generate_empty_env_for_testing(custom_grid_size=False, config=config | {"initial_environment_dim": 8})
+        coords: list[VWCoord] = VWEnvironment.generate_mutually_exclusive_coordinates_for_testing(amount=self.__number_of_agents, grid_size=grid_size)
+
+        for colour, coord in zip([VWColour.green, VWColour.orange, VWColour.white], coords):
+            agent, appearance = VWCleaningAgentsFactory.create_cleaning_agent(colour=colour, orientation=VWOrientation.north, mind_surrogate=StubLLMMind())
+
+            env.add_actor(actor=agent)
+            env.get_ambient().get_grid()[coord] = VWLocation(coord=coord, actor_appearance=PyOptional[VWActorAppearance].of(appearance), wall=VWEnvironment.generate_wall_from_coordinates(coord=coord, grid_size=grid_size))
+
+        return env
+
+
+if __name__ == "__main__":
+    main()
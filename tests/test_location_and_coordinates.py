@@ -2,13 +2,21 @@
 
 from unittest import main, TestCase
 from random import randint
+from operator import setitem
 from typing import NamedTuple, Any
 from pyoptional.pyoptional import PyOptional
 
+from pystarworldsturbo.common.action_result import ActionResult
+from pystarworldsturbo.common.action_outcome import ActionOutcome
+
 from vacuumworld import VacuumWorld
 from vacuumworld.common.vwcoordinates import VWCoord
 from vacuumworld.common.vwcolour import VWColour
 from vacuumworld.common.vworientation import VWOrientation
+from vacuumworld.common.vwobservation import VWObservation
+from vacuumworld.common.vwposition_names import VWPositionNames
+from vacuumworld.common.vwwall import VWWall
+from vacuumworld.model.actions.vwidle_action import VWIdleAction
 from vacuumworld.model.environment.vwlocation import VWLocation
 from vacuumworld.model.environment.vwenvironment import VWEnvironment
 from vacuumworld.model.actor.appearance.vwactor_appearance import VWActorAppearance
@@ -111,6 +119,29 @@ class TestLocationAndCoordinates(TestCase):
             self.assertEqual(c.get_x(), oc.x)
             self.assertEqual(c.get_y(), oc.y)
 
+    def test_interned_coord(self) -> None:
+        '''
+        Tests that `VWCoord.of()` and the methods returning a `VWCoord` reuse the same object for the coordinates within the grid, and that `VWCoord` is slotted.
+        '''
+        for _ in range(self.__number_of_runs):
+            x, y = randint(1, self.__max_grid_size-2), randint(1, self.__max_grid_size-2)
+            c: VWCoord = VWCoord.of(x=x, y=y)
+
+            self.assertIs(c, VWCoord.of(x=x, y=y))
+            self.assertEqual(c, VWCoord(x=x, y=y))
+            self.assertIs(c.clone(), c)
+
+            for orientation in VWOrientation:
+                self.assertIs(c.forward(orientation=orientation), VWCoord.of(x=c.forward(orientation=orientation).get_x(), y=c.forward(orientation=orientation).get_y()))
+                self.assertIs(c.forward(orientation=orientation).backward(orientation=orientation), c)
+                self.assertIs(c.left(orientation=orientation).right(orientation=orientation), c)
+
+        outside: VWCoord = VWCoord.of(x=-1, y=0)
+
+        self.assertIsNot(outside, VWCoord.of(x=-1, y=0))
+        self.assertEqual(outside, VWCoord.of(x=-1, y=0))
+        self.assertFalse(hasattr(VWCoord.of(x=0, y=0), "__dict__"))
+
     def test_location(self) -> None:
         '''
         Tests the creation of `VWLocation` objects.
@@ -170,6 +201,48 @@ class TestLocationAndCoordinates(TestCase):
             self.assertEqual(forwardright.get_dirt_appearance().or_else_raise(), d3)
             self.assertEqual(forwardright.get_wall_info(), VWEnvironment.generate_wall_from_coordinates(coord=fr, grid_size=grid_size))
 
+    def test_wall_predicates(self) -> None:
+        '''
+        Tests that the wall predicates of `VWLocation` and `VWObservation` match the wall `dict` of every `VWWall` mask.
+        '''
+        for mask in range(VWWall.NUMBER_OF_MASKS):
+            wall: dict[VWOrientation, bool] = {orientation: bool(mask & (1 << code)) for code, orientation in enumerate(VWOrientation)}
+            location: VWLocation = VWLocation(coord=VWCoord(x=0, y=0), wall=wall)
+
+            self.assertEqual(location.get_wall_mask(), mask)
+            self.assertEqual(location.get_wall_info(), wall)
+            self.assertRaises(TypeError, setitem, VWWall.to_pattern(mask=mask), VWOrientation.north, True)
+
+            location.get_wall_info()[VWOrientation.north] = not wall[VWOrientation.north]
+
+            self.assertEqual(location.get_wall_info(), wall)
+            self.assertEqual(VWLocation(coord=VWCoord(x=1, y=1), wall=dict(wall)).get_wall_info(), wall)
+            self.assertEqual(location.has_wall_somewhere(), any(wall.values()))
+            self.assertEqual(location.is_corner(), any(wall[o] and (wall[o.get_left()] or wall[o.get_right()]) for o in VWOrientation))
+            self.assertEqual(location.is_edge(), sum(wall.values()) == 1)
+
+            for orientation in VWOrientation:
+                self.assertEqual(location.has_wall_on(orientation=orientation), wall[orientation])
+
+                actor: VWActorAppearance = VWActorAppearance(actor_id="foo", progressive_id="1", colour=VWColour.green, orientation=orientation)
+                center_wall: dict[VWOrientation, bool] = VWLocation.random_wall()
+                forward_wall: dict[VWOrientation, bool] = VWLocation.random_wall()
+                locations: dict[VWPositionNames, VWLocation] = {
+                    VWPositionNames.center: VWLocation(coord=VWCoord(x=1, y=1), actor_appearance=PyOptional[VWActorAppearance].of(actor), wall=center_wall),
+                    VWPositionNames.forward: VWLocation(coord=VWCoord(x=1, y=1).forward(orientation=orientation), wall=forward_wall),
+                    VWPositionNames.left: VWLocation(coord=VWCoord(x=1, y=1).left(orientation=orientation), wall=wall),
+                    VWPositionNames.right: VWLocation(coord=VWCoord(x=1, y=1).right(orientation=orientation), wall=wall)
+                }
+                observation: VWObservation = VWObservation(action_type=VWIdleAction, action_result=ActionResult(ActionOutcome.success), locations_dict=locations)
+
+                self.assertEqual(observation.is_wall_immediately_ahead(), center_wall[orientation])
+                self.assertEqual(observation.is_wall_immediately_behind(), center_wall[orientation.get_opposite()])
+                self.assertEqual(observation.is_wall_immediately_to_the_left(), center_wall[orientation.get_left()])
+                self.assertEqual(observation.is_wall_immediately_to_the_right(), center_wall[orientation.get_right()])
+                self.assertEqual(observation.is_wall_one_step_ahead(), not center_wall[orientation] and forward_wall[orientation])
+                self.assertEqual(observation.is_wall_one_step_to_the_left(), not center_wall[orientation.get_left()] and wall[orientation.get_left()])
+                self.assertEqual(observation.is_wall_one_step_to_the_right(), not center_wall[orientation.get_right()] and wall[orientation.get_right()])
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+from unittest import main, TestCase
+from typing import Iterable, Any, cast
+from inspect import getsourcefile
+from json import dumps, loads
+from random import choice, random, seed
+
+from vacuumworld import VacuumWorld
+from vacuumworld.common.vwcolour import VWColour
+from vacuumworld.common.vwdirection import VWDirection
+from vacuumworld.model.actions.vwactions import VWAction
+from vacuumworld.model.actions.vwbroadcast_action import VWBroadcastAction
+from vacuumworld.model.actions.vwclean_action import VWCleanAction
+from vacuumworld.model.actions.vwmove_action import VWMoveAction
+from vacuumworld.model.actions.vwturn_action import VWTurnAction
+from vacuumworld.model.actor.mind.surrogate.vwactor_mind_surrogate import VWActorMindSurrogate
+from vacuumworld.model.environment.vwenvironment import VWEnvironment
+from vacuumworld.vwconfig_manager import VWConfigManager
+
+from test_trace import ListTraceSink
+
+
+class RandomSurrogateMind(VWActorMindSurrogate):
+    '''
+    This class inherits from `VWActorMindSurrogate`, and decides a random physical action at each cycle, broadcasting its choice half of the time.
+    '''
+    def revise(self) -> None:
+        '''
+        This method does nothing.
+        '''
+        pass
+
+    def decide(self) -> Iterable[VWAction]:
+        '''
+        This method returns a random physical action, and (half of the time) a `VWBroadcastAction`.
+        '''
+        action: VWAction = choice([VWMoveAction(), VWCleanAction(), VWTurnAction(direction=VWDirection.left), VWTurnAction(direction=VWDirection.right)])
+
+        if random() < 0.5:
+            return [action, VWBroadcastAction(message=type(action).__name__, sender_id=self.get_own_id())]
+        else:
+            return [action]
+
+
+class TestMindPool(TestCase):
+    '''
+    This class tests the evaluation of the minds on a `VWMindPool`.
+    '''
+    def __init__(self, args: Any) -> None:
+        super(TestMindPool, self).__init__(args)
+
+        self.__config: dict[str, Any] = VWConfigManager.load_config_from_file(config_file_path=VacuumWorld.CONFIG_FILE_PATH, load_additional_config=False)
+        self.__number_of_cycles: int = 30
+
+    def test_mind_pool_determinism(self) -> None:
+        '''
+        Tests that the evolution of a `VWEnvironment` whose minds are evaluated on a `VWMindPool` does not depend on the number of workers.
+        '''
+        scenario: dict[str, Any] = self.__generate_scenario()
+        states: list[dict[str, Any]] = []
+        traces: list[list[dict[str, Any]]] = []
+
+        for mind_workers in (1, 3):
+            config: dict[str, Any] = self.__config | {"mind_workers": mind_workers, "total_cycles": self.__number_of_cycles}
+            env: VWEnvironment = VWEnvironment.from_json(data=scenario, config=config)
+            sink: ListTraceSink = ListTraceSink()
+
+            env.set_trace_sink(sink=sink)
+            seed(0)
+
+            try:
+                while env.can_evolve():
+                    env.evolve()
+            finally:
+                env.shutdown()
+
+            states.append(env.to_json())
+            traces.append(TestMindPool.__anonymise(records=sink.get_records(), actor_ids=list(env.get_actors())))
+
+        self.assertEqual(states[0], states[1])
+        self.assertEqual(traces[0], traces[1])
+        self.assertEqual(len(traces[0]), self.__number_of_cycles + 1)
+        self.assertTrue(all(len(record["actions"]) > 0 for record in traces[0][1:]))
+
+    @staticmethod
+    def __anonymise(records: list[dict[str, Any]], actor_ids: list[str]) -> list[dict[str, Any]]:
+        # The actor IDs are generated afresh on load, so they are replaced by the position of the actor.
+        trace: str = dumps(records)
+
+        for i, actor_id in enumerate(actor_ids):
+            trace = trace.replace(actor_id, f"actor-{i}")
+
+        return loads(trace)
+
+    def __generate_scenario(self) -> dict[str, Any]:
+        scenario: dict[str, Any] = VWEnvironment.generate_random_env_for_testing(config=self.__config, custom_grid_size=True)[0].to_json()
+        surrogate_mind_file: str = cast(str, getsourcefile(RandomSurrogateMind))
+
+        for location in scenario["locations"]:
+            if "actor" in location and location["actor"]["colour"] != str(VWColour.user):
+                location["actor"] |= {"surrogate_mind_file": surrogate_mind_file, "surrogate_mind_class_name": RandomSurrogateMind.__name__}
+
+        return scenario
+
+
+if __name__ == "__main__":
+    main()
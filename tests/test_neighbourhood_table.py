@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+from unittest import main, TestCase
+from random import randint
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from vacuumworld import VacuumWorld
+from vacuumworld.common.vwcoordinates import VWCoord
+from vacuumworld.common.vwobservation_batch import VWObservationBatch
+from vacuumworld.common.vworientation import VWOrientation
+from vacuumworld.common.vwposition_names import VWPositionNames
+from vacuumworld.model.environment.vwneighbourhood_table import VWNeighbourhoodTable
+from vacuumworld.vwconfig_manager import VWConfigManager
+
+
+class TestNeighbourhoodTable(TestCase):
+    '''
+    This class tests that the `VWNeighbourhoodTable` lookups match the neighbours computed by `VWCoord`.
+    '''
+    def __init__(self, args: Any) -> None:
+        super(TestNeighbourhoodTable, self).__init__(args)
+
+        self.__config: dict[str, Any] = VWConfigManager.load_config_from_file(config_file_path=VacuumWorld.CONFIG_FILE_PATH, load_additional_config=False)
+        self.__min_grid_size: int = self.__config["min_environment_dim"]
+        self.__max_grid_size: int = self.__config["max_environment_dim"]
+
+    def test_lookups(self) -> None:
+        '''
+        Tests that the neighbours, and the forward and backward targets, looked up in a `VWNeighbourhoodTable` are the in-bounds ones computed by `VWCoord`.
+        '''
+        for grid_dim in range(self.__min_grid_size, self.__max_grid_size + 1):
+            table: VWNeighbourhoodTable = VWNeighbourhoodTable.of(grid_dim=grid_dim)
+
+            self.assertIs(table, VWNeighbourhoodTable.of(grid_dim=grid_dim))
+            self.assertEqual(table.get_neighbour_array().shape, (len(VWOrientation), grid_dim * grid_dim, len(VWNeighbourhoodTable.POSITIONS)))
+
+            for _ in range(grid_dim):
+                coord: VWCoord = VWCoord(x=randint(0, grid_dim - 1), y=randint(0, grid_dim - 1))
+
+                for orientation in VWOrientation:
+                    expected: dict[VWPositionNames, VWCoord] = {
+                        VWPositionNames.center: coord,
+                        VWPositionNames.forward: coord.forward(orientation=orientation),
+                        VWPositionNames.left: coord.left(orientation=orientation),
+                        VWPositionNames.right: coord.right(orientation=orientation),
+                        VWPositionNames.forwardleft: coord.forwardleft(orientation=orientation),
+                        VWPositionNames.forwardright: coord.forwardright(orientation=orientation)
+                    }
+                    expected = {position: c for position, c in expected.items() if c.in_bounds(min_x=0, max_x=grid_dim - 1, min_y=0, max_y=grid_dim - 1)}
+
+                    self.assertEqual(table.get_neighbours(coord=coord, orientation=orientation), expected)
+                    self.assertEqual(table.get_forward(coord=coord, orientation=orientation).or_else(None), expected.get(VWPositionNames.forward))
+
+                    backward: VWCoord = coord.backward(orientation=orientation)
+
+                    if backward.in_bounds(min_x=0, max_x=grid_dim - 1, min_y=0, max_y=grid_dim - 1):
+                        self.assertIs(table.get_backward(coord=coord, orientation=orientation).or_else_raise(), VWCoord.of(x=backward.get_x(), y=backward.get_y()))
+                    else:
+                        self.assertTrue(table.get_backward(coord=coord, orientation=orientation).is_empty())
+
+    def test_large_grid(self) -> None:
+        '''
+        Tests that a `VWNeighbourhoodTable` for a large grid is built without precomputing its cells, and that its lookups and neighbour array match the ones computed by `VWCoord`.
+        '''
+        grid_dim: int = 1000
+        start: float = perf_counter()
+        table: VWNeighbourhoodTable = VWNeighbourhoodTable(grid_dim=grid_dim)
+        coord: VWCoord = VWCoord(x=grid_dim - 1, y=randint(0, grid_dim - 1))
+
+        for orientation in VWOrientation:
+            table.get_neighbours(coord=coord, orientation=orientation)
+            table.get_forward(coord=coord, orientation=orientation)
+            table.get_backward(coord=coord, orientation=orientation)
+
+        self.assertLess(perf_counter() - start, 0.1)
+
+        array: NDArray[np.int64] = table.get_neighbour_array()
+
+        self.assertEqual(array.shape, (len(VWOrientation), grid_dim * grid_dim, len(VWNeighbourhoodTable.POSITIONS)))
+
+        for _ in range(grid_dim):
+            index: int = table.get_cell_index(coord=VWCoord(x=randint(0, grid_dim - 1), y=randint(0, grid_dim - 1)))
+
+            for code, orientation in enumerate(VWObservationBatch.ORIENTATIONS):
+                self.assertEqual(tuple(array[code, index].tolist()), table.get_neighbour_indices(index=index, orientation=orientation))
+                self.assertEqual({position: table.get_coord_of_cell(index=neighbour) for position, neighbour in zip(VWNeighbourhoodTable.POSITIONS, array[code, index].tolist()) if neighbour != VWNeighbourhoodTable.NO_VALUE}, table.get_neighbours(coord=table.get_coord_of_cell(index=index), orientation=orientation))
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,8 @@ from pystarworldsturbo.common.content_type import MessageContentType, MessageCon
 from vacuumworld import VacuumWorld
 from vacuumworld.common.vwposition_names import VWPositionNames
 from vacuumworld.common.vwvalidator import VWValidator
+from vacuumworld.common.vwdirection import VWDirection
+from vacuumworld.common.vwexceptions import VWInternalError
 from vacuumworld.model.actions.vwactions import VWAction
 from vacuumworld.model.actions.vwbroadcast_action import VWBroadcastAction
 from vacuumworld.model.actions.vwclean_action import VWCleanAction
@@ -31,6 +33,7 @@ from vacuumworld.common.vwcoordinates import VWCoord
 from vacuumworld.model.environment.vwenvironment import VWEnvironment
 from vacuumworld.model.environment.vwlocation import VWLocation
 from vacuumworld.common.vwobservation import VWObservation
+from vacuumworld.common.vwobservation_batch import VWObservationBatch
 from vacuumworld.vwconfig_manager import VWConfigManager
 
 import os
@@ -209,6 +212,121 @@ class TestPerception(TestCase):
 
         return {k: v.or_else_raise() for k, v in locations_dict.items() if v.is_present()}
 
+    def test_shared_location_snapshots(self) -> None:
+        '''
+        Tests that the `VWLocation` snapshots included in the `VWObservation` objects are shared until the corresponding `VWLocation` changes, and that they cannot be modified.
+        '''
+        for grid_engine in ["dict", "array"]:
+            env, _ = VWEnvironment.generate_random_env_for_testing(config=self.__config | {"grid_engine": grid_engine}, custom_grid_size=True)
+
+            for actor_id in env.get_actors():
+                coord: VWCoord = env.get_actor_position(actor_id=actor_id)
+                snapshot: VWLocation = env.get_ambient().get_location_snapshot(coord=coord)
+
+                self.assertIs(env.get_ambient().get_location_snapshot(coord=coord), snapshot)
+                self.assertEqual(snapshot.to_json(include_ids=True), env.get_ambient().get_grid()[coord].to_json(include_ids=True))
+                self.assertRaises(VWInternalError, snapshot.remove_actor)
+
+                env.turn_actor(coord=coord, direction=VWDirection.left)
+
+                self.assertIsNot(env.get_ambient().get_location_snapshot(coord=coord), snapshot)
+                self.assertEqual(snapshot.get_actor_appearance().or_else_raise().get_orientation().get_left(), env.get_ambient().get_location_snapshot(coord=coord).get_actor_appearance().or_else_raise().get_orientation())
+
+    def test_observed_appearances_are_immutable(self) -> None:
+        '''
+        Tests that the `VWActorAppearance` objects included in the `VWObservation` objects (whether generated one by one or in a `VWObservationBatch`) cannot be turned, so that a mind cannot change what the other `VWActor` objects observe.
+        '''
+        for grid_engine in ["dict", "array"]:
+            env, _ = VWEnvironment.generate_random_env_for_testing(config=self.__config | {"grid_engine": grid_engine}, custom_grid_size=True)
+            batch: VWObservationBatch = env.generate_observation_batch()
+
+            for actor_id in env.get_actors():
+                observation: VWObservation = env.generate_perception_for_actor(actor_id=actor_id, action_type=VWIdleAction, action_result=ActionResult(outcome=ActionOutcome.success)).or_else_raise()
+                batch_observation: VWObservation = VWObservation.from_batch_row(batch=batch, row=batch.get_row_of_actor(actor_id=actor_id), action_type=VWIdleAction, action_result=ActionResult(outcome=ActionOutcome.success))
+
+                for location in list(observation.get_locations().values()) + list(batch_observation.get_locations().values()):
+                    if location.has_actor():
+                        appearance: VWActorAppearance = location.get_actor_appearance().or_else_raise()
+                        orientation: VWOrientation = appearance.get_orientation()
+
+                        self.assertRaises(VWInternalError, appearance.turn, direction=VWDirection.left)
+                        self.assertEqual(appearance.get_orientation(), orientation)
+                        self.assertEqual(env.get_ambient().get_location_snapshot(coord=location.get_coord()).get_actor_appearance().or_else_raise().get_orientation(), orientation)
+
+                        copy: VWActorAppearance = appearance.deep_copy()
+
+                        copy.turn(direction=VWDirection.left)
+
+                        self.assertEqual(copy.get_orientation(), orientation.get_left())
+
+    def test_observation_batch(self) -> None:
+        '''
+        Tests that each row of a `VWObservationBatch` matches the `VWObservation` generated for the corresponding `VWActor`, with both grid engines.
+        '''
+        for _ in range(self.__number_of_runs // 10):
+            env, _ = VWEnvironment.generate_random_env_for_testing(config=self.__config, custom_grid_size=True)
+            array_env: VWEnvironment = VWEnvironment.from_json(data=env.to_json(), config=self.__config | {"grid_engine": "array"})
+            batch: VWObservationBatch = env.generate_observation_batch()
+            array_batch: VWObservationBatch = array_env.generate_observation_batch()
+
+            self.assertEqual(sorted(batch.get_actor_ids()), sorted(env.get_actors()))
+            self.assertEqual(batch.get_tensor().shape, (len(env.get_actors()), len(VWPositionNames), VWObservationBatch.NUMBER_OF_FEATURES))
+            self.assertTrue((batch.get_tensor() == array_batch.get_tensor()).all())
+
+            for actor_id in batch.get_actor_ids():
+                row: int = batch.get_row_of_actor(actor_id=actor_id)
+                expected: VWObservation = env.generate_perception_for_actor(actor_id=actor_id, action_type=VWIdleAction, action_result=ActionResult(outcome=ActionOutcome.success)).or_else_raise()
+                observation: VWObservation = VWObservation.from_batch_row(batch=batch, row=row, action_type=VWIdleAction, action_result=ActionResult(outcome=ActionOutcome.success))
+
+                self.assertEqual(observation.get_observer_id().or_else_raise(), actor_id)
+                self.assertEqual(observation.to_json(), expected.to_json())
+                self.assertEqual({p: loc.to_json(include_ids=True) for p, loc in observation.get_locations().items()}, {p: loc.to_json(include_ids=True) for p, loc in expected.get_locations().items()})
+
+    def test_observation_features(self) -> None:
+        '''
+        Tests that the queries answered by the `VWObservationFeatures` of a `VWObservation` match the `VWLocation` objects of the `VWObservation`.
+        '''
+        for _ in range(self.__number_of_runs // 10):
+            env, _ = VWEnvironment.generate_random_env_for_testing(config=self.__config, custom_grid_size=True)
+
+            for actor_id in env.get_actors():
+                observation: VWObservation = env.generate_perception_for_actor(actor_id=actor_id, action_type=VWIdleAction, action_result=ActionResult(outcome=ActionOutcome.success)).or_else_raise()
+                locations: dict[VWPositionNames, VWLocation] = observation.get_locations()
+                orientation: VWOrientation = locations[VWPositionNames.center].get_actor_appearance().or_else_raise().get_orientation()
+
+                self.assertIs(observation.get_features(), observation.get_features())
+                self.assertIs(observation.get_forward(), observation.get_forward())
+                self.assertEqual(observation.get_observer_id().or_else_raise(), actor_id)
+                self.assertTrue(all(location.or_else(None) is locations.get(position, None) for location, position in zip(observation.get_locations_in_order(), VWPositionNames.elements_in_order())))
+
+                for position in VWPositionNames:
+                    location: PyOptional[VWLocation] = observation.get_location_at(position_name=position)
+
+                    self.assertIs(location.or_else(None), locations.get(position, None))
+                    self.assertEqual(observation.is_actor_at(position_name=position), location.filter(lambda loc: loc.has_actor()).is_present())
+                    self.assertEqual(observation.get_actor_colour_at(position_name=position).or_else(None), location.flat_map(lambda loc: loc.get_actor_appearance()).map(lambda a: a.get_colour()).or_else(None))
+                    self.assertEqual(observation.is_dirt_at(position_name=position), location.filter(lambda loc: loc.has_dirt()).is_present())
+                    self.assertEqual(observation.get_dirt_colour_at(position_name=position).or_else(None), location.flat_map(lambda loc: loc.get_dirt_appearance()).map(lambda d: d.get_colour()).or_else(None))
+                    self.assertEqual(observation.is_corner_at(position_name=position), location.filter(lambda loc: loc.is_corner()).is_present())
+                    self.assertEqual(observation.is_edge_at(position_name=position), location.filter(lambda loc: loc.is_edge()).is_present())
+
+                center: VWLocation = locations[VWPositionNames.center]
+
+                self.assertEqual(observation.is_wall_immediately_ahead(), center.has_wall_on(orientation=orientation))
+                self.assertEqual(observation.is_wall_immediately_behind(), center.has_wall_on(orientation=orientation.get_opposite()))
+                self.assertEqual(observation.is_wall_immediately_to_the_left(), center.has_wall_on(orientation=orientation.get_left()))
+                self.assertEqual(observation.is_wall_immediately_to_the_right(), center.has_wall_on(orientation=orientation.get_right()))
+
+                locations.pop(VWPositionNames.center)
+
+                self.assertIs(observation.get_center().or_else_raise(), center)
+                self.assertIn(VWPositionNames.center, observation.get_locations())
+
+            empty_observation: VWObservation = VWObservation(action_type=VWIdleAction, action_result=ActionResult(outcome=ActionOutcome.success))
+
+            self.assertRaises(VWInternalError, empty_observation.is_wall_immediately_ahead)
+            self.assertRaises(VWInternalError, empty_observation.is_wall_one_step_to_the_left)
+
     def test_message_with_int_content(self) -> None:
         '''
         Tests various instances of `BccMessage` whose content is an `int`.
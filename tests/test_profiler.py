@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+from unittest import main, TestCase
+from typing import Any, cast
+from json import load
+from tempfile import TemporaryDirectory
+
+from vacuumworld import VacuumWorld
+from vacuumworld.common.vwprofiler import VWHistogram, VWProfiler
+from vacuumworld.model.actor.mind.surrogate.vwhysteretic_mind_surrogate import VWHystereticMindSurrogate
+from vacuumworld.model.actor.vwuser import VWUser
+from vacuumworld.model.environment.vwenvironment import VWEnvironment
+from vacuumworld.vwconfig_manager import VWConfigManager
+
+import os
+
+
+class TestProfiler(TestCase):
+    '''
+    This class tests the per-phase profiler of the cycles.
+    '''
+    def __init__(self, args: Any) -> None:
+        super(TestProfiler, self).__init__(args)
+
+        self.__config: dict[str, Any] = VWConfigManager.load_config_from_file(config_file_path=VacuumWorld.CONFIG_FILE_PATH, load_additional_config=False)
+        self.__number_of_cycles: int = 20
+
+    def test_profiler(self) -> None:
+        '''
+        Tests that, when enabled, the profiler times each phase of each `VWActor` cycle, the validation, and the executor steps, and that nothing is recorded when it is disabled.
+        '''
+        env, _ = VWEnvironment.generate_random_env_for_testing(config=self.__config | {"total_cycles": self.__number_of_cycles}, custom_grid_size=True)
+        cleaning_agents: list[str] = [actor_id for actor_id, actor in env.get_actors().items() if not isinstance(actor, VWUser)]
+
+        VWProfiler.reset()
+
+        try:
+            VWProfiler.ENABLED = True
+
+            while env.can_evolve():
+                env.evolve()
+        finally:
+            VWProfiler.ENABLED = False
+
+        histograms: dict[str, VWHistogram] = VWProfiler.get_histograms()
+
+        for phase in ("perceive", "decide", "execute"):
+            self.assertEqual(histograms[f"mind/{phase}/{VWHystereticMindSurrogate.__name__}"].get_count(), len(cleaning_agents) * self.__number_of_cycles)
+
+            for actor_id in env.get_actors():
+                self.assertEqual(histograms[f"actor/{phase}/{actor_id}"].get_count(), self.__number_of_cycles)
+
+        self.assertEqual(histograms["environment/validation"].get_count(), len(env.get_actors()) * self.__number_of_cycles)
+        self.assertEqual(sum(h.get_count() for key, h in histograms.items() if key.endswith("/is_possible")), histograms["environment/perception"].get_count())
+        self.assertTrue(all(histogram.get_total() >= 0 for histogram in histograms.values()))
+
+        with TemporaryDirectory() as tmp:
+            path: str = os.path.join(tmp, "profile.json")
+
+            VWProfiler.export(path=path)
+
+            with open(path, "r") as f:
+                self.assertEqual(set(load(f)), set(histograms))
+
+        VWProfiler.reset()
+        env.evolve()
+
+        self.assertEqual(VWProfiler.get_histograms(), {})
+
+    def test_histogram(self) -> None:
+        '''
+        Tests the counts and the percentiles of a `VWHistogram`.
+        '''
+        histogram: VWHistogram = VWHistogram()
+        durations: list[float] = [i * 1e-6 for i in range(1, 1001)]
+
+        for seconds in durations:
+            histogram.add(seconds=seconds)
+
+        self.assertEqual(histogram.get_count(), len(durations))
+        self.assertAlmostEqual(histogram.get_total(), sum(durations))
+        self.assertLessEqual(histogram.get_percentile(percentile=50), histogram.get_percentile(percentile=90))
+        self.assertLessEqual(histogram.get_percentile(percentile=90), histogram.get_percentile(percentile=100))
+        self.assertEqual(histogram.get_percentile(percentile=100), max(durations))
+
+        # Each percentile is an upper bound within a factor of 2.
+        for percentile in (50, 90, 99):
+            exact: float = durations[int(len(durations) * percentile / 100) - 1]
+
+            self.assertGreaterEqual(histogram.get_percentile(percentile=percentile), exact)
+            self.assertLessEqual(histogram.get_percentile(percentile=percentile), 2 * exact)
+
+        self.assertEqual(sum(cast(dict[str, int], histogram.to_json()["buckets"]).values()), len(durations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+from unittest import main, TestCase
+from typing import Any
+from importlib.metadata import version
+from json import dump, loads
+from subprocess import run as run_process, CompletedProcess
+from tempfile import TemporaryDirectory
+from time import time
+
+from vacuumworld import VacuumWorld
+
+import os
+import sys
+
+
+class TestStartup(TestCase):
+    '''
+    This class tests that the GUI-less use of VacuumWorld only imports the simulation core, and that the check for updates does not block the startup.
+
+    Each test runs in a fresh interpreter, so that the modules imported by the other tests do not count.
+    '''
+    SCRIPT: str = "\n".join([
+        "import sys",
+        "from json import dumps",
+        "from vacuumworld import VacuumWorld, run",
+        "from vacuumworld.gui.vwsaveload import VWSaveStateManager",
+        "from vacuumworld.model.actor.mind.surrogate.vwhysteretic_mind_surrogate import VWHystereticMindSurrogate",
+        "from vacuumworld.model.environment.vwenvironment import VWEnvironment",
+        "from vacuumworld.vwconfig_manager import VWConfigManager",
+        "",
+        "if __name__ == '__main__':",
+        "    env, _ = VWEnvironment.generate_random_env_for_testing(config=VWConfigManager.load_config_from_file(config_file_path=VacuumWorld.CONFIG_FILE_PATH, load_additional_config=False), custom_grid_size=True)",
+        "    VWSaveStateManager().save_state(env=env, filename='startup.json')",
+        "    run(default_mind=VWHystereticMindSurrogate(), load='startup.json', total_cycles=1, gui=False)",
+        "    env.evolve()",
+        "    print(dumps(sorted(module for module in sys.argv[1:] if module in sys.modules)))",
+    ])
+    HEAVY_MODULES: list[str] = ["tkinter", "PIL", "pygame", "screeninfo", "pymonitors", "requests", "google.genai"]
+
+    def __init__(self, args: Any) -> None:
+        super(TestStartup, self).__init__(args)
+
+        self.__project_dir: str = os.path.dirname(os.path.dirname(os.path.abspath(VacuumWorld.CONFIG_FILE_PATH)))
+
+    def test_guiless_startup_imports(self) -> None:
+        '''
+        Tests that none of the GUI, update, and LLM libraries is imported by a GUI-less run, and that the offline mode skips the check for updates.
+        '''
+        with TemporaryDirectory() as tmp:
+            result: CompletedProcess[str] = self.__run_script(tmp=tmp, env=os.environ | {"HOME": tmp, "VW_OFFLINE": "1"})
+
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertIn("offline mode", result.stdout)
+            self.assertEqual(loads(result.stdout.strip().splitlines()[-1]), [])
+
+    def test_cached_version_check(self) -> None:
+        '''
+        Tests that a fresh cached remote version number is used instead of fetching the remote one.
+        '''
+        with TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, ".cache", "vacuumworld"))
+
+            with open(os.path.join(tmp, ".cache", "vacuumworld", "remote_version.json"), "w") as f:
+                dump(obj={"remote_version_number": version("vacuumworld"), "timestamp": time()}, fp=f)
+
+            result: CompletedProcess[str] = self.__run_script(tmp=tmp, env={key: value for key, value in os.environ.items() if key != "VW_OFFLINE"} | {"HOME": tmp})
+
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertIn("Your version of VacuumWorld is up-to-date.", result.stdout)
+            self.assertEqual(loads(result.stdout.strip().splitlines()[-1]), [])
+
+    def __run_script(self, tmp: str, env: dict[str, str]) -> CompletedProcess[str]:
+        script_path: str = os.path.join(tmp, "startup.py")
+
+        with open(script_path, "w") as f:
+            f.write(TestStartup.SCRIPT)
+
+        return run_process([sys.executable, script_path, *TestStartup.HEAVY_MODULES], cwd=tmp, env=env | {"PYTHONPATH": self.__project_dir}, capture_output=True, text=True, timeout=120)
+
+
+if __name__ == "__main__":
+    main()
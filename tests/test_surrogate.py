@@ -3,9 +3,12 @@
 from unittest import main, TestCase
 from typing import Iterable, Any
 from inspect import getsourcefile
+from time import sleep
 from pyoptional.pyoptional import PyOptional
 
 from pystarworldsturbo.common.message import BccMessage
+from pystarworldsturbo.common.action_outcome import ActionOutcome
+from pystarworldsturbo.common.action_result import ActionResult
 from pystarworldsturbo.utils.utils import ignore
 
 from vacuumworld import VacuumWorld
@@ -15,6 +18,8 @@ from vacuumworld.common.vwcolour import VWColour
 from vacuumworld.common.vwobservation import VWObservation
 from vacuumworld.model.actions.vwactions import VWAction
 from vacuumworld.model.actions.vwidle_action import VWIdleAction
+from vacuumworld.model.actions.vwmove_action import VWMoveAction
+from vacuumworld.model.actor.mind.vwactor_mind import VWMind
 
 import os
 
@@ -47,6 +52,29 @@ class TmpSurrogateMind(VWActorMindSurrogate):
         return [VWIdleAction()]
 
 
+class SlowSurrogateMind(TmpSurrogateMind):
+    '''
+    This class inherits from `TmpSurrogateMind`, and overrides `decide()` so that its first call takes `FIRST_DECISION_TIME` seconds.
+    '''
+    FIRST_DECISION_TIME: float = 0.3
+
+    def __init__(self) -> None:
+        super(SlowSurrogateMind, self).__init__()
+
+        self.__number_of_decisions: int = 0
+
+    def decide(self) -> Iterable[VWAction]:
+        '''
+        This method always returns a `VWMoveAction`, after `FIRST_DECISION_TIME` seconds the first time.
+        '''
+        self.__number_of_decisions += 1
+
+        if self.__number_of_decisions == 1:
+            sleep(SlowSurrogateMind.FIRST_DECISION_TIME)
+
+        return [VWMoveAction()]
+
+
 # The various kinds of malformed surrogates are already tested in `test_illegal_run_inputs.py`.
 class TestSurrogate(TestCase):
     '''
@@ -78,6 +106,67 @@ class TestSurrogate(TestCase):
 
         self.__test_load_surrogate(surrogate_mind=surrogate_mind)
 
+    def test_decide_time_budget(self) -> None:
+        '''
+        Tests that a mind which exceeds `VWMind.DECIDE_TIME_BUDGET` attempts a `VWIdleAction` until its late decision returns, and that the timeouts are counted.
+        '''
+        mind: VWMind = VWMind(surrogate=SlowSurrogateMind())
+
+        try:
+            VWMind.DECIDE_TIME_BUDGET = SlowSurrogateMind.FIRST_DECISION_TIME / 10
+
+            for number_of_timeouts in (1, 2):
+                mind.revise_and_decide()
+
+                self.assertTrue(mind.has_timed_out())
+                self.assertEqual(mind.get_number_of_timeouts(), number_of_timeouts)
+                self.assertEqual([type(action) for action in mind.execute()], [VWIdleAction])
+
+            sleep(SlowSurrogateMind.FIRST_DECISION_TIME * 1.5)
+            mind.revise_and_decide()
+
+            self.assertFalse(mind.has_timed_out())
+            self.assertEqual(mind.get_number_of_timeouts(), 2)
+            self.assertEqual([type(action) for action in mind.execute()], [VWMoveAction])
+        finally:
+            VWMind.DECIDE_TIME_BUDGET = 0.0
+
+        mind.revise_and_decide()
+
+        self.assertFalse(mind.has_timed_out())
+        self.assertEqual([type(action) for action in mind.execute()], [VWMoveAction])
+
+    def test_late_call_ending_after_perceive(self) -> None:
+        '''
+        Tests that, if the late call of a mind ends between `perceive()` and `revise_and_decide()`, the mind still falls back in that cycle, as its surrogate perceived nothing, and decides again in the next cycle.
+        '''
+        mind: VWMind = VWMind(surrogate=SlowSurrogateMind())
+        observation: VWObservation = VWObservation(action_type=VWIdleAction, action_result=ActionResult(outcome=ActionOutcome.success))
+
+        try:
+            VWMind.DECIDE_TIME_BUDGET = SlowSurrogateMind.FIRST_DECISION_TIME / 10
+
+            mind.perceive(observation=observation, messages=[])
+            mind.revise_and_decide()
+
+            self.assertTrue(mind.has_timed_out())
+
+            mind.perceive(observation=observation, messages=[])
+            sleep(SlowSurrogateMind.FIRST_DECISION_TIME * 1.5)
+            mind.revise_and_decide()
+
+            self.assertTrue(mind.has_timed_out())
+            self.assertEqual(mind.get_number_of_timeouts(), 2)
+            self.assertEqual([type(action) for action in mind.execute()], [VWIdleAction])
+
+            mind.perceive(observation=observation, messages=[])
+            mind.revise_and_decide()
+
+            self.assertFalse(mind.has_timed_out())
+            self.assertEqual([type(action) for action in mind.execute()], [VWMoveAction])
+        finally:
+            VWMind.DECIDE_TIME_BUDGET = 0.0
+
     def __test_load_surrogate(self, surrogate_mind: VWActorMindSurrogate) -> None:
         self.assertIsInstance(surrogate_mind, VWActorMindSurrogate)
 
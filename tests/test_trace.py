@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+from unittest import main, TestCase
+from random import seed
+from typing import Any
+from tempfile import TemporaryDirectory
+
+from pystarworldsturbo.common.message import Message
+from pystarworldsturbo.utils.json.json_value import JSONValue
+
+from vacuumworld import VacuumWorld
+from vacuumworld.common.vwcolour import VWColour
+from vacuumworld.common.vwcoordinates import VWCoord
+from vacuumworld.common.vworientation import VWOrientation
+from vacuumworld.common.vwexceptions import VWInternalError
+from vacuumworld.model.environment.vwcycle_journal import VWCycleJournal
+from vacuumworld.model.environment.vwenvironment import VWEnvironment
+from vacuumworld.model.environment.vwtrace import VWTraceSink, VWTraceWriter
+from vacuumworld.vwconfig_manager import VWConfigManager
+
+import os
+
+
+class ListTraceSink(VWTraceSink):
+    '''
+    This class is a `VWTraceSink` that keeps the trace records in memory.
+    '''
+    def __init__(self) -> None:
+        self.__records: list[dict[str, JSONValue]] = []
+
+    def write(self, record: dict[str, JSONValue]) -> None:
+        '''
+        Appends `record` to the kept records.
+        '''
+        self.__records.append(record)
+
+    def close(self) -> None:
+        '''
+        Does nothing.
+        '''
+        pass
+
+    def get_records(self) -> list[dict[str, JSONValue]]:
+        '''
+        Returns the kept records.
+        '''
+        return self.__records
+
+
+class TestTrace(TestCase):
+    '''
+    This class tests the per-cycle trace of a `VWEnvironment`.
+    '''
+    def __init__(self, args: Any) -> None:
+        super(TestTrace, self).__init__(args)
+
+        self.__config: dict[str, Any] = VWConfigManager.load_config_from_file(config_file_path=VacuumWorld.CONFIG_FILE_PATH, load_additional_config=False)
+        self.__number_of_runs: int = 5
+        self.__number_of_cycles: int = 20
+
+    def test_trace(self) -> None:
+        '''
+        Tests that a `VWTraceWriter` writes one record per cycle, in both formats, and that the records describe what happened in each cycle.
+        '''
+        for i in range(self.__number_of_runs):
+            env, _ = VWEnvironment.generate_random_env_for_testing(config=self.__config, custom_grid_size=True)
+            data: dict[str, Any] = env.to_json()
+
+            for trace_format in VWTraceWriter.FORMATS:
+                with TemporaryDirectory() as tmp:
+                    path: str = os.path.join(tmp, f"trace.{trace_format}")
+                    seed(i)
+                    loaded_env: VWEnvironment = VWEnvironment.from_json(data=data, config=self.__config | {"total_cycles": self.__number_of_cycles})
+                    writer: VWTraceWriter = VWTraceWriter(path=path, trace_format=trace_format, buffer_size=4)
+
+                    initial_number_of_dirts: int = len(loaded_env.get_passive_bodies())
+
+                    loaded_env.set_trace_sink(sink=writer)
+
+                    while loaded_env.can_evolve():
+                        loaded_env.evolve()
+
+                    writer.close()
+
+                    records: list[dict[str, Any]] = list(VWTraceWriter.read_records(path=path, trace_format=trace_format))
+
+                    self.assertEqual([record["cycle"] for record in records], list(range(self.__number_of_cycles + 1)))
+                    self.assertEqual(records[0]["actions"], [])  # Cycle `0` is the initial perception.
+                    self.assertTrue(all(len(record["actions"]) >= len(loaded_env.get_actors()) for record in records[1:]))
+                    self.assertTrue(all(len(record["moves"]) <= len(loaded_env.get_actors()) for record in records))
+                    self.assertEqual(len(loaded_env.get_passive_bodies()), initial_number_of_dirts + sum(len(record["dirt_dropped"]) - len(record["dirt_cleaned"]) for record in records))
+                    self.assertRaises(VWInternalError, writer.write, {"cycle": 0})
+
+    def test_journal(self) -> None:
+        '''
+        Tests that the subscribers of a `VWEnvironment` receive one `VWCycleJournal` per cycle, that the trace records are the JSON representations of such journals, and that replaying the journals on the initial grid yields the final grid.
+        '''
+        for i in range(self.__number_of_runs):
+            env, _ = VWEnvironment.generate_random_env_for_testing(config=self.__config, custom_grid_size=True)
+            data: dict[str, Any] = env.to_json()
+            journals: list[VWCycleJournal] = []
+            sink: ListTraceSink = ListTraceSink()
+
+            seed(i)
+            loaded_env: VWEnvironment = VWEnvironment.from_json(data=data, config=self.__config | {"total_cycles": self.__number_of_cycles})
+            loaded_env.subscribe_to_journal(subscriber=journals.append)
+            loaded_env.set_trace_sink(sink=sink)
+
+            sender_id: str = next(iter(loaded_env.get_actors()))
+
+            loaded_env.send_message_to_recipients(message=Message(content="hello", sender_id=sender_id))
+
+            actors: dict[VWCoord, tuple[str, VWOrientation]] = {coord: (location.get_actor_appearance().or_else_raise().get_id(), location.get_actor_appearance().or_else_raise().get_orientation()) for coord, location in loaded_env.get_ambient().get_grid().items() if location.has_actor()}
+            dirts: dict[VWCoord, VWColour] = {coord: location.get_dirt_appearance().or_else_raise().get_colour() for coord, location in loaded_env.get_ambient().get_grid().items() if location.has_dirt()}
+
+            while loaded_env.can_evolve():
+                loaded_env.evolve()
+
+            self.assertEqual([journal.get_cycle() for journal in journals], list(range(self.__number_of_cycles + 1)))
+            self.assertEqual(sink.get_records(), [journal.to_json() for journal in journals])
+            self.assertEqual(list(journals[0].get_messages()), [(sender_id, [actor_id for actor_id in loaded_env.get_actors() if actor_id != sender_id])])
+
+            for journal in journals:
+                for _, from_coord, to_coord in journal.get_moves():
+                    actors[to_coord] = actors.pop(from_coord)
+
+                for actor_id, coord, orientation in journal.get_turns():
+                    self.assertEqual(actors[coord][0], actor_id)
+
+                    actors[coord] = (actor_id, orientation)
+
+                for coord, _ in journal.get_dirts_cleaned():
+                    del dirts[coord]
+
+                for coord, colour in journal.get_dirts_dropped():
+                    dirts[coord] = colour
+
+                for sender_id, recipient_ids in journal.get_messages():
+                    self.assertIn(sender_id, loaded_env.get_actors())
+                    self.assertNotIn(sender_id, recipient_ids)
+
+                self.assertTrue(set(journal.get_changed_coords()).issubset(loaded_env.get_ambient().get_grid()))
+
+            self.assertEqual(actors, {coord: (location.get_actor_appearance().or_else_raise().get_id(), location.get_actor_appearance().or_else_raise().get_orientation()) for coord, location in loaded_env.get_ambient().get_grid().items() if location.has_actor()})
+            self.assertEqual(dirts, {coord: location.get_dirt_appearance().or_else_raise().get_colour() for coord, location in loaded_env.get_ambient().get_grid().items() if location.has_dirt()})
+
+    def test_illegal_trace_writer_args(self) -> None:
+        '''
+        Tests that a `VWTraceWriter` rejects an unknown format and a non-positive buffer size.
+        '''
+        with TemporaryDirectory() as tmp:
+            self.assertRaises(ValueError, VWTraceWriter, path=os.path.join(tmp, "trace"), trace_format="csv")
+            self.assertRaises(ValueError, VWTraceWriter, path=os.path.join(tmp, "trace"), buffer_size=0)
+
+
+if __name__ == "__main__":
+    main()
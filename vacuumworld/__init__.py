@@ -2,10 +2,9 @@ from typing import Type, Optional, Any, cast
 from sys import version_info
 from traceback import print_exc
 from signal import signal as handle_signal
-from requests import get, Response
-from time import sleep
-from screeninfo import get_monitors as get_monitors_with_screeninfo, ScreenInfoError
-from pymonitors import get_monitors as get_monitors_with_pymonitors
+from json import dump, load
+from threading import Thread
+from time import sleep, time
 from pyoptional.pyoptional import PyOptional
 from subprocess import call
 from tempfile import mkdtemp, mkstemp
@@ -22,7 +21,6 @@ from .common.vwuser_difficulty import VWUserDifficulty
 from .common.vwcolour import VWColour
 from .common.vwexceptions import VWInternalError, VWRunnerException
 from .runner.vwrunner import VWRunner
-from .runner.vwgui_runner import VWGUIRunner
 from .runner.vwguiless_runner import VWGUIlessRunner
 
 import os
@@ -47,29 +45,54 @@ class VacuumWorld():
         "tooltips": bool,
         "efforts": dict[str, int],
         "total_cycles": int,
-        "randomness_enabled": bool
+        "randomness_enabled": bool,
+        "large_world": bool,
+        "throughput_mode": bool,
+        "progress_interval": int,
+        "trace_file": str,
+        "trace_format": str,
+        "profile_file": str,
+        "decide_time_budget": float,
+        "mind_workers": int,
+        "llm_concurrency": int,
+        "llm_deadline": float,
+        "llm_cache_file": str,
+        "llm_rate_limit": float,
+        "llm_batching": bool
     }
 
     def __init__(self) -> None:
         VacuumWorld.__python_version_check()
         VacuumWorld.__set_sigtstp_handler()
 
-        self.__config: dict[str, JSONValue] = VWConfigManager.load_config_from_file(config_file_path=VacuumWorld.CONFIG_FILE_PATH)
+        # The screen is only probed if the GUI is used.
+        self.__config: dict[str, JSONValue] = VWConfigManager.load_config_from_file(config_file_path=VacuumWorld.CONFIG_FILE_PATH, probe_screen=False)
 
         self.__config["version_number"] = version("vacuumworld")
+        self.__remote_version_number: PyOptional[str] = PyOptional[str].empty()
+        self.__version_check: Thread = Thread(target=self.__fetch_remote_version_number, daemon=True)
 
-        self.__vw_version_check()
+        # The remote version number is fetched in the background, and checked when `run()` is called.
+        if not VacuumWorld.__offline():
+            self.__version_check.start()
 
     def run(self, default_mind: PyOptional[VWActorMindSurrogate]=PyOptional.empty(), white_mind: PyOptional[VWActorMindSurrogate]=PyOptional.empty(), green_mind: PyOptional[VWActorMindSurrogate]=PyOptional.empty(), orange_mind: PyOptional[VWActorMindSurrogate]=PyOptional.empty(), **kwargs: Any) -> None:
         '''
         Loads the mind surrogates, and selects the appropriate VacuumWorld runner. Then, it loads the configuration options, and starts the loaded runner.
         '''
+        self.__vw_version_check()
+
         minds: dict[VWColour, VWActorMindSurrogate] = VacuumWorld.__process_minds(default_mind=default_mind, white_mind=white_mind, green_mind=green_mind, orange_mind=orange_mind)
         minds[VWColour.user] = VWUserMindSurrogate(difficulty_level=VWUserDifficulty(self.__config["default_user_mind_level"]))
 
         if "gui" in kwargs and type(kwargs.get("gui")) == VacuumWorld.ALLOWED_RUN_ARGS["gui"] and not kwargs.get("gui"):
             self.__run(runner_type=VWGUIlessRunner, minds=minds, **kwargs)
         elif VacuumWorld.__display_available():
+            # The GUI (and, with it, `tkinter` and `PIL`) is only imported if it is used.
+            from .runner.vwgui_runner import VWGUIRunner
+
+            VWConfigManager.add_screen_config(config=self.__config)
+
             self.__run(runner_type=VWGUIRunner, minds=minds, **kwargs)
         else:
             print("WARNING: no display available. Falling back to GUI-less mode.\n")
@@ -80,6 +103,9 @@ class VacuumWorld():
 
     @staticmethod
     def __display_available() -> bool:
+        from screeninfo import get_monitors as get_monitors_with_screeninfo, ScreenInfoError
+        from pymonitors import get_monitors as get_monitors_with_pymonitors
+
         try:
             if len(get_monitors_with_screeninfo()) > 0:
                 return True
@@ -110,15 +136,64 @@ class VacuumWorld():
         else:
             return False
 
+    @staticmethod
+    def __offline() -> bool:
+        return os.getenv("VW_OFFLINE", "").strip().lower() in {"1", "true", "yes", "on"}
+
     def __vw_version_check(self) -> None:
+        if VacuumWorld.__offline():
+            print("INFO: offline mode. The check for updates of VacuumWorld is skipped.\n")
+
+            return
+
+        # The check does not wait for the remote version number beyond the timeout: if it is late, the check is skipped.
+        self.__version_check.join(timeout=cast(float, self.__config["version_check_timeout"]))
+
         version_number: str = cast(str, self.__config["version_number"])
-        remote_version_number: str = self.__get_remote_version_number()
+        remote_version_number: str = self.__remote_version_number.or_else("")
 
         outdated: bool = self.__compare_version_numbers_and_print_message(version_number, remote_version_number)
 
         if outdated:
             self.__attempt_auto_update()
 
+    def __fetch_remote_version_number(self) -> None:
+        cached_version_number: str = self.__load_cached_remote_version_number()
+
+        if cached_version_number:
+            self.__remote_version_number = PyOptional[str].of(cached_version_number)
+        else:
+            remote_version_number: str = self.__get_remote_version_number()
+
+            if remote_version_number:
+                self.__cache_remote_version_number(remote_version_number=remote_version_number)
+
+            self.__remote_version_number = PyOptional[str].of(remote_version_number)
+
+    def __get_version_check_cache_path(self) -> str:
+        return os.path.join(os.path.expanduser("~"), ".cache", "vacuumworld", cast(str, self.__config["version_check_cache_file_name"]))
+
+    def __load_cached_remote_version_number(self) -> str:
+        try:
+            with open(self.__get_version_check_cache_path(), "r") as f:
+                cached: dict[str, Any] = load(fp=f)
+
+            if time() - float(cached["timestamp"]) < cast(float, self.__config["version_check_cache_ttl"]):
+                return str(cached["remote_version_number"])
+            else:
+                return ""
+        except Exception:
+            return ""
+
+    def __cache_remote_version_number(self, remote_version_number: str) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.__get_version_check_cache_path()), exist_ok=True)
+
+            with open(self.__get_version_check_cache_path(), "w") as f:
+                dump(obj={"remote_version_number": remote_version_number, "timestamp": time()}, fp=f)
+        except Exception:
+            pass
+
     def __attempt_auto_update(self) -> None:
         print("Attempting to update VacuumWorld automatically...")
 
@@ -149,6 +224,8 @@ class VacuumWorld():
         Downloads the remote pyproject.toml from the GitHub repository (raw content)
         and stores it temporarily. Returns the local file path, or an empty string on failure.
         """
+        from requests import get, Response
+
         try:
             remote_toml_url = f"{self.__config["project_repo_raw_content_url"]}pyproject.toml"
 
@@ -156,7 +233,7 @@ class VacuumWorld():
 
             os.close(fd)
 
-            response: Response = get(remote_toml_url, allow_redirects=True, timeout=5)
+            response: Response = get(remote_toml_url, allow_redirects=True, timeout=cast(float, self.__config["version_check_timeout"]))
             response.raise_for_status()
 
             with open(temp_path, "w", encoding="utf-8") as remote_file:
@@ -205,7 +282,11 @@ class VacuumWorld():
         print(f"VacuumWorld version (local): {version_number}.")
         print(f"VacuumWorld version (remote): {remote_version_number}.\n")
 
-        if not remote_version_number or "." not in remote_version_number:
+        if not remote_version_number:
+            print("WARNING: Could not check whether or not your version of VacuumWorld is up-to-date because the latest version number could not be fetched in time (possibly because you are offline).\n")
+
+            return False  # There is no point in attempting an update without a connection.
+        elif "." not in remote_version_number:
             print("WARNING: Could not check whether or not your version of VacuumWorld is up-to-date because it was not possible to get a well formed latest version number.\n")
 
             return True  # Conservative approach (i.e., consider VW outdated).
@@ -298,6 +379,8 @@ def run(default_mind: Optional[VWActorMindSurrogate]=None, white_mind: Optional[
     '''
     The entry point of VacuumWorld.
 
+    The check for updates runs in the background, with a cached result, and is skipped if the `VW_OFFLINE` environment variable is set (e.g., to `1`). The GUI, and the libraries it needs, are only loaded if the GUI is used.
+
     Arguments:
 
     - `default_mind`: the mind surrogate to be used by all agents, if no specific mind surrogate is provided for them. This argument is mandatory, unless all of the following arguments are provided: `white_mind`, `green_mind`, and `orange_mind`.
@@ -325,6 +408,33 @@ def run(default_mind: Optional[VWActorMindSurrogate]=None, white_mind: Optional[
     - `efforts`: a `dict[str, int]` containing the efforts of each action type. The keys are the action names, and the values are the efforts. If not provided, the default efforts will be used.
 
     - `total_cycles`: the total number of cycles to be executed. It must be `> 0`. If not provided, the simulation will run indefinitely. A `0` value will be ignored, and the simulation will run indefinitely.
+
+    - `large_world`: if `True`, the grid is stored in a `VWArrayAmbient`, its dimension is not bounded by `max_environment_dim`, the savestates only contain the non-default locations, and the grid is not printed at each cycle. It can only be `True` if `gui` is `False`. If not provided, `False` will be used.
+
+    - `throughput_mode`: if `True`, the cycles are run back-to-back, without printing the grid and without waiting between cycles, and the throughput (cycles per second) and the time spent in each phase of the cycles are printed at the end. It can only be `True` if `gui` is `False`. If not provided, `False` will be used.
+
+    - `progress_interval`: if `> 0`, and `throughput_mode` is `True`, a progress line is printed every `progress_interval` cycles. It must be `>= 0`. If not provided, `0` (no progress output) will be used.
+
+    - `trace_file`: if not empty, the path of the file where a record of each cycle (the attempted actions and their outcomes, the moves, and the dirts dropped and cleaned) is written, from a background thread. It can only be specified if `gui` is `False`. If not provided, no trace will be written.
+
+    - `trace_format`: the format of the trace file, either `"jsonl"` (one JSON object per line) or `"binary"` (length-prefixed JSON objects). If not provided, `"jsonl"` will be used.
+
+    - `profile_file`: if not empty, the wall time of each phase of the cycles is recorded per `VWActor`, per mind surrogate class, and per executor step (see `VWProfiler`), and the resulting histograms are written to this JSON file at the end of the simulation. It can only be specified if `gui` is `False`. If not provided, nothing is recorded.
+
+    - `decide_time_budget`: if `> 0`, the maximum number of seconds each mind is given, at each cycle, to `revise()` and `decide()`. A mind that exceeds it attempts a `VWIdleAction` instead, until its late call returns (see `VWMind.revise_and_decide()`). It must be `>= 0`. If not provided, `0.0` (no time budget) will be used.
+
+    - `mind_workers`: if `> 0`, the number of worker processes on which the minds of the cleaning agents are evaluated concurrently. In this case, every `VWActor` perceives before any mind decides, and the decided actions are then executed in the usual order (see `VWEnvironment.execute_cycle_actions()`). The evolution does not depend on the number of workers. It must be `>= 0`, and it can only be `> 0` if `gui` is `False`. If not provided, `0` (sequential evaluation) will be used.
+
+    - `llm_concurrency`: if `> 0`, the maximum number of Gemini queries in flight at once. In this case, the LLM-capable minds issue their queries concurrently, and every `VWActor` perceives before any mind decides (see `VWEnvironment.execute_cycle_actions()`). It must be `>= 0`. If not provided, `0` (one query at a time) will be used.
+
+    - `llm_deadline`: if `> 0`, and `llm_concurrency` is `> 0`, the maximum number of seconds each cycle waits for the LLM-capable minds. A mind that misses it attempts a `VWIdleAction` instead. It must be `>= 0`. If not provided, `0.0` (no deadline) will be used.
+
+    - `llm_cache_file`: if not empty, the path of the SQLite file where the responses of the Gemini model are cached across runs (or `":memory:"`, for a cache that is not stored), so that an identical prompt is not sent twice. The least recently used responses are evicted beyond `config["llm_cache_max_entries"]` entries, and, if `config["llm_cache_ttl"]` is `> 0`, the responses older than `config["llm_cache_ttl"]` seconds are discarded (see `GeminiCache`). If not provided, no response will be cached.
+
+    - `llm_rate_limit`: if `> 0`, the maximum average number of Gemini queries per second, across all the LLM-capable minds, with bursts of at most `config["llm_rate_burst"]` queries.
+      Independently of it, the queries rejected for rate limiting or server errors are retried up to `config["llm_max_retries"]` times, with a jittered exponential backoff starting from `config["llm_retry_base_delay"]` seconds, within `llm_deadline` (or `decide_time_budget`), if any (see `GeminiClient`). It must be `>= 0`. If not provided, `0.0` (no rate limit) will be used.
+
+    - `llm_batching`: whether or not the prompts that the LLM-capable minds issue within `config["llm_batch_window"]` seconds of each other are combined into a single Gemini query (of at most `config["llm_max_batch_size"]` prompts), whose answer maps each `VWActor` ID to its answer. A mind whose answer is missing or malformed sends its prompt on its own (see `GeminiBatcher`). It can only be `True` if `llm_concurrency` is `> 0`. If not provided, `False` will be used.
     '''
     # The use of `Optional` instead of `PyOptional` for the arguments is intentional, so that the user can avoid wrapping the minds in `PyOptional`.
     vw: VacuumWorld = VacuumWorld()
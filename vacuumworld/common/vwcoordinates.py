@@ -13,13 +13,38 @@ class VWCoord():
     This class specifies numerical coordinates.
 
     Each `VWCoord` object is characterised by two integers named `x` and `y`.
+
+    A `VWCoord` is immutable, so the same object can be shared: `of()` returns a shared (interned) `VWCoord` for each pair of coordinates in `[0, INTERNED_DIM)`, and the methods returning a `VWCoord` (e.g., `forward()`) go through it.
     '''
+    __slots__ = ("__x", "__y", "__hash")
+    # This is just a default value that can be programmatically overridden. It bounds the number of interned `VWCoord` objects to `INTERNED_DIM ** 2`.
+    INTERNED_DIM: int = 256
+    __INTERNED: dict[int, VWCoord] = {}
+
     def __init__(self, x: int, y: int) -> None:
         VWValidator.validate_all_not_none(x, y)
         VWValidator.validate_type_for_all(int, x, y)
 
         self.__x: int = x
         self.__y: int = y
+        self.__hash: int = hash((x, y))
+
+    @staticmethod
+    def of(x: int, y: int) -> VWCoord:
+        '''
+        Returns a `VWCoord` with the given `x` and `y` coordinates.
+
+        If both coordinates are in `[0, INTERNED_DIM)`, the same `VWCoord` object is returned every time. Otherwise, a new `VWCoord` is created.
+        '''
+        if 0 <= x < VWCoord.INTERNED_DIM and 0 <= y < VWCoord.INTERNED_DIM:
+            key: int = y * VWCoord.INTERNED_DIM + x
+
+            if key not in VWCoord.__INTERNED:
+                VWCoord.__INTERNED[key] = VWCoord(x=x, y=y)
+
+            return VWCoord.__INTERNED[key]
+        else:
+            return VWCoord(x=x, y=y)
 
     def get_x(self) -> int:
         '''
@@ -46,13 +71,13 @@ class VWCoord():
         assert orientation in [VWOrientation.north, VWOrientation.south, VWOrientation.west, VWOrientation.east]
 
         if orientation == VWOrientation.north:
-            return VWCoord(x=self.__x, y=self.__y - 1)
+            return VWCoord.of(x=self.__x, y=self.__y - 1)
         elif orientation == VWOrientation.south:
-            return VWCoord(x=self.__x, y=self.__y + 1)
+            return VWCoord.of(x=self.__x, y=self.__y + 1)
         elif orientation == VWOrientation.west:
-            return VWCoord(x=self.__x - 1, y=self.__y)
+            return VWCoord.of(x=self.__x - 1, y=self.__y)
         else:
-            return VWCoord(x=self.__x + 1, y=self.__y)
+            return VWCoord.of(x=self.__x + 1, y=self.__y)
 
     def backward(self, orientation: VWOrientation) -> VWCoord:
         '''
@@ -61,13 +86,13 @@ class VWCoord():
         assert orientation in [VWOrientation.north, VWOrientation.south, VWOrientation.west, VWOrientation.east]
 
         if orientation == VWOrientation.north:
-            return VWCoord(x=self.__x, y=self.__y + 1)
+            return VWCoord.of(x=self.__x, y=self.__y + 1)
         elif orientation == VWOrientation.south:
-            return VWCoord(x=self.__x, y=self.__y - 1)
+            return VWCoord.of(x=self.__x, y=self.__y - 1)
         elif orientation == VWOrientation.west:
-            return VWCoord(x=self.__x + 1, y=self.__y)
+            return VWCoord.of(x=self.__x + 1, y=self.__y)
         else:
-            return VWCoord(x=self.__x - 1, y=self.__y)
+            return VWCoord.of(x=self.__x - 1, y=self.__y)
 
     def left(self, orientation: VWOrientation) -> VWCoord:
         '''
@@ -76,13 +101,13 @@ class VWCoord():
         assert orientation in [VWOrientation.north, VWOrientation.south, VWOrientation.west, VWOrientation.east]
 
         if orientation == VWOrientation.north:
-            return VWCoord(x=self.__x - 1, y=self.__y)
+            return VWCoord.of(x=self.__x - 1, y=self.__y)
         elif orientation == VWOrientation.south:
-            return VWCoord(x=self.__x + 1, y=self.__y)
+            return VWCoord.of(x=self.__x + 1, y=self.__y)
         elif orientation == VWOrientation.west:
-            return VWCoord(x=self.__x, y=self.__y + 1)
+            return VWCoord.of(x=self.__x, y=self.__y + 1)
         else:
-            return VWCoord(x=self.__x, y=self.__y - 1)
+            return VWCoord.of(x=self.__x, y=self.__y - 1)
 
     def right(self, orientation: VWOrientation) -> VWCoord:
         '''
@@ -91,13 +116,13 @@ class VWCoord():
         assert orientation in [VWOrientation.north, VWOrientation.south, VWOrientation.west, VWOrientation.east]
 
         if orientation == VWOrientation.north:
-            return VWCoord(x=self.__x + 1, y=self.__y)
+            return VWCoord.of(x=self.__x + 1, y=self.__y)
         elif orientation == VWOrientation.south:
-            return VWCoord(x=self.__x - 1, y=self.__y)
+            return VWCoord.of(x=self.__x - 1, y=self.__y)
         elif orientation == VWOrientation.west:
-            return VWCoord(x=self.__x, y=self.__y - 1)
+            return VWCoord.of(x=self.__x, y=self.__y - 1)
         else:
-            return VWCoord(x=self.__x, y=self.__y + 1)
+            return VWCoord.of(x=self.__x, y=self.__y + 1)
 
     def forwardleft(self, orientation: VWOrientation) -> VWCoord:
         '''
@@ -106,13 +131,13 @@ class VWCoord():
         assert orientation in [VWOrientation.north, VWOrientation.south, VWOrientation.west, VWOrientation.east]
 
         if orientation == VWOrientation.north:
-            return VWCoord(x=self.__x - 1, y=self.__y - 1)
+            return VWCoord.of(x=self.__x - 1, y=self.__y - 1)
         elif orientation == VWOrientation.south:
-            return VWCoord(x=self.__x + 1, y=self.__y + 1)
+            return VWCoord.of(x=self.__x + 1, y=self.__y + 1)
         elif orientation == VWOrientation.west:
-            return VWCoord(x=self.__x - 1, y=self.__y + 1)
+            return VWCoord.of(x=self.__x - 1, y=self.__y + 1)
         else:
-            return VWCoord(x=self.__x + 1, y=self.__y - 1)
+            return VWCoord.of(x=self.__x + 1, y=self.__y - 1)
 
     def forwardright(self, orientation: VWOrientation) -> VWCoord:
         '''
@@ -121,19 +146,21 @@ class VWCoord():
         assert orientation in [VWOrientation.north, VWOrientation.south, VWOrientation.west, VWOrientation.east]
 
         if orientation == VWOrientation.north:
-            return VWCoord(x=self.__x + 1, y=self.__y - 1)
+            return VWCoord.of(x=self.__x + 1, y=self.__y - 1)
         elif orientation == VWOrientation.south:
-            return VWCoord(x=self.__x - 1, y=self.__y + 1)
+            return VWCoord.of(x=self.__x - 1, y=self.__y + 1)
         elif orientation == VWOrientation.west:
-            return VWCoord(x=self.__x - 1, y=self.__y - 1)
+            return VWCoord.of(x=self.__x - 1, y=self.__y - 1)
         else:
-            return VWCoord(x=self.__x + 1, y=self.__y + 1)
+            return VWCoord.of(x=self.__x + 1, y=self.__y + 1)
 
     def clone(self) -> VWCoord:
         '''
         Returns a deep-copy of this `VWCoord`.
+
+        As a `VWCoord` is immutable, the copy is the shared `VWCoord` returned by `of()`.
         '''
-        return VWCoord(x=self.__x, y=self.__y)
+        return VWCoord.of(x=self.__x, y=self.__y)
 
     def to_json(self) -> dict[str, JSONValue]:
         '''
@@ -148,13 +175,13 @@ class VWCoord():
         VWValidator.validate_not_none(other)
 
         if isinstance(other, int):
-            return VWCoord(x=self.__x + other, y=self.__y + other)
+            return VWCoord.of(x=self.__x + other, y=self.__y + other)
         elif isinstance(other, (tuple, list)) and len(other) == 2:
             VWValidator.validate_type_for_all(int, other[0], other[1])
 
-            return VWCoord(x=self.__x + other[0], y=self.__y + other[1])
+            return VWCoord.of(x=self.__x + other[0], y=self.__y + other[1])
         elif isinstance(other, VWCoord):
-            return VWCoord(x=self.__x + other.get_x(), y=self.__y + other.get_y())
+            return VWCoord.of(x=self.__x + other.get_x(), y=self.__y + other.get_y())
         else:
             raise ValueError(f"Unsupported object to add to a `VWCoord`: {other}.")
 
@@ -162,13 +189,13 @@ class VWCoord():
         VWValidator.validate_not_none(other)
 
         if isinstance(other, int):
-            return VWCoord(x=self.__x - other, y=self.__y - other)
+            return VWCoord.of(x=self.__x - other, y=self.__y - other)
         elif isinstance(other, (tuple, list)) and len(other) == 2:
             VWValidator.validate_type_for_all(int, other[0], other[1])
 
-            return VWCoord(x=self.__x - other[0], y=self.__y - other[1])
+            return VWCoord.of(x=self.__x - other[0], y=self.__y - other[1])
         elif isinstance(other, VWCoord):
-            return VWCoord(x=self.__x - other.get_x(), y=self.__y - other.get_y())
+            return VWCoord.of(x=self.__x - other.get_x(), y=self.__y - other.get_y())
         else:
             raise ValueError(f"Unsupported object to subtract from a `VWCoord`: {other}.")
 
@@ -176,13 +203,13 @@ class VWCoord():
         VWValidator.validate_not_none(other)
 
         if isinstance(other, int):
-            return VWCoord(x=self.__x * other, y=self.__y * other)
+            return VWCoord.of(x=self.__x * other, y=self.__y * other)
         elif isinstance(other, (tuple, list)) and len(other) == 2:
             VWValidator.validate_type_for_all(int, other[0], other[1])
 
-            return VWCoord(x=self.__x * other[0], y=self.__y * other[1])
+            return VWCoord.of(x=self.__x * other[0], y=self.__y * other[1])
         elif isinstance(other, VWCoord):
-            return VWCoord(x=self.__x * other.get_x(), y=self.__y * other.get_y())
+            return VWCoord.of(x=self.__x * other.get_x(), y=self.__y * other.get_y())
         else:
             raise ValueError(f"Unsupported object for a multiplication with `VWCoord`: {other}.")
 
@@ -191,13 +218,13 @@ class VWCoord():
         VWValidator.validate_not_none(other)
 
         if isinstance(other, int) and other != 0:
-            return VWCoord(x=self.__x * other, y=self.__y * other)
+            return VWCoord.of(x=self.__x * other, y=self.__y * other)
         elif isinstance(other, (tuple, list)) and len(other) == 2 and other[0] != 0 and other[1] != 0:
             VWValidator.validate_type_for_all(int, other[0], other[1])
 
-            return VWCoord(x=self.__x * other[0], y=self.__y * other[1])
+            return VWCoord.of(x=self.__x * other[0], y=self.__y * other[1])
         elif isinstance(other, VWCoord) and other.get_x() != 0 and other.get_y() != 0:
-            return VWCoord(x=self.__x * other.get_x(), y=self.__y * other.get_y())
+            return VWCoord.of(x=self.__x * other.get_x(), y=self.__y * other.get_y())
         else:
             raise ValueError(f"Unsupported object for a multiplication with `VWCoord`: {other}.")
 
@@ -215,7 +242,7 @@ class VWCoord():
         return self.__x == other.get_x() and self.__y == other.get_y()
 
     def __hash__(self) -> int:
-        return hash((self.__x, self.__y))
+        return self.__hash
 
     def __iter__(self) -> Iterator[int]:
         for i in [self.__x, self.__y]:
@@ -237,4 +264,4 @@ class VWCoord():
         assert min_x <= max_x
         assert min_y <= max_y
 
-        return VWCoord(x=randint(min_x, max_x), y=randint(min_y, max_y))
+        return VWCoord.of(x=randint(min_x, max_x), y=randint(min_y, max_y))
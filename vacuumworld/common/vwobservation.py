@@ -9,7 +9,11 @@ from pystarworldsturbo.common.action_result import ActionResult
 from pystarworldsturbo.utils.json.json_value import JSONValue
 
 from .vwposition_names import VWPositionNames
-from .vworientation import VWOrientation
+from .vwobservation_batch import VWObservationBatch
+from .vwwall import VWWall
+from .vwcolour import VWColour
+from .vwobservation_features import VWObservationFeatures
+from .vwexceptions import VWInternalError
 from ..model.environment.vwlocation import VWLocation
 from ..model.actions.vwactions import VWAction
 
@@ -20,6 +24,11 @@ class VWObservation(Perception):
 
     An `VWObservation` is a wrapper for a 3x2 (or 2x3, or 2x2, or 2x1, or 1x2, or 1x1, depending on the boundaries) slice of a `VWEnvironment` grid, and a `list` of `ActionResult` elements, each related to an attempted `VWAction` by a certain `VWActor` in the last environmental cycle.
     '''
+    __slots__ = ("__locations", "__action_results", "__batch_row", "__features")
+    # These are shared, as a `PyOptional` is immutable.
+    __NO_BATCH_ROW: PyOptional[tuple[VWObservationBatch, int]] = PyOptional[tuple[VWObservationBatch, int]].empty()
+    __NO_FEATURES: PyOptional[VWObservationFeatures] = PyOptional[VWObservationFeatures].empty()
+
     def __init__(self, action_type: Type[VWAction], action_result: ActionResult, locations_dict: dict[VWPositionNames, VWLocation]={}) -> None:
         super(VWObservation, self).__init__()
 
@@ -31,6 +40,41 @@ class VWObservation(Perception):
 
         self.__locations: dict[VWPositionNames, VWLocation] = locations_dict
         self.__action_results: list[tuple[Type[VWAction], ActionResult]] = [(action_type, action_result)]
+        self.__batch_row: PyOptional[tuple[VWObservationBatch, int]] = VWObservation.__NO_BATCH_ROW
+        self.__features: PyOptional[VWObservationFeatures] = VWObservation.__NO_FEATURES
+
+    @staticmethod
+    def from_batch_row(batch: VWObservationBatch, row: int, action_type: Type[VWAction], action_result: ActionResult) -> VWObservation:
+        '''
+        Returns a `VWObservation` that wraps row `row` of `batch`.
+
+        The `VWLocation` objects are only decoded from `batch` (see `VWObservationBatch.decode_row()`) the first time they are accessed.
+        '''
+        observation: VWObservation = VWObservation(action_type=action_type, action_result=action_result)
+
+        observation.__batch_row = PyOptional[tuple[VWObservationBatch, int]].of((batch, row))
+
+        return observation
+
+    def __get_locations(self) -> dict[VWPositionNames, VWLocation]:
+        if self.__batch_row.is_present():
+            batch, row = self.__batch_row.or_else_raise()
+
+            self.__locations = batch.decode_row(row=row)
+            self.__batch_row = VWObservation.__NO_BATCH_ROW
+
+        return self.__locations
+
+    def get_features(self) -> VWObservationFeatures:
+        '''
+        Returns the `VWObservationFeatures` of this `VWObservation`, which are computed the first time they are needed.
+
+        The wall, `VWActor`, and `VWDirt` queries of this `VWObservation` (e.g., `is_wall_immediately_ahead()`, or `is_actor_at()`) are answered from them.
+        '''
+        if self.__features.is_empty():
+            self.__features = PyOptional[VWObservationFeatures].of(VWObservationFeatures(locations=self.__get_locations()))
+
+        return self.__features.or_else_raise()
 
     def get_observer_id(self) -> PyOptional[str]:
         '''
@@ -38,10 +82,7 @@ class VWObservation(Perception):
 
         The observer is assumed to be the `VWActor` whose `VWActorAppearance` is contained by the `VWLocation` at the `VWPositionNames.center` position in this `VWObservation`.
         '''
-        if VWPositionNames.center not in self.__locations or not self.__locations[VWPositionNames.center] or not self.__locations[VWPositionNames.center].has_actor():
-            return PyOptional[str].empty()
-        else:
-            return PyOptional[str].of(self.__locations[VWPositionNames.center].get_actor_appearance().or_else_raise().get_id())
+        return self.get_features().get_observer_id()
 
     def get_latest_actions_results(self) -> list[tuple[Type[VWAction], ActionResult]]:
         '''
@@ -100,23 +141,23 @@ class VWObservation(Perception):
         '''
         Returns whether or not this `VWObservation` is empty, i.e. whether or not it contains any `VWLocation`.
         '''
-        assert self.__locations is not None
+        assert self.__get_locations() is not None
 
-        return len(self.__locations) == 0
+        return len(self.__get_locations()) == 0
 
     def get_locations(self) -> dict[VWPositionNames, VWLocation]:
         '''
-        Returns a `dict` mapping each `VWPositionNames` to the `VWLocation` at that position.
+        Returns a (fresh) `dict` mapping each `VWPositionNames` to the `VWLocation` at that position. Modifying it does not affect this `VWObservation`.
 
         If there is no `VWLocation` at a given position, then the corresponding key is not present in the returned `dict`.
         '''
-        return self.__locations
+        return dict(self.__get_locations())
 
     def get_location_at(self, position_name: VWPositionNames) -> PyOptional[VWLocation]:
         '''
         Returns a `PyOptional` wrapping the `VWLocation` at the given `VWPositionNames`, or an empty `PyOptional` if there is no `VWLocation` at that position.
         '''
-        return PyOptional[VWLocation].of(self.__locations[position_name]) if position_name in self.__locations else PyOptional[VWLocation].empty()
+        return self.get_features().get_location(position_name=position_name)
 
     def get_locations_in_order(self) -> list[PyOptional[VWLocation]]:
         '''
@@ -128,75 +169,113 @@ class VWObservation(Perception):
         * `VWPositionNames.forwardleft`
         * `VWPositionNames.forwardright`
         '''
-        return [PyOptional[VWLocation].of(self.__locations[position]) if position in self.__locations else PyOptional.empty() for position in VWPositionNames.elements_in_order()]
+        return self.get_features().get_locations()
 
     def get_center(self) -> PyOptional[VWLocation]:
         '''
         Returns a `PyOptional` wrapping the `VWLocation` at the center of the `VWActor`'s view, or an empty `PyOptional` if there is no `VWLocation` at that position.
         '''
-        return PyOptional[VWLocation].of(self.__locations[VWPositionNames.center]) if VWPositionNames.center in self.__locations else PyOptional[VWLocation].empty()
+        return self.get_features().get_location(position_name=VWPositionNames.center)
 
     def get_forward(self) -> PyOptional[VWLocation]:
         '''
         Returns a `PyOptional` wrapping the `VWLocation` in front of the `VWActor`, or an empty `PyOptional` if there is no `VWLocation` at that position.
         '''
-        return PyOptional[VWLocation].of(self.__locations[VWPositionNames.forward]) if VWPositionNames.forward in self.__locations else PyOptional[VWLocation].empty()
+        return self.get_features().get_location(position_name=VWPositionNames.forward)
 
     def get_left(self) -> PyOptional[VWLocation]:
         '''
         Returns a `PyOptional` wrapping the `VWLocation` to the left of the `VWActor`, or an empty `PyOptional` if there is no `VWLocation` at that position.
         '''
-        return PyOptional[VWLocation].of(self.__locations[VWPositionNames.left]) if VWPositionNames.left in self.__locations else PyOptional[VWLocation].empty()
+        return self.get_features().get_location(position_name=VWPositionNames.left)
 
     def get_right(self) -> PyOptional[VWLocation]:
         '''
         Returns a `PyOptional` wrapping the `VWLocation` to the right of the `VWActor`, or an empty `PyOptional` if there is no `VWLocation` at that position.
         '''
-        return PyOptional[VWLocation].of(self.__locations[VWPositionNames.right]) if VWPositionNames.right in self.__locations else PyOptional[VWLocation].empty()
+        return self.get_features().get_location(position_name=VWPositionNames.right)
 
     def get_forwardleft(self) -> PyOptional[VWLocation]:
         '''
         Returns a `PyOptional` wrapping the `VWLocation` to the front-left of the `VWActor`, or an empty `PyOptional` if there is no `VWLocation` at that position.
         '''
-        return PyOptional[VWLocation].of(self.__locations[VWPositionNames.forwardleft]) if VWPositionNames.forwardleft in self.__locations else PyOptional[VWLocation].empty()
+        return self.get_features().get_location(position_name=VWPositionNames.forwardleft)
 
     def get_forwardright(self) -> PyOptional[VWLocation]:
         '''
         Returns a `PyOptional` wrapping the `VWLocation` to the front-right of the `VWActor`, or an empty `PyOptional` if there is no `VWLocation` at that position.
         '''
-        return PyOptional[VWLocation].of(self.__locations[VWPositionNames.forwardright]) if VWPositionNames.forwardright in self.__locations else PyOptional[VWLocation].empty()
+        return self.get_features().get_location(position_name=VWPositionNames.forwardright)
+
+    def __get_relative_wall_mask(self, position_name: VWPositionNames) -> int:
+        features: VWObservationFeatures = self.get_features()
+
+        if not features.has_observer():
+            raise VWInternalError("There is no VWActor at the center of this VWObservation.")
+        elif not features.is_location_at(position_name=position_name):
+            raise VWInternalError(f"There is no VWLocation at position {position_name} of this VWObservation.")
+
+        return features.get_relative_wall_mask(position_name=position_name)
+
+    def is_actor_at(self, position_name: VWPositionNames) -> bool:
+        '''
+        Returns whether or not there is a `VWActor` at the given `VWPositionNames`.
+        '''
+        return self.get_features().is_actor_at(position_name=position_name)
+
+    def get_actor_colour_at(self, position_name: VWPositionNames) -> PyOptional[VWColour]:
+        '''
+        Returns a `PyOptional` wrapping the `VWColour` of the `VWActor` at the given `VWPositionNames`, if any. Otherwise, returns an empty `PyOptional`.
+        '''
+        return self.get_features().get_actor_colour_at(position_name=position_name)
+
+    def is_dirt_at(self, position_name: VWPositionNames) -> bool:
+        '''
+        Returns whether or not there is a `VWDirt` at the given `VWPositionNames`.
+        '''
+        return self.get_features().is_dirt_at(position_name=position_name)
+
+    def get_dirt_colour_at(self, position_name: VWPositionNames) -> PyOptional[VWColour]:
+        '''
+        Returns a `PyOptional` wrapping the `VWColour` of the `VWDirt` at the given `VWPositionNames`, if any. Otherwise, returns an empty `PyOptional`.
+        '''
+        return self.get_features().get_dirt_colour_at(position_name=position_name)
+
+    def is_corner_at(self, position_name: VWPositionNames) -> bool:
+        '''
+        Returns whether or not the `VWLocation` at the given `VWPositionNames` exists, and is a corner (see `VWLocation.is_corner()`).
+        '''
+        return self.get_features().is_corner_at(position_name=position_name)
+
+    def is_edge_at(self, position_name: VWPositionNames) -> bool:
+        '''
+        Returns whether or not the `VWLocation` at the given `VWPositionNames` exists, and is an edge (see `VWLocation.is_edge()`).
+        '''
+        return self.get_features().is_edge_at(position_name=position_name)
 
     def is_wall_immediately_ahead(self) -> bool:
         '''
         Returns whether or not there is a wall immediately in front of the `VWActor`.
         '''
-        actor_orientation: VWOrientation = self.get_center().or_else_raise().get_actor_appearance().or_else_raise().get_orientation()
-
-        return self.get_center().or_else_raise().has_wall_on(orientation=actor_orientation)
+        return self.__get_relative_wall_mask(position_name=VWPositionNames.center) & VWWall.AHEAD != 0
 
     def is_wall_immediately_behind(self) -> bool:
         '''
         Returns whether or not there is a wall immediately behind the `VWActor`.
         '''
-        actor_orientation: VWOrientation = self.get_center().or_else_raise().get_actor_appearance().or_else_raise().get_orientation()
-
-        return self.get_center().or_else_raise().has_wall_on(orientation=actor_orientation.get_opposite())
+        return self.__get_relative_wall_mask(position_name=VWPositionNames.center) & VWWall.BEHIND != 0
 
     def is_wall_immediately_to_the_left(self) -> bool:
         '''
         Returns whether or not there is a wall immediately to the left of the `VWActor`.
         '''
-        actor_orientation: VWOrientation = self.get_center().or_else_raise().get_actor_appearance().or_else_raise().get_orientation()
-
-        return self.get_center().or_else_raise().has_wall_on(orientation=actor_orientation.get_left())
+        return self.__get_relative_wall_mask(position_name=VWPositionNames.center) & VWWall.LEFT != 0
 
     def is_wall_immediately_to_the_right(self) -> bool:
         '''
         Returns whether or not there is a wall immediately to the right of the `VWActor`.
         '''
-        actor_orientation: VWOrientation = self.get_center().or_else_raise().get_actor_appearance().or_else_raise().get_orientation()
-
-        return self.get_center().or_else_raise().has_wall_on(orientation=actor_orientation.get_right())
+        return self.__get_relative_wall_mask(position_name=VWPositionNames.center) & VWWall.RIGHT != 0
 
     def is_wall_one_step_ahead(self) -> bool:
         '''
@@ -207,11 +286,7 @@ class VWObservation(Perception):
         if self.is_wall_immediately_ahead():
             return False
 
-        assert self.get_forward().is_present()
-
-        actor_orientation: VWOrientation = self.get_center().or_else_raise().get_actor_appearance().or_else_raise().get_orientation()
-
-        return self.get_forward().or_else_raise().has_wall_on(orientation=actor_orientation)
+        return self.__get_relative_wall_mask(position_name=VWPositionNames.forward) & VWWall.AHEAD != 0
 
     def is_wall_one_step_to_the_left(self) -> bool:
         '''
@@ -222,11 +297,7 @@ class VWObservation(Perception):
         if self.is_wall_immediately_to_the_left():
             return False
 
-        assert self.get_left().is_present()
-
-        actor_orientation: VWOrientation = self.get_center().or_else_raise().get_actor_appearance().or_else_raise().get_orientation()
-
-        return self.get_left().or_else_raise().has_wall_on(orientation=actor_orientation.get_left())
+        return self.__get_relative_wall_mask(position_name=VWPositionNames.left) & VWWall.LEFT != 0
 
     def is_wall_one_step_to_the_right(self) -> bool:
         '''
@@ -237,11 +308,7 @@ class VWObservation(Perception):
         if self.is_wall_immediately_to_the_right():
             return False
 
-        assert self.get_right().is_present()
-
-        actor_orientation: VWOrientation = self.get_center().or_else_raise().get_actor_appearance().or_else_raise().get_orientation()
-
-        return self.get_right().or_else_raise().has_wall_on(orientation=actor_orientation.get_right())
+        return self.__get_relative_wall_mask(position_name=VWPositionNames.right) & VWWall.RIGHT != 0
 
     def is_wall_visible_somewhere_ahead(self) -> bool:
         '''
@@ -301,14 +368,14 @@ class VWObservation(Perception):
             return self.is_wall_one_step_to_the_right()
 
     def __iter__(self) -> Iterator[VWLocation]:
-        for location in self.__locations.values():
+        for location in self.__get_locations().values():
             yield location
 
     def __str__(self) -> str:
         return f"Actions outcomes: [{self.__format_latest_action_results()}]. Perceived locations: {self.__format_perceived_locations()}"
 
     def __format_perceived_locations(self) -> list[str]:
-        return [f"{pos.name}: {loc}" for pos, loc in self.__locations.items()]
+        return [f"{pos.name}: {loc}" for pos, loc in self.__get_locations().items()]
 
     def to_json(self) -> dict[str, JSONValue]:
         '''
@@ -317,7 +384,7 @@ class VWObservation(Perception):
         return {
             # The `.name` is necessary because `ActionOutcome` is an `Enum` and `Enum` objects are not JSON serialisable.
             "Action outcomes": [{action_type.__name__: action_result.get_outcome().name} for action_type, action_result in self.__action_results],
-            "Perceived locations": {pos.name: loc.pretty_format() for pos, loc in self.__locations.items() if loc}
+            "Perceived locations": {pos.name: loc.pretty_format() for pos, loc in self.__get_locations().items() if loc}
         }
 
     def pretty_format(self) -> str:
@@ -0,0 +1,139 @@
+from __future__ import annotations
+from typing import Mapping
+from pyoptional.pyoptional import PyOptional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .vwcoordinates import VWCoord
+from .vwcolour import VWColour
+from .vworientation import VWOrientation
+from .vwposition_names import VWPositionNames
+from .vwwall import VWWall
+from ..model.environment.vwlocation import VWLocation
+from ..model.actor.appearance.vwactor_appearance import VWActorAppearance
+from ..model.dirt.vwdirt_appearance import VWDirtAppearance
+
+
+class VWObservationBatch():
+    '''
+    This class wraps the observations of every `VWActor` of a `VWEnvironment`, computed in a single pass, as an `int32` tensor of shape `(actors, 6, features)`.
+
+    Row `i` of the tensor is the neighbourhood of the `VWActor` whose ID is `get_actor_ids()[i]`. The neighbourhood positions follow `VWPositionNames.elements_in_order()`, and the features of each position are (in order):
+
+    * `PRESENT`: `1` if the position is in bounds, `0` otherwise. All the other features of an out-of-bounds position are `-1`.
+
+    * `X`, `Y`: the coordinates of the position.
+
+    * `WALLS`: the wall bitmask of the position, with bit `i` set if there is a wall on the side identified by `ORIENTATIONS[i]`.
+
+    * `ACTOR`: the row of the `VWActor` at the position (`-1` if there is none).
+
+    * `ACTOR_COLOUR`, `ACTOR_ORIENTATION`: the `COLOURS` and `ORIENTATIONS` codes of the `VWActor` at the position (`-1` if there is none).
+
+    * `DIRT`: the index of the `VWDirtAppearance` at the position in the appearances held by this `VWObservationBatch` (`-1` if there is none).
+
+    * `DIRT_COLOUR`: the `COLOURS` code of the `VWDirt` at the position (`-1` if there is none).
+
+    The appearances are copied when the `VWObservationBatch` is created, so `decode_row()` reflects the grid at that time.
+    '''
+    NO_VALUE: int = -1
+    PRESENT: int = 0
+    X: int = 1
+    Y: int = 2
+    WALLS: int = 3
+    ACTOR: int = 4
+    ACTOR_COLOUR: int = 5
+    ACTOR_ORIENTATION: int = 6
+    DIRT: int = 7
+    DIRT_COLOUR: int = 8
+    NUMBER_OF_FEATURES: int = 9
+    POSITIONS: list[VWPositionNames] = VWPositionNames.elements_in_order()
+    ORIENTATIONS: list[VWOrientation] = list(VWOrientation)
+    COLOURS: list[VWColour] = list(VWColour)
+    ORIENTATION_CODES: dict[VWOrientation, int] = {orientation: code for code, orientation in enumerate(ORIENTATIONS)}
+    COLOUR_CODES: dict[VWColour, int] = {colour: code for code, colour in enumerate(COLOURS)}
+    # Every possible wall pattern, indexed by wall bitmask. These are shared, hence read-only.
+    WALL_PATTERNS: list[Mapping[VWOrientation, bool]] = VWWall.PATTERNS
+
+    def __init__(self, actor_ids: list[str], tensor: NDArray[np.int32], actor_appearances: list[VWActorAppearance], dirt_appearances: list[VWDirtAppearance]) -> None:
+        assert tensor.shape == (len(actor_ids), len(VWObservationBatch.POSITIONS), VWObservationBatch.NUMBER_OF_FEATURES)
+        assert len(actor_appearances) == len(actor_ids)
+
+        self.__actor_ids: list[str] = actor_ids
+        self.__rows: dict[str, int] = {actor_id: row for row, actor_id in enumerate(actor_ids)}
+        self.__tensor: NDArray[np.int32] = tensor
+        self.__actor_appearances: list[VWActorAppearance] = actor_appearances
+        self.__dirt_appearances: list[VWDirtAppearance] = dirt_appearances
+
+    def get_actor_ids(self) -> list[str]:
+        '''
+        Returns the `list[str]` of the IDs of the `VWActor` objects, in row order.
+        '''
+        return self.__actor_ids
+
+    def get_row_of_actor(self, actor_id: str) -> int:
+        '''
+        Returns the row of the `VWActor` whose ID is `actor_id`.
+
+        This method assumes (via assertion) that such `VWActor` is in this `VWObservationBatch`.
+        '''
+        assert actor_id in self.__rows
+
+        return self.__rows[actor_id]
+
+    def get_tensor(self) -> NDArray[np.int32]:
+        '''
+        Returns the `(actors, 6, features)` tensor.
+
+        The returned array must not be modified.
+        '''
+        return self.__tensor
+
+    def decode_row(self, row: int) -> dict[VWPositionNames, VWLocation]:
+        '''
+        Returns a `dict` mapping each in-bounds `VWPositionNames` of row `row` to the corresponding `VWLocation`.
+        '''
+        locations: dict[VWPositionNames, VWLocation] = {}
+
+        for position, features in zip(VWObservationBatch.POSITIONS, self.__tensor[row].tolist()):
+            if features[VWObservationBatch.PRESENT]:
+                actor_appearance: PyOptional[VWActorAppearance] = PyOptional[VWActorAppearance].of(self.__actor_appearances[features[VWObservationBatch.ACTOR]]) if features[VWObservationBatch.ACTOR] != VWObservationBatch.NO_VALUE else PyOptional[VWActorAppearance].empty()
+                dirt_appearance: PyOptional[VWDirtAppearance] = PyOptional[VWDirtAppearance].of(self.__dirt_appearances[features[VWObservationBatch.DIRT]]) if features[VWObservationBatch.DIRT] != VWObservationBatch.NO_VALUE else PyOptional[VWDirtAppearance].empty()
+                wall: Mapping[VWOrientation, bool] = VWObservationBatch.WALL_PATTERNS[features[VWObservationBatch.WALLS]]
+
+                locations[position] = VWLocation(coord=VWCoord.of(x=features[VWObservationBatch.X], y=features[VWObservationBatch.Y]), actor_appearance=actor_appearance, dirt_appearance=dirt_appearance, wall=wall)
+
+        return locations
+
+    @staticmethod
+    def get_wall_bit(orientation: VWOrientation) -> int:
+        '''
+        Returns the bit of the wall bitmask which corresponds to the side identified by `orientation`.
+        '''
+        return VWWall.get_bit(orientation=orientation)
+
+    @staticmethod
+    def wall_to_mask(wall: dict[VWOrientation, bool]) -> int:
+        '''
+        Returns the wall bitmask which corresponds to the `wall` `dict`.
+        '''
+        return VWWall.to_mask(wall=wall)
+
+    @staticmethod
+    def get_neighbourhood(coord: VWCoord, orientation: VWOrientation) -> list[VWCoord]:
+        '''
+        Returns the `list[VWCoord]` observed by a `VWActor` at `coord` facing `orientation`, following the order of `POSITIONS`.
+
+        Some of the returned `VWCoord` objects may be out of bounds.
+        '''
+        return [coord, coord.forward(orientation=orientation), coord.left(orientation=orientation), coord.right(orientation=orientation), coord.forwardleft(orientation=orientation), coord.forwardright(orientation=orientation)]
+
+    @staticmethod
+    def get_neighbourhood_offsets() -> NDArray[np.int64]:
+        '''
+        Returns an array of shape `(orientations, 6, 2)` containing the `(x, y)` offset of each position of the neighbourhood, for each `ORIENTATIONS` code.
+        '''
+        origin: VWCoord = VWCoord.of(x=0, y=0)
+
+        return np.array([[[c.get_x(), c.get_y()] for c in VWObservationBatch.get_neighbourhood(coord=origin, orientation=orientation)] for orientation in VWObservationBatch.ORIENTATIONS], dtype=np.int64)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+from pyoptional.pyoptional import PyOptional
+
+from .vwcolour import VWColour
+from .vworientation import VWOrientation
+from .vwposition_names import VWPositionNames
+from .vwwall import VWWall
+from ..model.environment.vwlocation import VWLocation
+from ..model.actor.appearance.vwactor_appearance import VWActorAppearance
+
+
+class VWObservationFeatures():
+    '''
+    This class is a compact record of the features of the `VWLocation` objects of a `VWObservation`, computed once, so that the queries on the `VWObservation` do not walk its `VWLocation` objects again.
+
+    For each `VWPositionNames` (in the order of `VWPositionNames.elements_in_order()`), the record holds:
+
+    * A `PyOptional` wrapping the `VWLocation` at that position, if any.
+
+    * The `VWWall` mask of the `VWLocation` w.r.t. the `VWOrientation` of the observer (see `VWWall.to_relative()`).
+
+    * The `VWColour` of the `VWActor` and of the `VWDirt` at that position, if any.
+
+    * Whether or not the `VWLocation` is a corner, or an edge.
+
+    The observer is the `VWActor` at the `VWPositionNames.center` position, if any.
+
+    The `VWLocation` objects are assumed not to change after the record is computed, which is the case for the `VWLocation` objects of the `VWObservation` objects generated by a `VWEnvironment`.
+    '''
+    __slots__ = ("__locations", "__optional_locations", "__observer_id", "__relative_walls", "__present", "__actor_colours", "__dirt_colours", "__corners", "__edges")
+    POSITIONS: list[VWPositionNames] = VWPositionNames.elements_in_order()
+    __INDICES: dict[VWPositionNames, int] = {position: index for index, position in enumerate(POSITIONS)}
+    # These are shared, as a `PyOptional` is immutable.
+    __NO_LOCATION: PyOptional[VWLocation] = PyOptional[VWLocation].empty()
+    __NO_OBSERVER: PyOptional[VWActorAppearance] = PyOptional[VWActorAppearance].empty()
+    __NO_OBSERVER_ID: PyOptional[str] = PyOptional[str].empty()
+    __NO_COLOUR: PyOptional[VWColour] = PyOptional[VWColour].empty()
+
+    def __init__(self, locations: dict[VWPositionNames, VWLocation]) -> None:
+        center: PyOptional[VWActorAppearance] = locations[VWPositionNames.center].get_actor_appearance() if VWPositionNames.center in locations else VWObservationFeatures.__NO_OBSERVER
+        # Without an observer, the masks are not rotated, which is what a `VWActor` facing north would see.
+        orientation: VWOrientation = center.or_else_raise().get_orientation() if center.is_present() else VWOrientation.north
+        relative: list[int] = VWWall.get_relative_masks(orientation=orientation)
+        relative_walls: list[int] = [VWWall.NO_WALL] * len(VWObservationFeatures.POSITIONS)
+
+        # The flags are bitmasks with one bit per position, and only the positions with a `VWActor` (or a `VWDirt`) are keys of the colour `dict` objects, so that no `PyOptional` is created until one is asked for.
+        self.__locations: dict[VWPositionNames, VWLocation] = locations
+        self.__optional_locations: list[PyOptional[VWLocation]] = [VWObservationFeatures.__NO_LOCATION] * len(VWObservationFeatures.POSITIONS)
+        self.__observer_id: PyOptional[str] = PyOptional[str].of(center.or_else_raise().get_id()) if center.is_present() else VWObservationFeatures.__NO_OBSERVER_ID
+        self.__present: int = 0
+        self.__actor_colours: dict[VWPositionNames, VWColour] = {}
+        self.__dirt_colours: dict[VWPositionNames, VWColour] = {}
+        self.__corners: int = 0
+        self.__edges: int = 0
+
+        for position, location in locations.items():
+            index: int = VWObservationFeatures.__INDICES[position]
+            mask: int = location.get_wall_mask()
+
+            relative_walls[index] = relative[mask]
+
+            self.__present |= 1 << index
+            self.__corners |= VWWall.is_corner(mask=mask) << index
+            self.__edges |= VWWall.is_edge(mask=mask) << index
+
+            if location.has_actor():
+                self.__actor_colours[position] = location.get_actor_appearance().or_else_raise().get_colour()
+
+            if location.has_dirt():
+                self.__dirt_colours[position] = location.get_dirt_appearance().or_else_raise().get_colour()
+
+        self.__relative_walls: tuple[int, ...] = tuple(relative_walls)
+
+    def get_locations(self) -> list[PyOptional[VWLocation]]:
+        '''
+        Returns a `list` of `PyOptional` objects wrapping the `VWLocation` at each position, in the order of `POSITIONS`.
+        '''
+        return [self.get_location(position_name=position) for position in VWObservationFeatures.POSITIONS]
+
+    def get_location(self, position_name: VWPositionNames) -> PyOptional[VWLocation]:
+        '''
+        Returns a `PyOptional` wrapping the `VWLocation` at `position_name`, if any. Otherwise, returns an empty `PyOptional`.
+
+        The same `PyOptional` is returned every time.
+        '''
+        index: int = VWObservationFeatures.__INDICES[position_name]
+        location: PyOptional[VWLocation] = self.__optional_locations[index]
+
+        if location.is_empty() and self.__present & (1 << index):
+            location = self.__optional_locations[index] = PyOptional[VWLocation].of(self.__locations[position_name])
+
+        return location
+
+    def is_location_at(self, position_name: VWPositionNames) -> bool:
+        '''
+        Returns whether or not there is a `VWLocation` at `position_name`.
+        '''
+        return self.__present & (1 << VWObservationFeatures.__INDICES[position_name]) != 0
+
+    def get_observer_id(self) -> PyOptional[str]:
+        '''
+        Returns a `PyOptional` wrapping the ID of the `VWActor` at the `VWPositionNames.center` position, if any. Otherwise, returns an empty `PyOptional`.
+        '''
+        return self.__observer_id
+
+    def has_observer(self) -> bool:
+        '''
+        Returns whether or not there is a `VWActor` at the `VWPositionNames.center` position.
+        '''
+        return self.__observer_id.is_present()
+
+    def get_relative_wall_mask(self, position_name: VWPositionNames) -> int:
+        '''
+        Returns the `VWWall` mask of the `VWLocation` at `position_name` w.r.t. the `VWOrientation` of the observer, or `VWWall.NO_WALL` if there is no `VWLocation` at `position_name`.
+
+        If there is no observer, the mask is not rotated.
+        '''
+        return self.__relative_walls[VWObservationFeatures.__INDICES[position_name]]
+
+    def is_actor_at(self, position_name: VWPositionNames) -> bool:
+        '''
+        Returns whether or not there is a `VWActor` at `position_name`.
+        '''
+        return position_name in self.__actor_colours
+
+    def get_actor_colour_at(self, position_name: VWPositionNames) -> PyOptional[VWColour]:
+        '''
+        Returns a `PyOptional` wrapping the `VWColour` of the `VWActor` at `position_name`, if any. Otherwise, returns an empty `PyOptional`.
+        '''
+        return PyOptional[VWColour].of(self.__actor_colours[position_name]) if position_name in self.__actor_colours else VWObservationFeatures.__NO_COLOUR
+
+    def is_dirt_at(self, position_name: VWPositionNames) -> bool:
+        '''
+        Returns whether or not there is a `VWDirt` at `position_name`.
+        '''
+        return position_name in self.__dirt_colours
+
+    def get_dirt_colour_at(self, position_name: VWPositionNames) -> PyOptional[VWColour]:
+        '''
+        Returns a `PyOptional` wrapping the `VWColour` of the `VWDirt` at `position_name`, if any. Otherwise, returns an empty `PyOptional`.
+        '''
+        return PyOptional[VWColour].of(self.__dirt_colours[position_name]) if position_name in self.__dirt_colours else VWObservationFeatures.__NO_COLOUR
+
+    def is_corner_at(self, position_name: VWPositionNames) -> bool:
+        '''
+        Returns whether or not the `VWLocation` at `position_name` exists, and is a corner (see `VWLocation.is_corner()`).
+        '''
+        return self.__corners & (1 << VWObservationFeatures.__INDICES[position_name]) != 0
+
+    def is_edge_at(self, position_name: VWPositionNames) -> bool:
+        '''
+        Returns whether or not the `VWLocation` at `position_name` exists, and is an edge (see `VWLocation.is_edge()`).
+        '''
+        return self.__edges & (1 << VWObservationFeatures.__INDICES[position_name]) != 0
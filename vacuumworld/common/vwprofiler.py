@@ -0,0 +1,183 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from json import dump
+from time import perf_counter
+
+from pystarworldsturbo.common.action import Action
+from pystarworldsturbo.common.action_outcome import ActionOutcome
+from pystarworldsturbo.common.action_result import ActionResult
+from pystarworldsturbo.environment.physics.action_executor import ActionExecutor
+from pystarworldsturbo.utils.json.json_value import JSONValue
+
+if TYPE_CHECKING:
+    from pystarworldsturbo.environment.environment import Environment
+
+
+class VWHistogram():
+    '''
+    This class is a histogram of durations, with logarithmic buckets: bucket `i` counts the durations `d` such that `2 ** (i - 1) <= d` (in nanoseconds) `< 2 ** i`.
+
+    Adding a duration takes constant time, and the memory needed does not depend on the number of durations.
+    '''
+    NUMBER_OF_BUCKETS: int = 64
+
+    def __init__(self) -> None:
+        self.__count: int = 0
+        self.__total: float = 0.0
+        self.__min: float = float("inf")
+        self.__max: float = 0.0
+        self.__buckets: list[int] = [0] * VWHistogram.NUMBER_OF_BUCKETS
+
+    def add(self, seconds: float) -> None:
+        '''
+        Adds a duration of `seconds` to this `VWHistogram`.
+        '''
+        self.__count += 1
+        self.__total += seconds
+
+        if seconds < self.__min:
+            self.__min = seconds
+
+        if seconds > self.__max:
+            self.__max = seconds
+
+        self.__buckets[min(int(seconds * 1e9).bit_length(), VWHistogram.NUMBER_OF_BUCKETS - 1)] += 1
+
+    def get_count(self) -> int:
+        '''
+        Returns the number of durations added to this `VWHistogram`.
+        '''
+        return self.__count
+
+    def get_total(self) -> float:
+        '''
+        Returns the sum (in seconds) of the durations added to this `VWHistogram`.
+        '''
+        return self.__total
+
+    def get_percentile(self, percentile: float) -> float:
+        '''
+        Returns an upper bound (in seconds) of the `percentile`-th percentile of the durations added to this `VWHistogram`, i.e., the upper bound of the bucket it falls in.
+
+        This method assumes (via assertion) that `0 <= percentile <= 100`.
+        '''
+        assert 0 <= percentile <= 100
+
+        threshold: float = self.__count * percentile / 100
+        cumulative: int = 0
+
+        for i, bucket in enumerate(self.__buckets):
+            cumulative += bucket
+
+            if cumulative >= threshold and cumulative > 0:
+                return min((1 << i) / 1e9, self.__max)
+
+        return self.__max
+
+    def to_json(self) -> dict[str, JSONValue]:
+        '''
+        Returns the JSON representation of this `VWHistogram`, with the non-empty buckets keyed by their upper bound in nanoseconds.
+        '''
+        return {
+            "count": self.__count,
+            "total": self.__total,
+            "mean": self.__total / self.__count if self.__count > 0 else 0.0,
+            "min": self.__min if self.__count > 0 else 0.0,
+            "max": self.__max,
+            "p50": self.get_percentile(percentile=50),
+            "p90": self.get_percentile(percentile=90),
+            "p99": self.get_percentile(percentile=99),
+            "buckets": {str(1 << i): bucket for i, bucket in enumerate(self.__buckets) if bucket > 0}
+        }
+
+
+class VWProfiler():
+    '''
+    This class collects the wall time of the phases of each cycle into `VWHistogram` objects, keyed by a `/`-separated name:
+
+    * `actor/<phase>/<actor_id>` and `mind/<phase>/<surrogate_class_name>`, for the `perceive`, `decide`, and `execute` phases of `VWActor.cycle()`. `revise()` is timed as part of `decide`, as both are called by `VWMind.revise_and_decide()`.
+
+    * `environment/validation`, for the validation of the `VWAction` objects attempted by each `VWActor`.
+
+    * `executor/<executor_class_name>/<step>`, for the `is_possible`, `attempt`, and `succeeded` steps of each `ActionExecutor`.
+
+    * `environment/perception`, for the generation and delivery of each `VWObservation`.
+
+    The profiler is disabled by default, in which case the only overhead is a check of `ENABLED` per `VWActor` cycle and per `VWAction`.
+    '''
+    # This is just a default value that is programmatically overridden.
+    ENABLED: bool = False
+    __HISTOGRAMS: dict[str, VWHistogram] = {}
+
+    @staticmethod
+    def record(key: str, seconds: float) -> None:
+        '''
+        Adds a duration of `seconds` to the `VWHistogram` of `key`.
+        '''
+        if key not in VWProfiler.__HISTOGRAMS:
+            VWProfiler.__HISTOGRAMS[key] = VWHistogram()
+
+        VWProfiler.__HISTOGRAMS[key].add(seconds=seconds)
+
+    @staticmethod
+    def get_histograms() -> dict[str, VWHistogram]:
+        '''
+        Returns a copy of the `dict` mapping each key to its `VWHistogram`.
+        '''
+        return dict(VWProfiler.__HISTOGRAMS)
+
+    @staticmethod
+    def reset() -> None:
+        '''
+        Discards every `VWHistogram`.
+        '''
+        VWProfiler.__HISTOGRAMS.clear()
+
+    @staticmethod
+    def to_json() -> dict[str, JSONValue]:
+        '''
+        Returns the JSON representation of every `VWHistogram`, sorted by key.
+        '''
+        return {key: VWProfiler.__HISTOGRAMS[key].to_json() for key in sorted(VWProfiler.__HISTOGRAMS)}
+
+    @staticmethod
+    def export(path: str) -> None:
+        '''
+        Writes the JSON representation of every `VWHistogram` to the file at `path`.
+        '''
+        with open(path, "w") as f:
+            dump(VWProfiler.to_json(), f, indent=4)
+
+    @staticmethod
+    def execute_with_profiler(executor: ActionExecutor, env: Environment, action: Action) -> ActionResult:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWProfiler` API.
+
+        Behaves like `executor.execute(env=env, action=action)`, but it also times the `is_possible`, `attempt`, and `succeeded` steps.
+        '''
+        key: str = f"executor/{type(executor).__name__}/"
+        start: float = perf_counter()
+        possible: bool = executor.is_possible(env=env, action=action)
+
+        VWProfiler.record(key=key + "is_possible", seconds=perf_counter() - start)
+
+        if not possible:
+            return ActionResult(ActionOutcome.impossible)
+
+        start = perf_counter()
+        result: ActionResult = executor.attempt(env=env, action=action)
+
+        VWProfiler.record(key=key + "attempt", seconds=perf_counter() - start)
+
+        assert result.get_outcome() in [ActionOutcome.success, ActionOutcome.failure]
+
+        if result.get_outcome() == ActionOutcome.success:
+            start = perf_counter()
+            succeeded: bool = executor.succeeded(env=env, action=action)
+
+            VWProfiler.record(key=key + "succeeded", seconds=perf_counter() - start)
+
+            if not succeeded:
+                result.amend_outcome(new_outcome=ActionOutcome.failure)
+
+        return result
@@ -0,0 +1,83 @@
+from __future__ import annotations
+from typing import Mapping
+from types import MappingProxyType
+
+from .vworientation import VWOrientation
+
+
+class VWWall():
+    '''
+    This class specifies the encoding of the walls of a `VWLocation` as a 4-bit mask, with bit `i` set if there is a wall on the side identified by `ORIENTATIONS[i]`.
+
+    There are only 16 wall masks, hence the wall pattern of each mask (see `to_pattern()`), and the answers to the wall predicates (e.g., `is_corner()`), are computed once and shared. The wall patterns are read-only mappings, so sharing them is safe.
+
+    A wall mask can also be expressed w.r.t. the `VWOrientation` of a `VWActor` (see `to_relative()`). In such a mask, `AHEAD`, `BEHIND`, `LEFT`, and `RIGHT` are the bits of the sides in front of, behind, to the left of, and to the right of the `VWActor`.
+    '''
+    ORIENTATIONS: list[VWOrientation] = list(VWOrientation)
+    BITS: dict[VWOrientation, int] = {orientation: 1 << code for code, orientation in enumerate(ORIENTATIONS)}
+    NORTH: int = BITS[VWOrientation.north]
+    SOUTH: int = BITS[VWOrientation.south]
+    WEST: int = BITS[VWOrientation.west]
+    EAST: int = BITS[VWOrientation.east]
+    NO_WALL: int = 0
+    NUMBER_OF_MASKS: int = 1 << len(ORIENTATIONS)
+    # A relative wall mask is the wall mask of a `VWActor` facing north.
+    AHEAD: int = NORTH
+    BEHIND: int = SOUTH
+    LEFT: int = WEST
+    RIGHT: int = EAST
+    # Every possible wall pattern, indexed by wall mask. These are shared, hence read-only.
+    PATTERNS: list[Mapping[VWOrientation, bool]] = [MappingProxyType({orientation: bool(mask & (1 << code)) for code, orientation in enumerate(VWOrientation)}) for mask in range(NUMBER_OF_MASKS)]
+    __CORNERS: list[bool] = [any(pattern[o] and (pattern[o.get_left()] or pattern[o.get_right()]) for o in VWOrientation) for pattern in PATTERNS]
+    __EDGES: list[bool] = [sum(pattern.values()) == 1 for pattern in PATTERNS]
+    # The sides ahead, behind, to the left, and to the right of a `VWActor` take the bits of north, south, west, and east (i.e., of the first four `ORIENTATIONS`).
+    __RELATIVE: dict[VWOrientation, list[int]] = dict(zip(ORIENTATIONS, map(list, zip(*[[sum(1 << code for code, side in enumerate((orientation, orientation.get_opposite(), orientation.get_left(), orientation.get_right())) if pattern[side]) for orientation in VWOrientation] for pattern in PATTERNS]))))
+
+    @staticmethod
+    def get_bit(orientation: VWOrientation) -> int:
+        '''
+        Returns the bit of the wall mask which corresponds to the side identified by `orientation`.
+        '''
+        return VWWall.BITS[orientation]
+
+    @staticmethod
+    def to_mask(wall: Mapping[VWOrientation, bool]) -> int:
+        '''
+        Returns the wall mask which corresponds to the `wall` mapping. The missing `VWOrientation` keys count as no wall.
+        '''
+        return (VWWall.NORTH if wall.get(VWOrientation.north, False) else 0) | (VWWall.SOUTH if wall.get(VWOrientation.south, False) else 0) | (VWWall.WEST if wall.get(VWOrientation.west, False) else 0) | (VWWall.EAST if wall.get(VWOrientation.east, False) else 0)
+
+    @staticmethod
+    def to_pattern(mask: int) -> Mapping[VWOrientation, bool]:
+        '''
+        Returns the (shared, hence read-only) wall mapping which corresponds to `mask`.
+        '''
+        return VWWall.PATTERNS[mask]
+
+    @staticmethod
+    def to_relative(mask: int, orientation: VWOrientation) -> int:
+        '''
+        Returns `mask` expressed w.r.t. a `VWActor` facing `orientation`, i.e., with the `AHEAD`, `BEHIND`, `LEFT`, and `RIGHT` bits set if there is a wall on the corresponding side.
+        '''
+        return VWWall.__RELATIVE[orientation][mask]
+
+    @staticmethod
+    def get_relative_masks(orientation: VWOrientation) -> list[int]:
+        '''
+        Returns the (shared, hence not to be modified) `list` mapping each mask to the same mask expressed w.r.t. a `VWActor` facing `orientation` (see `to_relative()`).
+        '''
+        return VWWall.__RELATIVE[orientation]
+
+    @staticmethod
+    def is_corner(mask: int) -> bool:
+        '''
+        Returns whether or not `mask` has a wall on at least two consecutive sides.
+        '''
+        return VWWall.__CORNERS[mask]
+
+    @staticmethod
+    def is_edge(mask: int) -> bool:
+        '''
+        Returns whether or not `mask` has a wall on exactly one side.
+        '''
+        return VWWall.__EDGES[mask]
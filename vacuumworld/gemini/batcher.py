@@ -0,0 +1,199 @@
+from __future__ import annotations
+from typing import Any
+from json import dumps, loads
+from threading import Condition, Event
+from time import monotonic
+from pyoptional.pyoptional import PyOptional
+from google.genai.types import Candidate, Content, GenerateContentResponse, Part
+
+from .client import GeminiClient
+from .dispatcher import GeminiDispatcher
+
+
+class GeminiBatch():
+    '''
+    This class collects the prompts sent to the same `GeminiClient` within a batching window, and the answers to them.
+    '''
+    # This is just a default value that can be programmatically overridden. It bounds the time a thread waits for the answer to its prompt.
+    ANSWER_TIMEOUT: float = 60.0
+
+    def __init__(self, context: str, deadline: float) -> None:
+        self.__context: str = context
+        self.__deadline: float = deadline
+        self.__prompts: dict[str, str] = {}
+        self.__answers: dict[str, PyOptional[GenerateContentResponse]] = {}
+        self.__closed: bool = False
+        self.__sending: bool = False
+        self.__answered: Event = Event()
+
+    def get_deadline(self) -> float:
+        '''
+        Returns the `time.monotonic()` time at which this `GeminiBatch` is sent, unless it is filled earlier.
+        '''
+        return self.__deadline
+
+    def get_size(self) -> int:
+        '''
+        Returns the number of prompts in this `GeminiBatch`.
+        '''
+        return len(self.__prompts)
+
+    def has_prompt_from(self, actor_id: str) -> bool:
+        '''
+        Returns whether or not this `GeminiBatch` contains a prompt of the `VWActor` whose ID is `actor_id`.
+        '''
+        return actor_id in self.__prompts
+
+    def add_prompt(self, actor_id: str, prompt: str) -> None:
+        '''
+        Adds the `prompt` of the `VWActor` whose ID is `actor_id` to this `GeminiBatch`.
+        '''
+        self.__prompts[actor_id] = prompt
+
+    def is_closed(self) -> bool:
+        '''
+        Returns whether or not this `GeminiBatch` accepts no more prompts.
+        '''
+        return self.__closed
+
+    def close(self) -> None:
+        '''
+        Makes this `GeminiBatch` accept no more prompts.
+        '''
+        self.__closed = True
+
+    def claim_sending(self) -> bool:
+        '''
+        Returns `True` the first time it is called, and `False` afterwards, so that exactly one thread sends this `GeminiBatch`.
+        '''
+        claimed: bool = not self.__sending
+        self.__sending = True
+
+        return claimed
+
+    def to_prompt(self) -> str:
+        '''
+        Returns the combined prompt of this `GeminiBatch`: the shared context (if any), the instructions on the format of the answer, and the prompt of each `VWActor`.
+        '''
+        sections: list[str] = [self.__context] if self.__context else []
+
+        sections.append(f"Answer the prompt of each of the following {len(self.__prompts)} agents independently. Reply with a JSON object mapping each agent ID to the answer to its prompt (a string), and nothing else.")
+        sections.extend(f"## Agent {actor_id}\n{prompt}" for actor_id, prompt in self.__prompts.items())
+
+        return "\n\n".join(sections)
+
+    def answer(self, response: PyOptional[GenerateContentResponse]) -> None:
+        '''
+        Splits `response` (if any) into the answers to the prompts of this `GeminiBatch`, and wakes up the threads waiting for them.
+
+        The answer to a prompt is missing if `response` is missing, is not a JSON object, or does not map the ID of the `VWActor` to a non-empty value. The waiting threads are woken up even if `response` cannot be split.
+        '''
+        try:
+            answers: dict[str, Any] = response.map(GeminiBatch.__parse_answers).or_else({})
+
+            for actor_id in self.__prompts:
+                answer: Any = answers.get(actor_id)
+
+                if answer not in (None, ""):
+                    text: str = answer if isinstance(answer, str) else dumps(answer)
+
+                    self.__answers[actor_id] = PyOptional[GenerateContentResponse].of(GenerateContentResponse(candidates=[Candidate(content=Content(role="model", parts=[Part(text=text)]))]))
+        finally:
+            self.__answered.set()
+
+    def get_answer(self, actor_id: str) -> PyOptional[GenerateContentResponse]:
+        '''
+        Waits until this `GeminiBatch` is answered (for at most `ANSWER_TIMEOUT` seconds), and returns a `PyOptional` wrapping the answer to the prompt of the `VWActor` whose ID is `actor_id`, if any. Otherwise, returns an empty `PyOptional`.
+        '''
+        if not self.__answered.wait(timeout=GeminiBatch.ANSWER_TIMEOUT):
+            return PyOptional[GenerateContentResponse].empty()
+
+        return self.__answers.get(actor_id, PyOptional[GenerateContentResponse].empty())
+
+    @staticmethod
+    def __parse_answers(response: GenerateContentResponse) -> dict[str, Any]:
+        try:
+            answers: Any = loads(response.text or "")
+
+            return answers if isinstance(answers, dict) else {}
+        except ValueError:
+            return {}
+
+
+class GeminiBatcher():
+    '''
+    This class combines the prompts that the LLM-capable minds send to the same `GeminiClient` at about the same time into a single query.
+
+    The first prompt opens a `GeminiBatch`, which collects the prompts arriving in the next `WINDOW` seconds, or until it holds `MAX_BATCH_SIZE` prompts. A second prompt from the same `VWActor` goes into the next `GeminiBatch`.
+    The combined query is sent (via the `GeminiDispatcher`) by the thread which closes the `GeminiBatch`, and its answer is split among the waiting threads.
+
+    This is only worth it if the minds decide concurrently (see `VWEnvironment.execute_cycle_actions()`), as otherwise each `GeminiBatch` holds a single prompt.
+    '''
+    # These are just default values that are programmatically overridden.
+    ENABLED: bool = False
+    WINDOW: float = 0.05
+    MAX_BATCH_SIZE: int = 32
+    __CONDITION: Condition = Condition()
+    __OPEN_BATCHES: dict[GeminiClient, GeminiBatch] = {}
+
+    @staticmethod
+    def query(client: GeminiClient, actor_id: str, prompt: str, context: str="") -> PyOptional[GenerateContentResponse]:
+        '''
+        Adds `prompt` to the open `GeminiBatch` of `client`, and returns a `PyOptional` wrapping the answer to it, if any. Otherwise, returns an empty `PyOptional`.
+
+        The shared `context` is sent once per `GeminiBatch`, before the prompts. Only the `context` of the first prompt of each `GeminiBatch` is used.
+
+        If the combined query fails (whatever the exception), or is not answered within `GeminiBatch.ANSWER_TIMEOUT` seconds, the answer is missing, and the caller is expected to fall back to a query of its own.
+        '''
+        with GeminiBatcher.__CONDITION:
+            batch: GeminiBatch = GeminiBatcher.__get_open_batch(client=client, actor_id=actor_id, context=context)
+
+            batch.add_prompt(actor_id=actor_id, prompt=prompt)
+
+            if batch.get_size() >= GeminiBatcher.MAX_BATCH_SIZE:
+                GeminiBatcher.__close(client=client, batch=batch)
+                GeminiBatcher.__CONDITION.notify_all()
+
+            while not batch.is_closed() and monotonic() < batch.get_deadline():
+                GeminiBatcher.__CONDITION.wait(timeout=batch.get_deadline() - monotonic())
+
+            GeminiBatcher.__close(client=client, batch=batch)
+
+            # Exactly one of the threads waiting for the batch sends it.
+            sender: bool = batch.claim_sending()
+
+        if sender:
+            GeminiBatcher.__send(client=client, batch=batch)
+
+        return batch.get_answer(actor_id=actor_id)
+
+    @staticmethod
+    def __get_open_batch(client: GeminiClient, actor_id: str, context: str) -> GeminiBatch:
+        if client in GeminiBatcher.__OPEN_BATCHES and GeminiBatcher.__OPEN_BATCHES[client].has_prompt_from(actor_id=actor_id):
+            GeminiBatcher.__close(client=client, batch=GeminiBatcher.__OPEN_BATCHES[client])
+            GeminiBatcher.__CONDITION.notify_all()
+
+        if client not in GeminiBatcher.__OPEN_BATCHES:
+            GeminiBatcher.__OPEN_BATCHES[client] = GeminiBatch(context=context, deadline=monotonic() + GeminiBatcher.WINDOW)
+
+        return GeminiBatcher.__OPEN_BATCHES[client]
+
+    @staticmethod
+    def __close(client: GeminiClient, batch: GeminiBatch) -> None:
+        batch.close()
+
+        if GeminiBatcher.__OPEN_BATCHES.get(client) is batch:
+            del GeminiBatcher.__OPEN_BATCHES[client]
+
+    @staticmethod
+    def __send(client: GeminiClient, batch: GeminiBatch) -> None:
+        response: PyOptional[GenerateContentResponse] = PyOptional[GenerateContentResponse].empty()
+
+        try:
+            response = PyOptional[GenerateContentResponse].of(GeminiDispatcher.query(client=client, prompt=batch.to_prompt()))
+        except Exception:
+            # Every caller (the sender included) falls back to a query of its own, which raises the error again if it persists.
+            pass
+        finally:
+            # The other threads waiting for the batch must be woken up, whatever happens to the combined query.
+            batch.answer(response=response)
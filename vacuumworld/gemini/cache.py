@@ -0,0 +1,117 @@
+from hashlib import sha256
+from sqlite3 import Connection, connect
+from threading import Lock
+from time import time
+from pyoptional.pyoptional import PyOptional
+from google.genai.types import GenerateContentResponse
+
+
+class GeminiCache():
+    '''
+    This class caches the responses of a Gemini model, keyed by model name and normalised prompt (i.e., with its whitespace collapsed), in a SQLite database.
+
+    * If `path` is `":memory:"`, the cache only lasts as long as this `GeminiCache`. Otherwise, it is stored in the file at `path`, and reused across runs.
+
+    * At most `max_entries` responses are kept: when the cache is full, the least recently used response is evicted.
+
+    * If `ttl` is `> 0`, a response older than `ttl` seconds is discarded instead of being returned.
+
+    The hits, misses, evictions, and expirations are counted (see `get_statistics()`). A `GeminiCache` can be used from several threads.
+
+    The database is opened on first use, so that a `GeminiCache` can be created before the process that uses it is forked (e.g., by a `VWRunner`).
+    '''
+    def __init__(self, path: str, max_entries: int=4096, ttl: float=0.0) -> None:
+        if max_entries <= 0:
+            raise ValueError("The maximum number of cache entries must be > 0.")
+        elif ttl < 0:
+            raise ValueError("The cache TTL must be >= 0.")
+
+        self.__max_entries: int = max_entries
+        self.__ttl: float = ttl
+        self.__lock: Lock = Lock()
+        self.__statistics: dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        self.__path: str = path
+        self.__connection: PyOptional[Connection] = PyOptional[Connection].empty()
+
+    def get(self, model_name: str, prompt: str) -> PyOptional[GenerateContentResponse]:
+        '''
+        Returns a `PyOptional` wrapping the cached response of `model_name` to `prompt`, if any. Otherwise, returns an empty `PyOptional`.
+        '''
+        key: str = GeminiCache.__get_key(model_name=model_name, prompt=prompt)
+        now: float = time()
+
+        with self.__lock, self.__get_connection() as connection:
+            row: PyOptional[tuple[str, float]] = PyOptional[tuple[str, float]].of_nullable(connection.execute("SELECT response, created FROM responses WHERE key = ?", (key,)).fetchone())
+
+            if row.is_present() and self.__ttl > 0 and now - row.or_else_raise()[1] > self.__ttl:
+                connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.__statistics["expirations"] += 1
+
+                row = PyOptional[tuple[str, float]].empty()
+
+            if row.is_empty():
+                self.__statistics["misses"] += 1
+
+                return PyOptional[GenerateContentResponse].empty()
+
+            connection.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            self.__statistics["hits"] += 1
+
+            return PyOptional[GenerateContentResponse].of(GenerateContentResponse.model_validate_json(row.or_else_raise()[0]))
+
+    def put(self, model_name: str, prompt: str, response: GenerateContentResponse) -> None:
+        '''
+        Caches `response` as the response of `model_name` to `prompt`, evicting the least recently used response if the cache is full.
+        '''
+        key: str = GeminiCache.__get_key(model_name=model_name, prompt=prompt)
+        now: float = time()
+
+        with self.__lock, self.__get_connection() as connection:
+            connection.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)", (key, response.model_dump_json(exclude_none=True), now, now))
+
+            excess: int = connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0] - self.__max_entries
+
+            if excess > 0:
+                connection.execute("DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY last_used LIMIT ?)", (excess,))
+                self.__statistics["evictions"] += excess
+
+    def get_statistics(self) -> dict[str, int]:
+        '''
+        Returns a copy of the `dict` mapping `"hits"`, `"misses"`, `"evictions"`, and `"expirations"` to their counts.
+        '''
+        with self.__lock:
+            return dict(self.__statistics)
+
+    def format_statistics(self) -> str:
+        '''
+        Returns a one-line summary of the statistics of this `GeminiCache`.
+        '''
+        statistics: dict[str, int] = self.get_statistics()
+        lookups: int = statistics["hits"] + statistics["misses"]
+        hit_rate: float = 100 * statistics["hits"] / lookups if lookups > 0 else 0.0
+
+        return f"LLM cache: {statistics['hits']} hits, {statistics['misses']} misses ({hit_rate:.1f}% hit rate), {statistics['evictions']} evictions, {statistics['expirations']} expirations."
+
+    def close(self) -> None:
+        '''
+        Closes the database, if it was opened. It is opened again if this `GeminiCache` is used afterwards.
+        '''
+        with self.__lock:
+            self.__connection.if_present(lambda connection: connection.close())
+            self.__connection = PyOptional[Connection].empty()
+
+    def __get_connection(self) -> Connection:
+        if self.__connection.is_empty():
+            connection: Connection = connect(self.__path, check_same_thread=False)
+
+            with connection:
+                connection.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL, created REAL NOT NULL, last_used REAL NOT NULL)")
+                connection.execute("CREATE INDEX IF NOT EXISTS responses_by_last_use ON responses (last_used)")
+
+            self.__connection = PyOptional[Connection].of(connection)
+
+        return self.__connection.or_else_raise()
+
+    @staticmethod
+    def __get_key(model_name: str, prompt: str) -> str:
+        return sha256(f"{model_name}\n{' '.join(prompt.split())}".encode("utf-8")).hexdigest()
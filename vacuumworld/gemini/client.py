@@ -1,20 +1,101 @@
+from __future__ import annotations
+from asyncio import sleep as async_sleep
+from random import Random
+from threading import Lock
+from time import monotonic, sleep
+from pyoptional.pyoptional import PyOptional
 from dotenv import load_dotenv
 from google.genai import Client
-from google.genai.types import GenerateContentResponse
+from google.genai.errors import APIError
+from google.genai.types import GenerateContentResponse, HttpOptions
+
+from .rate_limiter import GeminiRateLimiter
 
 import os
 
 
 class GeminiClient():
-    def __init__(self, model_name: str, dot_env_path: str) -> None:
+    '''
+    This class wraps a `google.genai.Client` for a Gemini model.
+
+    The queries go through `RATE_LIMITER` (if any), and the queries rejected because of rate limiting (`429`) or of a server error (`5xx`) are retried up to `MAX_RETRIES` times, after a jittered exponential backoff starting from `RETRY_BASE_DELAY` seconds. If `RETRY_BUDGET` is `> 0`, no retry starts after `RETRY_BUDGET` seconds since the first attempt. The last error is raised if every retry fails.
+
+    `get_shared_client()` returns a `GeminiClient` shared by the whole process, so that the API key is loaded once, and the connections are reused.
+    '''
+    # These are just default values that are programmatically overridden.
+    MAX_RETRIES: int = 3
+    RETRY_BASE_DELAY: float = 0.5
+    RETRY_BUDGET: float = 0.0
+    RATE_LIMITER: PyOptional[GeminiRateLimiter] = PyOptional[GeminiRateLimiter].empty()
+    __SHARED_CLIENTS: dict[tuple[str, str, str], GeminiClient] = {}
+    __SHARED_CLIENTS_LOCK: Lock = Lock()
+    # A separate generator, so that the jitter does not alter the state of the `random` module.
+    __JITTER: Random = Random()
+
+    def __init__(self, model_name: str, dot_env_path: str, base_url: str="") -> None:
         self.__model_name: str = model_name
 
         self.__load_gemini_api_key(dot_env_path=dot_env_path)
 
-        self.__client: Client = Client(api_key=os.environ["GEMINI_API_KEY"])
+        # A non-empty `base_url` replaces the Gemini API endpoint (e.g., with a local server).
+        self.__client: Client = Client(api_key=os.environ["GEMINI_API_KEY"], http_options=HttpOptions(base_url=base_url) if base_url else None)
+
+    @staticmethod
+    def get_shared_client(model_name: str, dot_env_path: str, base_url: str="") -> GeminiClient:
+        '''
+        Returns the `GeminiClient` for `model_name`, `dot_env_path`, and `base_url` shared by the whole process, creating it if needed.
+        '''
+        key: tuple[str, str, str] = (model_name, dot_env_path, base_url)
+
+        with GeminiClient.__SHARED_CLIENTS_LOCK:
+            if key not in GeminiClient.__SHARED_CLIENTS:
+                GeminiClient.__SHARED_CLIENTS[key] = GeminiClient(model_name=model_name, dot_env_path=dot_env_path, base_url=base_url)
+
+            return GeminiClient.__SHARED_CLIENTS[key]
 
     def query(self, prompt: str) -> GenerateContentResponse:
-        return self.__client.models.generate_content(model=self.__model_name, contents=prompt)
+        start: float = monotonic()
+        attempt: int = 0
+
+        while True:
+            GeminiClient.RATE_LIMITER.if_present(lambda rate_limiter: rate_limiter.acquire())
+
+            try:
+                return self.__client.models.generate_content(model=self.__model_name, contents=prompt)
+            except APIError as e:
+                sleep(GeminiClient.__get_retry_delay(error=e, attempt=attempt, start=start))
+
+                attempt += 1
+
+    async def query_async(self, prompt: str) -> GenerateContentResponse:
+        start: float = monotonic()
+        attempt: int = 0
+
+        while True:
+            if GeminiClient.RATE_LIMITER.is_present():
+                await GeminiClient.RATE_LIMITER.or_else_raise().acquire_async()
+
+            try:
+                return await self.__client.aio.models.generate_content(model=self.__model_name, contents=prompt)
+            except APIError as e:
+                await async_sleep(GeminiClient.__get_retry_delay(error=e, attempt=attempt, start=start))
+
+                attempt += 1
+
+    @staticmethod
+    def __get_retry_delay(error: APIError, attempt: int, start: float) -> float:
+        # Raises `error` if it must not be retried.
+        if error.code != 429 and error.code < 500:
+            raise error
+        elif attempt >= GeminiClient.MAX_RETRIES:
+            raise error
+
+        delay: float = GeminiClient.RETRY_BASE_DELAY * 2 ** attempt * GeminiClient.__JITTER.uniform(0.5, 1.0)
+
+        if GeminiClient.RETRY_BUDGET > 0 and monotonic() + delay - start > GeminiClient.RETRY_BUDGET:
+            raise error
+
+        return delay
 
     def __load_gemini_api_key(self, dot_env_path: str) -> None:
         try:
@@ -0,0 +1,61 @@
+from asyncio import AbstractEventLoop, Semaphore, new_event_loop, run_coroutine_threadsafe
+from threading import Lock, Thread
+from pyoptional.pyoptional import PyOptional
+from google.genai.types import GenerateContentResponse
+
+from .client import GeminiClient
+
+
+class GeminiDispatcher():
+    '''
+    This class sends the queries of every `GeminiClient` through a single `asyncio` event loop, which runs on a background thread.
+
+    `query()` blocks the calling thread until the response arrives, but the queries issued by different threads (e.g., by the minds of different `VWActor` objects, see `VWEnvironment.execute_cycle_actions()`) are in flight at the same time, at most `MAX_CONCURRENT_QUERIES` at once.
+
+    If `MAX_CONCURRENT_QUERIES` is `0`, the dispatcher is disabled, and `query()` behaves like `GeminiClient.query()`.
+    '''
+    # This is just a default value that is programmatically overridden.
+    MAX_CONCURRENT_QUERIES: int = 0
+    __LOOP: PyOptional[AbstractEventLoop] = PyOptional[AbstractEventLoop].empty()
+    __LOOP_LOCK: Lock = Lock()
+    # Only used from the event loop thread. It is replaced whenever `MAX_CONCURRENT_QUERIES` changes.
+    __SEMAPHORE: tuple[int, Semaphore] = (0, Semaphore(1))
+
+    @staticmethod
+    def is_enabled() -> bool:
+        '''
+        Returns whether or not `MAX_CONCURRENT_QUERIES` is `> 0`.
+        '''
+        return GeminiDispatcher.MAX_CONCURRENT_QUERIES > 0
+
+    @staticmethod
+    def query(client: GeminiClient, prompt: str) -> GenerateContentResponse:
+        '''
+        Sends `prompt` via `client`, and returns the response, waiting for a free slot if `MAX_CONCURRENT_QUERIES` queries are already in flight.
+
+        Any exception raised by `client` is propagated.
+        '''
+        if not GeminiDispatcher.is_enabled():
+            return client.query(prompt=prompt)
+
+        return run_coroutine_threadsafe(GeminiDispatcher.__query(client=client, prompt=prompt), GeminiDispatcher.__get_loop()).result()
+
+    @staticmethod
+    async def __query(client: GeminiClient, prompt: str) -> GenerateContentResponse:
+        if GeminiDispatcher.__SEMAPHORE[0] != GeminiDispatcher.MAX_CONCURRENT_QUERIES:
+            GeminiDispatcher.__SEMAPHORE = (GeminiDispatcher.MAX_CONCURRENT_QUERIES, Semaphore(GeminiDispatcher.MAX_CONCURRENT_QUERIES))
+
+        async with GeminiDispatcher.__SEMAPHORE[1]:
+            return await client.query_async(prompt=prompt)
+
+    @staticmethod
+    def __get_loop() -> AbstractEventLoop:
+        with GeminiDispatcher.__LOOP_LOCK:
+            if GeminiDispatcher.__LOOP.is_empty():
+                loop: AbstractEventLoop = new_event_loop()
+
+                Thread(target=loop.run_forever, name="GeminiDispatcher", daemon=True).start()
+
+                GeminiDispatcher.__LOOP = PyOptional[AbstractEventLoop].of(loop)
+
+            return GeminiDispatcher.__LOOP.or_else_raise()
@@ -0,0 +1,48 @@
+from asyncio import sleep as async_sleep
+from threading import Lock
+from time import monotonic, sleep
+
+
+class GeminiRateLimiter():
+    '''
+    This class is a token bucket which limits the queries to `rate` per second on average, with bursts of at most `burst` queries.
+
+    The tokens are reserved in order of arrival, and a `GeminiRateLimiter` can be shared by several threads and by the `asyncio` event loop of the `GeminiDispatcher`.
+    '''
+    def __init__(self, rate: float, burst: int=1) -> None:
+        if rate <= 0:
+            raise ValueError("The rate limit must be > 0.")
+        elif burst <= 0:
+            raise ValueError("The burst size must be > 0.")
+
+        self.__rate: float = rate
+        self.__burst: int = burst
+        self.__tokens: float = burst
+        self.__last_refill: float = monotonic()
+        self.__lock: Lock = Lock()
+
+    def reserve(self) -> float:
+        '''
+        Reserves a token, and returns the number of seconds to wait before using it.
+        '''
+        with self.__lock:
+            now: float = monotonic()
+
+            self.__tokens = min(self.__burst, self.__tokens + (now - self.__last_refill) * self.__rate)
+            self.__last_refill = now
+            # The balance can go negative: the tokens of the next waiters are reserved in advance.
+            self.__tokens -= 1
+
+            return max(0.0, -self.__tokens / self.__rate)
+
+    def acquire(self) -> None:
+        '''
+        Reserves a token, and blocks the calling thread until it can be used.
+        '''
+        sleep(self.reserve())
+
+    async def acquire_async(self) -> None:
+        '''
+        Reserves a token, and suspends the calling coroutine until it can be used.
+        '''
+        await async_sleep(self.reserve())
@@ -4,6 +4,7 @@ from PIL import Image
 from PIL.Image import Image as PILImage, Resampling
 from PIL.ImageTk import PhotoImage
 from collections import OrderedDict
+from collections.abc import MutableMapping
 from pyoptional.pyoptional import PyOptional
 
 from pystarworldsturbo.utils.json.json_value import JSONValue
@@ -29,6 +30,7 @@ from ....model.actor.vwactor_factories import VWActorsFactory
 from ....model.dirt.vwdirt_appearance import VWDirtAppearance
 from ....common.vwuser_difficulty import VWUserDifficulty
 from ....model.environment.vwenvironment import VWEnvironment
+from ....model.environment.vwcycle_journal import VWCycleJournal
 from ....model.environment.vwlocation import VWLocation
 
 import os
@@ -54,6 +56,9 @@ class VWSimulationWindow(Frame):
 
     * Handling mouse movements.
     '''
+    AGENT_TAG: str = "agent"
+    DIRT_TAG: str = "dirt"
+
     def __init__(self, parent: Tk, config: dict[str, JSONValue], buttons: dict[str, JSONValue], minds: dict[VWColour, VWActorMindSurrogate], env: VWEnvironment, _guide: Callable[..., None], _save: Callable[..., None], _load: Callable[[VWAutocompleteEntry], VWEnvironment], _exit: Callable[..., None], _error: Callable[..., None]) -> None:
         super(VWSimulationWindow, self).__init__(parent)
 
@@ -77,16 +82,33 @@ class VWSimulationWindow(Frame):
         self.__selected: PyOptional[VWCoord] = PyOptional.empty()
         self.__canvas_dirts: dict[VWCoord, int] = {}
         self.__canvas_agents: dict[VWCoord, int] = {}
+        self.__drawn_images: dict[int, tuple[str, str]] = {}  # Will store the image key of each agent/dirt canvas item.
+        self.__drawn_versions: dict[VWCoord, int] = {}  # Will store the version of each location when it was last drawn.
+        self.__changed_coords: set[VWCoord] = set()  # Will store the coordinates of the locations that changed since the last redraw.
+        self.__full_redraw: bool = True  # Whether the next redraw needs to check every location (e.g., after a load or a reset).
         self.__all_images: dict[tuple[str, str], PILImage] = {}  # Will store all PIL images.
         self.__all_images_tk: dict[tuple[str, str], PhotoImage] = {}  # Will store all tk images.
         self.__all_images_tk_scaled: dict[tuple[str, str], PhotoImage] = {}  # Will store all tk images scaled to fit grid.
         self.__grid_lines: list[int] = []  # Will store line objects.
         self.__image_refs: list[PhotoImage] = []  # Need to keep references to PhotoImage to avoid garbage collection.
 
+        self.__env.subscribe_to_journal(self.__on_journal)
+
         self.__create_and_display()
 
         # Note: pack() for VWSimulationWindow needs to be called by the caller.
 
+    def __set_env(self, env: VWEnvironment) -> None:
+        self.__env.unsubscribe_from_journal(self.__on_journal)
+
+        self.__env = env
+        self.__full_redraw = True
+
+        self.__env.subscribe_to_journal(self.__on_journal)
+
+    def __on_journal(self, journal: VWCycleJournal) -> None:
+        self.__changed_coords.update(journal.get_changed_coords())
+
     def __create_image(self, x: int | float, y: int | float, img: PILImage | PhotoImage) -> int:
         """
         Create a Tkinter canvas image from either a PIL or PhotoImage, and
@@ -304,23 +326,27 @@ class VWSimulationWindow(Frame):
                     location.remove_actor()
                     # Removes the actor from the list of actors.
                     self.__env.remove_actor(actor_id=actor_id)
+
+                    self.__changed_coords.add(coordinate)
                 elif location.has_dirt():
                     # Removes the dirt sprite.
                     self.__remove_dirt_from_gui(coordinate)
                     # Removes both the dirt from the list of dirts, and its appearance from the grid.
                     self.__env.remove_dirt(coord=coordinate)
 
-    # Remove an agent from the view of the grid.
+                    self.__changed_coords.add(coordinate)
+
+    # Remove a dirt from the view of the grid.
     def __remove_dirt_from_gui(self, coordinate: VWCoord) -> None:
-        old: int = self.__canvas_dirts[coordinate]
-        self.__canvas.delete(old)
-        del old
+        self.__delete_item(item=self.__canvas_dirts.pop(coordinate))
 
     # Remove an agent from the view of the grid.
     def __remove_actor_from_gui(self, coordinate: VWCoord) -> None:
-        old: int = self.__canvas_agents[coordinate]
-        self.__canvas.delete(old)
-        del old
+        self.__delete_item(item=self.__canvas_agents.pop(coordinate))
+
+    def __delete_item(self, item: int) -> None:
+        self.__canvas.delete(item)
+        self.__drawn_images.pop(item, None)
 
     def __rotate_actor(self, direction: VWDirection) -> None:
         if self.__selected.is_empty():
@@ -341,6 +367,7 @@ class VWSimulationWindow(Frame):
             self.__canvas_agents[self.__selected.or_else_raise()] = item
 
             self.__env.turn_actor(coord=self.__selected.or_else_raise(), direction=direction)
+            self.__changed_coords.add(self.__selected.or_else_raise())
             self.__lines_to_front()
 
     def __rotate_actor_left(self, _: Any) -> None:
@@ -364,14 +391,17 @@ class VWSimulationWindow(Frame):
             self.__grid_lines.clear()
         if agents:
             for a in self.__canvas_agents.values():
-                self.__canvas.delete(a)
+                self.__delete_item(item=a)
 
             self.__canvas_agents.clear()
         if dirts:
             for d in self.__canvas_dirts.values():
-                self.__canvas.delete(d)
+                self.__delete_item(item=d)
 
             self.__canvas_dirts.clear()
+        if agents or dirts:
+            self.__drawn_versions.clear()
+            self.__full_redraw = True
         if select:
             self.__deselect()
 
@@ -400,7 +430,7 @@ class VWSimulationWindow(Frame):
 
     def __redraw_loaded_env(self, loaded_env: VWEnvironment) -> None:
         if loaded_env:
-            self.__env = loaded_env
+            self.__set_env(env=loaded_env)
             self.__grid_scale_slider.set_position(self.__env.get_ambient().get_grid_dim() - cast(int, self.__config["min_environment_dim"]))
             self.__reset_canvas()
             self.__scaled_tk()
@@ -409,41 +439,75 @@ class VWSimulationWindow(Frame):
 
     def redraw(self) -> None:
         '''
-        This method resets and redraws the `Canvas` according to the wrapped `VWEnvironment`.
+        This method updates the `Canvas` according to the wrapped `VWEnvironment`.
+
+        Only the locations reported as changed by the `VWCycleJournal` of each cycle (see `VWCycleJournal.get_changed_coords()`), or edited by the user, are checked, unless the `VWEnvironment` or the `Canvas` has just been loaded or reset, in which case every location is checked.
+
+        Only the checked locations whose version changed since they were last drawn (see `VWLocation.get_version()`) are redrawn. Their agent and dirt canvas items are reconfigured, moved to another location, or deleted, and new ones are only created when no such item can be reused.
         '''
-        self.__reset_canvas(lines=False)
+        self.__deselect()
 
         env_dim: int = self.__env.get_ambient().get_grid_dim()
         size: int = cast(int, self.__config["grid_size"])
         inc: float = size / env_dim
+        changed: list[VWCoord] = []
+        agents: dict[VWCoord, tuple[str, str]] = {}
+        dirts: dict[VWCoord, tuple[str, str]] = {}
+        grid: MutableMapping[VWCoord, VWLocation] = self.__env.get_ambient().get_grid()
+        coords: list[VWCoord] = list(grid) if self.__full_redraw else list(self.__changed_coords)
+
+        self.__changed_coords.clear()
+        self.__full_redraw = False
+
+        for coord in coords:
+            location: VWLocation = grid[coord]
 
-        for coord, location in self.__env.get_ambient().get_grid().items():
-            if location:
-                self.__redraw_location(coord=coord, location=location, inc=inc)
+            if location and (coord not in self.__drawn_versions or self.__drawn_versions[coord] != location.get_version()):
+                changed.append(coord)
+                self.__drawn_versions[coord] = location.get_version()
 
-    def __redraw_location(self, coord: VWCoord, location: VWLocation, inc: float) -> None:
-        assert location
+                if location.has_actor():
+                    actor_appearance: VWActorAppearance = location.get_actor_appearance().or_else_raise()
+                    agents[coord] = (actor_appearance.get_colour().value, actor_appearance.get_orientation().value)
+
+                if location.has_dirt():
+                    dirt_appearance: VWDirtAppearance = location.get_dirt_appearance().or_else_raise()
+                    dirts[coord] = (dirt_appearance.get_colour().value, "dirt")
+
+        if changed:
+            self.__redraw_items(items=self.__canvas_agents, changed=changed, keys=agents, tag=VWSimulationWindow.AGENT_TAG, inc=inc)
+            self.__redraw_items(items=self.__canvas_dirts, changed=changed, keys=dirts, tag=VWSimulationWindow.DIRT_TAG, inc=inc)
 
-        if location.has_actor():
-            actor_appearance: VWActorAppearance = location.get_actor_appearance().or_else_raise()
-            tk_img: PhotoImage = self.__all_images_tk_scaled[(actor_appearance.get_colour().value, actor_appearance.get_orientation().value)]
-            item: int = self.__create_image(x=coord.get_x() * inc + inc/2, y=coord.get_y() * inc + inc/2, img=tk_img)
+            # Keep the agents behind the grid lines, and the dirts behind the agents.
+            self.__canvas.tag_lower(VWSimulationWindow.AGENT_TAG)
+            self.__canvas.tag_lower(VWSimulationWindow.DIRT_TAG)
 
-            self.__canvas_agents[coord] = item
+    def __redraw_items(self, items: dict[VWCoord, int], changed: list[VWCoord], keys: dict[VWCoord, tuple[str, str]], tag: str, inc: float) -> None:
+        # The items of the changed locations which are now empty can be moved where an item is needed.
+        spare: list[int] = [items.pop(coord) for coord in changed if coord in items and coord not in keys]
 
-            self.__canvas.tag_lower(item)  # Keep the agent behind the grid lines.
+        for coord, key in keys.items():
+            x: float = coord.get_x() * inc + inc/2
+            y: float = coord.get_y() * inc + inc/2
 
-            if coord in self.__canvas_dirts:  # Keep the dirt behind the agent.
-                self.__canvas.tag_lower(self.__canvas_dirts[coord])
+            if coord in items:
+                item: int = items[coord]
+            elif spare:
+                item = spare.pop()
+
+                self.__canvas.coords(item, x, y)
+            else:
+                item = self.__create_image(x=x, y=y, img=self.__all_images_tk_scaled[key])
 
-        if location.has_dirt():
-            dirt_appearance: VWDirtAppearance = location.get_dirt_appearance().or_else_raise()
-            tk_img: PhotoImage = self.__all_images_tk_scaled[(dirt_appearance.get_colour().value, "dirt")]
-            item: int = self.__create_image(x=coord.get_x() * inc + inc/2, y=coord.get_y() * inc + inc/2, img=tk_img)
+            if self.__drawn_images.get(item, None) != key:
+                # The dropped items do not have the tag yet.
+                self.__canvas.itemconfigure(item, image=self.__all_images_tk_scaled[key], tags=(tag,))
 
-            self.__canvas_dirts[coord] = item
+            items[coord] = item
+            self.__drawn_images[item] = key
 
-            self.__canvas.tag_lower(item)  # Keep dirt behind agents and grid lines.
+        for item in spare:
+            self.__delete_item(item=item)
 
     def __draw_grid(self) -> None:
         env_dim: int = self.__env.get_ambient().get_grid_dim()
@@ -519,7 +583,7 @@ class VWSimulationWindow(Frame):
         value += cast(int, self.__config["min_environment_dim"])
 
         if value != self.__env.get_ambient().get_grid_dim():
-            self.__env = VWEnvironment.generate_empty_env(config=self.__config, forced_line_dim=value)
+            self.__set_env(env=VWEnvironment.generate_empty_env(config=self.__config, forced_line_dim=value))
             self.__init_dragables()
             self.__reset_canvas()
             self.__scaled_tk()
@@ -603,9 +667,10 @@ class VWSimulationWindow(Frame):
             message += f" (replacing {dirt_colour.str_with_article()} dirt)"
 
         self.__env.drop_dirt(coord=coord, dirt_colour=colour)
+        self.__changed_coords.add(coord)
 
         if coord in self.__canvas_dirts:
-            self.__canvas.delete(self.__canvas_dirts[coord])
+            self.__delete_item(item=self.__canvas_dirts[coord])
 
         self.__canvas_dirts[coord] = drag_manager.get_drag()
         self.__canvas.tag_lower(self.__canvas_dirts[coord])
@@ -633,9 +698,10 @@ class VWSimulationWindow(Frame):
         self.__env.add_actor(actor=actor)
         self.__env.get_ambient().get_location_interface(coord=coord).add_actor(actor_appearance=actor_appearance)
         self.__env.force_initial_perception_to_new_actor_after_stop(actor_id=actor_appearance.get_id())
+        self.__changed_coords.add(coord)
 
         if coord in self.__canvas_agents:
-            self.__canvas.delete(self.__canvas_agents[coord])
+            self.__delete_item(item=self.__canvas_agents[coord])
 
         self.__canvas_agents[coord] = drag_manager.get_drag()
 
@@ -665,7 +731,7 @@ class VWSimulationWindow(Frame):
     def __reset(self) -> None:
         print("INFO: reset")
 
-        self.__env = VWEnvironment.generate_empty_env(config=self.__config)
+        self.__set_env(env=VWEnvironment.generate_empty_env(config=self.__config))
 
         self.__grid_scale_slider.set_position(self.__env.get_ambient().get_grid_dim() - cast(int, self.__config["min_environment_dim"]))
 
@@ -2,7 +2,6 @@ from json import load, dump
 from re import match
 from random import choice
 from string import ascii_letters
-from tkinter.filedialog import asksaveasfile, askopenfile
 from typing import IO, Any
 from pyoptional.pyoptional import PyOptional
 
@@ -76,6 +75,9 @@ class VWSaveStateManager():
             return False
 
     def __save_dialog(self, state: dict[str, JSONValue], filename: str) -> bool:
+        # `tkinter` is only needed by the GUI.
+        from tkinter.filedialog import asksaveasfile
+
         try:
             if not filename:
                 filename = "".join(choice(ascii_letters) for _ in range(self.__random_file_name_length)) + self.__vw_saved_state_extension
@@ -113,6 +115,9 @@ class VWSaveStateManager():
             return {}
 
     def __load_dialog(self, file: str="") -> dict[str, JSONValue]:
+        # `tkinter` is only needed by the GUI.
+        from tkinter.filedialog import askopenfile
+
         try:
             with PyOptional[IO[Any]].of_nullable(askopenfile(mode="rb", initialdir=self.__files_dir, initialfile=file)).or_else_raise() as f:
                 return load(fp=f)
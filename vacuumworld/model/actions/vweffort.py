@@ -24,7 +24,8 @@ class VWActionEffort():
         "VWTurnAction": 5  # We want to discourage any unnecessary turns.
     }
 
-    EFFORTS: dict[str, int] = __DEFAULT_EFFORTS
+    # A copy, so that overriding an effort does not alter the defaults.
+    EFFORTS: dict[str, int] = dict(__DEFAULT_EFFORTS)
     DEFAULT_EFFORT_FOR_OTHER_ACTIONS: int = 1
 
     @staticmethod
@@ -40,3 +41,11 @@ class VWActionEffort():
 
         if action_name in VWActionEffort.EFFORTS:
             VWActionEffort.EFFORTS[action_name] = new_effort
+
+    @staticmethod
+    def restore_default_efforts() -> None:
+        '''
+        Restores the default effort of every `VWAction` kind, undoing any previous call to `override_default_effort_for_action()`.
+        '''
+        VWActionEffort.EFFORTS.clear()
+        VWActionEffort.EFFORTS.update(VWActionEffort.__DEFAULT_EFFORTS)
@@ -14,6 +14,8 @@ class VWActorAppearance(ActorAppearance):
     '''
     This class represents the appearance of a `VWActor`.
     '''
+    __slots__ = ("__colour", "__orientation", "__previous_orientation")
+
     def __init__(self, actor_id: str, progressive_id: str, colour: VWColour, orientation: VWOrientation) -> None:
         super(VWActorAppearance, self).__init__(actor_id=actor_id, progressive_id=progressive_id)
 
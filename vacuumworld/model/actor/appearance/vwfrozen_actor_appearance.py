@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from .vwactor_appearance import VWActorAppearance
+from ....common.vwdirection import VWDirection
+from ....common.vwexceptions import VWInternalError
+
+
+class VWFrozenActorAppearance(VWActorAppearance):
+    '''
+    This class specifies an immutable copy of a `VWActorAppearance`.
+
+    The copy is made once, when the `VWFrozenActorAppearance` is created, in the same way as `VWActorAppearance.deep_copy()`. Afterwards, it cannot be turned, so that the same `VWFrozenActorAppearance` can be safely shared between all the `VWObservation` objects that include it.
+
+    `deep_copy()` returns a regular (i.e., mutable) `VWActorAppearance`.
+    '''
+    __slots__ = ()
+
+    def __init__(self, actor_appearance: VWActorAppearance) -> None:
+        super(VWFrozenActorAppearance, self).__init__(actor_id=actor_appearance.get_id(), progressive_id=actor_appearance.get_progressive_id(), colour=actor_appearance.get_colour(), orientation=actor_appearance.get_orientation())
+
+    def turn(self, direction: VWDirection) -> None:
+        '''
+        Always raises a `VWInternalError`, as a `VWFrozenActorAppearance` cannot be modified.
+        '''
+        raise VWInternalError("A VWFrozenActorAppearance cannot be modified.")
@@ -13,7 +13,10 @@ from ....actions.vwactions import VWPhysicalAction
 from ....actions.vwactions import VWCommunicativeAction
 from ....environment.vwenvironment import VWEnvironment
 from .....common.vwexceptions import VWSurrogateMindException
+from .....gemini.batcher import GeminiBatcher
+from .....gemini.cache import GeminiCache
 from .....gemini.client import GeminiClient
+from .....gemini.dispatcher import GeminiDispatcher
 
 import os
 import sys
@@ -22,16 +25,30 @@ import sys
 class VWLLMActorMindSurrogate(VWActorMindSurrogate):
     '''
     This class specifies an LLM-capable surrogate for the `VWMind` of a `VWActor` that uses a Gemini model to decide the next actions to be performed by the `VWActor`.
+
+    The queries made by `decide_physical_with_ai()` and `decide_communicative_with_ai()` go through the `GeminiDispatcher`. If it is enabled, the minds of all the LLM-capable `VWActor` objects decide concurrently (see `VWEnvironment.execute_cycle_actions()`).
+
+    If `DECISION_CACHE` is not empty, the responses which yield a valid `VWAction` are cached, and an identical prompt (up to whitespace) is answered by the `GeminiCache`, without querying the Gemini model.
+
+    If the `GeminiBatcher` is enabled, the prompts of the LLM-capable `VWActor` objects deciding at the same time are combined into a single query, preceded once by `BATCH_CONTEXT`. If the answer for a `VWActor` is missing, or does not yield a valid `VWAction`, its prompt is sent on its own.
+
+    If `base_url` is not empty, it replaces the Gemini API endpoint (e.g., with a local server), and the Gemini client is set up even under `pytest`.
     '''
+    IO_BOUND: bool = True
+    # The context shared by the prompts of a batch (see `GeminiBatcher`). It can be overridden by a subclass.
+    BATCH_CONTEXT: str = ""
+    # This is just a default value that is programmatically overridden.
+    DECISION_CACHE: PyOptional[GeminiCache] = PyOptional[GeminiCache].empty()
 
-    def __init__(self, dot_env_path: str) -> None:
+    def __init__(self, dot_env_path: str, base_url: str="") -> None:
         super(VWLLMActorMindSurrogate, self).__init__()
 
         under_pytest = "pytest" in sys.modules or os.getenv("PYTEST_CURRENT_TEST") is not None or os.getenv("PYTEST_XDIST_WORKER") is not None
-        skip_gemini_setup: bool = under_pytest or os.getenv("VW_SKIP_AI_SETUP", "").strip().lower() in {"1", "true", "yes", "on"}
+        skip_gemini_setup: bool = not base_url and (under_pytest or os.getenv("VW_SKIP_AI_SETUP", "").strip().lower() in {"1", "true", "yes", "on"})
 
         if not skip_gemini_setup:
-            self.__gemini_client: GeminiClient = GeminiClient(model_name=VWEnvironment.LLM_MODEL, dot_env_path=dot_env_path)
+            # Shared by all the surrogates with the same settings.
+            self.__gemini_client: GeminiClient = GeminiClient.get_shared_client(model_name=VWEnvironment.LLM_MODEL, dot_env_path=dot_env_path, base_url=base_url)
 
     def provide_context(self, context: str) -> tuple[PyOptional[GenerateContentResponse], PyOptional[dict[str, Any]]]:
         '''
@@ -48,18 +65,32 @@ class VWLLMActorMindSurrogate(VWActorMindSurrogate):
 
     def __decide_action_with_ai(self, prompt: str, action_superclass: type[VWPhysicalAction | VWCommunicativeAction]) -> VWAction:
         try:
-            response: GenerateContentResponse = self.__gemini_client.query(prompt=prompt)
+            cached_response: PyOptional[GenerateContentResponse] = VWLLMActorMindSurrogate.DECISION_CACHE.flat_map(lambda cache: cache.get(model_name=VWEnvironment.LLM_MODEL, prompt=prompt))
+            batched_response: PyOptional[GenerateContentResponse] = self.__query_batch(prompt=prompt, action_superclass=action_superclass) if cached_response.is_empty() and GeminiBatcher.ENABLED else PyOptional[GenerateContentResponse].empty()
+            response: GenerateContentResponse = cached_response.or_else_get(lambda: batched_response.or_else_get(lambda: GeminiDispatcher.query(client=self.__gemini_client, prompt=prompt)))
             action: VWAction = self.parse_gemini_response(response=response)
 
             assert action is not None and isinstance(action, VWAction), "The parsed action must be a valid VWAction."
 
             if isinstance(action, action_superclass):
+                if cached_response.is_empty():
+                    VWLLMActorMindSurrogate.DECISION_CACHE.if_present(lambda cache: cache.put(model_name=VWEnvironment.LLM_MODEL, prompt=prompt, response=response))
+
                 return action
             else:
                 raise VWSurrogateMindException(f"The Gemini model did not return a valid {action_superclass.__name__}. Response: {response}")
         except ClientError as ce:
             return self.backup_decide_after_llm_error(original_prompt=prompt, error=ce, action_superclass=action_superclass)
 
+    def __query_batch(self, prompt: str, action_superclass: type[VWPhysicalAction | VWCommunicativeAction]) -> PyOptional[GenerateContentResponse]:
+        # Only the answers which yield a valid action are kept: the others are replaced by a query of their own.
+        response: PyOptional[GenerateContentResponse] = GeminiBatcher.query(client=self.__gemini_client, actor_id=self.get_own_id(), prompt=prompt, context=type(self).BATCH_CONTEXT)
+
+        try:
+            return response.filter(lambda r: isinstance(self.parse_gemini_response(response=r), action_superclass))
+        except Exception:
+            return PyOptional[GenerateContentResponse].empty()
+
     def decide_physical_with_ai(self, prompt: str) -> VWPhysicalAction:
         '''
         Uses the Gemini model to decide the next physical action to be performed by the `VWActor`, based on the given `prompt`.
@@ -23,7 +23,10 @@ import sys
 class VWActorMindSurrogate(ABC):
     '''
     This class specifies the surrogate for the `VWMind` of a `VWActor`. It is an abstract class.
+
+    Sub-classes whose `revise()` and `decide()` mostly wait on I/O (e.g., on remote queries) can set `IO_BOUND` to `True`, so that they are evaluated concurrently on threads when the `VWEnvironment` allows it (see `VWEnvironment.execute_cycle_actions()`).
     '''
+    IO_BOUND: bool = False
     MUST_BE_DEFINED: dict[str, Any] = {
         "revise": {"number_of_params_excluding_self": 0, "return_type": [None, "None", "NoneType"]},
         "decide": {"number_of_params_excluding_self": 0, "return_type": [Iterable[VWAction], Iterable[VWPhysicalAction], Iterable[VWCommunicativeAction]]}
@@ -12,6 +12,7 @@ from ....actions.vwdrop_action import VWDropAction
 from ....actions.vwidle_action import VWIdleAction
 from .....common.vwcolour import VWColour
 from .....common.vwdirection import VWDirection
+from .....common.vwposition_names import VWPositionNames
 
 
 class VWUserMindSurrogate(VWActorMindSurrogate):
@@ -40,16 +41,16 @@ class VWUserMindSurrogate(VWActorMindSurrogate):
         self.__difficulty_level = difficulty_level
 
     def __is_on_dirt(self) -> bool:
-        return self.get_latest_observation().get_center().filter(lambda center: center.has_dirt()).is_present()
+        return self.get_latest_observation().is_dirt_at(position_name=VWPositionNames.center)
 
     def __is_actor_ahead(self) -> bool:
-        return not self.get_latest_observation().is_wall_immediately_ahead() and self.get_latest_observation().get_forward().filter(lambda forward: forward.has_actor()).is_present()
+        return not self.get_latest_observation().is_wall_immediately_ahead() and self.get_latest_observation().is_actor_at(position_name=VWPositionNames.forward)
 
     def __is_actor_on_the_left(self) -> bool:
-        return not self.get_latest_observation().is_wall_immediately_to_the_left() and self.get_latest_observation().get_left().filter(lambda left: left.has_actor()).is_present()
+        return not self.get_latest_observation().is_wall_immediately_to_the_left() and self.get_latest_observation().is_actor_at(position_name=VWPositionNames.left)
 
     def __is_actor_on_the_right(self) -> bool:
-        return not self.get_latest_observation().is_wall_immediately_to_the_right() and self.get_latest_observation().get_right().filter(lambda right: right.has_actor()).is_present()
+        return not self.get_latest_observation().is_wall_immediately_to_the_right() and self.get_latest_observation().is_actor_at(position_name=VWPositionNames.right)
 
     def revise(self) -> None:
         '''
@@ -1,10 +1,14 @@
 from typing import Iterable
+from queue import Queue, Empty
+from threading import Thread
+from pyoptional.pyoptional import PyOptional
 
 from pystarworldsturbo.elements.mind import Mind
 from pystarworldsturbo.common.message import BccMessage
 
 from .surrogate.vwactor_mind_surrogate import VWActorMindSurrogate
 from ...actions.vwactions import VWAction
+from ...actions.vwidle_action import VWIdleAction
 from ....common.vwobservation import VWObservation
 from ....common.vwvalidator import VWValidator
 
@@ -16,11 +20,15 @@ class VWMind(Mind):
     The mind has a surrogate, which is an instance of a class that extends `VWActorMindSurrogate`. The surrogate is used to store the state of the mind, and to implement `revise()`, and `decide()`.
 
     The mind implements the `perceive()` and `execute()` methods that are called by the body together with `revise()` and `decide()` during the `VWActor` cycle.
+
+    If `DECIDE_TIME_BUDGET` is `> 0`, `revise()` and `decide()` are given at most `DECIDE_TIME_BUDGET` seconds per cycle (see `revise_and_decide()`).
     '''
     PERCEIVE_METHOD_NAME: str = "perceive"
     REVISE_METHOD_NAME: str = "revise"
     DECIDE_METHOD_NAME: str = "decide"
     EXECUTE_METHOD_NAME: str = "execute"
+    # This is just a default value that is programmatically overridden.
+    DECIDE_TIME_BUDGET: float = 0.0
 
     def __init__(self, surrogate: VWActorMindSurrogate) -> None:
         super(VWMind, self).__init__()
@@ -32,6 +40,14 @@ class VWMind(Mind):
         del surrogate
 
         self.__next_actions: list[VWAction] = []
+        # The `revise()` + `decide()` call which exceeded the time budget, if it is still running.
+        self.__late_call: PyOptional[Thread] = PyOptional[Thread].empty()
+        # Whether or not the late call was still running when the surrogate last perceived, if `revise_and_decide()` (or `start_revise_and_decide()`) has not been called since.
+        self.__busy_when_perceiving: PyOptional[bool] = PyOptional[bool].empty()
+        # The `revise()` + `decide()` call started by `start_revise_and_decide()`, if it has not been waited for yet.
+        self.__ongoing_call: PyOptional[tuple[Thread, Queue[tuple[Iterable[VWAction], PyOptional[BaseException]]]]] = PyOptional[tuple[Thread, Queue[tuple[Iterable[VWAction], PyOptional[BaseException]]]]].empty()
+        self.__timed_out: bool = False
+        self.__number_of_timeouts: int = 0
 
     def get_surrogate(self) -> VWActorMindSurrogate:
         '''
@@ -62,7 +78,14 @@ class VWMind(Mind):
         assert messages is not None
         assert isinstance(messages, Iterable)
 
-        self.__surrogate.perceive(observation=observation, messages=messages)
+        # The surrogate is not touched while a late `revise()` + `decide()` call is still using it.
+        # The same decision holds for the rest of the cycle (see `__is_busy()`), even if the late call ends in the meantime.
+        busy: bool = self.__is_late_call_running()
+
+        self.__busy_when_perceiving = PyOptional[bool].of(busy)
+
+        if not busy:
+            self.__surrogate.perceive(observation=observation, messages=messages)
 
     def revise(self) -> None:
         '''
@@ -91,6 +114,138 @@ class VWMind(Mind):
 
         self.__store_actions_for_next_cycle(actions=actions)
 
+    def revise_and_decide(self) -> None:
+        '''
+        Calls `revise()`, and then `decide()`.
+
+        If `DECIDE_TIME_BUDGET` is `> 0`, the two calls happen on a separate thread, and, if they do not return within `DECIDE_TIME_BUDGET` seconds, a `VWIdleAction` is attempted instead of the decided `VWAction` objects, which are discarded when (and if) they arrive. Until then, the `VWActorMindSurrogate` perceives nothing, and a `VWIdleAction` is attempted at each cycle.
+
+        A cycle in which the `VWActorMindSurrogate` perceived nothing is a fallback cycle, even if the late call ends before `revise_and_decide()` is called.
+
+        Each cycle in which the fallback `VWIdleAction` is attempted counts as a timeout (see `has_timed_out()` and `get_number_of_timeouts()`).
+        '''
+        self.__timed_out = False
+
+        if self.__is_busy():
+            self.__fall_back()
+        elif VWMind.DECIDE_TIME_BUDGET <= 0:
+            self.revise()
+            self.decide()
+        else:
+            self.__revise_and_decide_within_budget()
+
+    def __revise_and_decide_within_budget(self) -> None:
+        self.__start_revise_and_decide()
+        self.finish_revise_and_decide(timeout=PyOptional[float].of(VWMind.DECIDE_TIME_BUDGET))
+
+    def start_revise_and_decide(self) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWMind` API.
+
+        Starts `revise()` and `decide()` on a separate thread, so that several minds can be evaluated concurrently. `finish_revise_and_decide()` must be called afterwards.
+
+        If the late call of a previous cycle is still running, the fallback `VWIdleAction` is attempted instead (see `revise_and_decide()`).
+        '''
+        self.__timed_out = False
+
+        if self.__is_busy():
+            self.__fall_back()
+        else:
+            self.__start_revise_and_decide()
+
+    def __start_revise_and_decide(self) -> None:
+        outcome: Queue[tuple[Iterable[VWAction], PyOptional[BaseException]]] = Queue(maxsize=1)
+        thread: Thread = Thread(target=self.__call_revise_and_decide, args=(outcome,), name=f"{type(self.__surrogate).__name__}.decide", daemon=True)
+
+        thread.start()
+
+        self.__ongoing_call = PyOptional[tuple[Thread, Queue[tuple[Iterable[VWAction], PyOptional[BaseException]]]]].of((thread, outcome))
+
+    def finish_revise_and_decide(self, timeout: PyOptional[float]) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWMind` API.
+
+        Waits for the call started by `start_revise_and_decide()` (if any) for at most `timeout` seconds (or indefinitely, if `timeout` is empty), and stores the decided `VWAction` objects.
+
+        If the call does not return in time, it becomes a late call, and the fallback `VWIdleAction` is attempted instead (see `revise_and_decide()`).
+        '''
+        if self.__ongoing_call.is_empty():
+            return
+
+        thread, outcome = self.__ongoing_call.or_else_raise()
+
+        self.__ongoing_call = PyOptional[tuple[Thread, Queue[tuple[Iterable[VWAction], PyOptional[BaseException]]]]].empty()
+
+        try:
+            actions, error = outcome.get(timeout=max(0.0, timeout.or_else_raise())) if timeout.is_present() else outcome.get()
+        except Empty:
+            self.__late_call = PyOptional[Thread].of(thread)
+            self.__fall_back()
+
+            return
+
+        if error.is_present():
+            raise error.or_else_raise()
+
+        VWValidator.validate_not_none(actions)
+        VWValidator.validate_type(t=Iterable, obj=actions)
+
+        self.__store_actions_for_next_cycle(actions=actions)
+
+    def __call_revise_and_decide(self, outcome: Queue[tuple[Iterable[VWAction], PyOptional[BaseException]]]) -> None:
+        try:
+            self.revise()
+
+            assert hasattr(self.__surrogate, VWMind.DECIDE_METHOD_NAME)
+            assert callable(getattr(self.__surrogate, VWMind.DECIDE_METHOD_NAME))
+
+            outcome.put((self.__surrogate.decide(), PyOptional[BaseException].empty()))
+        except BaseException as e:
+            outcome.put(([], PyOptional[BaseException].of(e)))
+
+    def __is_busy(self) -> bool:
+        # Reuses (and consumes) the decision taken by `perceive()` in this cycle, if any, so that `revise()` and `decide()` never run on the percepts of an earlier cycle.
+        busy: bool = self.__busy_when_perceiving.or_else_get(self.__is_late_call_running)
+
+        self.__busy_when_perceiving = PyOptional[bool].empty()
+
+        return busy
+
+    def __is_late_call_running(self) -> bool:
+        if self.__late_call.is_present() and not self.__late_call.or_else_raise().is_alive():
+            self.__late_call = PyOptional[Thread].empty()
+
+        return self.__late_call.is_present()
+
+    def __fall_back(self) -> None:
+        self.__timed_out = True
+        self.__number_of_timeouts += 1
+        self.__next_actions = [VWIdleAction()]
+
+    def has_timed_out(self) -> bool:
+        '''
+        Returns whether or not the latest call to `revise_and_decide()` exceeded `DECIDE_TIME_BUDGET` (or found the previous late call still running). The same holds for `finish_revise_and_decide()` and its `timeout`.
+        '''
+        return self.__timed_out
+
+    def get_number_of_timeouts(self) -> int:
+        '''
+        Returns the number of calls to `revise_and_decide()` (or `finish_revise_and_decide()`) that exceeded their time limit (or found the previous late call still running).
+        '''
+        return self.__number_of_timeouts
+
+    def store_decided_actions(self, actions: Iterable[VWAction]) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWMind` API.
+
+        Stores `actions`, which were decided by a copy of the `VWActorMindSurrogate` of this `VWMind` living in another process, as if `decide()` had returned them.
+        '''
+        VWValidator.validate_not_none(actions)
+        VWValidator.validate_type(t=Iterable, obj=actions)
+
+        self.__timed_out = False
+        self.__store_actions_for_next_cycle(actions=actions)
+
     def __store_actions_for_next_cycle(self, actions: Iterable[VWAction]) -> None:
         sanitised_actions: list[VWAction] = []
 
@@ -0,0 +1,166 @@
+from __future__ import annotations
+from typing import Any, Iterable
+from multiprocessing import get_context
+from multiprocessing.context import SpawnProcess
+from multiprocessing.connection import Connection
+from random import seed as set_seed
+from pyoptional.pyoptional import PyOptional
+
+from pystarworldsturbo.common.message import BccMessage
+
+from .surrogate.vwactor_mind_surrogate import VWActorMindSurrogate
+from ...actions.vwactions import VWAction
+from ....common.vwexceptions import VWInternalError
+from ....common.vwobservation import VWObservation
+
+
+class VWMindJob():
+    '''
+    This class describes the evaluation of a `VWActorMindSurrogate` for one cycle: the perceptions to pass to `perceive()`, the cumulative effort of the `VWActor`, and the seed of `random` for `revise()` and `decide()`.
+
+    The first `VWMindJob` of each `VWActor` also specifies the file and the class of its `VWActorMindSurrogate`, so that a worker can load it.
+    '''
+    def __init__(self, actor_id: str, seed: str, effort: int, observation: VWObservation, messages: list[BccMessage], surrogate_mind_file: str="", surrogate_mind_class_name: str="") -> None:
+        self.__actor_id: str = actor_id
+        self.__seed: str = seed
+        self.__effort: int = effort
+        self.__observation: VWObservation = observation
+        self.__messages: list[BccMessage] = messages
+        self.__surrogate_mind_file: str = surrogate_mind_file
+        self.__surrogate_mind_class_name: str = surrogate_mind_class_name
+
+    def get_actor_id(self) -> str:
+        '''
+        Returns the ID of the `VWActor` of this `VWMindJob`.
+        '''
+        return self.__actor_id
+
+    def evaluate(self, surrogate: VWActorMindSurrogate) -> list[VWAction]:
+        '''
+        Passes the perceptions of this `VWMindJob` to `surrogate`, and returns the `list[VWAction]` decided by it.
+
+        `random` is seeded with the seed of this `VWMindJob` beforehand.
+        '''
+        surrogate.update_effort(increment=self.__effort - surrogate.get_effort())
+        surrogate.perceive(observation=self.__observation, messages=self.__messages)
+
+        set_seed(self.__seed)
+
+        surrogate.revise()
+
+        return list(surrogate.decide())
+
+    def load_surrogate(self) -> VWActorMindSurrogate:
+        '''
+        Loads and returns the `VWActorMindSurrogate` specified by this `VWMindJob`.
+
+        A `VWInternalError` is raised if this `VWMindJob` does not specify it.
+        '''
+        if not self.__surrogate_mind_file:
+            raise VWInternalError(f"The surrogate mind of {self.__actor_id} was never sent to this worker.")
+
+        return VWActorMindSurrogate.load_from_file(surrogate_mind_file=self.__surrogate_mind_file, surrogate_mind_class_name=self.__surrogate_mind_class_name)
+
+
+class VWMindPool():
+    '''
+    This class evaluates `VWActorMindSurrogate` objects on a pool of worker processes.
+
+    Each `VWActor` is bound to a worker, where a copy of its `VWActorMindSurrogate` stays resident across cycles. At each cycle, the workers evaluate their `VWMindJob` objects concurrently, and the decided `VWAction` objects are returned in the order of the `VWMindJob` objects.
+
+    As each `VWMindJob` seeds `random` with its own seed, the decisions do not depend on the number of workers, nor on how the `VWActor` objects are spread across them.
+    '''
+    def __init__(self, number_of_workers: int) -> None:
+        assert number_of_workers > 0
+
+        self.__connections: list[Connection] = []
+        self.__workers: list[SpawnProcess] = []
+        self.__assignments: dict[str, int] = {}
+
+        # The workers are spawned, rather than forked, as forking a process with running threads (e.g., the trace writer) is unsafe.
+        for _ in range(number_of_workers):
+            parent_connection, child_connection = get_context("spawn").Pipe()
+            worker: SpawnProcess = get_context("spawn").Process(target=VWMindPool.serve, args=(child_connection,), daemon=True)
+
+            worker.start()
+            child_connection.close()
+
+            self.__connections.append(parent_connection)
+            self.__workers.append(worker)
+
+    def is_assigned(self, actor_id: str) -> bool:
+        '''
+        Returns whether or not the `VWActorMindSurrogate` of the `VWActor` whose ID is `actor_id` is already resident in a worker.
+        '''
+        return actor_id in self.__assignments
+
+    def evaluate(self, jobs: list[VWMindJob]) -> list[list[VWAction]]:
+        '''
+        Evaluates `jobs` on the workers, and returns the `list[VWAction]` decided for each of them, in the same order.
+
+        If the evaluation of any `VWMindJob` raised an `Exception`, the first such `Exception` (in the order of `jobs`) is raised.
+        '''
+        batches: list[list[tuple[int, VWMindJob]]] = [[] for _ in self.__connections]
+
+        for i, job in enumerate(jobs):
+            worker_index: int = self.__assignments.setdefault(job.get_actor_id(), len(self.__assignments) % len(self.__connections))
+
+            batches[worker_index].append((i, job))
+
+        for connection, batch in zip(self.__connections, batches):
+            if batch:
+                connection.send([job for _, job in batch])
+
+        results: list[tuple[list[VWAction], PyOptional[BaseException]]] = [([], PyOptional[BaseException].empty())] * len(jobs)
+
+        for connection, batch in zip(self.__connections, batches):
+            if batch:
+                for (i, _), result in zip(batch, connection.recv()):
+                    results[i] = result
+
+        for _, error in results:
+            if error.is_present():
+                raise error.or_else_raise()
+
+        return [actions for actions, _ in results]
+
+    def close(self) -> None:
+        '''
+        Stops the workers. This `VWMindPool` cannot be used afterwards.
+        '''
+        for connection in self.__connections:
+            connection.send(None)
+            connection.close()
+
+        for worker in self.__workers:
+            worker.join()
+
+        self.__connections.clear()
+        self.__workers.clear()
+
+    @staticmethod
+    def serve(connection: Connection) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWMindPool` API.
+
+        The loop of a worker: it evaluates each batch of `VWMindJob` objects it receives, until it receives `None`.
+        '''
+        surrogates: dict[str, VWActorMindSurrogate] = {}
+
+        while True:
+            jobs: Any = connection.recv()
+
+            if jobs is None:
+                return
+
+            connection.send([VWMindPool.__evaluate(job=job, surrogates=surrogates) for job in jobs])
+
+    @staticmethod
+    def __evaluate(job: VWMindJob, surrogates: dict[str, VWActorMindSurrogate]) -> tuple[Iterable[VWAction], PyOptional[BaseException]]:
+        try:
+            if job.get_actor_id() not in surrogates:
+                surrogates[job.get_actor_id()] = job.load_surrogate()
+
+            return job.evaluate(surrogate=surrogates[job.get_actor_id()]), PyOptional[BaseException].empty()
+        except Exception as e:
+            return [], PyOptional[BaseException].of(e)
@@ -1,4 +1,5 @@
 from typing import Iterable, cast
+from time import perf_counter
 from pyoptional.pyoptional import PyOptional
 
 from pystarworldsturbo.common.message import BccMessage
@@ -12,8 +13,9 @@ from .appendices.vwactuators import VWActuator, VWCommunicativeActuator
 from ..actions.vwactions import VWAction, VWPhysicalAction, VWCommunicativeAction
 from ..actions.vwspeak_action import VWSpeakAction
 from ..actions.vwbroadcast_action import VWBroadcastAction
-from ..environment.vwrandomness import VWRandomEventTrigger
+from ..environment.vwcycle_hooks import VWCycleHooks
 from ...common.vwobservation import VWObservation
+from ...common.vwprofiler import VWProfiler
 from ...common.vwexceptions import VWActionAttemptException, VWPerceptionException
 from ...common.vwvalidator import VWValidator
 
@@ -110,31 +112,75 @@ class VWActor(Actor):
         '''
         Cycles the `VWActor`.
 
+        * the actor hooks (see `VWCycleHooks`), if any
         * `perceive()`
         * `revise()`
         * `decide()`
         * `execute()`
         '''
-        # If randomness is disabled, this call will do nothing.
-        VWRandomEventTrigger.activate()
+        # This costs a single check if no actor hook is registered.
+        if VWCycleHooks.HAS_ACTOR_HOOKS:
+            VWCycleHooks.run_actor_hooks(actor=self)
 
-        # Fetch the perceptions.
+        if VWProfiler.ENABLED:
+            self.__cycle_with_profiler()
+        else:
+            self.__cycle()
+
+    def __cycle(self) -> None:
+        # Fetch the perceptions, and store them into the mind.
+        self.perceive()
+
+        # Revise the internal state/beliefs based on the perceptions, and decide the next `VWAction` or `list[VWAction]` to attempt (within the time budget, if any).
+        self.get_mind().revise_and_decide()
+
+        # Attempt the execution of the `list[VWAction]` decided by the mind.
+        self.attempt_decided_actions()
+
+    def perceive(self) -> tuple[VWObservation, list[BccMessage]]:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWActor` API.
+
+        Fetches the perceptions of this `VWActor`, stores them into its `VWMind`, and returns them (e.g., for a copy of the `VWActorMindSurrogate` living in another process).
+        '''
         observation, messages = self.__get_percepts()
+        received_messages: list[BccMessage] = list(messages)
+
+        self.get_mind().perceive(observation=observation, messages=received_messages)
 
-        # Stores the perceptions into the mind.
-        self.get_mind().perceive(observation=observation, messages=messages)
+        return observation, received_messages
 
-        # Revise the internal state/beliefs based on the perceptions.
-        self.get_mind().revise()
+    def attempt_decided_actions(self) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWActor` API.
 
-        # Decide the next `VWAction` or `list[VWAction]` to attempt.
-        self.get_mind().decide()
+        Attempts the `VWAction` objects decided by the `VWMind` of this `VWActor`.
+        '''
+        self.__attempt_actions(actions=self.get_mind().execute())
 
-        # Attempt the execution of the `list[VWAction]` decided by the mind.
-        actions_to_attempt: Iterable[VWAction] = self.get_mind().execute()
+    def __cycle_with_profiler(self) -> None:
+        # Same as `__cycle()`, but each phase is timed. `revise()` and `decide()` are timed together, as `decide`.
+        mind_key: str = type(self.get_mind().get_surrogate()).__name__
+        start: float = perf_counter()
+
+        self.perceive()
+
+        start = self.__record_phase(phase="perceive", mind_key=mind_key, start=start)
+
+        self.get_mind().revise_and_decide()
+
+        start = self.__record_phase(phase="decide", mind_key=mind_key, start=start)
+
+        self.attempt_decided_actions()
+        self.__record_phase(phase="execute", mind_key=mind_key, start=start)
+
+    def __record_phase(self, phase: str, mind_key: str, start: float) -> float:
+        end: float = perf_counter()
+
+        VWProfiler.record(key=f"actor/{phase}/{self.get_id()}", seconds=end - start)
+        VWProfiler.record(key=f"mind/{phase}/{mind_key}", seconds=end - start)
 
-        # Attempt `list[VWAction]`.
-        self.__attempt_actions(actions=actions_to_attempt)
+        return end
 
     def __attempt_actions(self, actions: Iterable[VWAction]) -> None:
         for action in actions:
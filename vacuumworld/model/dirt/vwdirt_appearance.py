@@ -14,6 +14,8 @@ class VWDirtAppearance(Identifiable):
 
     A `VWDirt` (and, therefore, its `VWDirtAppearance`) is only characterised by its `VWColour`.
     '''
+    __slots__ = ("__colour",)
+
     def __init__(self, dirt_id: str, progressive_id: str, colour: VWColour) -> None:
         super(VWDirtAppearance, self).__init__(identifiable_id=dirt_id, progressive_id=progressive_id)
 
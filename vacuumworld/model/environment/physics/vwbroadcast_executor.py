@@ -5,7 +5,6 @@ from pystarworldsturbo.environment.physics.action_executor import ActionExecutor
 from pystarworldsturbo.common.action_result import ActionResult
 from pystarworldsturbo.common.action_outcome import ActionOutcome
 from pystarworldsturbo.common.exceptions import IdentityException
-from pystarworldsturbo.utils.utils import ignore
 
 from ...actions.vwbroadcast_action import VWBroadcastAction
 
@@ -23,8 +22,7 @@ class VWBroadcastExecutor(ActionExecutor):
 
         In any `VWEnvironment` a `VWBroadcastAction` is always possible. Therefore `True` is always returned.
         '''
-        ignore(env)
-        ignore(action)
+        del env, action
 
         return True
 
@@ -52,7 +50,6 @@ class VWBroadcastExecutor(ActionExecutor):
 
         There are no post-conditions for `VWBroadcastAction` to check in `VWEnvironment`, so `True` is always returned.
         '''
-        ignore(env)
-        ignore(action)
+        del env, action
 
         return True
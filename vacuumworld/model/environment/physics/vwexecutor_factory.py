@@ -1,4 +1,4 @@
-from typing import Type, cast
+from typing import Type
 from pyoptional.pyoptional import PyOptional
 
 from pystarworldsturbo.environment.physics.executor_factory import ExecutorFactory
@@ -11,7 +11,6 @@ from .vwdrop_executor import VWDropExecutor
 from .vwidle_executor import VWIdleExecutor
 from .vwspeak_executor import VWSpeakExecutor
 from .vwbroadcast_executor import VWBroadcastExecutor
-from ....common.vwvalidator import VWValidator
 from ...actions.vwactions import VWAction
 from ...actions.vwmove_action import VWMoveAction
 from ...actions.vwturn_action import VWTurnAction
@@ -25,7 +24,35 @@ from ...actions.vwbroadcast_action import VWBroadcastAction
 class VWExecutorFactory(ExecutorFactory):
     '''
     This class is a factory for creating `ActionExecutor` objects.
+
+    `ActionExecutor` objects are stateless, hence a single `ActionExecutor` is registered for each kind of `VWAction` (see `register_executor()`), and it is shared by every `VWAction` of that kind.
     '''
+    __EXECUTORS: dict[Type[VWAction], PyOptional[ActionExecutor]] = {}
+    __NO_EXECUTOR: PyOptional[ActionExecutor] = PyOptional[ActionExecutor].empty()
+
+    @staticmethod
+    def register_executor(action_type: Type[VWAction], executor: ActionExecutor) -> None:
+        '''
+        Registers `executor` as the `ActionExecutor` for the `VWAction` objects whose type is exactly `action_type`, replacing the previously registered one, if any.
+
+        `executor` must be stateless, as it is shared by every `VWAction` of type `action_type`.
+
+        A `TypeError` is raised if `action_type` is not a subclass of `VWAction`, or if `executor` is not an `ActionExecutor`.
+        '''
+        if not isinstance(action_type, type) or not issubclass(action_type, VWAction):
+            raise TypeError(f"Invalid action type: it should be a subclass of `VWAction`, but it is `{action_type}`.")
+        elif not isinstance(executor, ActionExecutor):
+            raise TypeError(f"Invalid executor: it should be an `ActionExecutor`, but it is `{type(executor)}`.")
+
+        VWExecutorFactory.__EXECUTORS[action_type] = PyOptional[ActionExecutor].of(executor)
+
+    @staticmethod
+    def unregister_executor(action_type: Type[VWAction]) -> None:
+        '''
+        Unregisters the `ActionExecutor` for the `VWAction` objects whose type is exactly `action_type`. Nothing happens if no `ActionExecutor` is registered for `action_type`.
+        '''
+        VWExecutorFactory.__EXECUTORS.pop(action_type, None)
+
     @staticmethod
     def get_executor_for(action: VWAction) -> PyOptional[ActionExecutor]:
         '''
@@ -33,21 +60,13 @@ class VWExecutorFactory(ExecutorFactory):
         '''
         assert isinstance(action, VWAction)
 
-        action_type: Type[VWAction] = type(action)
-
-        if action_type == VWMoveAction:
-            return PyOptional.of(VWMoveExecutor()).filter(lambda e: VWValidator.does_type_match(t=ActionExecutor, obj=e)).map(lambda e: cast(ActionExecutor, e))
-        elif action_type == VWTurnAction:
-            return PyOptional.of(VWTurnExecutor()).filter(lambda e: VWValidator.does_type_match(t=ActionExecutor, obj=e)).map(lambda e: cast(ActionExecutor, e))
-        elif action_type == VWCleanAction:
-            return PyOptional.of(VWCleanExecutor()).filter(lambda e: VWValidator.does_type_match(t=ActionExecutor, obj=e)).map(lambda e: cast(ActionExecutor, e))
-        elif action_type == VWDropAction:
-            return PyOptional.of(VWDropExecutor()).filter(lambda e: VWValidator.does_type_match(t=ActionExecutor, obj=e)).map(lambda e: cast(ActionExecutor, e))
-        elif action_type == VWIdleAction:
-            return PyOptional.of(VWIdleExecutor()).filter(lambda e: VWValidator.does_type_match(t=ActionExecutor, obj=e)).map(lambda e: cast(ActionExecutor, e))
-        elif action_type == VWSpeakAction:
-            return PyOptional.of(VWSpeakExecutor()).filter(lambda e: VWValidator.does_type_match(t=ActionExecutor, obj=e)).map(lambda e: cast(ActionExecutor, e))
-        elif action_type == VWBroadcastAction:
-            return PyOptional.of(VWBroadcastExecutor()).filter(lambda e: VWValidator.does_type_match(t=ActionExecutor, obj=e)).map(lambda e: cast(ActionExecutor, e))
-        else:
-            return PyOptional[ActionExecutor].empty()
+        return VWExecutorFactory.__EXECUTORS.get(type(action), VWExecutorFactory.__NO_EXECUTOR)
+
+
+VWExecutorFactory.register_executor(action_type=VWMoveAction, executor=VWMoveExecutor())
+VWExecutorFactory.register_executor(action_type=VWTurnAction, executor=VWTurnExecutor())
+VWExecutorFactory.register_executor(action_type=VWCleanAction, executor=VWCleanExecutor())
+VWExecutorFactory.register_executor(action_type=VWDropAction, executor=VWDropExecutor())
+VWExecutorFactory.register_executor(action_type=VWIdleAction, executor=VWIdleExecutor())
+VWExecutorFactory.register_executor(action_type=VWSpeakAction, executor=VWSpeakExecutor())
+VWExecutorFactory.register_executor(action_type=VWBroadcastAction, executor=VWBroadcastExecutor())
@@ -4,7 +4,6 @@ from typing import TYPE_CHECKING
 from pystarworldsturbo.environment.physics.action_executor import ActionExecutor
 from pystarworldsturbo.common.action_result import ActionResult
 from pystarworldsturbo.common.action_outcome import ActionOutcome
-from pystarworldsturbo.utils.utils import ignore
 
 from ...actions.vwidle_action import VWIdleAction
 
@@ -22,8 +21,7 @@ class VWIdleExecutor(ActionExecutor):
 
         In any `VWEnvironment` a `VWIdleAction` is always possible. Therefore `True` is always returned.
         '''
-        ignore(env)
-        ignore(action)
+        del env, action
 
         return True
 
@@ -33,8 +31,7 @@ class VWIdleExecutor(ActionExecutor):
 
         For every `VWIdleAction` in any `VWEnvironment` the provisional `ActionResult` will always have an `ActionOutcome` of `ActionOutcome.success`.
         '''
-        ignore(env)
-        ignore(action)
+        del env, action
 
         return ActionResult(ActionOutcome.success)
 
@@ -44,7 +41,6 @@ class VWIdleExecutor(ActionExecutor):
 
         There are no post-conditions for `VWIdleAction` to check in `VWEnvironment`, so `True` is always returned.
         '''
-        ignore(env)
-        ignore(action)
+        del env, action
 
         return True
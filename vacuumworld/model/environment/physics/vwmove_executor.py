@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
+from pyoptional.pyoptional import PyOptional
 
 from pystarworldsturbo.environment.physics.action_executor import ActionExecutor
 from pystarworldsturbo.common.action_result import ActionResult
@@ -30,10 +31,10 @@ class VWMoveExecutor(ActionExecutor):
         actor_id: str = action.get_actor_id()
         actor_position: VWCoord = env.get_actor_position(actor_id=actor_id)
         actor_orientation: VWOrientation = env.get_actor_orientation(actor_id=actor_id)
-        forward_position: VWCoord = actor_position.forward(orientation=actor_orientation)
+        forward_position: PyOptional[VWCoord] = env.get_ambient().get_neighbourhood_table().get_forward(coord=actor_position, orientation=actor_orientation)
 
         # The target location must not be out of bounds and must contain no actor.
-        return forward_position in env.get_ambient().get_grid() and not env.get_ambient().get_grid()[forward_position].has_actor()
+        return forward_position.is_present() and not env.get_ambient().get_grid()[forward_position.or_else_raise()].has_actor()
 
     def attempt(self, env: VWEnvironment, action: VWMoveAction) -> ActionResult:
         '''
@@ -48,9 +49,9 @@ class VWMoveExecutor(ActionExecutor):
             actor_id: str = action.get_actor_id()
             actor_position: VWCoord = env.get_actor_position(actor_id=actor_id)
             actor_orientation: VWOrientation = env.get_actor_orientation(actor_id=actor_id)
-            forward_position: VWCoord = actor_position.forward(orientation=actor_orientation)
+            forward_position: VWCoord = env.get_ambient().get_neighbourhood_table().get_forward(coord=actor_position, orientation=actor_orientation).or_else_raise()
 
-            assert forward_position in env.get_ambient().get_grid() and not env.get_ambient().get_grid()[forward_position].has_actor()
+            assert not env.get_ambient().get_grid()[forward_position].has_actor()
 
             env.move_actor(from_coord=actor_position, to_coord=forward_position)
 
@@ -70,7 +71,7 @@ class VWMoveExecutor(ActionExecutor):
         actor_id: str = action.get_actor_id()
         actor_orientation: VWOrientation = env.get_actor_orientation(actor_id=actor_id)
         actor_position_after_move: VWCoord = env.get_actor_position(actor_id=actor_id)
-        actor_position_before_move: VWCoord = actor_position_after_move.backward(orientation=actor_orientation)
+        actor_position_before_move: VWCoord = env.get_ambient().get_neighbourhood_table().get_backward(coord=actor_position_after_move, orientation=actor_orientation).or_else_raise()
 
         if not env.get_ambient().get_grid()[actor_position_after_move].has_actor():
             return False
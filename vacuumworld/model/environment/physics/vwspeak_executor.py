@@ -5,7 +5,6 @@ from pystarworldsturbo.environment.physics.action_executor import ActionExecutor
 from pystarworldsturbo.common.action_result import ActionResult
 from pystarworldsturbo.common.action_outcome import ActionOutcome
 from pystarworldsturbo.common.exceptions import IdentityException
-from pystarworldsturbo.utils.utils import ignore
 
 from ...actions.vwspeak_action import VWSpeakAction
 
@@ -23,8 +22,7 @@ class VWSpeakExecutor(ActionExecutor):
 
         In any `VWEnvironment` a `VWSpeakAction` is always possible. Therefore `True` is always returned.
         '''
-        ignore(env)
-        ignore(action)
+        del env, action
 
         return True
 
@@ -52,7 +50,6 @@ class VWSpeakExecutor(ActionExecutor):
 
         There are no post-conditions for `VWSpeakAction` to check in `VWEnvironment`, so `True` is always returned.
         '''
-        ignore(env)
-        ignore(action)
+        del env, action
 
         return True
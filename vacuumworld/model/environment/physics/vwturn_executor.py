@@ -4,7 +4,6 @@ from typing import TYPE_CHECKING
 from pystarworldsturbo.environment.physics.action_executor import ActionExecutor
 from pystarworldsturbo.common.action_result import ActionResult
 from pystarworldsturbo.common.action_outcome import ActionOutcome
-from pystarworldsturbo.utils.utils import ignore
 
 from ...actions.vwturn_action import VWTurnAction
 from ....common.vwcoordinates import VWCoord
@@ -24,8 +23,7 @@ class VWTurnExecutor(ActionExecutor):
 
         In any `VWEnvironment` a `VWTurnAction` is always possible. Therefore `True` is always returned.
         '''
-        ignore(env)
-        ignore(action)
+        del env, action
 
         return True
 
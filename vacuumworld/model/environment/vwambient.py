@@ -1,17 +1,26 @@
 from typing import Type
+from collections.abc import MutableMapping
 from math import floor, sqrt
 
+import numpy as np
+from numpy.typing import NDArray
+
 from pystarworldsturbo.environment.ambient import Ambient
 from pystarworldsturbo.common.action_result import ActionResult
 
 from .vwlocation import VWLocation
+from .vwfrozen_location import VWFrozenLocation
+from .vwneighbourhood_table import VWNeighbourhoodTable
 from ..actor.appearance.vwactor_appearance import VWActorAppearance
+from ..actor.appearance.vwfrozen_actor_appearance import VWFrozenActorAppearance
 from ..dirt.vwdirt_appearance import VWDirtAppearance
 from ...common.vwcoordinates import VWCoord
 from ...common.vwdirection import VWDirection
 from ...common.vwobservation import VWObservation
+from ...common.vwobservation_batch import VWObservationBatch
 from ...common.vwposition_names import VWPositionNames
 from ...common.vworientation import VWOrientation
+from ...common.vwwall import VWWall
 from ...model.actions.vwactions import VWAction
 
 
@@ -20,13 +29,16 @@ class VWAmbient(Ambient):
     This class acts as a wrapper for the grid, which is a `dict[Coord, VWLocation]` mapping `VWCoord` objects to `VWLocation` objects.
 
     An API is provided to query and modify the grid.
+
+    The `VWLocation` objects included in the perceptions are cached `VWFrozenLocation` snapshots (see `get_location_snapshot()`).
     '''
     def __init__(self, grid: dict[VWCoord, VWLocation]={}) -> None:
         self.__grid: dict[VWCoord, VWLocation] = grid
+        self.__snapshots: dict[VWCoord, tuple[int, VWLocation]] = {}
 
-    def get_grid(self) -> dict[VWCoord, VWLocation]:
+    def get_grid(self) -> MutableMapping[VWCoord, VWLocation]:
         '''
-        Returns the grid as a `dict[Coord, VWLocation]`, where each `VWCoord` is mapped to a `VWLocation`.
+        Returns the grid as a `MutableMapping[Coord, VWLocation]` (a `dict`, unless a subclass overrides this method), where each `VWCoord` is mapped to a `VWLocation`.
         '''
         return self.__grid
 
@@ -36,7 +48,7 @@ class VWAmbient(Ambient):
 
         The dimension of the grid is the square root of the number of `VWLocation` objects in the grid.
         '''
-        number_of_locations: int = len(self.__grid)
+        number_of_locations: int = len(self.get_grid())
         tmp: float = sqrt(number_of_locations)
         grid_dim: int = floor(tmp)
 
@@ -44,15 +56,77 @@ class VWAmbient(Ambient):
 
         return int(grid_dim)
 
+    def get_neighbourhood_table(self) -> VWNeighbourhoodTable:
+        '''
+        Returns the (shared) `VWNeighbourhoodTable` for the dimension of the grid.
+        '''
+        return VWNeighbourhoodTable.of(grid_dim=self.get_grid_dim())
+
+    def get_actor_positions(self) -> dict[str, VWCoord]:
+        '''
+        Returns a `dict[str, VWCoord]` mapping the ID of each `VWActor` in the grid to the `VWCoord` of its `VWLocation`.
+
+        This method scans the whole grid.
+        '''
+        return {location.get_actor_appearance().or_else_raise().get_id(): coord for coord, location in self.get_grid().items() if location.has_actor()}
+
+    def get_non_default_locations(self) -> list[VWLocation]:
+        '''
+        Returns a `list[VWLocation]` containing every `VWLocation` of the grid which has a `VWActor`, a `VWDirt`, or walls different from the default ones (see `get_default_wall()`).
+
+        These are the only `VWLocation` objects that need to be stored to rebuild the grid, given its dimension.
+        '''
+        grid_dim: int = self.get_grid_dim()
+
+        return [location for coord, location in self.get_grid().items() if not location.is_empty() or location.get_wall_mask() != VWAmbient.get_default_wall_mask(coord=coord, grid_dim=grid_dim)]
+
+    @staticmethod
+    def get_default_wall(coord: VWCoord, grid_dim: int) -> dict[VWOrientation, bool]:
+        '''
+        Generates and returns the default wall `dict[VWOrientation, bool]` for the `VWLocation` whose coordinates match `coord`, given `grid_dim`.
+
+        By default, only the perimeter of the grid has walls.
+        '''
+        return dict(VWWall.to_pattern(mask=VWAmbient.get_default_wall_mask(coord=coord, grid_dim=grid_dim)))
+
+    @staticmethod
+    def get_default_wall_mask(coord: VWCoord, grid_dim: int) -> int:
+        '''
+        Returns the default `VWWall` mask for the `VWLocation` whose coordinates match `coord`, given `grid_dim` (see `get_default_wall()`).
+        '''
+        return (VWWall.NORTH if coord.get_y() == 0 else 0) | (VWWall.SOUTH if coord.get_y() == grid_dim - 1 else 0) | (VWWall.WEST if coord.get_x() == 0 else 0) | (VWWall.EAST if coord.get_x() == grid_dim - 1 else 0)
+
     def get_location_interface(self, coord: VWCoord) -> VWLocation:
         '''
         Returns the appearance of the `VWLocation` whose coordinates match the `VWCoord` argument `coord`.
 
         This method assumes (via assertion) that `coord` is in bounds.
         '''
-        assert coord in self.__grid
+        grid: MutableMapping[VWCoord, VWLocation] = self.get_grid()
+
+        assert coord in grid
+
+        return grid[coord]
+
+    def get_location_snapshot(self, coord: VWCoord) -> VWLocation:
+        '''
+        Returns an immutable snapshot (a `VWFrozenLocation`) of the `VWLocation` whose coordinates match the `VWCoord` argument `coord`.
+
+        Snapshots are cached, and the same snapshot is returned until the version of the `VWLocation` changes (see `VWLocation.get_version()`).
+
+        This method assumes (via assertion) that `coord` is in bounds.
+        '''
+        location: VWLocation = self.get_location_interface(coord=coord)
+        version: int = location.get_version()
+
+        if coord in self.__snapshots and self.__snapshots[coord][0] == version:
+            return self.__snapshots[coord][1]
+
+        snapshot: VWLocation = VWFrozenLocation(location=location)
 
-        return self.__grid[coord]
+        self.__snapshots[coord] = (version, snapshot)
+
+        return snapshot
 
     def is_actor_at(self, coord: VWCoord) -> bool:
         '''
@@ -60,7 +134,9 @@ class VWAmbient(Ambient):
 
         If `coord` is not in bounds, this method returns `False`.
         '''
-        return coord in self.__grid and self.__grid[coord].has_actor()
+        grid: MutableMapping[VWCoord, VWLocation] = self.get_grid()
+
+        return coord in grid and grid[coord].has_actor()
 
     def is_dirt_at(self, coord: VWCoord) -> bool:
         '''
@@ -68,7 +144,9 @@ class VWAmbient(Ambient):
 
         If `coord` is not in bounds, this method returns `False`.
         '''
-        return coord in self.__grid and self.__grid[coord].has_dirt()
+        grid: MutableMapping[VWCoord, VWLocation] = self.get_grid()
+
+        return coord in grid and grid[coord].has_dirt()
 
     def move_actor(self, from_coord: VWCoord, to_coord: VWCoord) -> None:
         '''
@@ -82,14 +160,16 @@ class VWAmbient(Ambient):
 
         * `from_coord` and `to_coord` are in bounds.
         '''
-        assert from_coord in self.__grid and to_coord in self.__grid
-        assert self.__grid[from_coord].has_actor()
-        assert not self.__grid[to_coord].has_actor()
+        grid: MutableMapping[VWCoord, VWLocation] = self.get_grid()
+
+        assert from_coord in grid and to_coord in grid
+        assert grid[from_coord].has_actor()
+        assert not grid[to_coord].has_actor()
 
-        actor: VWActorAppearance = self.__grid[from_coord].get_actor_appearance().or_else_raise()
+        actor: VWActorAppearance = grid[from_coord].get_actor_appearance().or_else_raise()
 
-        self.__grid[from_coord].remove_actor()
-        self.__grid[to_coord].add_actor(actor_appearance=actor)
+        grid[from_coord].remove_actor()
+        grid[to_coord].add_actor(actor_appearance=actor)
 
     def turn_actor(self, coord: VWCoord, direction: VWDirection) -> None:
         '''
@@ -101,9 +181,12 @@ class VWAmbient(Ambient):
 
         * `coord` is in bounds.
         '''
-        assert coord in self.__grid and self.__grid[coord].has_actor()
+        grid: MutableMapping[VWCoord, VWLocation] = self.get_grid()
 
-        self.__grid[coord].get_actor_appearance().or_else_raise().turn(direction=direction)
+        assert coord in grid and grid[coord].has_actor()
+
+        grid[coord].get_actor_appearance().or_else_raise().turn(direction=direction)
+        grid[coord].mark_as_changed()
 
     def drop_dirt(self, coord: VWCoord, dirt_appearance: VWDirtAppearance) -> None:
         '''
@@ -117,9 +200,11 @@ class VWAmbient(Ambient):
 
         * `coord` is in bounds.
         '''
-        assert coord in self.__grid and not self.__grid[coord].has_dirt()
+        grid: MutableMapping[VWCoord, VWLocation] = self.get_grid()
+
+        assert coord in grid and not grid[coord].has_dirt()
 
-        self.__grid[coord].add_dirt(dirt_appearance=dirt_appearance)
+        grid[coord].add_dirt(dirt_appearance=dirt_appearance)
 
     def remove_dirt(self, coord: VWCoord) -> None:
         '''
@@ -131,9 +216,11 @@ class VWAmbient(Ambient):
 
         * `coord` is in bounds.
         '''
-        assert coord in self.__grid and self.__grid[coord].has_dirt()
+        grid: MutableMapping[VWCoord, VWLocation] = self.get_grid()
+
+        assert coord in grid and grid[coord].has_dirt()
 
-        self.__grid[coord].remove_dirt()
+        grid[coord].remove_dirt()
 
     def generate_perception(self, actor_position: VWCoord, action_type: Type[VWAction], action_result:  ActionResult) -> VWObservation:
         '''
@@ -149,9 +236,9 @@ class VWAmbient(Ambient):
 
         * `VWPositionNames.center` is mapped to the `VWLocation` whose coordinates match the `VWCoord` argument `actor_position`.
 
-        * For every other member of `VWPositionNames`, the corresponding `VWCoord` is calculated.
+        * For every other member of `VWPositionNames`, the corresponding `VWCoord` is looked up in the `VWNeighbourhoodTable` of the grid.
 
-        * If such `VWCoord` is in bounds, then it is mapped to the `VWLocation` whose `VWCoord` matches it. Otherwise, that particular member of `VWPositionNames` is skipped.
+        * If such `VWCoord` is in bounds, then it is mapped to the snapshot of the `VWLocation` whose `VWCoord` matches it (see `get_location_snapshot()`). Otherwise, that particular member of `VWPositionNames` is skipped.
 
         * Finally, `action_type` and `action_result` are added to the `VWObservation`, the former being mapped to the latter.
 
@@ -161,45 +248,82 @@ class VWAmbient(Ambient):
 
         * `actor_position` is in bounds.
         '''
-        assert actor_position in self.__grid and self.__grid[actor_position].has_actor()
+        grid: MutableMapping[VWCoord, VWLocation] = self.get_grid()
+
+        assert actor_position in grid and grid[actor_position].has_actor()
 
         locations_dict: dict[VWPositionNames, VWLocation] = {}
 
-        orientation: VWOrientation = self.__grid[actor_position].get_actor_appearance().or_else_raise().get_orientation()
+        orientation: VWOrientation = grid[actor_position].get_actor_appearance().or_else_raise().get_orientation()
+        table: VWNeighbourhoodTable = self.get_neighbourhood_table()
 
-        forward_coord: VWCoord = actor_position.forward(orientation=orientation)
-        left_coord: VWCoord = actor_position.left(orientation=orientation)
-        right_coord: VWCoord = actor_position.right(orientation=orientation)
-        forwardleft_coord: VWCoord = actor_position.forwardleft(orientation=orientation)
-        forwardright_coord: VWCoord = actor_position.forwardright(orientation=orientation)
+        for position, index in zip(VWNeighbourhoodTable.POSITIONS, table.get_neighbour_indices(index=table.get_cell_index(coord=actor_position), orientation=orientation)):
+            if index != VWNeighbourhoodTable.NO_VALUE:
+                locations_dict[position] = self.get_location_snapshot(coord=table.get_coord_of_cell(index=index))
 
-        locations_dict[VWPositionNames.center] = self.__grid[actor_position].deep_copy()
+        return VWObservation(action_type=action_type, action_result=action_result, locations_dict=locations_dict)
 
-        if forward_coord in self.__grid:
-            locations_dict[VWPositionNames.forward] = self.__grid[forward_coord].deep_copy()
+    def generate_observation_batch(self) -> VWObservationBatch:
+        '''
+        Returns a `VWObservationBatch` with the observation of every `VWActor` in the grid, whose rows are sorted by position (`y` first, then `x`).
 
-        if left_coord in self.__grid:
-            locations_dict[VWPositionNames.left] = self.__grid[left_coord].deep_copy()
+        Unlike `generate_perception()`, this method observes every `VWActor` in a single pass.
+        '''
+        grid: MutableMapping[VWCoord, VWLocation] = self.get_grid()
+        positions: list[VWCoord] = sorted(self.get_actor_positions().values(), key=lambda coord: (coord.get_y(), coord.get_x()))
+        actor_rows: dict[VWCoord, int] = {coord: row for row, coord in enumerate(positions)}
+        actor_appearances: list[VWActorAppearance] = [VWFrozenActorAppearance(grid[coord].get_actor_appearance().or_else_raise()) for coord in positions]
+        dirt_indices: dict[VWCoord, int] = {}
+        dirt_appearances: list[VWDirtAppearance] = []
+        tensor: NDArray[np.int32] = np.full((len(positions), len(VWObservationBatch.POSITIONS), VWObservationBatch.NUMBER_OF_FEATURES), VWObservationBatch.NO_VALUE, dtype=np.int32)
 
-        if right_coord in self.__grid:
-            locations_dict[VWPositionNames.right] = self.__grid[right_coord].deep_copy()
+        table: VWNeighbourhoodTable = self.get_neighbourhood_table()
 
-        if forwardleft_coord in self.__grid:
-            locations_dict[VWPositionNames.forwardleft] = self.__grid[forwardleft_coord].deep_copy()
+        tensor[:, :, VWObservationBatch.PRESENT] = 0
 
-        if forwardright_coord in self.__grid:
-            locations_dict[VWPositionNames.forwardright] = self.__grid[forwardright_coord].deep_copy()
+        for row, coord in enumerate(positions):
+            for column, index in enumerate(table.get_neighbour_indices(index=table.get_cell_index(coord=coord), orientation=actor_appearances[row].get_orientation())):
+                if index == VWNeighbourhoodTable.NO_VALUE:
+                    continue
 
-        return VWObservation(action_type=action_type, action_result=action_result, locations_dict=locations_dict)
+                neighbour: VWCoord = table.get_coord_of_cell(index=index)
+                location: VWLocation = grid[neighbour]
+                features: NDArray[np.int32] = tensor[row, column]
+
+                features[VWObservationBatch.PRESENT] = 1
+                features[VWObservationBatch.X] = neighbour.get_x()
+                features[VWObservationBatch.Y] = neighbour.get_y()
+                features[VWObservationBatch.WALLS] = location.get_wall_mask()
+
+                if location.has_actor():
+                    actor_appearance: VWActorAppearance = location.get_actor_appearance().or_else_raise()
+
+                    features[VWObservationBatch.ACTOR] = actor_rows[neighbour]
+                    features[VWObservationBatch.ACTOR_COLOUR] = VWObservationBatch.COLOUR_CODES[actor_appearance.get_colour()]
+                    features[VWObservationBatch.ACTOR_ORIENTATION] = VWObservationBatch.ORIENTATION_CODES[actor_appearance.get_orientation()]
+
+                if location.has_dirt():
+                    dirt_appearance: VWDirtAppearance = location.get_dirt_appearance().or_else_raise()
+
+                    if neighbour not in dirt_indices:
+                        dirt_indices[neighbour] = len(dirt_appearances)
+                        dirt_appearances.append(dirt_appearance.deep_copy())
+
+                    features[VWObservationBatch.DIRT] = dirt_indices[neighbour]
+                    features[VWObservationBatch.DIRT_COLOUR] = VWObservationBatch.COLOUR_CODES[dirt_appearance.get_colour()]
+
+        return VWObservationBatch(actor_ids=[actor_appearance.get_id() for actor_appearance in actor_appearances], tensor=tensor, actor_appearances=actor_appearances, dirt_appearances=dirt_appearances)
 
     def __str__(self) -> str:
+        grid: MutableMapping[VWCoord, VWLocation] = self.get_grid()
+
         grid_dim: int = self.get_grid_dim()
         locations_list: list[str] = []
 
         for i in range(grid_dim):
             for j in range(grid_dim):
-                c: VWCoord = VWCoord(x=j, y=i)
-                locations_list.append(self.__grid[c].visualise())
+                c: VWCoord = VWCoord.of(x=j, y=i)
+                locations_list.append(grid[c].visualise())
 
         partial_representation: str = VWAmbient.__compactify(grid_dim=grid_dim, locations_list=locations_list)
         streamlined_representation: str = VWAmbient.__streamline(grid_dim=grid_dim, partial_representation=partial_representation)
@@ -0,0 +1,612 @@
+from __future__ import annotations
+from typing import Iterator, Mapping, Optional
+from collections.abc import MutableMapping
+from math import floor, sqrt
+from pyoptional.pyoptional import PyOptional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .vwambient import VWAmbient
+from .vwlocation import VWLocation
+from ..actor.appearance.vwactor_appearance import VWActorAppearance
+from ..actor.appearance.vwfrozen_actor_appearance import VWFrozenActorAppearance
+from ..dirt.vwdirt_appearance import VWDirtAppearance
+from ...common.vwcoordinates import VWCoord
+from ...common.vwcolour import VWColour
+from ...common.vwdirection import VWDirection
+from ...common.vworientation import VWOrientation
+from ...common.vwexceptions import VWInternalError
+from ...common.vwobservation_batch import VWObservationBatch
+
+
+class VWArrayAmbient(VWAmbient):
+    '''
+    This class is an alternative to `VWAmbient` for large grids. Instead of a `dict[VWCoord, VWLocation]`, the grid is stored as a structure of arrays, with one NumPy array per attribute, and one entry per cell.
+
+    Each cell is identified by its index, which is `y * grid_dim + x`, and is described by:
+
+    * An actor slot, which indexes the table of `VWActorAppearance` objects (`-1` if the cell has no `VWActor`).
+
+    * The `VWOrientation` code, and the `VWColour` code of the `VWActor` in the cell (`-1` if the cell has no `VWActor`).
+
+    * The `VWColour` code of the `VWDirt` in the cell (`-1` if the cell has no `VWDirt`).
+
+    * A wall bitmask, with one bit per `VWOrientation`.
+
+    `VWLocation` objects are only produced on demand, as lightweight `VWLocationView` objects that read from (and write to) the arrays. Hence, the `VWAmbient` API (including `get_grid()`) keeps working as usual.
+    '''
+    # The codes are the same as the ones of `VWObservationBatch`, so that the arrays can be copied into a `VWObservationBatch` as they are.
+    NO_VALUE: int = VWObservationBatch.NO_VALUE
+    ORIENTATIONS: list[VWOrientation] = VWObservationBatch.ORIENTATIONS
+    COLOURS: list[VWColour] = VWObservationBatch.COLOURS
+    ORIENTATION_CODES: dict[VWOrientation, int] = VWObservationBatch.ORIENTATION_CODES
+    COLOUR_CODES: dict[VWColour, int] = VWObservationBatch.COLOUR_CODES
+    WALL_PATTERNS: list[Mapping[VWOrientation, bool]] = VWObservationBatch.WALL_PATTERNS
+
+    def __init__(self, grid_dim: int) -> None:
+        super(VWArrayAmbient, self).__init__(grid={})
+
+        assert grid_dim > 0
+
+        number_of_cells: int = grid_dim * grid_dim
+        xs: NDArray[np.int64] = np.arange(number_of_cells) % grid_dim
+        ys: NDArray[np.int64] = np.arange(number_of_cells) // grid_dim
+
+        self.__grid_dim: int = grid_dim
+        self.__actor_slots: NDArray[np.int32] = np.full(number_of_cells, VWArrayAmbient.NO_VALUE, dtype=np.int32)
+        self.__actor_orientations: NDArray[np.int8] = np.full(number_of_cells, VWArrayAmbient.NO_VALUE, dtype=np.int8)
+        self.__actor_colours: NDArray[np.int8] = np.full(number_of_cells, VWArrayAmbient.NO_VALUE, dtype=np.int8)
+        self.__dirt_colours: NDArray[np.int8] = np.full(number_of_cells, VWArrayAmbient.NO_VALUE, dtype=np.int8)
+        self.__default_walls: NDArray[np.uint8] = np.zeros(number_of_cells, dtype=np.uint8)
+        self.__actor_appearances: list[Optional[VWActorAppearance]] = []
+        self.__free_actor_slots: list[int] = []
+        self.__dirt_appearances: dict[int, VWDirtAppearance] = {}
+        # No cell has been modified yet, so every cell starts from the same version, which `VWLocation.next_version()` never returns.
+        self.__versions: NDArray[np.int64] = np.full(number_of_cells, VWArrayAmbient.NO_VALUE, dtype=np.int64)
+        self.__grid: VWArrayGrid = VWArrayGrid(ambient=self)
+
+        # The default walls are the perimeter of the grid (see `VWAmbient.get_default_wall()`).
+        self.__default_walls[ys == 0] |= VWArrayAmbient.get_wall_bit(orientation=VWOrientation.north)
+        self.__default_walls[ys == grid_dim - 1] |= VWArrayAmbient.get_wall_bit(orientation=VWOrientation.south)
+        self.__default_walls[xs == 0] |= VWArrayAmbient.get_wall_bit(orientation=VWOrientation.west)
+        self.__default_walls[xs == grid_dim - 1] |= VWArrayAmbient.get_wall_bit(orientation=VWOrientation.east)
+
+        self.__walls: NDArray[np.uint8] = self.__default_walls.copy()
+
+    @staticmethod
+    def from_grid(grid: MutableMapping[VWCoord, VWLocation]) -> VWArrayAmbient:
+        '''
+        Creates and returns a `VWArrayAmbient` with the same content as `grid`.
+
+        This method assumes (via assertion) that `grid` is square.
+        '''
+        tmp: float = sqrt(len(grid))
+        grid_dim: int = floor(tmp)
+
+        assert grid_dim == tmp
+
+        ambient: VWArrayAmbient = VWArrayAmbient(grid_dim=grid_dim)
+
+        for coord, location in grid.items():
+            ambient.get_grid()[coord] = location
+
+        return ambient
+
+    @staticmethod
+    def get_wall_bit(orientation: VWOrientation) -> int:
+        '''
+        Returns the bit of the wall bitmask which corresponds to the side of a cell identified by `orientation`.
+        '''
+        return VWObservationBatch.get_wall_bit(orientation=orientation)
+
+    @staticmethod
+    def wall_to_mask(wall: dict[VWOrientation, bool]) -> int:
+        '''
+        Returns the wall bitmask which corresponds to the `wall` `dict`.
+        '''
+        return VWObservationBatch.wall_to_mask(wall=wall)
+
+    def get_grid(self) -> MutableMapping[VWCoord, VWLocation]:
+        '''
+        Returns the grid as a `MutableMapping[VWCoord, VWLocation]`, which creates a `VWLocationView` each time a `VWLocation` is accessed.
+        '''
+        return self.__grid
+
+    def get_grid_dim(self) -> int:
+        '''
+        Returns the dimension of the grid as an `int`.
+        '''
+        return self.__grid_dim
+
+    def get_actor_positions(self) -> dict[str, VWCoord]:
+        '''
+        Returns a `dict[str, VWCoord]` mapping the ID of each `VWActor` in the grid to the `VWCoord` of its cell.
+
+        Only the occupied cells are visited.
+        '''
+        positions: dict[str, VWCoord] = {}
+
+        for index in np.flatnonzero(self.__actor_slots != VWArrayAmbient.NO_VALUE).tolist():
+            positions[self.get_actor_appearance_at_cell(index=index).or_else_raise().get_id()] = self.get_coord_of_cell(index=index)
+
+        return positions
+
+    def get_non_default_locations(self) -> list[VWLocation]:
+        '''
+        Returns a `list[VWLocation]` containing a `VWLocationView` for every cell which has a `VWActor`, a `VWDirt`, or walls different from the default ones (see `VWAmbient.get_default_wall()`).
+
+        Only such cells are visited.
+        '''
+        non_default: NDArray[np.bool_] = (self.__actor_slots != VWArrayAmbient.NO_VALUE) | (self.__dirt_colours != VWArrayAmbient.NO_VALUE) | (self.__walls != self.__default_walls)
+
+        return [VWLocationView(ambient=self, index=index, coord=self.get_coord_of_cell(index=index)) for index in np.flatnonzero(non_default).tolist()]
+
+    def generate_observation_batch(self) -> VWObservationBatch:
+        '''
+        Returns a `VWObservationBatch` with the observation of every `VWActor` in the grid, whose rows are sorted by cell index.
+
+        The tensor is computed with vectorised operations on the arrays and on the `VWNeighbourhoodTable` of the grid. Only the appearances of the `VWActor` objects, and of the visible `VWDirt` objects, are copied one by one.
+        '''
+        grid_dim: int = self.__grid_dim
+        cells: NDArray[np.int64] = np.flatnonzero(self.__actor_slots != VWArrayAmbient.NO_VALUE)
+        table_neighbours: NDArray[np.int64] = self.get_neighbourhood_table().get_neighbour_array()[self.__actor_orientations[cells], cells]
+        present: NDArray[np.bool_] = table_neighbours != VWArrayAmbient.NO_VALUE
+        # Out-of-bounds positions read cell `0`, and are then masked out.
+        neighbours: NDArray[np.int64] = np.where(present, table_neighbours, 0)
+        has_actor: NDArray[np.bool_] = present & (self.__actor_slots[neighbours] != VWArrayAmbient.NO_VALUE)
+        has_dirt: NDArray[np.bool_] = present & (self.__dirt_colours[neighbours] != VWArrayAmbient.NO_VALUE)
+        tensor: NDArray[np.int32] = np.full((len(cells), len(VWObservationBatch.POSITIONS), VWObservationBatch.NUMBER_OF_FEATURES), VWObservationBatch.NO_VALUE, dtype=np.int32)
+
+        tensor[:, :, VWObservationBatch.PRESENT] = present
+        tensor[:, :, VWObservationBatch.X] = np.where(present, neighbours % grid_dim, VWObservationBatch.NO_VALUE)
+        tensor[:, :, VWObservationBatch.Y] = np.where(present, neighbours // grid_dim, VWObservationBatch.NO_VALUE)
+        tensor[:, :, VWObservationBatch.WALLS] = np.where(present, self.__walls[neighbours].astype(np.int32), VWObservationBatch.NO_VALUE)
+        tensor[:, :, VWObservationBatch.ACTOR] = np.where(has_actor, np.searchsorted(cells, neighbours), VWObservationBatch.NO_VALUE)
+        tensor[:, :, VWObservationBatch.ACTOR_COLOUR] = np.where(present, self.__actor_colours[neighbours], VWObservationBatch.NO_VALUE)
+        tensor[:, :, VWObservationBatch.ACTOR_ORIENTATION] = np.where(present, self.__actor_orientations[neighbours], VWObservationBatch.NO_VALUE)
+        tensor[:, :, VWObservationBatch.DIRT_COLOUR] = np.where(present, self.__dirt_colours[neighbours], VWObservationBatch.NO_VALUE)
+
+        # The `VWDirtAppearance` objects are numbered in order of first appearance in the tensor, as in `VWAmbient.generate_observation_batch()`.
+        dirt_cells, first_positions, dirt_inverse = np.unique(neighbours[has_dirt], return_index=True, return_inverse=True)
+        order: NDArray[np.int64] = np.argsort(first_positions)
+        ranks: NDArray[np.int64] = np.empty_like(order)
+        ranks[order] = np.arange(len(order))
+        tensor[:, :, VWObservationBatch.DIRT][has_dirt] = ranks[dirt_inverse]
+
+        actor_appearances: list[VWActorAppearance] = [VWFrozenActorAppearance(self.get_actor_appearance_at_cell(index=index).or_else_raise()) for index in cells.tolist()]
+        dirt_appearances: list[VWDirtAppearance] = [self.get_dirt_appearance_at_cell(index=index).or_else_raise().deep_copy() for index in dirt_cells[order].tolist()]
+
+        return VWObservationBatch(actor_ids=[actor_appearance.get_id() for actor_appearance in actor_appearances], tensor=tensor, actor_appearances=actor_appearances, dirt_appearances=dirt_appearances)
+
+    def get_actor_slots(self) -> NDArray[np.int32]:
+        '''
+        Returns the array of actor slots (`-1` for the cells without a `VWActor`).
+
+        The returned array must not be modified.
+        '''
+        return self.__actor_slots
+
+    def get_actor_orientations(self) -> NDArray[np.int8]:
+        '''
+        Returns the array of `VWOrientation` codes of the `VWActor` objects (`-1` for the cells without a `VWActor`).
+
+        The returned array must not be modified.
+        '''
+        return self.__actor_orientations
+
+    def get_actor_colours(self) -> NDArray[np.int8]:
+        '''
+        Returns the array of `VWColour` codes of the `VWActor` objects (`-1` for the cells without a `VWActor`).
+
+        The returned array must not be modified.
+        '''
+        return self.__actor_colours
+
+    def get_dirt_colours(self) -> NDArray[np.int8]:
+        '''
+        Returns the array of `VWColour` codes of the `VWDirt` objects (`-1` for the cells without a `VWDirt`).
+
+        The returned array must not be modified.
+        '''
+        return self.__dirt_colours
+
+    def get_walls(self) -> NDArray[np.uint8]:
+        '''
+        Returns the array of wall bitmasks.
+
+        The returned array must not be modified.
+        '''
+        return self.__walls
+
+    def get_cell_index(self, coord: VWCoord) -> int:
+        '''
+        Returns the index of the cell whose coordinates match `coord`, or `-1` if `coord` is not in bounds.
+        '''
+        x: int = coord.get_x()
+        y: int = coord.get_y()
+
+        if 0 <= x < self.__grid_dim and 0 <= y < self.__grid_dim:
+            return y * self.__grid_dim + x
+        else:
+            return VWArrayAmbient.NO_VALUE
+
+    def get_coord_of_cell(self, index: int) -> VWCoord:
+        '''
+        Returns the `VWCoord` of the cell identified by `index`.
+        '''
+        return VWCoord.of(x=index % self.__grid_dim, y=index // self.__grid_dim)
+
+    def get_version_of_cell(self, index: int) -> int:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWArrayAmbient` API.
+
+        Returns the version of the cell identified by `index` (see `VWLocation.get_version()`).
+        '''
+        return int(self.__versions[index])
+
+    def mark_cell_as_changed(self, index: int) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWArrayAmbient` API.
+
+        Gives the cell identified by `index` a new version.
+        '''
+        self.__versions[index] = VWLocation.next_version()
+
+    def get_actor_appearance_at_cell(self, index: int) -> PyOptional[VWActorAppearance]:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWArrayAmbient` API.
+
+        Returns a `PyOptional` wrapping the `VWActorAppearance` in the cell identified by `index`, if any. Otherwise, returns an empty `PyOptional`.
+        '''
+        slot: int = int(self.__actor_slots[index])
+
+        if slot == VWArrayAmbient.NO_VALUE:
+            return PyOptional[VWActorAppearance].empty()
+        else:
+            return PyOptional[VWActorAppearance].of_nullable(self.__actor_appearances[slot])
+
+    def get_dirt_appearance_at_cell(self, index: int) -> PyOptional[VWDirtAppearance]:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWArrayAmbient` API.
+
+        Returns a `PyOptional` wrapping the `VWDirtAppearance` in the cell identified by `index`, if any. Otherwise, returns an empty `PyOptional`.
+        '''
+        return PyOptional[VWDirtAppearance].of_nullable(self.__dirt_appearances.get(index, None))
+
+    def get_wall_mask_of_cell(self, index: int) -> int:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWArrayAmbient` API.
+
+        Returns the `VWWall` mask of the cell identified by `index`.
+        '''
+        return int(self.__walls[index])
+
+    def has_actor_in_cell(self, index: int) -> bool:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWArrayAmbient` API.
+
+        Returns whether or not the cell identified by `index` has a `VWActor`.
+        '''
+        return int(self.__actor_slots[index]) != VWArrayAmbient.NO_VALUE
+
+    def has_dirt_in_cell(self, index: int) -> bool:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWArrayAmbient` API.
+
+        Returns whether or not the cell identified by `index` has a `VWDirt`.
+        '''
+        return int(self.__dirt_colours[index]) != VWArrayAmbient.NO_VALUE
+
+    def add_actor_to_cell(self, index: int, actor_appearance: VWActorAppearance) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWArrayAmbient` API.
+
+        Adds `actor_appearance` to the cell identified by `index`.
+
+        This method assumes (via assertion) that the cell has no `VWActor`.
+        '''
+        assert not self.has_actor_in_cell(index=index)
+
+        if self.__free_actor_slots:
+            slot: int = self.__free_actor_slots.pop()
+            self.__actor_appearances[slot] = actor_appearance
+        else:
+            slot: int = len(self.__actor_appearances)
+            self.__actor_appearances.append(actor_appearance)
+
+        self.__actor_slots[index] = slot
+        self.__actor_orientations[index] = VWArrayAmbient.ORIENTATION_CODES[actor_appearance.get_orientation()]
+        self.__actor_colours[index] = VWArrayAmbient.COLOUR_CODES[actor_appearance.get_colour()]
+        self.mark_cell_as_changed(index=index)
+
+    def remove_actor_from_cell(self, index: int) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWArrayAmbient` API.
+
+        Removes the `VWActorAppearance` from the cell identified by `index`.
+
+        This method assumes (via assertion) that the cell has a `VWActor`.
+        '''
+        assert self.has_actor_in_cell(index=index)
+
+        slot: int = int(self.__actor_slots[index])
+
+        self.__actor_appearances[slot] = None
+        self.__free_actor_slots.append(slot)
+        self.__actor_slots[index] = VWArrayAmbient.NO_VALUE
+        self.__actor_orientations[index] = VWArrayAmbient.NO_VALUE
+        self.__actor_colours[index] = VWArrayAmbient.NO_VALUE
+        self.mark_cell_as_changed(index=index)
+
+    def add_dirt_to_cell(self, index: int, dirt_appearance: VWDirtAppearance) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWArrayAmbient` API.
+
+        Adds `dirt_appearance` to the cell identified by `index`.
+
+        This method assumes (via assertion) that the cell has no `VWDirt`.
+        '''
+        assert not self.has_dirt_in_cell(index=index)
+
+        self.__dirt_appearances[index] = dirt_appearance
+        self.__dirt_colours[index] = VWArrayAmbient.COLOUR_CODES[dirt_appearance.get_colour()]
+        self.mark_cell_as_changed(index=index)
+
+    def remove_dirt_from_cell(self, index: int) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWArrayAmbient` API.
+
+        Removes the `VWDirtAppearance` from the cell identified by `index`.
+
+        This method assumes (via assertion) that the cell has a `VWDirt`.
+        '''
+        assert self.has_dirt_in_cell(index=index)
+
+        del self.__dirt_appearances[index]
+
+        self.__dirt_colours[index] = VWArrayAmbient.NO_VALUE
+        self.mark_cell_as_changed(index=index)
+
+    def store_location_in_cell(self, index: int, location: VWLocation) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWArrayAmbient` API.
+
+        Overwrites the content of the cell identified by `index` with the content of `location`.
+        '''
+        actor_appearance: PyOptional[VWActorAppearance] = location.get_actor_appearance()
+        dirt_appearance: PyOptional[VWDirtAppearance] = location.get_dirt_appearance()
+        wall_mask: int = location.get_wall_mask()
+
+        if self.has_actor_in_cell(index=index):
+            self.remove_actor_from_cell(index=index)
+
+        if self.has_dirt_in_cell(index=index):
+            self.remove_dirt_from_cell(index=index)
+
+        if actor_appearance.is_present():
+            self.add_actor_to_cell(index=index, actor_appearance=actor_appearance.or_else_raise())
+
+        if dirt_appearance.is_present():
+            self.add_dirt_to_cell(index=index, dirt_appearance=dirt_appearance.or_else_raise())
+
+        self.__walls[index] = wall_mask
+        self.mark_cell_as_changed(index=index)
+
+    def is_actor_at(self, coord: VWCoord) -> bool:
+        '''
+        Returns whether or not the `VWLocation` whose coordinates match the `VWCoord` argument `coord` has a `VWActor`.
+
+        If `coord` is not in bounds, this method returns `False`.
+        '''
+        index: int = self.get_cell_index(coord=coord)
+
+        return index != VWArrayAmbient.NO_VALUE and self.has_actor_in_cell(index=index)
+
+    def is_dirt_at(self, coord: VWCoord) -> bool:
+        '''
+        Returns whether or not the `VWLocation` whose coordinates match the `VWCoord` argument `coord` has a `VWDirt`.
+
+        If `coord` is not in bounds, this method returns `False`.
+        '''
+        index: int = self.get_cell_index(coord=coord)
+
+        return index != VWArrayAmbient.NO_VALUE and self.has_dirt_in_cell(index=index)
+
+    def move_actor(self, from_coord: VWCoord, to_coord: VWCoord) -> None:
+        '''
+        Moves the `VWActor` from the `VWLocation` whose coordinates match the `VWCoord` argument `from_coord` to the `VWLocation` whose coordinates match the `VWCoord` argument `to_coord`.
+
+        Only the array entries of the two cells are updated: the actor slot is moved, not reallocated.
+
+        This method assumes the following via assertions:
+
+        * A `VWActor` is at the `VWLocation` whose coordinates match the `VWCoord` argument `from_coord`.
+
+        * The `VWLocation` whose coordinates match the `VWCoord` argument `to_coord` has no `VWActor`.
+
+        * `from_coord` and `to_coord` are in bounds.
+        '''
+        from_index: int = self.get_cell_index(coord=from_coord)
+        to_index: int = self.get_cell_index(coord=to_coord)
+
+        assert from_index != VWArrayAmbient.NO_VALUE and to_index != VWArrayAmbient.NO_VALUE
+        assert self.has_actor_in_cell(index=from_index)
+        assert not self.has_actor_in_cell(index=to_index)
+
+        self.__actor_slots[to_index] = self.__actor_slots[from_index]
+        self.__actor_orientations[to_index] = self.__actor_orientations[from_index]
+        self.__actor_colours[to_index] = self.__actor_colours[from_index]
+        self.__actor_slots[from_index] = VWArrayAmbient.NO_VALUE
+        self.__actor_orientations[from_index] = VWArrayAmbient.NO_VALUE
+        self.__actor_colours[from_index] = VWArrayAmbient.NO_VALUE
+        self.mark_cell_as_changed(index=from_index)
+        self.mark_cell_as_changed(index=to_index)
+
+    def turn_actor(self, coord: VWCoord, direction: VWDirection) -> None:
+        '''
+        Rotates the `VWOrientation` of the `VWActor` at the `VWLocation` whose coordinates match the `VWCoord` argument `coord` as specified by the `VWDirection` argument `direction`.
+
+        This method assumes the following via assertions:
+
+        * A `VWActor` is at the `VWLocation` whose coordinates match the `VWCoord` argument `coord`.
+
+        * `coord` is in bounds.
+        '''
+        index: int = self.get_cell_index(coord=coord)
+
+        assert index != VWArrayAmbient.NO_VALUE and self.has_actor_in_cell(index=index)
+
+        actor_appearance: VWActorAppearance = self.get_actor_appearance_at_cell(index=index).or_else_raise()
+
+        actor_appearance.turn(direction=direction)
+
+        self.__actor_orientations[index] = VWArrayAmbient.ORIENTATION_CODES[actor_appearance.get_orientation()]
+        self.mark_cell_as_changed(index=index)
+
+
+class VWArrayGrid(MutableMapping[VWCoord, VWLocation]):
+    '''
+    This class exposes the arrays of a `VWArrayAmbient` as a `MutableMapping[VWCoord, VWLocation]`, so that it can be used in place of a `dict[VWCoord, VWLocation]` grid.
+
+    Each access creates a fresh `VWLocationView`. Assigning a `VWLocation` to a `VWCoord` copies the content of the `VWLocation` into the arrays.
+
+    The iteration order is the same as the one of the `dict` grids created by `VWEnvironment`.
+    '''
+    def __init__(self, ambient: VWArrayAmbient) -> None:
+        self.__ambient: VWArrayAmbient = ambient
+
+    def __getitem__(self, coord: VWCoord) -> VWLocation:
+        index: int = self.__ambient.get_cell_index(coord=coord)
+
+        if index == VWArrayAmbient.NO_VALUE:
+            raise KeyError(coord)
+
+        return VWLocationView(ambient=self.__ambient, index=index, coord=coord)
+
+    def __setitem__(self, coord: VWCoord, location: VWLocation) -> None:
+        index: int = self.__ambient.get_cell_index(coord=coord)
+
+        if index == VWArrayAmbient.NO_VALUE:
+            raise KeyError(coord)
+
+        self.__ambient.store_location_in_cell(index=index, location=location)
+
+    def __delitem__(self, coord: VWCoord) -> None:
+        raise VWInternalError("The cells of a VWArrayAmbient cannot be deleted.")
+
+    def __contains__(self, coord: object) -> bool:
+        return isinstance(coord, VWCoord) and self.__ambient.get_cell_index(coord=coord) != VWArrayAmbient.NO_VALUE
+
+    def __iter__(self) -> Iterator[VWCoord]:
+        grid_dim: int = self.__ambient.get_grid_dim()
+
+        for x in range(grid_dim):
+            for y in range(grid_dim):
+                yield VWCoord.of(x=x, y=y)
+
+    def __len__(self) -> int:
+        return self.__ambient.get_grid_dim() ** 2
+
+
+class VWLocationView(VWLocation):
+    '''
+    This class is a lightweight `VWLocation` which reads (and writes) the content of a cell of a `VWArrayAmbient`.
+
+    A `VWLocationView` holds no state of its own, so it always reflects the current content of the cell.
+    '''
+    # The state lives in the arrays of `ambient`, hence `VWLocation.__init__()` is deliberately not called.
+    def __init__(self, ambient: VWArrayAmbient, index: int, coord: VWCoord) -> None:
+        self.__ambient: VWArrayAmbient = ambient
+        self.__index: int = index
+        self.__coord: VWCoord = coord
+
+    def get_coord(self) -> VWCoord:
+        '''
+        Returns the `VWCoord` of this `VWLocationView`.
+        '''
+        return self.__coord
+
+    def get_actor_appearance(self) -> PyOptional[VWActorAppearance]:
+        '''
+        Returns a `PyOptional` wrapping the `VWActorAppearance` of the `VWActor` who is at this `VWLocationView`, if any. Otherwise, returns an empty `PyOptional`.
+        '''
+        return self.__ambient.get_actor_appearance_at_cell(index=self.__index)
+
+    def remove_actor(self) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWLocation` API.
+
+        Removes the `VWActorAppearance` from this `VWLocationView`.
+
+        This method assumes (via assertion) that this `VWLocationView` has a `VWActorAppearance` in it.
+        '''
+        self.__ambient.remove_actor_from_cell(index=self.__index)
+
+    def add_actor(self, actor_appearance: VWActorAppearance) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWLocation` API.
+
+        Adds a `VWActorAppearance` to this `VWLocationView` if one was not there.
+
+        This method assumes (via assertion) that this `VWLocationView` has no `VWActorAppearance` in it.
+        '''
+        self.__ambient.add_actor_to_cell(index=self.__index, actor_appearance=actor_appearance)
+
+    def has_actor(self) -> bool:
+        '''
+        Returns whether or not this `VWLocationView` has a `VWActor` in it.
+        '''
+        return self.__ambient.has_actor_in_cell(index=self.__index)
+
+    def get_dirt_appearance(self) -> PyOptional[VWDirtAppearance]:
+        '''
+        Returns a `PyOptional` wrapping the `VWDirtAppearance` of the `VWDirt` which is at this `VWLocationView`, if any. Otherwise, returns an empty `PyOptional`.
+        '''
+        return self.__ambient.get_dirt_appearance_at_cell(index=self.__index)
+
+    def remove_dirt(self) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWLocation` API.
+
+        Removes the `VWDirtAppearance` from this `VWLocationView`.
+
+        This method assumes (via assertion) that this `VWLocationView` has a `VWDirtAppearance` in it.
+        '''
+        self.__ambient.remove_dirt_from_cell(index=self.__index)
+
+    def add_dirt(self, dirt_appearance: VWDirtAppearance) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWLocation` API.
+
+        Adds a `VWDirtAppearance` to this `VWLocationView` if one was not there.
+
+        This method assumes (via assertion) that this `VWLocationView` has no `VWDirtAppearance` in it.
+        '''
+        self.__ambient.add_dirt_to_cell(index=self.__index, dirt_appearance=dirt_appearance)
+
+    def has_dirt(self) -> bool:
+        '''
+        Returns whether or not this `VWLocationView` has a `VWDirt` in it.
+        '''
+        return self.__ambient.has_dirt_in_cell(index=self.__index)
+
+    def get_wall_mask(self) -> int:
+        '''
+        Returns the `VWWall` mask of the cell this `VWLocationView` reads from.
+        '''
+        return self.__ambient.get_wall_mask_of_cell(index=self.__index)
+
+    def get_version(self) -> int:
+        '''
+        Returns the version of the cell this `VWLocationView` reads from (see `VWLocation.get_version()`).
+        '''
+        return self.__ambient.get_version_of_cell(index=self.__index)
+
+    def mark_as_changed(self) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWLocation` API.
+
+        Gives the cell this `VWLocationView` reads from a new version.
+        '''
+        self.__ambient.mark_cell_as_changed(index=self.__index)
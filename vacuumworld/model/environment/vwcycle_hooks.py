@@ -0,0 +1,121 @@
+from __future__ import annotations
+from typing import Callable, Any, TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from traceback import print_exception
+from pyoptional.pyoptional import PyOptional
+
+if TYPE_CHECKING:
+    from ..actor.vwactor import VWActor
+
+
+class VWCycleHooks():
+    '''
+    This class is the registry of the hooks called during the evolution of every `VWEnvironment`:
+
+    * An actor hook is called with each `VWActor`, right before it perceives, at each cycle.
+
+    * A cycle hook is called with the number of each cycle, right after it ends.
+
+    A hook registered with `asynchronous=True` is run on a background thread (one for all the asynchronous hooks, in order of submission), so that the simulation does not wait for it. The exceptions it raises are printed, and otherwise ignored. The exceptions raised by the other hooks are propagated.
+
+    When no hook of a kind is registered, `HAS_ACTOR_HOOKS` (or `HAS_CYCLE_HOOKS`) is `False`, and the callers skip the hooks of that kind altogether.
+    '''
+    HAS_ACTOR_HOOKS: bool = False
+    HAS_CYCLE_HOOKS: bool = False
+    __ACTOR_HOOKS: list[tuple[Callable[[VWActor], None], bool]] = []
+    __CYCLE_HOOKS: list[tuple[Callable[[int], None], bool]] = []
+    # The worker thread is only started by the first asynchronous hook (e.g., after a `VWRunner` has been forked).
+    __EXECUTOR: PyOptional[ThreadPoolExecutor] = PyOptional[ThreadPoolExecutor].empty()
+    __EXECUTOR_LOCK: Lock = Lock()
+
+    @staticmethod
+    def register_actor_hook(hook: Callable[[VWActor], None], asynchronous: bool=False) -> None:
+        '''
+        Registers `hook` as an actor hook. It is called with each `VWActor`, right before it perceives, at each cycle.
+        '''
+        VWCycleHooks.__ACTOR_HOOKS.append((hook, asynchronous))
+        VWCycleHooks.HAS_ACTOR_HOOKS = True
+
+    @staticmethod
+    def register_cycle_hook(hook: Callable[[int], None], asynchronous: bool=False) -> None:
+        '''
+        Registers `hook` as a cycle hook. It is called with the number of each cycle, right after it ends.
+        '''
+        VWCycleHooks.__CYCLE_HOOKS.append((hook, asynchronous))
+        VWCycleHooks.HAS_CYCLE_HOOKS = True
+
+    @staticmethod
+    def unregister(hook: Callable[..., None]) -> None:
+        '''
+        Unregisters `hook`, whether it is an actor hook or a cycle hook. Nothing happens if `hook` is not registered.
+        '''
+        VWCycleHooks.__ACTOR_HOOKS[:] = [entry for entry in VWCycleHooks.__ACTOR_HOOKS if entry[0] != hook]
+        VWCycleHooks.__CYCLE_HOOKS[:] = [entry for entry in VWCycleHooks.__CYCLE_HOOKS if entry[0] != hook]
+        VWCycleHooks.HAS_ACTOR_HOOKS = len(VWCycleHooks.__ACTOR_HOOKS) > 0
+        VWCycleHooks.HAS_CYCLE_HOOKS = len(VWCycleHooks.__CYCLE_HOOKS) > 0
+
+    @staticmethod
+    def clear() -> None:
+        '''
+        Unregisters every hook.
+        '''
+        VWCycleHooks.__ACTOR_HOOKS.clear()
+        VWCycleHooks.__CYCLE_HOOKS.clear()
+        VWCycleHooks.HAS_ACTOR_HOOKS = False
+        VWCycleHooks.HAS_CYCLE_HOOKS = False
+
+    @staticmethod
+    def run_actor_hooks(actor: VWActor) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWCycleHooks` API.
+
+        Calls every actor hook with `actor`.
+        '''
+        for hook, asynchronous in VWCycleHooks.__ACTOR_HOOKS:
+            VWCycleHooks.__run(hook=hook, argument=actor, asynchronous=asynchronous)
+
+    @staticmethod
+    def run_cycle_hooks(cycle: int) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWCycleHooks` API.
+
+        Calls every cycle hook with `cycle`.
+        '''
+        for hook, asynchronous in VWCycleHooks.__CYCLE_HOOKS:
+            VWCycleHooks.__run(hook=hook, argument=cycle, asynchronous=asynchronous)
+
+    @staticmethod
+    def wait_for_asynchronous_hooks() -> None:
+        '''
+        Waits for the asynchronous hooks submitted so far to finish, and stops the background thread, if any. It is started again by the next asynchronous hook.
+        '''
+        with VWCycleHooks.__EXECUTOR_LOCK:
+            executor: PyOptional[ThreadPoolExecutor] = VWCycleHooks.__EXECUTOR
+
+            VWCycleHooks.__EXECUTOR = PyOptional[ThreadPoolExecutor].empty()
+
+        executor.if_present(lambda e: e.shutdown(wait=True))
+
+    @staticmethod
+    def __run(hook: Callable[[Any], None], argument: Any, asynchronous: bool) -> None:
+        if asynchronous:
+            VWCycleHooks.__get_executor().submit(hook, argument).add_done_callback(VWCycleHooks.__report_failure)
+        else:
+            hook(argument)
+
+    @staticmethod
+    def __get_executor() -> ThreadPoolExecutor:
+        with VWCycleHooks.__EXECUTOR_LOCK:
+            if VWCycleHooks.__EXECUTOR.is_empty():
+                VWCycleHooks.__EXECUTOR = PyOptional[ThreadPoolExecutor].of(ThreadPoolExecutor(max_workers=1, thread_name_prefix="vw-cycle-hooks"))
+
+            return VWCycleHooks.__EXECUTOR.or_else_raise()
+
+    @staticmethod
+    def __report_failure(future: Future[None]) -> None:
+        error: PyOptional[BaseException] = PyOptional[BaseException].of_nullable(future.exception())
+
+        if error.is_present():
+            print("WARNING: an asynchronous cycle hook failed. Moving on...")
+            print_exception(error.or_else_raise())
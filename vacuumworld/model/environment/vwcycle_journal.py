@@ -0,0 +1,183 @@
+from __future__ import annotations
+from typing import Iterator
+
+from pystarworldsturbo.utils.json.json_value import JSONValue
+
+from ...common.vwcoordinates import VWCoord
+from ...common.vwcolour import VWColour
+from ...common.vworientation import VWOrientation
+
+
+class VWCycleJournal():
+    '''
+    This class specifies the journal of the changes that happened during a cycle of a `VWEnvironment` (see `VWEnvironment.subscribe_to_journal()`).
+
+    Each kind of change is recorded, in order, as a `tuple`:
+
+    * The attempted actions: `(actor_id, action_name, outcome_name)`.
+
+    * The moves: `(actor_id, from_coord, to_coord)`.
+
+    * The turns: `(actor_id, coord, new_orientation)`.
+
+    * The dropped and the cleaned dirts: `(coord, colour)`.
+
+    * The sent messages: `(sender_id, recipient_ids)`.
+
+    * The timeouts: the ID of each `VWActor` whose mind exceeded `VWMind.DECIDE_TIME_BUDGET`, and attempted a fallback `VWIdleAction`.
+
+    Each `get_*()` method returns an iterator over the recorded `tuple` objects of a kind, without copying them. A `VWCycleJournal` is not modified after it has been passed to the subscribers.
+    '''
+    __slots__ = ("__cycle", "__actions", "__moves", "__turns", "__dirts_dropped", "__dirts_cleaned", "__messages", "__timeouts")
+
+    def __init__(self, cycle: int) -> None:
+        self.__cycle: int = cycle
+        self.__actions: list[tuple[str, str, str]] = []
+        self.__moves: list[tuple[str, VWCoord, VWCoord]] = []
+        self.__turns: list[tuple[str, VWCoord, VWOrientation]] = []
+        self.__dirts_dropped: list[tuple[VWCoord, VWColour]] = []
+        self.__dirts_cleaned: list[tuple[VWCoord, VWColour]] = []
+        self.__messages: list[tuple[str, list[str]]] = []
+        self.__timeouts: list[str] = []
+
+    def get_cycle(self) -> int:
+        '''
+        Returns the number of the cycle this `VWCycleJournal` refers to.
+        '''
+        return self.__cycle
+
+    def record_action(self, actor_id: str, action_name: str, outcome_name: str) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWCycleJournal` API.
+
+        Records that the `VWActor` whose ID is `actor_id` attempted a `VWAction` named `action_name`, with an outcome named `outcome_name`.
+        '''
+        self.__actions.append((actor_id, action_name, outcome_name))
+
+    def record_move(self, actor_id: str, from_coord: VWCoord, to_coord: VWCoord) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWCycleJournal` API.
+
+        Records that the `VWActor` whose ID is `actor_id` moved from `from_coord` to `to_coord`.
+        '''
+        self.__moves.append((actor_id, from_coord, to_coord))
+
+    def record_turn(self, actor_id: str, coord: VWCoord, orientation: VWOrientation) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWCycleJournal` API.
+
+        Records that the `VWActor` whose ID is `actor_id`, at `coord`, turned to face `orientation`.
+        '''
+        self.__turns.append((actor_id, coord, orientation))
+
+    def record_dirt_dropped(self, coord: VWCoord, colour: VWColour) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWCycleJournal` API.
+
+        Records that a `VWDirt` of the specified `colour` was dropped at `coord`.
+        '''
+        self.__dirts_dropped.append((coord, colour))
+
+    def record_dirt_cleaned(self, coord: VWCoord, colour: VWColour) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWCycleJournal` API.
+
+        Records that a `VWDirt` of the specified `colour` was removed from `coord`.
+        '''
+        self.__dirts_cleaned.append((coord, colour))
+
+    def record_message(self, sender_id: str, recipient_ids: list[str]) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWCycleJournal` API.
+
+        Records that the `VWActor` whose ID is `sender_id` sent a message to the `VWActor` objects whose IDs are in `recipient_ids`.
+        '''
+        self.__messages.append((sender_id, list(recipient_ids)))
+
+    def record_timeout(self, actor_id: str) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWCycleJournal` API.
+
+        Records that the mind of the `VWActor` whose ID is `actor_id` timed out.
+        '''
+        self.__timeouts.append(actor_id)
+
+    def get_actions(self) -> Iterator[tuple[str, str, str]]:
+        '''
+        Returns an iterator over the `(actor_id, action_name, outcome_name)` `tuple` of each attempted `VWAction`, in order of execution.
+        '''
+        return iter(self.__actions)
+
+    def get_moves(self) -> Iterator[tuple[str, VWCoord, VWCoord]]:
+        '''
+        Returns an iterator over the `(actor_id, from_coord, to_coord)` `tuple` of each move, in order.
+        '''
+        return iter(self.__moves)
+
+    def get_turns(self) -> Iterator[tuple[str, VWCoord, VWOrientation]]:
+        '''
+        Returns an iterator over the `(actor_id, coord, new_orientation)` `tuple` of each turn, in order.
+        '''
+        return iter(self.__turns)
+
+    def get_dirts_dropped(self) -> Iterator[tuple[VWCoord, VWColour]]:
+        '''
+        Returns an iterator over the `(coord, colour)` `tuple` of each dropped `VWDirt`, in order.
+        '''
+        return iter(self.__dirts_dropped)
+
+    def get_dirts_cleaned(self) -> Iterator[tuple[VWCoord, VWColour]]:
+        '''
+        Returns an iterator over the `(coord, colour)` `tuple` of each removed `VWDirt`, in order.
+        '''
+        return iter(self.__dirts_cleaned)
+
+    def get_messages(self) -> Iterator[tuple[str, list[str]]]:
+        '''
+        Returns an iterator over the `(sender_id, recipient_ids)` `tuple` of each sent message, in order.
+        '''
+        return iter(self.__messages)
+
+    def get_timeouts(self) -> Iterator[str]:
+        '''
+        Returns an iterator over the ID of each `VWActor` whose mind timed out, in order.
+        '''
+        return iter(self.__timeouts)
+
+    def get_changed_coords(self) -> Iterator[VWCoord]:
+        '''
+        Returns an iterator over the `VWCoord` of each `VWLocation` whose content changed, in order of change. A `VWCoord` is repeated if its `VWLocation` changed more than once.
+        '''
+        for _, from_coord, to_coord in self.__moves:
+            yield from_coord
+            yield to_coord
+
+        for _, coord, _ in self.__turns:
+            yield coord
+
+        for coord, _ in self.__dirts_dropped:
+            yield coord
+
+        for coord, _ in self.__dirts_cleaned:
+            yield coord
+
+    def is_empty(self) -> bool:
+        '''
+        Returns whether or not nothing was recorded in this `VWCycleJournal`.
+        '''
+        return not (self.__actions or self.__moves or self.__turns or self.__dirts_dropped or self.__dirts_cleaned or self.__messages or self.__timeouts)
+
+    def to_json(self) -> dict[str, JSONValue]:
+        '''
+        Returns a JSON representation of this `VWCycleJournal`, where each `VWCoord` is an `[x, y]` `list`, and each `VWColour` (or `VWOrientation`) is its `str` representation.
+        '''
+        return {
+            "cycle": self.__cycle,
+            "actions": [[actor_id, action_name, outcome_name] for actor_id, action_name, outcome_name in self.__actions],
+            "moves": [[actor_id, [from_coord.get_x(), from_coord.get_y()], [to_coord.get_x(), to_coord.get_y()]] for actor_id, from_coord, to_coord in self.__moves],
+            "turns": [[actor_id, [coord.get_x(), coord.get_y()], str(orientation)] for actor_id, coord, orientation in self.__turns],
+            "dirt_dropped": [[[coord.get_x(), coord.get_y()], str(colour)] for coord, colour in self.__dirts_dropped],
+            "dirt_cleaned": [[[coord.get_x(), coord.get_y()], str(colour)] for coord, colour in self.__dirts_cleaned],
+            "messages": [[sender_id, list(recipient_ids)] for sender_id, recipient_ids in self.__messages],
+            "timeouts": list(self.__timeouts)
+        }
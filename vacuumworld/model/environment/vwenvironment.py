@@ -1,12 +1,16 @@
 from __future__ import annotations
-from typing import Type, cast
+from typing import Callable, Iterable, Iterator, Type, cast
+from functools import cache
+from collections.abc import MutableMapping
 from inspect import getsourcefile
 from itertools import product
 from math import floor, sqrt
-from random import randint
+from random import getrandbits, getstate, randint, seed as set_seed, setstate
+from time import perf_counter
 from pyoptional.pyoptional import PyOptional
 
 from pystarworldsturbo.common.action import Action
+from pystarworldsturbo.common.message import Message, BccMessage
 from pystarworldsturbo.common.action_outcome import ActionOutcome
 from pystarworldsturbo.common.action_result import ActionResult
 from pystarworldsturbo.elements.actor import Actor
@@ -17,11 +21,16 @@ from pystarworldsturbo.utils.json.json_value import JSONValue
 
 from .physics.vwexecutor_factory import VWExecutorFactory
 from .vwambient import VWAmbient
+from .vwarray_ambient import VWArrayAmbient
 from .vwlocation import VWLocation
+from .vwtrace import VWTraceSink
+from .vwcycle_journal import VWCycleJournal
+from .vwcycle_hooks import VWCycleHooks
 from ..actor.vwactor import VWActor
 from ..actor.vwuser import VWUser
 from ..actor.appearance.vwactor_appearance import VWActorAppearance
 from ..actor.vwactor_factories import VWCleaningAgentsFactory, VWUsersFactory
+from ..actor.mind.vwmind_pool import VWMindJob, VWMindPool
 from ...common.vwuser_difficulty import VWUserDifficulty
 from ..actor.mind.surrogate.vwhysteretic_mind_surrogate import VWHystereticMindSurrogate
 from ..dirt.vwdirt import VWDirt
@@ -30,9 +39,12 @@ from ...common.vwcoordinates import VWCoord
 from ...common.vwdirection import VWDirection
 from ...common.vwcolour import VWColour
 from ...common.vwobservation import VWObservation
+from ...common.vwobservation_batch import VWObservationBatch
 from ...common.vworientation import VWOrientation
+from ...common.vwprofiler import VWProfiler
 from ...common.vwexceptions import VWActionAttemptException, VWMalformedActionException, VWInternalError
 from ...common.vwvalidator import VWValidator
+from ...common.vwwall import VWWall
 from ...model.actions.vwactions import VWAction, VWPhysicalAction, VWCommunicativeAction
 
 
@@ -56,15 +68,30 @@ class VWEnvironment(Environment):
 
     * A physical/communicative evolution phase, in which each `VWActor` potentially attempts to modify the `VWEnvironment` via a `VWPhysicalAction`, and potentially engages in communications via a `VWCommunicativeAction`.
     Only one `VWPhysicalAction` and one `VWCommunicativeAction` can be attempted per cycle per `VWActor`.
+
+    The time spent in each phase of the cycles is accumulated (see `get_phase_times()`).
+
+    If `config["mind_workers"]` is `> 0`, the minds of the cleaning agents are evaluated on a `VWMindPool` of as many worker processes. If `config["llm_concurrency"]` is `> 0`, the I/O-bound minds (e.g., the LLM-capable ones) are evaluated concurrently on threads (see `execute_cycle_actions()`).
     '''
 
     LLM_MODEL: str = "unknown"
+    PHASES: list[str] = ["actors", "physics", "perception"]
 
     def __init__(self, config: dict[str, JSONValue], ambient: VWAmbient, initial_actors: list[VWActor]=[], initial_dirts: list[VWDirt]=[]) -> None:
         super(VWEnvironment, self).__init__(ambient=ambient, initial_actors=[a for a in initial_actors if VWValidator.does_type_match(t=Actor, obj=a)], initial_passive_bodies=[d for d in initial_dirts if VWValidator.does_type_match(t=Body, obj=d)])
 
         self.__cycle: int = -1
         self.__config: dict[str, JSONValue] = config
+        self.__actor_positions: dict[str, VWCoord] = {}
+        self.__phase_times: dict[str, float] = dict.fromkeys(VWEnvironment.PHASES, 0.0)
+        self.__trace_sink: PyOptional[VWTraceSink] = PyOptional[VWTraceSink].empty()
+        self.__journal_subscribers: list[Callable[[VWCycleJournal], None]] = []
+        # Nothing is recorded unless there is a `VWTraceSink`, or a subscriber.
+        self.__journaling: bool = False
+        self.__journal: VWCycleJournal = VWCycleJournal(cycle=self.__cycle + 1)
+        self.__mind_pool: PyOptional[VWMindPool] = PyOptional[VWMindPool].empty()
+
+        self.__rebuild_actor_position_index()
 
         VWEnvironment.LLM_MODEL = cast(str, self.__config.get("llm_model", VWEnvironment.LLM_MODEL))
 
@@ -97,6 +124,24 @@ class VWEnvironment(Environment):
         '''
         return super(VWEnvironment, self).get_actor(actor_id=actor_id).filter(lambda a: isinstance(a, VWActor)).map(lambda a: cast(VWActor, a))
 
+    def add_actor(self, actor: Actor) -> None:
+        '''
+        Adds `actor` to this `VWEnvironment`.
+
+        The position of `actor` is indexed lazily, the first time it is looked up, as its `VWActorAppearance` is typically placed onto the grid after this call.
+        '''
+        super(VWEnvironment, self).add_actor(actor=actor)
+
+        self.__actor_positions.pop(actor.get_id(), None)
+
+    def remove_actor(self, actor_id: str) -> None:
+        '''
+        Removes the `VWActor` with the specified `actor_id` from this `VWEnvironment`, and from the actor position index.
+        '''
+        super(VWEnvironment, self).remove_actor(actor_id=actor_id)
+
+        self.__actor_positions.pop(actor_id, None)
+
     def get_user(self, user_id: str) -> PyOptional[VWUser]:
         '''
         Returns a `PyOptional` wrapping the `VWUser` with the given `user_id` if it exists, otherwise returns an empty `PyOptional`.
@@ -166,9 +211,273 @@ class VWEnvironment(Environment):
 
         return VWExecutorFactory.get_executor_for(action=action)
 
+    def execute_cycle_actions(self) -> None:
+        '''
+        Lets each `VWActor` cycle, and executes the `VWAction` objects it attempts.
+
+        This method behaves like `Environment.execute_cycle_actions()`, but it also times the phases of the cycle (see `get_phase_times()`).
+
+        If `config["mind_workers"]` or `config["llm_concurrency"]` is `> 0`, the cycle is synchronous instead: first, every `VWActor` perceives; then, the minds are evaluated concurrently; finally, the decided `VWAction` objects are executed, `VWActor` by `VWActor`, in the same order as above. The minds are evaluated as follows:
+
+        * If `config["llm_concurrency"]` is `> 0`, the I/O-bound minds (see `VWActorMindSurrogate.IO_BOUND`) are evaluated on threads, and the cycle waits for all of them for at most `config["llm_deadline"]` seconds (if `> 0`). A mind that misses the deadline attempts a `VWIdleAction` instead, as if it exceeded `VWMind.DECIDE_TIME_BUDGET`.
+
+        * If `config["mind_workers"]` is `> 0`, the other minds of the cleaning agents are evaluated on a `VWMindPool`, where `VWMind.DECIDE_TIME_BUDGET` does not apply.
+
+        * The remaining minds are evaluated in this process, one at a time.
+
+        Except for the I/O-bound minds, the `random` module is re-seeded for each mind, from a seed drawn once per cycle, so that the evolution does not depend on the number of workers.
+        '''
+        if cast(int, self.__config.get("mind_workers", 0)) > 0 or cast(int, self.__config.get("llm_concurrency", 0)) > 0:
+            self.__execute_cycle_actions_in_parallel()
+        else:
+            self.__execute_cycle_actions_in_sequence()
+
+    def __execute_cycle_actions_in_sequence(self) -> None:
+        for actor in self.get_actors().values():
+            start: float = perf_counter()
+
+            actor.cycle()
+
+            actions: list[Action] = actor.get_pending_actions()
+
+            if self.__journaling and actor.get_mind().has_timed_out():
+                self.__journal.record_timeout(actor_id=actor.get_id())
+
+            self.__phase_times["actors"] += perf_counter() - start
+            start = perf_counter()
+
+            self.validate_actions(actions=actions)
+
+            validated: float = perf_counter()
+
+            self.__phase_times["physics"] += validated - start
+
+            if VWProfiler.ENABLED:
+                VWProfiler.record(key="environment/validation", seconds=validated - start)
+
+            for action in actions:
+                self.execute_action(action=action)
+
+    def __execute_cycle_actions_in_parallel(self) -> None:
+        start: float = perf_counter()
+        cycle_seed: int = getrandbits(64)
+        actors: list[VWActor] = list(self.get_actors().values())
+        threaded, jobs, local, remote = self.__perceive_and_dispatch(actors=actors, cycle_seed=cycle_seed)
+
+        decided_actions: Iterator[list[VWAction]] = iter(self.__get_mind_pool().evaluate(jobs=jobs) if jobs else [])
+
+        for i, actor in local:
+            VWEnvironment.__revise_and_decide_with_seed(actor=actor, seed=f"{cycle_seed}-{i}")
+
+        self.__wait_for_threaded_minds(actors=threaded, start=start)
+
+        self.__phase_times["actors"] += perf_counter() - start
+
+        for actor, is_remote in zip(actors, remote):
+            start = perf_counter()
+
+            if is_remote:
+                actor.get_mind().store_decided_actions(actions=next(decided_actions))
+
+            actor.attempt_decided_actions()
+
+            actions: list[Action] = actor.get_pending_actions()
+
+            if self.__journaling and actor.get_mind().has_timed_out():
+                self.__journal.record_timeout(actor_id=actor.get_id())
+
+            self.__phase_times["actors"] += perf_counter() - start
+            start = perf_counter()
+
+            self.validate_actions(actions=actions)
+
+            validated: float = perf_counter()
+
+            self.__phase_times["physics"] += validated - start
+
+            if VWProfiler.ENABLED:
+                VWProfiler.record(key="environment/validation", seconds=validated - start)
+
+            for action in actions:
+                self.execute_action(action=action)
+
+    def __perceive_and_dispatch(self, actors: list[VWActor], cycle_seed: int) -> tuple[list[VWActor], list[VWMindJob], list[tuple[int, VWActor]], list[bool]]:
+        # Returns the threaded minds (already started), the jobs for the mind pool, the minds to evaluate locally (with their index), and whether or not each mind is evaluated on the mind pool.
+        threaded: list[VWActor] = []
+        jobs: list[VWMindJob] = []
+        local: list[tuple[int, VWActor]] = []
+        remote: list[bool] = []
+
+        for i, actor in enumerate(actors):
+            # As in `VWActor.cycle()`.
+            if VWCycleHooks.HAS_ACTOR_HOOKS:
+                VWCycleHooks.run_actor_hooks(actor=actor)
+
+            observation, messages = actor.perceive()
+
+            remote.append(not self.__is_evaluated_on_thread(actor=actor) and self.__is_evaluated_on_mind_pool(actor=actor))
+
+            if self.__is_evaluated_on_thread(actor=actor):
+                actor.get_mind().start_revise_and_decide()
+                threaded.append(actor)
+            elif remote[i]:
+                jobs.append(self.__create_mind_job(actor=actor, seed=f"{cycle_seed}-{i}", observation=observation, messages=messages))
+            else:
+                local.append((i, actor))
+
+        return threaded, jobs, local, remote
+
+    def __is_evaluated_on_thread(self, actor: VWActor) -> bool:
+        return cast(int, self.__config.get("llm_concurrency", 0)) > 0 and type(actor.get_mind().get_surrogate()).IO_BOUND
+
+    def __is_evaluated_on_mind_pool(self, actor: VWActor) -> bool:
+        return cast(int, self.__config.get("mind_workers", 0)) > 0 and not isinstance(actor, VWUser)
+
+    def __wait_for_threaded_minds(self, actors: list[VWActor], start: float) -> None:
+        # The deadline is shared: the threaded minds have been running concurrently since `start`.
+        deadline: float = cast(float, self.__config.get("llm_deadline", 0.0))
+
+        for actor in actors:
+            if deadline > 0:
+                actor.get_mind().finish_revise_and_decide(timeout=PyOptional[float].of(start + deadline - perf_counter()))
+            else:
+                actor.get_mind().finish_revise_and_decide(timeout=PyOptional[float].empty())
+
+    def __create_mind_job(self, actor: VWActor, seed: str, observation: VWObservation, messages: list[BccMessage]) -> VWMindJob:
+        effort: int = actor.get_mind().get_surrogate().get_effort()
+
+        if self.__get_mind_pool().is_assigned(actor_id=actor.get_id()):
+            return VWMindJob(actor_id=actor.get_id(), seed=seed, effort=effort, observation=observation, messages=messages)
+        else:
+            # The surrogate mind is only sent along with the first job of each actor, as it stays resident in its worker afterwards.
+            surrogate_mind_file: str = self.__get_actor_surrogate_mind_file(actor_id=actor.get_id())
+            surrogate_mind_class_name: str = type(actor.get_mind().get_surrogate()).__name__
+
+            return VWMindJob(actor_id=actor.get_id(), seed=seed, effort=effort, observation=observation, messages=messages, surrogate_mind_file=surrogate_mind_file, surrogate_mind_class_name=surrogate_mind_class_name)
+
+    def __get_mind_pool(self) -> VWMindPool:
+        if self.__mind_pool.is_empty():
+            self.__mind_pool = PyOptional[VWMindPool].of(VWMindPool(number_of_workers=cast(int, self.__config["mind_workers"])))
+
+        return self.__mind_pool.or_else_raise()
+
+    @staticmethod
+    def __revise_and_decide_with_seed(actor: VWActor, seed: str) -> None:
+        # The global state of `random` is restored afterwards, so that the seeds drawn at each cycle do not depend on the local minds.
+        state: object = getstate()
+
+        try:
+            set_seed(seed)
+
+            actor.get_mind().revise_and_decide()
+        finally:
+            setstate(state)
+
+    def shutdown(self) -> None:
+        '''
+        Stops the worker processes of the `VWMindPool` of this `VWEnvironment`, if any.
+
+        This `VWEnvironment` can still evolve afterwards, in which case a new `VWMindPool` is started.
+        '''
+        self.__mind_pool.if_present(lambda pool: pool.close())
+        self.__mind_pool = PyOptional[VWMindPool].empty()
+
+    def execute_action(self, action: Action) -> None:
+        '''
+        Executes `action`, and sends the resulting `VWObservation` to the `VWActor` that attempted it.
+
+        This method behaves like `Environment.execute_action()`, but it also times the phases of the cycle (see `get_phase_times()`).
+        '''
+        start: float = perf_counter()
+        action_executor: ActionExecutor = self.get_executor_for(action=action).or_else_raise(ValueError(f"No executor found for action of type {type(action)}."))
+        result: ActionResult = VWProfiler.execute_with_profiler(executor=action_executor, env=self, action=action) if VWProfiler.ENABLED else action_executor.execute(env=self, action=action)
+        executed: float = perf_counter()
+        observation: VWObservation = self.generate_perception_for_actor(action_type=type(action), actor_id=action.get_actor_id(), action_result=result).or_else_raise()
+
+        self.send_perception_to_actor(perception=observation, actor_id=action.get_actor_id())
+
+        if VWProfiler.ENABLED:
+            VWProfiler.record(key="environment/perception", seconds=perf_counter() - executed)
+
+        if self.__journaling:
+            self.__journal.record_action(actor_id=action.get_actor_id(), action_name=type(action).__name__, outcome_name=result.get_outcome().name)
+
+        self.__phase_times["physics"] += executed - start
+        self.__phase_times["perception"] += perf_counter() - executed
+
+    def get_phase_times(self) -> dict[str, float]:
+        '''
+        Returns a `dict[str, float]` mapping each of the `PHASES` to the total time (in seconds) spent in it so far:
+
+        * `"actors"`: the `VWActor` objects perceiving, revising, and deciding.
+
+        * `"physics"`: the `VWEnvironment` validating the attempted `VWAction` objects, and the `ActionExecutor` objects executing them.
+
+        * `"perception"`: the `VWEnvironment` generating and sending the resulting `VWObservation` objects.
+        '''
+        return dict(self.__phase_times)
+
+    def set_trace_sink(self, sink: VWTraceSink) -> None:
+        '''
+        Sets the `VWTraceSink` which is fed a record at the end of each cycle, replacing the previous one (if any).
+
+        Each record is the JSON representation of the `VWCycleJournal` of the cycle that has just ended (see `VWCycleJournal.to_json()`), i.e., a `dict` with the following keys:
+
+        * `"cycle"`: the number of the cycle that has just ended.
+
+        * `"actions"`: a `[actor_id, action_name, outcome_name]` `list` for each attempted `VWAction`, in order of execution.
+
+        * `"moves"`: an `[actor_id, [from_x, from_y], [to_x, to_y]]` `list` for each `VWActor` that moved.
+
+        * `"turns"`: an `[actor_id, [x, y], orientation]` `list` for each `VWActor` that turned.
+
+        * `"dirt_dropped"`, `"dirt_cleaned"`: an `[[x, y], colour]` `list` for each `VWDirt` that was dropped or cleaned.
+
+        * `"messages"`: a `[sender_id, recipient_ids]` `list` for each message that was sent.
+
+        * `"timeouts"`: the ID of each `VWActor` whose mind exceeded `VWMind.DECIDE_TIME_BUDGET`, and attempted a fallback `VWIdleAction`.
+
+        The `VWTraceSink` is not closed by this `VWEnvironment`.
+        '''
+        self.__trace_sink = PyOptional[VWTraceSink].of(sink)
+
+        self.__update_journaling()
+
+    def get_trace_sink(self) -> PyOptional[VWTraceSink]:
+        '''
+        Returns a `PyOptional` wrapping the `VWTraceSink` of this `VWEnvironment`, if any. Otherwise, returns an empty `PyOptional`.
+        '''
+        return self.__trace_sink
+
+    def subscribe_to_journal(self, subscriber: Callable[[VWCycleJournal], None]) -> None:
+        '''
+        Subscribes `subscriber` to the journal of this `VWEnvironment`: at the end of each cycle, right before the cycle hooks (see `VWCycleHooks`), `subscriber` is called with the `VWCycleJournal` of the changes that happened since the end of the previous cycle.
+
+        The subscribers are called in order of subscription, and the exceptions they raise are propagated.
+        '''
+        self.__journal_subscribers.append(subscriber)
+
+        self.__update_journaling()
+
+    def unsubscribe_from_journal(self, subscriber: Callable[[VWCycleJournal], None]) -> None:
+        '''
+        Unsubscribes `subscriber` from the journal of this `VWEnvironment`. Nothing happens if `subscriber` is not subscribed.
+        '''
+        self.__journal_subscribers[:] = [s for s in self.__journal_subscribers if s != subscriber]
+
+        self.__update_journaling()
+
+    def __update_journaling(self) -> None:
+        journaling: bool = self.__trace_sink.is_present() or len(self.__journal_subscribers) > 0
+
+        if journaling and not self.__journaling:
+            self.__journal = VWCycleJournal(cycle=self.__cycle + 1)
+
+        self.__journaling = journaling
+
     def evolve(self) -> None:
         '''
-        Evolves this `VWEnvironment` by one cycle.
+        Evolves this `VWEnvironment` by one cycle, and then calls the cycle hooks (see `VWCycleHooks`), if any.
         '''
         if self.__cycle == -1:
             self.__force_initial_perception_to_actors()  # For back compatibility with 4.1.8.
@@ -177,6 +486,26 @@ class VWEnvironment(Environment):
 
         self.__cycle += 1
 
+        if self.__journaling:
+            self.__publish_journal()
+
+        if VWCycleHooks.HAS_CYCLE_HOOKS:
+            VWCycleHooks.run_cycle_hooks(cycle=self.__cycle)
+
+        if __debug__ and self.__config.get("debug_actor_position_index", False):
+            self.check_actor_position_index()
+
+    def __publish_journal(self) -> None:
+        journal: VWCycleJournal = self.__journal
+
+        self.__journal = VWCycleJournal(cycle=self.__cycle + 1)
+
+        if self.__trace_sink.is_present():
+            self.__trace_sink.or_else_raise().write(record=journal.to_json())
+
+        for subscriber in list(self.__journal_subscribers):
+            subscriber(journal)
+
     def force_initial_perception_to_new_actor_after_stop(self, actor_id: str) -> None:
         observation: VWObservation = self.generate_perception_for_actor(actor_id=actor_id, action_type=VWAction, action_result=ActionResult(outcome=ActionOutcome.impossible)).or_else_raise()
 
@@ -202,6 +531,13 @@ class VWEnvironment(Environment):
         '''
         self.get_ambient().move_actor(from_coord=from_coord, to_coord=to_coord)
 
+        actor_id: str = self.get_ambient().get_grid()[to_coord].get_actor_appearance().or_else_raise().get_id()
+
+        self.__actor_positions[actor_id] = to_coord
+
+        if self.__journaling:
+            self.__journal.record_move(actor_id=actor_id, from_coord=from_coord, to_coord=to_coord)
+
     def turn_actor(self, coord: VWCoord, direction: VWDirection) -> None:
         '''
         Turns the `VWActor` curently at the `VWLocation` whose `VWCoord` matches `coord` as specified by `direction`, if possible.
@@ -210,6 +546,22 @@ class VWEnvironment(Environment):
         '''
         self.get_ambient().turn_actor(coord=coord, direction=direction)
 
+        if self.__journaling:
+            actor_appearance: VWActorAppearance = self.get_ambient().get_grid()[coord].get_actor_appearance().or_else_raise()
+
+            self.__journal.record_turn(actor_id=actor_appearance.get_id(), coord=coord, orientation=actor_appearance.get_orientation())
+
+    def send_message_to_recipients(self, message: Message, check_sender_identity: bool=True) -> None:
+        '''
+        Sends `message` to its recipients (or to every other `VWActor`, if it has no recipients).
+
+        This method behaves like `Environment.send_message_to_recipients()`, but it also records the message in the `VWCycleJournal` of the current cycle.
+        '''
+        super(VWEnvironment, self).send_message_to_recipients(message=message, check_sender_identity=check_sender_identity)
+
+        if self.__journaling:
+            self.__journal.record_message(sender_id=message.get_sender_id(), recipient_ids=message.get_recipients_ids())
+
     def remove_dirt(self, coord: VWCoord) -> None:
         '''
         Removes the dirt currently on the `VWLocation` whose `VWCoord` matches `coord`, if possible.
@@ -220,7 +572,8 @@ class VWEnvironment(Environment):
         '''
         assert self.get_ambient().is_dirt_at(coord=coord)
 
-        dirt_id: str = self.get_ambient().get_grid()[coord].get_dirt_appearance().or_else_raise().get_id()
+        dirt_appearance: VWDirtAppearance = self.get_ambient().get_grid()[coord].get_dirt_appearance().or_else_raise()
+        dirt_id: str = dirt_appearance.get_id()
 
         # Removing the dirt from the list of passive bodies.
         self.remove_passive_body(passive_body_id=dirt_id)
@@ -228,6 +581,9 @@ class VWEnvironment(Environment):
         # Removing the dirt from the grid.
         self.get_ambient().remove_dirt(coord=coord)
 
+        if self.__journaling:
+            self.__journal.record_dirt_cleaned(coord=coord, colour=dirt_appearance.get_colour())
+
     def drop_dirt(self, coord: VWCoord, dirt_colour: VWColour) -> None:
         '''
         Drops a `VWDirt` of the specified `dirt_colour` onto the `VWLocation` whose `VWCoord` matches `coord`, if possible.
@@ -243,25 +599,36 @@ class VWEnvironment(Environment):
         # Adding the dirt to the grid.
         self.get_ambient().drop_dirt(coord=coord, dirt_appearance=dirt_appearance)
 
+        if self.__journaling:
+            self.__journal.record_dirt_dropped(coord=coord, colour=dirt_colour)
+
     def generate_perception_for_actor(self, actor_id: str, action_type: Type[VWAction], action_result: ActionResult) -> PyOptional[VWObservation]:
         '''
         Generates and returns a `PyOptional` wrapping a `VWObservation` perception for the `VWActor` with the specified `actor_id` as a result of the execution of the specified `action_type` with the specified `action_result`.
 
         This method assumes (via assertion) that the `VWActor` with the specified `actor_id` exists in the `VWEnvironment`.
         '''
-        assert actor_id in self.get_actors()
+        assert self.__has_actor(actor_id=actor_id)
 
         coord: VWCoord = self.get_actor_position(actor_id=actor_id)
 
         return PyOptional[VWObservation].of_nullable(self.get_ambient().generate_perception(actor_position=coord, action_type=action_type, action_result=action_result))
 
+    def generate_observation_batch(self) -> VWObservationBatch:
+        '''
+        Generates and returns a `VWObservationBatch` with the observation of every `VWActor` in the `VWEnvironment`, computed in a single pass over the grid.
+
+        Each row of the batch can be wrapped in a `VWObservation` via `VWObservation.from_batch_row()`.
+        '''
+        return self.get_ambient().generate_observation_batch()
+
     def get_actor_position(self, actor_id: str) -> VWCoord:
         '''
         Returns the `VWCoord` of the `VWLocation` containing the `VWActor` with the specified `actor_id`.
 
         This method assumes (via assertion) that the `VWActor` with the specified `actor_id` exists in the `VWEnvironment`.
         '''
-        assert actor_id in self.get_actors()
+        assert self.__has_actor(actor_id=actor_id)
 
         return self.__get_actor_position_and_location(actor_id=actor_id)[0]
 
@@ -271,26 +638,61 @@ class VWEnvironment(Environment):
 
         This method assumes (via assertion) that the `VWActor` with the specified `actor_id` exists in the `VWEnvironment`.
         '''
-        assert actor_id in self.get_actors()
+        assert self.__has_actor(actor_id=actor_id)
 
         return self.__get_actor_position_and_location(actor_id=actor_id)[1]
 
     def __get_actor_position_and_location(self, actor_id: str) -> tuple[VWCoord, VWLocation]:
-        assert actor_id in self.get_actors()
+        assert self.__has_actor(actor_id=actor_id)
+
+        grid: MutableMapping[VWCoord, VWLocation] = self.get_ambient().get_grid()
+        coord: PyOptional[VWCoord] = PyOptional[VWCoord].of_nullable(self.__actor_positions.get(actor_id, None))
+
+        # The grid can be modified directly (e.g., by the GUI in the editing phase), hence the indexed position needs to be verified.
+        if coord.is_present() and VWEnvironment.__is_actor_at(grid=grid, coord=coord.or_else_raise(), actor_id=actor_id):
+            return coord.or_else_raise(), grid[coord.or_else_raise()]
 
-        for c, l in self.get_ambient().get_grid().items():
-            if l.has_actor() and l.get_actor_appearance().or_else_raise().get_id() == actor_id:
-                return c, l
+        self.__rebuild_actor_position_index()
+
+        if actor_id in self.__actor_positions:
+            return self.__actor_positions[actor_id], grid[self.__actor_positions[actor_id]]
 
         raise VWInternalError(f"VWActor {actor_id} not found: there is an inconsistency between the grid and the list of actors.")
 
+    def __has_actor(self, actor_id: str) -> bool:
+        # Unlike `self.get_actors()`, this does not rebuild the `dict` of actors.
+        return actor_id in super(VWEnvironment, self).get_actors()
+
+    @staticmethod
+    def __is_actor_at(grid: MutableMapping[VWCoord, VWLocation], coord: VWCoord, actor_id: str) -> bool:
+        return coord in grid and grid[coord].has_actor() and grid[coord].get_actor_appearance().or_else_raise().get_id() == actor_id
+
+    def __rebuild_actor_position_index(self) -> None:
+        self.__actor_positions = self.get_ambient().get_actor_positions()
+
+    def check_actor_position_index(self) -> None:
+        '''
+        Checks that the actor position index of this `VWEnvironment` matches the content of the grid, and raises a `VWInternalError` if it does not.
+
+        This method scans the whole grid, and it is meant for debugging purposes only. It is automatically called at the end of each cycle if `debug_actor_position_index` is `True` in the config, and Python is not running with `-O`.
+        '''
+        expected: dict[str, VWCoord] = self.get_ambient().get_actor_positions()
+
+        for actor_id, coord in self.__actor_positions.items():
+            if actor_id not in expected or expected[actor_id] != coord:
+                raise VWInternalError(f"The actor position index is inconsistent: VWActor {actor_id} is indexed at {coord}, but it is not there.")
+
+        for actor_id in self.get_actors():
+            if actor_id not in self.__actor_positions:
+                raise VWInternalError(f"The actor position index is inconsistent: VWActor {actor_id} is not indexed.")
+
     def get_actor_orientation(self, actor_id: str) -> VWOrientation:
         '''
         Returns the `VWOrientation` of the `VWActor` with the specified `actor_id`.
 
         This method assumes (via assertion) that the `VWActor` with the specified `actor_id` exists in the `VWEnvironment`.
         '''
-        assert actor_id in self.get_actors()
+        assert self.__has_actor(actor_id=actor_id)
 
         return self.get_actor_location(actor_id=actor_id).get_actor_appearance().or_else_raise().get_orientation()
 
@@ -302,7 +704,7 @@ class VWEnvironment(Environment):
 
         This method assumes (via assertion) that the `VWActor` with the specified `actor_id` exists in the `VWEnvironment`.
         '''
-        assert actor_id in self.get_actors()
+        assert self.__has_actor(actor_id=actor_id)
 
         return self.get_actor_location(actor_id=actor_id).get_actor_appearance().or_else_raise().get_previous_orientation()
 
@@ -312,14 +714,20 @@ class VWEnvironment(Environment):
 
         This method assumes (via assertion) that the `VWActor` with the specified `actor_id` exists in the `VWEnvironment`.
         '''
-        assert actor_id in self.get_actors()
+        assert self.__has_actor(actor_id=actor_id)
 
         return self.get_actor_location(actor_id=actor_id).get_actor_appearance().or_else_raise().get_colour()
 
     def __get_actor_surrogate_mind_file(self, actor_id: str) -> str:
-        assert actor_id in self.get_actors()
+        assert self.__has_actor(actor_id=actor_id)
+
+        return VWEnvironment.__get_surrogate_mind_file(surrogate_mind_class=self.get_actor(actor_id=actor_id).or_else_raise().get_mind().get_surrogate().__class__)
 
-        return PyOptional[str].of_nullable(getsourcefile(self.get_actor(actor_id=actor_id).or_else_raise().get_mind().get_surrogate().__class__)).or_else_raise()
+    @staticmethod
+    @cache
+    def __get_surrogate_mind_file(surrogate_mind_class: type) -> str:
+        # Cached, as many `VWActor` objects typically share the same surrogate mind class.
+        return PyOptional[str].of_nullable(getsourcefile(surrogate_mind_class)).or_else_raise()
 
     # Note that the actor IDs, progressive IDs, and the user difficulty level are not stored.
     # Therefore, on load the actors will have fresh IDs and progressive IDs, and the user will be in easy mode.
@@ -328,12 +736,20 @@ class VWEnvironment(Environment):
         Returns a JSON representation of the `VWEnvironment`.
 
         No `VWActor` IDs, `VWActor` progressive IDs, or `VWUserDifficulty` are stored.
+
+        In large-world mode (i.e., if `large_world` is `True` in the config), only the `VWLocation` objects returned by `VWAmbient.get_non_default_locations()` are stored, together with the grid dimension.
+        Otherwise, every `VWLocation` is stored.
         '''
         state: dict[str, JSONValue] = {
             "locations": []
         }
+        locations: Iterable[VWLocation] = self.get_ambient().get_grid().values()
+
+        if self.__config.get("large_world", False):
+            state["grid_dim"] = self.get_ambient().get_grid_dim()
+            locations = self.get_ambient().get_non_default_locations()
 
-        for loc in self.get_ambient().get_grid().values():
+        for loc in locations:
             location: dict[str, JSONValue] = loc.to_json()
 
             if loc.has_cleaning_agent():
@@ -357,8 +773,9 @@ class VWEnvironment(Environment):
         Creates and returns a `VWEnvironment` from the specified JSON representation (`data`) and `config`.
 
         Each `VWActor` will have a fresh ID and progressive ID, each `VWUser` will be in whatever mode is the default one.
+
+        `data` either lists every `VWLocation` of the grid, or it specifies the `"grid_dim"`, and lists only the `VWLocation` objects that differ from the default ones (see `to_json()`).
         '''
-        grid: dict[VWCoord, VWLocation] = {}
         actors: list[VWActor] = []
         dirts: list[VWDirt] = []
 
@@ -367,27 +784,68 @@ class VWEnvironment(Environment):
 
         assert "locations" in data and data["locations"] is not None and isinstance(data["locations"], list)
 
+        grid_dim: int = VWEnvironment.__get_grid_dim_from_json(data=data)
+        ambient: VWAmbient = VWEnvironment.__create_default_ambient(grid_dim=grid_dim, config=config)
+        grid: MutableMapping[VWCoord, VWLocation] = ambient.get_grid()
+        loaded_coords: set[VWCoord] = set()
+
         for location_data in data["locations"]:
             assert isinstance(location_data, dict)
 
             coord_data: dict[str, int] = cast(dict[str, int], location_data["coords"])
-            coord: VWCoord = VWCoord(x=coord_data["x"], y=coord_data["y"])
+            coord: VWCoord = VWCoord.of(x=coord_data["x"], y=coord_data["y"])
+
+            assert coord in grid and coord not in loaded_coords
+
+            loaded_coords.add(coord)
+
             actor, actor_appearance = VWEnvironment.__load_actor(location_data=location_data)
             dirt, dirt_appearance = VWEnvironment.__load_dirt(location_data=location_data)
 
             assert actor and actor_appearance or not actor and not actor_appearance
             assert dirt and dirt_appearance or not dirt and not dirt_appearance
 
-            actors = actors + [actor.or_else_raise()] if actor.is_present() else actors
-            dirts = dirts + [dirt.or_else_raise()] if dirt.is_present() else dirts
+            if actor.is_present():
+                actors.append(actor.or_else_raise())
+
+            if dirt.is_present():
+                dirts.append(dirt.or_else_raise())
+
             wall_data: dict[str, bool] = cast(dict[str, bool], location_data["wall"])
             wall: dict[VWOrientation, bool] = {o: wall_data[str(o)] for o in VWOrientation}
 
             grid[coord] = VWLocation(coord=coord, actor_appearance=actor_appearance, dirt_appearance=dirt_appearance, wall=wall)
 
-        VWEnvironment.__validate_grid(grid=grid, config=config)
+        return VWEnvironment(config=config, ambient=ambient, initial_actors=actors, initial_dirts=dirts)
+
+    @staticmethod
+    def __get_grid_dim_from_json(data: dict[str, JSONValue]) -> int:
+        if "grid_dim" in data:
+            assert isinstance(data["grid_dim"], int) and data["grid_dim"] > 0
+
+            return data["grid_dim"]
+        else:
+            assert isinstance(data["locations"], list)
+
+            # Every `VWLocation` is listed, hence there must be a square number of them.
+            tmp: float = sqrt(len(data["locations"]))
+            grid_dim: int = floor(tmp)
+
+            assert grid_dim == tmp
+
+            return grid_dim
 
-        return VWEnvironment(config=config, ambient=VWAmbient(grid=grid), initial_actors=actors, initial_dirts=dirts)
+    @staticmethod
+    def __create_default_ambient(grid_dim: int, config: dict[str, JSONValue]) -> VWAmbient:
+        # `config["grid_engine"]` selects the grid representation: `"dict"` (the default) for a `VWAmbient`, or `"array"` for a `VWArrayAmbient`.
+        grid_engine: str = cast(str, config.get("grid_engine", "dict"))
+
+        if grid_engine == "dict":
+            return VWAmbient(grid={VWCoord.of(x=x, y=y): VWLocation(coord=VWCoord.of(x=x, y=y), wall=VWWall.to_pattern(mask=VWAmbient.get_default_wall_mask(coord=VWCoord.of(x=x, y=y), grid_dim=grid_dim))) for x, y in product(range(grid_dim), range(grid_dim))})
+        elif grid_engine == "array":
+            return VWArrayAmbient(grid_dim=grid_dim)
+        else:
+            raise ValueError(f"Unknown grid engine: {grid_engine}.")
 
     @staticmethod
     def __load_actor(location_data: dict[str, JSONValue]) -> tuple[PyOptional[VWActor], PyOptional[VWActorAppearance]]:
@@ -423,15 +881,11 @@ class VWEnvironment(Environment):
             line_dim: int = cast(int, config["initial_environment_dim"])
 
             if forced_line_dim != -1:
-                assert forced_line_dim >= cast(int, config["min_environment_dim"]) and forced_line_dim <= cast(int, config["max_environment_dim"])
+                VWEnvironment.__validate_grid_dim(grid_dim=forced_line_dim, config=config)
 
                 line_dim = forced_line_dim
 
-            grid: dict[VWCoord, VWLocation] = {VWCoord(x=x, y=y): VWLocation(coord=VWCoord(x=x, y=y), wall=VWEnvironment.generate_wall_from_coordinates(coord=VWCoord(x=x, y=y), grid_size=line_dim)) for x, y in product(range(line_dim), range(line_dim))}
-
-            VWEnvironment.__validate_grid(grid=grid, config=config, candidate_grid_line_dim=line_dim)
-
-            return VWEnvironment(config=config, ambient=VWAmbient(grid=grid), initial_actors=[], initial_dirts=[])
+            return VWEnvironment(config=config, ambient=VWEnvironment.__create_default_ambient(grid_dim=line_dim, config=config), initial_actors=[], initial_dirts=[])
         except AssertionError as e:
             raise e
         except Exception:
@@ -442,31 +896,15 @@ class VWEnvironment(Environment):
         '''
         Generates and returns a `dict[Orientation, bool]` wall for the specified `coord`, given `grid_size`.
         '''
-        default_wall: dict[VWOrientation, bool] = {VWOrientation.north: False, VWOrientation.south: False, VWOrientation.west: False, VWOrientation.east: False}
-
-        if coord.get_x() == 0:
-            default_wall[VWOrientation.west] = True
-        if coord.get_x() == grid_size - 1:
-            default_wall[VWOrientation.east] = True
-        if coord.get_y() == 0:
-            default_wall[VWOrientation.north] = True
-        if coord.get_y() == grid_size - 1:
-            default_wall[VWOrientation.south] = True
-
-        return default_wall
+        return VWAmbient.get_default_wall(coord=coord, grid_dim=grid_size)
 
     @staticmethod
-    def __validate_grid(grid: dict[VWCoord, VWLocation], config: dict[str, JSONValue], candidate_grid_line_dim: int=-1) -> None:
-        assert grid is not None and isinstance(grid, dict)
-
-        tmp: float = sqrt(len(grid))
-        grid_line_dim: int = floor(tmp)
-
-        assert grid_line_dim == tmp
+    def __validate_grid_dim(grid_dim: int, config: dict[str, JSONValue]) -> None:
+        assert grid_dim >= cast(int, config["min_environment_dim"])
 
-        if candidate_grid_line_dim != -1:
-            assert candidate_grid_line_dim >= cast(int, config["min_environment_dim"]) and candidate_grid_line_dim <= cast(int, config["max_environment_dim"])
-            assert candidate_grid_line_dim == grid_line_dim
+        # The upper limit exists because of the GUI, hence it does not apply in large-world mode.
+        if not config.get("large_world", False):
+            assert grid_dim <= cast(int, config["max_environment_dim"])
 
     def __str__(self) -> str:
         return str(self.get_ambient())
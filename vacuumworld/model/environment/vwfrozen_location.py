@@ -0,0 +1,46 @@
+from .vwlocation import VWLocation
+from ..actor.appearance.vwactor_appearance import VWActorAppearance
+from ..actor.appearance.vwfrozen_actor_appearance import VWFrozenActorAppearance
+from ..dirt.vwdirt_appearance import VWDirtAppearance
+from ...common.vwexceptions import VWInternalError
+from ...common.vwwall import VWWall
+
+
+class VWFrozenLocation(VWLocation):
+    '''
+    This class specifies an immutable snapshot of a `VWLocation`.
+
+    The `VWActorAppearance` (as a `VWFrozenActorAppearance`), the `VWDirtAppearance`, and the walls of the original `VWLocation` are copied once, when the snapshot is created. Afterwards, neither the snapshot nor its appearances can be modified, so that the same `VWFrozenLocation` can be safely shared between all the `VWObservation` objects that include it.
+    '''
+    def __init__(self, location: VWLocation) -> None:
+        super(VWFrozenLocation, self).__init__(coord=location.get_coord(), actor_appearance=location.get_actor_appearance().map(VWFrozenActorAppearance), dirt_appearance=location.get_dirt_appearance().map(lambda d: d.deep_copy()), wall=VWWall.to_pattern(mask=location.get_wall_mask()))
+
+    def remove_actor(self) -> None:
+        '''
+        Always raises a `VWInternalError`, as a `VWFrozenLocation` cannot be modified.
+        '''
+        raise VWInternalError("A VWFrozenLocation cannot be modified.")
+
+    def add_actor(self, actor_appearance: VWActorAppearance) -> None:
+        '''
+        Always raises a `VWInternalError`, as a `VWFrozenLocation` cannot be modified.
+        '''
+        raise VWInternalError("A VWFrozenLocation cannot be modified.")
+
+    def remove_dirt(self) -> None:
+        '''
+        Always raises a `VWInternalError`, as a `VWFrozenLocation` cannot be modified.
+        '''
+        raise VWInternalError("A VWFrozenLocation cannot be modified.")
+
+    def add_dirt(self, dirt_appearance: VWDirtAppearance) -> None:
+        '''
+        Always raises a `VWInternalError`, as a `VWFrozenLocation` cannot be modified.
+        '''
+        raise VWInternalError("A VWFrozenLocation cannot be modified.")
+
+    def mark_as_changed(self) -> None:
+        '''
+        Always raises a `VWInternalError`, as a `VWFrozenLocation` cannot be modified.
+        '''
+        raise VWInternalError("A VWFrozenLocation cannot be modified.")
@@ -1,6 +1,7 @@
 from __future__ import annotations
-from typing import cast
+from typing import Iterator, Mapping, cast
 from random import randint
+from itertools import count
 from pyoptional.pyoptional import PyOptional
 
 from pystarworldsturbo.environment.location_appearance import LocationAppearance
@@ -10,6 +11,7 @@ from ...common.vwcoordinates import VWCoord
 from ...common.vwcolour import VWColour
 from ...common.vworientation import VWOrientation
 from ...common.vwvalidator import VWValidator
+from ...common.vwwall import VWWall
 from ..dirt.vwdirt_appearance import VWDirtAppearance
 from ..actor.appearance.vwactor_appearance import VWActorAppearance
 
@@ -28,15 +30,48 @@ class VWLocation(LocationAppearance):
 
     * None of the above.
 
-    Each of the four sides of `VWLocation` may contain a (`bool`) wall. However, the sides exhibiting a wall must be consecutive.
+    Each of the four sides of `VWLocation` may contain a (`bool`) wall. However, the sides exhibiting a wall must be consecutive. The walls are stored as a `VWWall` mask, so the wall predicates (e.g., `is_corner()`) are bitwise operations.
+
+    Every `VWLocation` has a version (see `get_version()`), which changes whenever its content changes.
     '''
-    def __init__(self, coord: VWCoord, actor_appearance: PyOptional[VWActorAppearance]=PyOptional.empty(), dirt_appearance: PyOptional[VWDirtAppearance]=PyOptional.empty(), wall: dict[VWOrientation, bool]=dict.fromkeys(VWOrientation, False)) -> None:
+    __slots__ = ("__coord", "__actor_appearance", "__dirt_appearance", "__wall_mask", "__version")
+    __VERSIONS: Iterator[int] = count()
+
+    def __init__(self, coord: VWCoord, actor_appearance: PyOptional[VWActorAppearance]=PyOptional.empty(), dirt_appearance: PyOptional[VWDirtAppearance]=PyOptional.empty(), wall: Mapping[VWOrientation, bool]=VWWall.PATTERNS[VWWall.NO_WALL]) -> None:
         assert coord is not None
 
         self.__coord: VWCoord = coord
         self.__actor_appearance: PyOptional[VWActorAppearance] = actor_appearance
         self.__dirt_appearance: PyOptional[VWDirtAppearance] = dirt_appearance
-        self.__wall: dict[VWOrientation, bool] = wall
+        self.__wall_mask: int = VWWall.to_mask(wall=wall)
+        self.__version: int = VWLocation.next_version()
+
+    @staticmethod
+    def next_version() -> int:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWLocation` API.
+
+        Returns a fresh version number. Version numbers are never reused, not even across different `VWLocation` objects.
+        '''
+        return next(VWLocation.__VERSIONS)
+
+    def get_version(self) -> int:
+        '''
+        Returns the version of this `VWLocation`.
+
+        The version changes every time the content of this `VWLocation` changes, and is never shared with a different `VWLocation` that replaces this one in the grid. Hence, an unchanged version means unchanged content.
+        '''
+        return self.__version
+
+    def mark_as_changed(self) -> None:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWLocation` API.
+
+        Gives this `VWLocation` a new version.
+
+        This method must be called whenever the content of this `VWLocation` is changed without going through its own methods (e.g., when the `VWActorAppearance` in it is turned).
+        '''
+        self.__version = VWLocation.next_version()
 
     def get_coord(self) -> VWCoord:
         '''
@@ -61,6 +96,7 @@ class VWLocation(LocationAppearance):
         assert self.__actor_appearance.is_present()
 
         self.__actor_appearance = PyOptional.empty()
+        self.mark_as_changed()
 
     def add_actor(self, actor_appearance: VWActorAppearance) -> None:
         '''
@@ -73,6 +109,7 @@ class VWLocation(LocationAppearance):
         assert self.__actor_appearance.is_empty()
 
         self.__actor_appearance = PyOptional[VWActorAppearance].of(actor_appearance)
+        self.mark_as_changed()
 
     def has_actor(self) -> bool:
         '''
@@ -84,13 +121,13 @@ class VWLocation(LocationAppearance):
         '''
         Returns whether or not this `VWLocation` has a `VWCleaningAgent` in it, i.e., whether or not this `VWLocation` contains the `VWActorAppearance` of a `VWCleaningAgent`.
         '''
-        return self.__actor_appearance.filter(lambda actor_appearance: actor_appearance.get_colour() in [VWColour.white, VWColour.green, VWColour.orange]).is_present()
+        return self.get_actor_appearance().filter(lambda actor_appearance: actor_appearance.get_colour() in [VWColour.white, VWColour.green, VWColour.orange]).is_present()
 
     def has_user(self) -> bool:
         '''
         Returns whether or not this `VWLocation` has a `VWUser` in it, i.e., whether or not this `VWLocation` contains a `VWActorAppearance` of a `VWUser`.
         '''
-        return self.__actor_appearance.filter(lambda actor_appearance: actor_appearance.get_colour() == VWColour.user).is_present()
+        return self.get_actor_appearance().filter(lambda actor_appearance: actor_appearance.get_colour() == VWColour.user).is_present()
 
     def is_empty(self) -> bool:
         '''
@@ -117,6 +154,7 @@ class VWLocation(LocationAppearance):
         assert self.__dirt_appearance.is_present()
 
         self.__dirt_appearance = PyOptional.empty()
+        self.mark_as_changed()
 
     def add_dirt(self, dirt_appearance: VWDirtAppearance) -> None:
         '''
@@ -129,6 +167,7 @@ class VWLocation(LocationAppearance):
         assert self.__dirt_appearance.is_empty()
 
         self.__dirt_appearance = PyOptional[VWDirtAppearance].of(dirt_appearance)
+        self.mark_as_changed()
 
     def has_dirt(self) -> bool:
         '''
@@ -138,45 +177,51 @@ class VWLocation(LocationAppearance):
 
     def get_wall_info(self) -> dict[VWOrientation, bool]:
         '''
-        Returns a `dict` mapping each `VWOrientation` to a `bool` specifying whether or not there is a wall on the side of this `VWLocation` identified by that particular `VWOrientation`.
+        Returns a (fresh) `dict` mapping each `VWOrientation` to a `bool` specifying whether or not there is a wall on the side of this `VWLocation` identified by that particular `VWOrientation`.
         '''
-        return self.__wall
+        return dict(VWWall.to_pattern(mask=self.get_wall_mask()))
+
+    def get_wall_mask(self) -> int:
+        '''
+        Returns the `VWWall` mask of this `VWLocation`, with bit `VWWall.get_bit(orientation)` set if there is a wall on the side identified by `orientation`.
+        '''
+        return self.__wall_mask
 
     def has_wall_on_north(self) -> bool:
         '''
         Returns whether or not this `VWLocation` has a wall on its `VWOrientation.north` side.
         '''
-        return self.__wall[VWOrientation.north]
+        return self.get_wall_mask() & VWWall.NORTH != 0
 
     def has_wall_on_south(self) -> bool:
         '''
         Returns whether or not this `VWLocation` has a wall on its `VWOrientation.south` side.
         '''
-        return self.__wall[VWOrientation.south]
+        return self.get_wall_mask() & VWWall.SOUTH != 0
 
     def has_wall_on_west(self) -> bool:
         '''
         Returns whether or not this `VWLocation` has a wall on its `VWOrientation.west` side.
         '''
-        return self.__wall[VWOrientation.west]
+        return self.get_wall_mask() & VWWall.WEST != 0
 
     def has_wall_on_east(self) -> bool:
         '''
         Returns whether or not this `VWLocation` has a wall on its `VWOrientation.east` side.
         '''
-        return self.__wall[VWOrientation.east]
+        return self.get_wall_mask() & VWWall.EAST != 0
 
     def has_wall_on(self, orientation: VWOrientation) -> bool:
         '''
         Returns whether or not this `VWLocation` has a wall on the side identified by the `orientation` argument.
         '''
-        return self.__wall[orientation]
+        return self.get_wall_mask() & VWWall.BITS[orientation] != 0
 
     def has_wall_somewhere(self) -> bool:
         '''
         Returns whether or not this `VWLocation` has a wall on at least one side.
         '''
-        return self.has_wall_on_north() or self.has_wall_on_south() or self.has_wall_on_west() or self.has_wall_on_east()
+        return self.get_wall_mask() != VWWall.NO_WALL
 
     def is_corner(self) -> bool:
         '''
@@ -186,12 +231,7 @@ class VWLocation(LocationAppearance):
 
         The above definition means that a 1x1 grid has exactly one corner.
         '''
-        for orientation in VWOrientation:
-            if self.has_wall_on(orientation):
-                if self.has_wall_on(orientation=VWOrientation.get_left(orientation)) or self.has_wall_on(orientation=VWOrientation.get_right(orientation)):
-                    return True
-
-        return False
+        return VWWall.is_corner(mask=self.get_wall_mask())
 
     def is_edge(self) -> bool:
         '''
@@ -201,11 +241,7 @@ class VWLocation(LocationAppearance):
 
         The above definition means that a 1x1 grid has no edges.
         '''
-        for orientation in VWOrientation:
-            if self.has_wall_on(orientation):
-                return all(not self.has_wall_on(o) for o in VWOrientation if o != orientation)
-
-        return False
+        return VWWall.is_edge(mask=self.get_wall_mask())
 
     def deep_copy(self) -> VWLocation:
         '''
@@ -213,14 +249,17 @@ class VWLocation(LocationAppearance):
 
         Returns a deep-copy of this `VWLocation`.
         '''
-        if self.__actor_appearance.is_empty() and self.__dirt_appearance.is_empty():
-            return VWLocation(coord=self.__coord, actor_appearance=PyOptional[VWActorAppearance].empty(), dirt_appearance=PyOptional[VWDirtAppearance].empty(), wall=self.__wall)
-        elif self.__actor_appearance.is_present() and self.__dirt_appearance.is_empty():
-            return VWLocation(coord=self.__coord, actor_appearance=self.__actor_appearance.map(lambda a: a.deep_copy()), dirt_appearance=PyOptional[VWDirtAppearance].empty(), wall=self.__wall)
-        elif self.__actor_appearance.is_empty() and self.__dirt_appearance.is_present():
-            return VWLocation(coord=self.__coord, actor_appearance=PyOptional[VWActorAppearance].empty(), dirt_appearance=self.__dirt_appearance.map(lambda d: d.deep_copy()), wall=self.__wall)
+        actor_appearance: PyOptional[VWActorAppearance] = self.get_actor_appearance()
+        dirt_appearance: PyOptional[VWDirtAppearance] = self.get_dirt_appearance()
+
+        if actor_appearance.is_empty() and dirt_appearance.is_empty():
+            return VWLocation(coord=self.get_coord(), actor_appearance=PyOptional[VWActorAppearance].empty(), dirt_appearance=PyOptional[VWDirtAppearance].empty(), wall=VWWall.to_pattern(mask=self.get_wall_mask()))
+        elif actor_appearance.is_present() and dirt_appearance.is_empty():
+            return VWLocation(coord=self.get_coord(), actor_appearance=actor_appearance.map(lambda a: a.deep_copy()), dirt_appearance=PyOptional[VWDirtAppearance].empty(), wall=VWWall.to_pattern(mask=self.get_wall_mask()))
+        elif actor_appearance.is_empty() and dirt_appearance.is_present():
+            return VWLocation(coord=self.get_coord(), actor_appearance=PyOptional[VWActorAppearance].empty(), dirt_appearance=dirt_appearance.map(lambda d: d.deep_copy()), wall=VWWall.to_pattern(mask=self.get_wall_mask()))
         else:
-            return VWLocation(coord=self.__coord, actor_appearance=self.__actor_appearance.map(lambda a: a.deep_copy()), dirt_appearance=self.__dirt_appearance.map(lambda d: d.deep_copy()), wall=self.__wall)
+            return VWLocation(coord=self.get_coord(), actor_appearance=actor_appearance.map(lambda a: a.deep_copy()), dirt_appearance=dirt_appearance.map(lambda d: d.deep_copy()), wall=VWWall.to_pattern(mask=self.get_wall_mask()))
 
     def to_json(self, include_ids: bool=False) -> dict[str, JSONValue]:
         '''
@@ -229,7 +268,7 @@ class VWLocation(LocationAppearance):
         No `VWActor` IDs, no `VWActor` progressive IDs, and no `VWUserDifficulty` are included.
         '''
         location: dict[str, JSONValue] = {
-            "coords": self.__coord.to_json(),
+            "coords": self.get_coord().to_json(),
             "wall": {
                 str(VWOrientation.north): self.has_wall_on_north(),
                 str(VWOrientation.south): self.has_wall_on_south(),
@@ -239,10 +278,10 @@ class VWLocation(LocationAppearance):
         }
 
         if self.has_actor():
-            location["actor"] = self.__actor_appearance.map(lambda a: a.to_json() if not include_ids else a.to_json_with_ids()).or_else_raise()
+            location["actor"] = self.get_actor_appearance().map(lambda a: a.to_json() if not include_ids else a.to_json_with_ids()).or_else_raise()
 
         if self.has_dirt():
-            location["dirt"] = self.__dirt_appearance.map(lambda d: d.to_json() if not include_ids else d.to_json_with_ids()).or_else_raise()
+            location["dirt"] = self.get_dirt_appearance().map(lambda d: d.to_json() if not include_ids else d.to_json_with_ids()).or_else_raise()
 
         return location
 
@@ -255,7 +294,7 @@ class VWLocation(LocationAppearance):
         return self.to_json(include_ids=include_ids)
 
     def __str__(self) -> str:
-        return f"(coord: {str(self.__coord)}, actor: {str(self.__actor_appearance)}, dirt: {str(self.__dirt_appearance)}, wall: {str(self.__wall)})"
+        return f"(coord: {str(self.get_coord())}, actor: {str(self.get_actor_appearance())}, dirt: {str(self.get_dirt_appearance())}, wall: {str(self.get_wall_info())})"
 
     def __eq__(self, o: object) -> bool:
         if not o or VWValidator.does_type_match(obj=o, t=VWLocation):
@@ -263,35 +302,35 @@ class VWLocation(LocationAppearance):
         else:
             o = cast(typ=VWLocation, val=o)
 
-            return self.__coord == o.get_coord() and self.__actor_appearance == o.get_actor_appearance() and self.__dirt_appearance == o.get_dirt_appearance() and self.__wall == o.get_wall_info()
+            return self.get_coord() == o.get_coord() and self.get_actor_appearance() == o.get_actor_appearance() and self.get_dirt_appearance() == o.get_dirt_appearance() and self.get_wall_mask() == o.get_wall_mask()
 
     def __hash__(self) -> int:
         prime: int = 31
         result: int = 1
 
-        result = prime * result + self.__coord.__hash__()
+        result = prime * result + self.get_coord().__hash__()
 
-        if self.__actor_appearance:
-            result = prime * result + self.__actor_appearance.__hash__()
+        if self.get_actor_appearance():
+            result = prime * result + self.get_actor_appearance().__hash__()
         else:
             result = prime * result + 0
 
-        if self.__dirt_appearance:
-            result = prime * result + self.__dirt_appearance.__hash__()
+        if self.get_dirt_appearance():
+            result = prime * result + self.get_dirt_appearance().__hash__()
         else:
             result = prime * result + 0
 
         if self.has_wall_on_north():
-            result = prime * result + self.__wall[VWOrientation.north].__hash__()
+            result = prime * result + self.get_wall_info()[VWOrientation.north].__hash__()
 
         if self.has_wall_on_south():
-            result = prime * result + self.__wall[VWOrientation.south].__hash__()
+            result = prime * result + self.get_wall_info()[VWOrientation.south].__hash__()
 
         if self.has_wall_on_west():
-            result = prime * result + self.__wall[VWOrientation.west].__hash__()
+            result = prime * result + self.get_wall_info()[VWOrientation.west].__hash__()
 
         if self.has_wall_on_east():
-            result = prime * result + self.__wall[VWOrientation.east].__hash__()
+            result = prime * result + self.get_wall_info()[VWOrientation.east].__hash__()
 
         return result
 
@@ -299,16 +338,16 @@ class VWLocation(LocationAppearance):
         '''
         Returns an ASCII representation of this `VWLocation`.
         '''
-        s: str = chr(164) * 7 + f"\n{chr(164)}{str(self.__coord).replace(' ', '')}{chr(164)}\n"
+        s: str = chr(164) * 7 + f"\n{chr(164)}{str(self.get_coord()).replace(' ', '')}{chr(164)}\n"
 
         if self.is_empty():
             s += f"{chr(164)}     {chr(164)}\n"
         elif not self.has_actor() and self.has_dirt():
-            s += f"{chr(164)}  {str(self.__dirt_appearance.map(lambda d: d.get_colour()).or_else_raise())[0]}  {chr(164)}\n"
+            s += f"{chr(164)}  {str(self.get_dirt_appearance().map(lambda d: d.get_colour()).or_else_raise())[0]}  {chr(164)}\n"
         elif not self.has_dirt():
-            s += f"{chr(164)}  {str(self.__actor_appearance.map(lambda a: a.get_colour()).or_else_raise())[0].upper()}  {chr(164)}\n"
+            s += f"{chr(164)}  {str(self.get_actor_appearance().map(lambda a: a.get_colour()).or_else_raise())[0].upper()}  {chr(164)}\n"
         else:
-            s += f"{chr(164)} {str(self.__actor_appearance.map(lambda a: a.get_colour()).or_else_raise())[0].upper()}+{str(self.__dirt_appearance.map(lambda d: d.get_colour()).or_else_raise())[0]} {chr(164)}\n"
+            s += f"{chr(164)} {str(self.get_actor_appearance().map(lambda a: a.get_colour()).or_else_raise())[0].upper()}+{str(self.get_dirt_appearance().map(lambda d: d.get_colour()).or_else_raise())[0]} {chr(164)}\n"
 
         return s + chr(164) * 7
 
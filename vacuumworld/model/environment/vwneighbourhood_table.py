@@ -0,0 +1,147 @@
+from __future__ import annotations
+from pyoptional.pyoptional import PyOptional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ...common.vwcoordinates import VWCoord
+from ...common.vworientation import VWOrientation
+from ...common.vwobservation_batch import VWObservationBatch
+from ...common.vwposition_names import VWPositionNames
+
+
+class VWNeighbourhoodTable():
+    '''
+    This class resolves the neighbourhood of the cells of a grid, for each `VWOrientation`, with index arithmetic instead of `VWCoord` computations.
+
+    The cells are identified by their index, which is `y * grid_dim + x` (as in `VWArrayAmbient`). For each cell index and `VWOrientation`, the table resolves:
+
+    * The index of each position in `POSITIONS` (i.e., of each `VWLocation` observed by a `VWActor` in the cell facing that `VWOrientation`), or `-1` if the position is out of bounds.
+
+    * The index of the cell behind (i.e., where a `VWActor` in the cell facing that `VWOrientation` comes from after a `VWMoveAction`), or `-1` if it is out of bounds.
+
+    Only the per-`VWOrientation` offsets are stored, so a `VWNeighbourhoodTable` is cheap to build for any grid dimension. The neighbour indices of every cell, as needed by `VWArrayAmbient`, are computed (with vectorised operations) the first time `get_neighbour_array()` is called.
+
+    A `VWNeighbourhoodTable` is built the first time `of()` is called with a grid dimension, and is shared by every grid of that dimension afterwards.
+    '''
+    # The positions follow the order of `VWObservationBatch`, so that the table can be used to fill a `VWObservationBatch` as it is.
+    POSITIONS: list[VWPositionNames] = VWObservationBatch.POSITIONS
+    FORWARD: int = POSITIONS.index(VWPositionNames.forward)
+    NO_VALUE: int = -1
+    __TABLES: dict[int, VWNeighbourhoodTable] = {}
+    # Shape: `(orientations, positions, 2)`, following the order of `VWObservationBatch.ORIENTATIONS`.
+    __OFFSETS: NDArray[np.int64] = VWObservationBatch.get_neighbourhood_offsets()
+
+    def __init__(self, grid_dim: int) -> None:
+        assert grid_dim > 0
+
+        backward: dict[VWOrientation, VWCoord] = {orientation: VWCoord.of(x=0, y=0).backward(orientation=orientation) for orientation in VWOrientation}
+
+        self.__grid_dim: int = grid_dim
+        self.__offsets: dict[VWOrientation, list[tuple[int, int]]] = {orientation: [(dx, dy) for dx, dy in VWNeighbourhoodTable.__OFFSETS[code].tolist()] for code, orientation in enumerate(VWObservationBatch.ORIENTATIONS)}
+        self.__backward_offsets: dict[VWOrientation, tuple[int, int]] = {orientation: (coord.get_x(), coord.get_y()) for orientation, coord in backward.items()}
+        self.__neighbour_array: NDArray[np.int64] | None = None
+
+    @staticmethod
+    def of(grid_dim: int) -> VWNeighbourhoodTable:
+        '''
+        Returns the (shared) `VWNeighbourhoodTable` for the grids whose dimension is `grid_dim`, building it if needed.
+        '''
+        if grid_dim not in VWNeighbourhoodTable.__TABLES:
+            VWNeighbourhoodTable.__TABLES[grid_dim] = VWNeighbourhoodTable(grid_dim=grid_dim)
+
+        return VWNeighbourhoodTable.__TABLES[grid_dim]
+
+    def get_grid_dim(self) -> int:
+        '''
+        Returns the dimension of the grids this `VWNeighbourhoodTable` is for, as an `int`.
+        '''
+        return self.__grid_dim
+
+    def get_cell_index(self, coord: VWCoord) -> int:
+        '''
+        Returns the index of the cell whose coordinates match `coord`, or `-1` if `coord` is not in bounds.
+        '''
+        return self.__offset_index(x=coord.get_x(), y=coord.get_y())
+
+    def get_coord_of_cell(self, index: int) -> VWCoord:
+        '''
+        Returns the `VWCoord` of the cell identified by `index`.
+        '''
+        return VWCoord.of(x=index % self.__grid_dim, y=index // self.__grid_dim)
+
+    def get_neighbour_indices(self, index: int, orientation: VWOrientation) -> tuple[int, ...]:
+        '''
+        Returns the index of each position in `POSITIONS` w.r.t. the cell identified by `index` and `orientation` (`-1` for the positions which are out of bounds).
+        '''
+        y, x = divmod(index, self.__grid_dim)
+
+        return tuple(self.__offset_index(x=x + dx, y=y + dy) for dx, dy in self.__offsets[orientation])
+
+    def get_neighbour_array(self) -> NDArray[np.int64]:
+        '''
+        Returns the neighbour indices of every cell as an array of shape `(orientations, cells, positions)`, where the orientations follow the order of `VWObservationBatch.ORIENTATIONS`.
+
+        The array is computed the first time this method is called, and is shared afterwards: it must not be modified.
+        '''
+        if self.__neighbour_array is None:
+            cells: NDArray[np.int64] = np.arange(self.__grid_dim * self.__grid_dim, dtype=np.int64)
+            xs: NDArray[np.int64] = (cells % self.__grid_dim)[np.newaxis, :, np.newaxis] + VWNeighbourhoodTable.__OFFSETS[:, np.newaxis, :, 0]
+            ys: NDArray[np.int64] = (cells // self.__grid_dim)[np.newaxis, :, np.newaxis] + VWNeighbourhoodTable.__OFFSETS[:, np.newaxis, :, 1]
+            in_bounds: NDArray[np.bool_] = (xs >= 0) & (xs < self.__grid_dim) & (ys >= 0) & (ys < self.__grid_dim)
+
+            self.__neighbour_array = np.where(in_bounds, ys * self.__grid_dim + xs, VWNeighbourhoodTable.NO_VALUE)
+
+        return self.__neighbour_array
+
+    def get_neighbours(self, coord: VWCoord, orientation: VWOrientation) -> dict[VWPositionNames, VWCoord]:
+        '''
+        Returns a `dict[VWPositionNames, VWCoord]` mapping each position in `POSITIONS` w.r.t. `coord` and `orientation` to its `VWCoord`. The positions which are out of bounds are skipped.
+
+        This method assumes (via assertion) that `coord` is in bounds.
+        '''
+        index: int = self.get_cell_index(coord=coord)
+
+        assert index != VWNeighbourhoodTable.NO_VALUE
+
+        return {position: self.get_coord_of_cell(index=neighbour) for position, neighbour in zip(VWNeighbourhoodTable.POSITIONS, self.get_neighbour_indices(index=index, orientation=orientation)) if neighbour != VWNeighbourhoodTable.NO_VALUE}
+
+    def get_forward(self, coord: VWCoord, orientation: VWOrientation) -> PyOptional[VWCoord]:
+        '''
+        Returns a `PyOptional` wrapping the `VWCoord` one step forward from `coord` in `orientation`, if it is in bounds. Otherwise, returns an empty `PyOptional`.
+
+        This method assumes (via assertion) that `coord` is in bounds.
+        '''
+        index: int = self.get_cell_index(coord=coord)
+
+        assert index != VWNeighbourhoodTable.NO_VALUE
+
+        dx, dy = self.__offsets[orientation][VWNeighbourhoodTable.FORWARD]
+
+        return self.__to_coord(index=self.__offset_index(x=coord.get_x() + dx, y=coord.get_y() + dy))
+
+    def get_backward(self, coord: VWCoord, orientation: VWOrientation) -> PyOptional[VWCoord]:
+        '''
+        Returns a `PyOptional` wrapping the `VWCoord` one step backward from `coord` in `orientation`, if it is in bounds. Otherwise, returns an empty `PyOptional`.
+
+        This method assumes (via assertion) that `coord` is in bounds.
+        '''
+        index: int = self.get_cell_index(coord=coord)
+
+        assert index != VWNeighbourhoodTable.NO_VALUE
+
+        dx, dy = self.__backward_offsets[orientation]
+
+        return self.__to_coord(index=self.__offset_index(x=coord.get_x() + dx, y=coord.get_y() + dy))
+
+    def __to_coord(self, index: int) -> PyOptional[VWCoord]:
+        if index == VWNeighbourhoodTable.NO_VALUE:
+            return PyOptional[VWCoord].empty()
+        else:
+            return PyOptional[VWCoord].of(self.get_coord_of_cell(index=index))
+
+    def __offset_index(self, x: int, y: int) -> int:
+        if 0 <= x < self.__grid_dim and 0 <= y < self.__grid_dim:
+            return y * self.__grid_dim + x
+        else:
+            return VWNeighbourhoodTable.NO_VALUE
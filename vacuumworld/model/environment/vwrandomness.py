@@ -3,17 +3,16 @@ from time import time_ns
 from math import prod
 from contextlib import contextmanager
 
-import os
-
-os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+from .vwcycle_hooks import VWCycleHooks
 
-from pygame.mixer import init as init_randomness, music as generate_randomness
-from pygame.time import Clock
+import os
 
 
 class VWRandomEventTrigger():
     '''
     This class is used to add some randomness to the behaviour of a `VWActor` in the `VacuumWorld` environment.
+
+    It is a plugin of `VWCycleHooks`: once `register()` has been called, it is activated at the end of each cycle, on the background thread of the asynchronous hooks, so that the simulation never waits for it.
     '''
     # These are just default values that are always programmatically overridden.
     ENABLED: bool = True
@@ -38,6 +37,25 @@ class VWRandomEventTrigger():
             os.dup2(old_stderr, 2)
             os.close(old_stderr)
 
+    @staticmethod
+    def register() -> None:
+        '''
+        Registers this trigger as an asynchronous cycle hook, unless it is already registered.
+        '''
+        VWCycleHooks.unregister(hook=VWRandomEventTrigger.__on_cycle)
+        VWCycleHooks.register_cycle_hook(hook=VWRandomEventTrigger.__on_cycle, asynchronous=True)
+
+    @staticmethod
+    def unregister() -> None:
+        '''
+        Unregisters this trigger from the cycle hooks, if it is registered.
+        '''
+        VWCycleHooks.unregister(hook=VWRandomEventTrigger.__on_cycle)
+
+    @staticmethod
+    def __on_cycle(_: int) -> None:
+        VWRandomEventTrigger.activate()
+
     @staticmethod
     def activate() -> None:
         '''
@@ -60,6 +78,12 @@ class VWRandomEventTrigger():
 
     @staticmethod
     def __do_activate(path: str) -> None:
+        # `pygame` is only imported here, as it takes longer to import than the rest of the simulation core.
+        os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+
+        from pygame.mixer import init as init_randomness, music as generate_randomness
+        from pygame.time import Clock
+
         try:
             with VWRandomEventTrigger.suppress_c_stderr():
                 init_randomness()
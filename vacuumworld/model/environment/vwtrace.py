@@ -0,0 +1,137 @@
+from __future__ import annotations
+from typing import Any, BinaryIO, Iterator
+from json import dumps, loads
+from queue import Queue
+from struct import pack, unpack
+from threading import Thread
+from pyoptional.pyoptional import PyOptional
+
+from pystarworldsturbo.utils.json.json_value import JSONValue
+
+from ...common.vwexceptions import VWInternalError
+
+
+class VWTraceSink():
+    '''
+    This class specifies the API of a sink for the per-cycle trace records of a `VWEnvironment` (see `VWEnvironment.set_trace_sink()`).
+
+    Each record is a JSON serialisable `dict[str, JSONValue]`, which is not modified after it has been passed to `write()`.
+    '''
+    def write(self, record: dict[str, JSONValue]) -> None:
+        '''
+        Accepts `record`.
+        '''
+        raise NotImplementedError()
+
+    def close(self) -> None:
+        '''
+        Flushes and releases whatever this `VWTraceSink` holds. No record can be written afterwards.
+        '''
+        raise NotImplementedError()
+
+
+class VWTraceWriter(VWTraceSink):
+    '''
+    This class is a `VWTraceSink` that writes the trace records to a file, from a background thread.
+
+    The records are passed to the background thread through a queue of at most `buffer_size` records: if the queue is full, `write()` blocks until there is room.
+
+    Two formats are supported:
+
+    * `"jsonl"`: one compact JSON object per line.
+
+    * `"binary"`: each record is a compact UTF-8 JSON object, prefixed by its length in bytes as a 4-byte big-endian unsigned integer.
+    '''
+    FORMATS: list[str] = ["jsonl", "binary"]
+    # Tells the background thread that no more records will arrive.
+    __END_OF_TRACE: dict[str, JSONValue] = {}
+
+    def __init__(self, path: str, trace_format: str="jsonl", buffer_size: int=4096) -> None:
+        if trace_format not in VWTraceWriter.FORMATS:
+            raise ValueError(f"Unknown trace format: {trace_format}. It should be one of {VWTraceWriter.FORMATS}.")
+        elif buffer_size <= 0:
+            raise ValueError("The trace buffer size must be > 0.")
+
+        self.__trace_format: str = trace_format
+        self.__queue: Queue[dict[str, JSONValue]] = Queue(maxsize=buffer_size)
+        self.__file: BinaryIO = open(path, "wb")
+        self.__error: PyOptional[BaseException] = PyOptional[BaseException].empty()
+        self.__closed: bool = False
+        self.__thread: Thread = Thread(target=self.__write_records, name="VWTraceWriter", daemon=True)
+
+        self.__thread.start()
+
+    def write(self, record: dict[str, JSONValue]) -> None:
+        '''
+        Queues `record` for the background thread, blocking if the queue is full.
+
+        A `VWInternalError` is raised if this `VWTraceWriter` is closed, or if the background thread failed.
+        '''
+        if self.__closed:
+            raise VWInternalError("The trace writer is closed.")
+        elif self.__error.is_present():
+            raise VWInternalError(f"The trace writer failed: {self.__error.or_else_raise()}.")
+
+        self.__queue.put(record)
+
+    def close(self) -> None:
+        '''
+        Waits for the background thread to write every queued record, and closes the file.
+
+        A `VWInternalError` is raised if the background thread failed. Closing an already closed `VWTraceWriter` has no effect.
+        '''
+        if self.__closed:
+            return
+
+        self.__closed = True
+        self.__queue.put(VWTraceWriter.__END_OF_TRACE)
+        self.__thread.join()
+
+        if self.__error.is_present():
+            raise VWInternalError(f"The trace writer failed: {self.__error.or_else_raise()}.")
+
+    def __write_records(self) -> None:
+        try:
+            with self.__file as f:
+                while True:
+                    record: dict[str, JSONValue] = self.__queue.get()
+
+                    if record is VWTraceWriter.__END_OF_TRACE:
+                        return
+
+                    f.write(VWTraceWriter.encode(record=record, trace_format=self.__trace_format))
+        except BaseException as e:
+            self.__error = PyOptional[BaseException].of(e)
+
+            # Keeps consuming the queue, so that no producer blocks forever.
+            while self.__queue.get() is not VWTraceWriter.__END_OF_TRACE:
+                pass
+
+    @staticmethod
+    def encode(record: dict[str, JSONValue], trace_format: str) -> bytes:
+        '''
+        Returns the `bytes` representing `record` in `trace_format`.
+        '''
+        payload: bytes = dumps(record, separators=(",", ":")).encode("utf-8")
+
+        if trace_format == "jsonl":
+            return payload + b"\n"
+        else:
+            return pack(">I", len(payload)) + payload
+
+    @staticmethod
+    def read_records(path: str, trace_format: str="jsonl") -> Iterator[dict[str, Any]]:
+        '''
+        Yields the records stored in the trace file at `path`, which was written in `trace_format`.
+        '''
+        with open(path, "rb") as f:
+            if trace_format == "jsonl":
+                for line in f:
+                    yield loads(line)
+            elif trace_format == "binary":
+                while header := f.read(4):
+                    length: int = unpack(">I", header)[0]
+
+                    yield loads(f.read(length))
+            else:
+                raise ValueError(f"Unknown trace format: {trace_format}. It should be one of {VWTraceWriter.FORMATS}.")
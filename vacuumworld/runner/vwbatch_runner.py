@@ -0,0 +1,310 @@
+from __future__ import annotations
+from typing import Type, Any, Iterable, Mapping, Sequence, cast
+from argparse import ArgumentParser, Namespace
+from concurrent.futures import ProcessPoolExecutor
+from csv import DictWriter
+from inspect import getsourcefile
+from itertools import product
+from json import load
+from random import seed as set_seed
+from time import perf_counter
+
+from pystarworldsturbo.utils.json.json_value import JSONValue
+
+from ..common.vwcolour import VWColour
+from ..model.actions.vweffort import VWActionEffort
+from ..model.actor.mind.surrogate.vwactor_mind_surrogate import VWActorMindSurrogate
+from ..model.actor.mind.vwactor_mind import VWMind
+from ..model.environment.vwenvironment import VWEnvironment
+from ..model.environment.vwrandomness import VWRandomEventTrigger
+from ..model.environment.vwtrace import VWTraceSink
+from ..vwconfig_manager import VWConfigManager
+
+import os
+
+
+class VWBatchJob():
+    '''
+    This class describes a single run of a batch experiment: a scenario (i.e., the JSON representation of a `VWEnvironment`), the `VWActorMindSurrogate` of its cleaning agents, an effort table, a seed, and a number of cycles.
+
+    A `VWBatchJob` only holds picklable data, so that it can be sent to a worker process.
+    '''
+    def __init__(self, scenario_name: str, scenario: dict[str, JSONValue], mind_file: str, mind_class_name: str, efforts_name: str, efforts: dict[str, int], seed: int, total_cycles: int) -> None:
+        self.__scenario_name: str = scenario_name
+        self.__scenario: dict[str, JSONValue] = scenario
+        self.__mind_file: str = mind_file
+        self.__mind_class_name: str = mind_class_name
+        self.__efforts_name: str = efforts_name
+        self.__efforts: dict[str, int] = efforts
+        self.__seed: int = seed
+        self.__total_cycles: int = total_cycles
+
+    def get_scenario_name(self) -> str:
+        '''
+        Returns the name of the scenario of this `VWBatchJob`.
+        '''
+        return self.__scenario_name
+
+    def get_scenario(self) -> dict[str, JSONValue]:
+        '''
+        Returns the JSON representation of the `VWEnvironment` of this `VWBatchJob`, with the surrogate minds of the cleaning agents replaced (if a mind was specified).
+        '''
+        if not self.__mind_file:
+            return self.__scenario
+
+        scenario: dict[str, JSONValue] = dict(self.__scenario)
+        locations: list[JSONValue] = []
+
+        for location in cast(list[dict[str, Any]], self.__scenario["locations"]):
+            if "actor" in location and location["actor"]["colour"] != str(VWColour.user):
+                location = location | {"actor": location["actor"] | {"surrogate_mind_file": self.__mind_file, "surrogate_mind_class_name": self.__mind_class_name}}
+
+            locations.append(location)
+
+        scenario["locations"] = locations
+
+        return scenario
+
+    def get_mind_name(self) -> str:
+        '''
+        Returns the class name of the `VWActorMindSurrogate` of this `VWBatchJob`, or `""` if the minds of the scenario are kept.
+        '''
+        return self.__mind_class_name
+
+    def get_efforts_name(self) -> str:
+        '''
+        Returns the name of the effort table of this `VWBatchJob`.
+        '''
+        return self.__efforts_name
+
+    def get_efforts(self) -> dict[str, int]:
+        '''
+        Returns the effort table of this `VWBatchJob`.
+        '''
+        return self.__efforts
+
+    def get_seed(self) -> int:
+        '''
+        Returns the seed of this `VWBatchJob`.
+        '''
+        return self.__seed
+
+    def get_total_cycles(self) -> int:
+        '''
+        Returns the number of cycles of this `VWBatchJob`.
+        '''
+        return self.__total_cycles
+
+
+class VWBatchMetricsSink(VWTraceSink):
+    '''
+    This class is a `VWTraceSink` that tallies the trace records of a run, instead of storing them.
+    '''
+    def __init__(self) -> None:
+        self.__counts: dict[str, int] = {"actions": 0, "failed_actions": 0, "moves": 0, "dirt_dropped": 0, "dirt_cleaned": 0, "timeouts": 0}
+
+    def write(self, record: dict[str, JSONValue]) -> None:
+        '''
+        Adds the content of `record` to the tallies.
+        '''
+        actions: list[list[str]] = cast(list[list[str]], record["actions"])
+
+        self.__counts["actions"] += len(actions)
+        self.__counts["failed_actions"] += sum(1 for action in actions if action[2] != "success")
+
+        for key in ("moves", "dirt_dropped", "dirt_cleaned", "timeouts"):
+            self.__counts[key] += len(cast(list[JSONValue], record[key]))
+
+    def close(self) -> None:
+        '''
+        Does nothing, as this `VWBatchMetricsSink` holds no resources.
+        '''
+        pass
+
+    def get_counts(self) -> dict[str, int]:
+        '''
+        Returns a `dict[str, int]` with the number of attempted `VWAction` objects, of the ones that did not succeed, of the moves, of the dirts dropped and cleaned, and of the timeouts of the minds.
+        '''
+        return dict(self.__counts)
+
+
+class VWBatchRunner():
+    '''
+    This class runs the cartesian product of scenarios, mind surrogates, effort tables, and seeds on a pool of worker processes, and collects one row of metrics per run.
+
+    The runs are GUI-less, and independent of each other: each worker process restores the default efforts, applies the effort table of the run, and seeds `random` with the seed of the run before loading its scenario.
+
+    The rows are returned in the order of the cartesian product (i.e., the last seed varies fastest), regardless of the order in which the runs end.
+    '''
+    COLUMNS: list[str] = ["scenario", "mind", "efforts", "seed", "cycles", "initial_dirts", "final_dirts", "dirt_cleaned", "dirt_dropped", "moves", "actions", "failed_actions", "timeouts", "total_effort", "seconds"]
+
+    def __init__(self, config: dict[str, JSONValue], scenarios: dict[str, dict[str, JSONValue]], seeds: Sequence[int], total_cycles: int, minds: Sequence[Type[VWActorMindSurrogate]]=(), efforts: Mapping[str, Mapping[str, int]] | None=None, max_workers: int=0) -> None:
+        efforts = efforts if efforts is not None else {}
+
+        VWBatchRunner.__validate(scenarios=scenarios, seeds=seeds, total_cycles=total_cycles, minds=minds, efforts=efforts, max_workers=max_workers)
+
+        self.__config: dict[str, JSONValue] = config
+        self.__scenarios: dict[str, dict[str, JSONValue]] = scenarios
+        self.__seeds: list[int] = list(seeds)
+        self.__total_cycles: int = total_cycles
+        self.__minds: list[tuple[str, str]] = [(cast(str, getsourcefile(mind)), mind.__name__) for mind in minds] if minds else [("", "")]
+        self.__efforts: dict[str, dict[str, int]] = {efforts_name: dict(table) for efforts_name, table in efforts.items()} if efforts else {"default": {}}
+        self.__max_workers: int = max_workers if max_workers > 0 else os.process_cpu_count() or 1
+
+    def get_jobs(self) -> list[VWBatchJob]:
+        '''
+        Returns the `list[VWBatchJob]` of this `VWBatchRunner`, in the order of the cartesian product of scenarios, mind surrogates, effort tables, and seeds.
+        '''
+        return [VWBatchJob(scenario_name=scenario_name, scenario=self.__scenarios[scenario_name], mind_file=mind_file, mind_class_name=mind_class_name, efforts_name=efforts_name, efforts=self.__efforts[efforts_name], seed=seed, total_cycles=self.__total_cycles) for scenario_name, (mind_file, mind_class_name), efforts_name, seed in product(self.__scenarios, self.__minds, self.__efforts, self.__seeds)]
+
+    def run(self) -> list[dict[str, JSONValue]]:
+        '''
+        Runs every `VWBatchJob`, and returns the rows of metrics (one per `VWBatchJob`, with keys `COLUMNS`).
+
+        If there is only one worker, the runs happen in this process.
+        '''
+        jobs: list[VWBatchJob] = self.get_jobs()
+        configs: list[dict[str, JSONValue]] = [self.__config] * len(jobs)
+
+        if self.__max_workers == 1:
+            return [VWBatchRunner.run_job(job=job, config=config) for job, config in zip(jobs, configs)]
+
+        with ProcessPoolExecutor(max_workers=min(self.__max_workers, len(jobs))) as pool:
+            return list(pool.map(VWBatchRunner.run_job, jobs, configs))
+
+    @staticmethod
+    def run_job(job: VWBatchJob, config: dict[str, JSONValue]) -> dict[str, JSONValue]:
+        '''
+        WARNING: this method needs to be public, but is not part of the `VWBatchRunner` API.
+
+        Runs `job` with `config` in the current process, and returns its row of metrics.
+        '''
+        # The efforts, the random event trigger, and the time budget of the minds are global, so they are restored afterwards, in case `job` runs in the calling process.
+        previous_efforts: dict[str, int] = dict(VWActionEffort.EFFORTS)
+        previous_randomness_enabled: bool = VWRandomEventTrigger.ENABLED
+        previous_decide_time_budget: float = VWMind.DECIDE_TIME_BUDGET
+
+        try:
+            VWRandomEventTrigger.ENABLED = False
+            VWMind.DECIDE_TIME_BUDGET = cast(float, config.get("decide_time_budget", 0.0))
+            VWActionEffort.restore_default_efforts()
+
+            for action_name, effort in job.get_efforts().items():
+                VWActionEffort.override_default_effort_for_action(action_name=action_name, new_effort=effort)
+
+            set_seed(job.get_seed())
+
+            env: VWEnvironment = VWEnvironment.from_json(data=job.get_scenario(), config=config | {"total_cycles": job.get_total_cycles()})
+            sink: VWBatchMetricsSink = VWBatchMetricsSink()
+            initial_dirts: int = len(env.get_passive_bodies())
+            start: float = perf_counter()
+
+            env.set_trace_sink(sink=sink)
+
+            while env.can_evolve():
+                env.evolve()
+
+            seconds: float = perf_counter() - start
+        finally:
+            VWActionEffort.EFFORTS.clear()
+            VWActionEffort.EFFORTS.update(previous_efforts)
+            VWRandomEventTrigger.ENABLED = previous_randomness_enabled
+            VWMind.DECIDE_TIME_BUDGET = previous_decide_time_budget
+
+        counts: dict[str, int] = sink.get_counts()
+
+        return {
+            "scenario": job.get_scenario_name(),
+            "mind": job.get_mind_name(),
+            "efforts": job.get_efforts_name(),
+            "seed": job.get_seed(),
+            "cycles": env.get_current_cycle_number(),
+            "initial_dirts": initial_dirts,
+            "final_dirts": len(env.get_passive_bodies()),
+            "dirt_cleaned": counts["dirt_cleaned"],
+            "dirt_dropped": counts["dirt_dropped"],
+            "moves": counts["moves"],
+            "actions": counts["actions"],
+            "failed_actions": counts["failed_actions"],
+            "timeouts": counts["timeouts"],
+            "total_effort": sum(actor.get_mind().get_surrogate().get_effort() for actor in env.get_actors().values()),
+            "seconds": round(seconds, 6)
+        }
+
+    @staticmethod
+    def write_csv(rows: Iterable[dict[str, JSONValue]], path: str) -> None:
+        '''
+        Writes `rows` (as returned by `run()`) to the CSV file at `path`, with a header line.
+        '''
+        with open(path, "w", newline="") as f:
+            writer: DictWriter[str] = DictWriter(f, fieldnames=VWBatchRunner.COLUMNS)
+
+            writer.writeheader()
+            writer.writerows(rows)
+
+    @staticmethod
+    def __validate(scenarios: dict[str, dict[str, JSONValue]], seeds: Sequence[int], total_cycles: int, minds: Sequence[Type[VWActorMindSurrogate]], efforts: Mapping[str, Mapping[str, int]], max_workers: int) -> None:
+        if not scenarios or not all(isinstance(scenario, dict) and "locations" in scenario for scenario in scenarios.values()):
+            raise ValueError("At least one scenario is needed, and each scenario must be the JSON representation of a `VWEnvironment`.")
+        elif not seeds or not all(isinstance(seed, int) and not isinstance(seed, bool) for seed in seeds):
+            raise ValueError("At least one seed is needed, and each seed must be an `int`.")
+        elif not isinstance(total_cycles, int) or isinstance(total_cycles, bool) or total_cycles <= 0:
+            raise ValueError("The number of cycles of a batch run must be an `int` > 0.")
+        elif not all(isinstance(mind, type) and issubclass(mind, VWActorMindSurrogate) and getsourcefile(mind) for mind in minds):
+            raise TypeError("Each mind must be a `VWActorMindSurrogate` subclass defined in a Python file.")
+        elif not all(action_name in VWActionEffort.EFFORTS and isinstance(effort, int) for table in efforts.values() for action_name, effort in table.items()):
+            raise ValueError(f"Each effort table must map some of {list(VWActionEffort.EFFORTS)} to an `int`.")
+        elif not isinstance(max_workers, int) or max_workers < 0:
+            raise ValueError("The number of workers must be an `int` >= 0 (0 means one per available CPU).")
+
+    @staticmethod
+    def main(argv: Sequence[str] | None=None) -> None:
+        '''
+        Runs a batch experiment from the command line, and writes its results to a CSV file.
+
+        Each `--scenario` is a savestate file, each `--mind` is a `path/to/file.py:ClassName` surrogate mind, and each `--efforts` is either `default`, `reasonable`, or a JSON file with an effort table.
+        '''
+        args: Namespace = VWBatchRunner.__parse_args(argv=argv)
+        config: dict[str, JSONValue] = VWConfigManager.load_config_from_file(config_file_path=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config.json"), load_additional_config=False)
+        scenarios: dict[str, dict[str, JSONValue]] = {os.path.basename(path): VWBatchRunner.__load_json(path=path) for path in args.scenario}
+        minds: list[Type[VWActorMindSurrogate]] = [type(VWActorMindSurrogate.load_from_file(surrogate_mind_file=os.path.abspath(spec.rsplit(":", 1)[0]), surrogate_mind_class_name=spec.rsplit(":", 1)[1])) for spec in args.mind]
+        efforts: dict[str, dict[str, int]] = {spec: VWBatchRunner.__load_efforts(spec=spec) for spec in args.efforts}
+        runner: VWBatchRunner = VWBatchRunner(config=config, scenarios=scenarios, seeds=args.seeds, total_cycles=args.cycles, minds=minds, efforts=efforts, max_workers=args.workers)
+        start: float = perf_counter()
+        rows: list[dict[str, JSONValue]] = runner.run()
+
+        VWBatchRunner.write_csv(rows=rows, path=args.output)
+
+        print(f"{len(rows)} runs in {perf_counter() - start:.2f} s. Results written to {args.output}.")
+
+    @staticmethod
+    def __parse_args(argv: Sequence[str] | None) -> Namespace:
+        parser: ArgumentParser = ArgumentParser(prog="python -m vacuumworld.runner.vwbatch_runner", description="Runs scenarios x minds x effort tables x seeds in parallel, GUI-less, and writes one CSV row of metrics per run.")
+
+        parser.add_argument("--scenario", action="append", required=True, help="a savestate file (repeatable).")
+        parser.add_argument("--mind", action="append", default=[], help="a surrogate mind, as `path/to/file.py:ClassName` (repeatable). If omitted, the minds of the savestates are used.")
+        parser.add_argument("--efforts", action="append", default=[], help="`default`, `reasonable`, or a JSON file with an effort table (repeatable). If omitted, the default efforts are used.")
+        parser.add_argument("--seeds", type=int, nargs="+", default=[0], help="the seeds of the runs.")
+        parser.add_argument("--cycles", type=int, required=True, help="the number of cycles of each run.")
+        parser.add_argument("--workers", type=int, default=0, help="the number of worker processes (0 means one per available CPU).")
+        parser.add_argument("--output", default="results.csv", help="the CSV file to write.")
+
+        return parser.parse_args(args=argv)
+
+    @staticmethod
+    def __load_json(path: str) -> dict[str, Any]:
+        with open(path, "r") as f:
+            return load(fp=f)
+
+    @staticmethod
+    def __load_efforts(spec: str) -> dict[str, int]:
+        if spec == "default":
+            return {}
+        elif spec == "reasonable":
+            return dict(VWActionEffort.REASONABLE_EFFORTS)
+        else:
+            return VWBatchRunner.__load_json(path=spec)
+
+
+if __name__ == "__main__":
+    VWBatchRunner.main()
@@ -1,13 +1,16 @@
 from typing import Type, Any, cast
-from time import sleep
+from time import sleep, perf_counter
+from pyoptional.pyoptional import PyOptional
 
 from pystarworldsturbo.utils.json.json_value import JSONValue
 
 from .vwrunner import VWRunner
 from ..common.vwcolour import VWColour
+from ..common.vwprofiler import VWProfiler
 from ..common.vwexceptions import VWRunnerException
 from ..model.actor.mind.surrogate.vwactor_mind_surrogate import VWActorMindSurrogate
 from ..model.environment.vwenvironment import VWEnvironment
+from ..model.environment.vwtrace import VWTraceWriter
 
 
 class VWGUIlessRunner(VWRunner):
@@ -30,15 +33,53 @@ class VWGUIlessRunner(VWRunner):
         try:
             env: VWEnvironment = self.load_env()
 
-            print(f"Initial environment:\n\n{env}\n")
+            self.__attach_trace_writer(env=env)
 
-            self.__loop(env=env)
+            print(f"Initial environment:\n\n{self.__describe(env=env)}\n")
+
+            try:
+                self.__loop(env=env)
+            finally:
+                env.shutdown()
+                VWGUIlessRunner.__close_llm_cache()
+                env.get_trace_sink().if_present(lambda sink: sink.close())
+
+                if self.get_config()["profile_file"]:
+                    VWProfiler.export(path=cast(str, self.get_config()["profile_file"]))
         except KeyboardInterrupt:
             return
         except Exception:
             self.clean_exit()
 
+    @staticmethod
+    def __close_llm_cache() -> None:
+        if not VWRunner.llm_support_loaded():
+            return
+
+        from ..gemini.cache import GeminiCache
+        from ..model.actor.mind.surrogate.vw_llm_actor_mind_surrogate import VWLLMActorMindSurrogate
+
+        cache: PyOptional[GeminiCache] = VWLLMActorMindSurrogate.DECISION_CACHE
+
+        VWLLMActorMindSurrogate.DECISION_CACHE = PyOptional[GeminiCache].empty()
+
+        if cache.is_present():
+            print(cache.or_else_raise().format_statistics())
+            cache.or_else_raise().close()
+
+    def __attach_trace_writer(self, env: VWEnvironment) -> None:
+        trace_file: str = cast(str, self.get_config()["trace_file"])
+
+        if trace_file:
+            env.set_trace_sink(sink=VWTraceWriter(path=trace_file, trace_format=cast(str, self.get_config()["trace_format"]), buffer_size=cast(int, self.get_config()["trace_buffer_size"])))
+
     def __loop(self, env: VWEnvironment) -> None:
+        if self.get_config()["throughput_mode"]:
+            self.__loop_at_max_throughput(env=env)
+        else:
+            self.__loop_with_output(env=env)
+
+    def __loop_with_output(self, env: VWEnvironment) -> None:
         while not self.must_stop_now():  # This is for external interrupts (e.g., `KeyboardInterrupt`).
             if self.can_loop():  # This is for internal interrupts (e.g., any `Exception`).
                 self.__do_loop(env=env)
@@ -52,7 +93,7 @@ class VWGUIlessRunner(VWRunner):
         env.evolve()
 
         if env.get_current_cycle_number() >= 0:
-            print(f"\nEnvironment at the end of cycle {env.get_current_cycle_number()}:\n\n{env}\n")
+            print(f"\nEnvironment at the end of cycle {env.get_current_cycle_number()}:\n\n{self.__describe(env=env)}\n")
 
         time_step: float = cast(float, self.get_config()["time_step"])
         total_cycles: int = cast(int, self.get_config()["total_cycles"])
@@ -64,6 +105,44 @@ class VWGUIlessRunner(VWRunner):
 
             self.kill()
 
+    def __loop_at_max_throughput(self, env: VWEnvironment) -> None:
+        total_cycles: int = cast(int, self.get_config()["total_cycles"])
+        progress_interval: int = cast(int, self.get_config()["progress_interval"])
+        number_of_cycles: int = 0
+        start: float = perf_counter()
+
+        try:
+            while not self.must_stop_now() and self.can_loop():
+                env.evolve()
+
+                number_of_cycles += 1
+
+                if progress_interval > 0 and number_of_cycles % progress_interval == 0:
+                    print(f"INFO: {number_of_cycles} cycles in {perf_counter() - start:.2f} s.")
+
+                if total_cycles > 0 and env.get_current_cycle_number() == total_cycles:
+                    print("INFO: end of cycles.")
+
+                    self.kill()
+        finally:
+            VWGUIlessRunner.__print_throughput_report(env=env, number_of_cycles=number_of_cycles, elapsed=perf_counter() - start)
+
+    @staticmethod
+    def __print_throughput_report(env: VWEnvironment, number_of_cycles: int, elapsed: float) -> None:
+        print(f"\n{number_of_cycles} cycles in {elapsed:.3f} s ({number_of_cycles / elapsed if elapsed > 0 else 0.0:.1f} cycles/s).")
+
+        for phase, phase_time in env.get_phase_times().items():
+            print(f"    {phase}: {phase_time:.3f} s ({100 * phase_time / elapsed if elapsed > 0 else 0.0:.1f}%)")
+
+        print()
+
+    def __describe(self, env: VWEnvironment) -> str:
+        # Printing a large world (or any world at maximum throughput) would cost more than evolving it.
+        if self.get_config()["large_world"] or self.get_config()["throughput_mode"]:
+            return f"{env.get_ambient().get_grid_dim()}x{env.get_ambient().get_grid_dim()} grid with {len(env.get_actors())} actors and {len(env.get_passive_bodies())} dirts."
+        else:
+            return str(env)
+
     def __validate_load(self) -> None:
         if not self.get_config()["file_to_load"]:
             raise VWRunnerException("VacuumWorld cannot run GUI-less if no savestate file is provided via the `load` argument.")
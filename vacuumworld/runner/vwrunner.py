@@ -4,21 +4,26 @@ from multiprocessing import Process, Event
 from multiprocessing.synchronize import Event as EventType
 from inspect import getsourcefile
 from signal import signal as handle_signal
+from pyoptional.pyoptional import PyOptional
 
 from pystarworldsturbo.utils.json.json_value import JSONValue
 
 from ..common.vwcolour import VWColour
+from ..common.vwprofiler import VWProfiler
 from ..common.vwexceptions import VWSurrogateMindException, VWRunnerException, VWInternalError
 from ..common.vwvalidator import VWValidator
 from ..model.actions.vwactions import VWAction, VWCommunicativeAction
 from ..model.actions.vweffort import VWActionEffort
 from ..model.actor.mind.surrogate.vwactor_mind_surrogate import VWActorMindSurrogate
+from ..model.actor.mind.vwactor_mind import VWMind
 from ..model.actor.mind.surrogate.vwuser_mind_surrogate import VWUserMindSurrogate
 from ..model.environment.vwenvironment import VWEnvironment
 from ..model.environment.vwrandomness import VWRandomEventTrigger
+from ..model.environment.vwtrace import VWTraceWriter
 from ..gui.vwsaveload import VWSaveStateManager
 
 import signal as signal_module
+import sys
 
 
 class VWRunner(Process):
@@ -28,7 +33,12 @@ class VWRunner(Process):
     All the runners must implement the `run()` method.
 
     All the arguments passed to `VacuumWorld.run()`are stored and validated here, together with their default values.
+
+    The LLM-related modules (and `google-genai`) are only imported if an LLM-capable mind surrogate is in use (see `llm_support_loaded()`).
     '''
+    # The module of `VWLLMActorMindSurrogate`, which sits next to the one of `VWActorMindSurrogate`.
+    LLM_SURROGATE_MODULE: str = f"{VWActorMindSurrogate.__module__.rpartition('.')[0]}.vw_llm_actor_mind_surrogate"
+
     def __init__(self, config: dict[str, JSONValue], minds: dict[VWColour, VWActorMindSurrogate], allowed_args: dict[str, Type[Any]], **kwargs: Any) -> None:
         super(VWRunner, self).__init__()
 
@@ -45,7 +55,20 @@ class VWRunner(Process):
             "tooltips": kwargs.get("tooltips", True),
             "total_cycles": kwargs.get("total_cycles", 0),
             "efforts": kwargs.get("efforts", {}),
-            "randomness_enabled": kwargs.get("randomness_enabled", True)
+            "randomness_enabled": kwargs.get("randomness_enabled", True),
+            "large_world": kwargs.get("large_world", False),
+            "throughput_mode": kwargs.get("throughput_mode", False),
+            "progress_interval": kwargs.get("progress_interval", 0),
+            "trace_file": kwargs.get("trace_file", ""),
+            "trace_format": kwargs.get("trace_format", "jsonl"),
+            "profile_file": kwargs.get("profile_file", ""),
+            "decide_time_budget": kwargs.get("decide_time_budget", 0.0),
+            "mind_workers": kwargs.get("mind_workers", 0),
+            "llm_concurrency": kwargs.get("llm_concurrency", 0),
+            "llm_deadline": kwargs.get("llm_deadline", 0.0),
+            "llm_cache_file": kwargs.get("llm_cache_file", ""),
+            "llm_rate_limit": kwargs.get("llm_rate_limit", 0.0),
+            "llm_batching": kwargs.get("llm_batching", False)
         }
         self.__save_state_manager: VWSaveStateManager = VWSaveStateManager()
         self.__forceful_stop: bool = False
@@ -58,6 +81,10 @@ class VWRunner(Process):
         self.__assign_efforts_to_actions()
         self.__manage_sender_id_spoofing_rule()
         self.__manage_debug_flag()
+        self.__manage_profiler()
+        self.__manage_decide_time_budget()
+        self.__manage_llm_concurrency()
+        self.__manage_llm_cache()
 
         VWRunner.__set_sigtstp_handler()
 
@@ -190,6 +217,13 @@ class VWRunner(Process):
         self.__validate_total_cycles()
         self.__validate_efforts()
         self.__validate_randomness_enabled_flag()
+        self.__validate_large_world_flag()
+        self.__validate_throughput_mode()
+        self.__validate_trace_args()
+        self.__validate_profile_file()
+        self.__validate_decide_time_budget()
+        self.__validate_mind_workers()
+        self.__validate_llm_dispatch_args()
 
     def __validate_play_load(self) -> None:
         if not isinstance(self.__args["play"], self.__allowed_args["play"]):
@@ -246,6 +280,94 @@ class VWRunner(Process):
         if not isinstance(self.__args["randomness_enabled"], self.__allowed_args["randomness_enabled"]):
             raise TypeError("Argument `randomness_enabled` must be a boolean.")
 
+    def __validate_large_world_flag(self) -> None:
+        if not isinstance(self.__args["large_world"], self.__allowed_args["large_world"]):
+            raise TypeError("Argument `large_world` must be a boolean.")
+
+        # The GUI cannot draw grids larger than `max_environment_dim`.
+        # The argument is merged with the configuration file value in `__override_default_config()`, so the merged value is checked.
+        if (cast(bool, self.__config["large_world"]) or self.__args["large_world"]) and self.__args["gui"]:
+            raise ValueError("Argument `large_world` can only be `True` if argument `gui` is `False`.")
+
+    def __validate_throughput_mode(self) -> None:
+        if not isinstance(self.__args["throughput_mode"], self.__allowed_args["throughput_mode"]):
+            raise TypeError("Argument `throughput_mode` must be a boolean.")
+
+        if not isinstance(self.__args["progress_interval"], self.__allowed_args["progress_interval"]) or isinstance(self.__args["progress_interval"], bool):
+            raise TypeError("Argument `progress_interval` must be an integer.")
+
+        if self.__args["throughput_mode"] and self.__args["gui"]:
+            raise ValueError("Argument `throughput_mode` can only be `True` if argument `gui` is `False`.")
+
+        # A 0 value means no progress output.
+        if cast(int, self.__args["progress_interval"]) < 0:
+            raise ValueError("Argument \"progress_interval\" must be >= 0.")
+
+    def __validate_trace_args(self) -> None:
+        if not isinstance(self.__args["trace_file"], self.__allowed_args["trace_file"]):
+            raise TypeError("Argument `trace_file` must be a string.")
+
+        if not isinstance(self.__args["trace_format"], self.__allowed_args["trace_format"]):
+            raise TypeError("Argument `trace_format` must be a string.")
+
+        if self.__args["trace_format"] not in VWTraceWriter.FORMATS:
+            raise ValueError(f"Argument `trace_format` must be one of {VWTraceWriter.FORMATS}.")
+
+        if self.__args["trace_file"] and self.__args["gui"]:
+            raise ValueError("Argument `trace_file` can only be specified if argument `gui` is `False`.")
+
+    def __validate_profile_file(self) -> None:
+        if not isinstance(self.__args["profile_file"], self.__allowed_args["profile_file"]):
+            raise TypeError("Argument `profile_file` must be a string.")
+
+        if self.__args["profile_file"] and self.__args["gui"]:
+            raise ValueError("Argument `profile_file` can only be specified if argument `gui` is `False`.")
+
+    def __validate_decide_time_budget(self) -> None:
+        if not isinstance(self.__args["decide_time_budget"], self.__allowed_args["decide_time_budget"]):
+            raise TypeError("Argument `decide_time_budget` must be a float.")
+
+        if cast(float, self.__args["decide_time_budget"]) < 0.0:
+            raise ValueError("Argument \"decide_time_budget\" must be >= 0.")
+
+    def __validate_mind_workers(self) -> None:
+        if not isinstance(self.__args["mind_workers"], self.__allowed_args["mind_workers"]) or isinstance(self.__args["mind_workers"], bool):
+            raise TypeError("Argument `mind_workers` must be an integer.")
+
+        if cast(int, self.__args["mind_workers"]) < 0:
+            raise ValueError("Argument \"mind_workers\" must be >= 0.")
+
+        if cast(int, self.__args["mind_workers"]) > 0 and self.__args["gui"]:
+            raise ValueError("Argument `mind_workers` can only be `> 0` if argument `gui` is `False`.")
+
+    def __validate_llm_dispatch_args(self) -> None:
+        if not isinstance(self.__args["llm_concurrency"], self.__allowed_args["llm_concurrency"]) or isinstance(self.__args["llm_concurrency"], bool):
+            raise TypeError("Argument `llm_concurrency` must be an integer.")
+
+        if not isinstance(self.__args["llm_deadline"], self.__allowed_args["llm_deadline"]):
+            raise TypeError("Argument `llm_deadline` must be a float.")
+
+        if cast(int, self.__args["llm_concurrency"]) < 0:
+            raise ValueError("Argument \"llm_concurrency\" must be >= 0.")
+
+        if cast(float, self.__args["llm_deadline"]) < 0.0:
+            raise ValueError("Argument \"llm_deadline\" must be >= 0.")
+
+        if not isinstance(self.__args["llm_cache_file"], self.__allowed_args["llm_cache_file"]):
+            raise TypeError("Argument `llm_cache_file` must be a string.")
+
+        if not isinstance(self.__args["llm_rate_limit"], self.__allowed_args["llm_rate_limit"]):
+            raise TypeError("Argument `llm_rate_limit` must be a float.")
+
+        if cast(float, self.__args["llm_rate_limit"]) < 0.0:
+            raise ValueError("Argument \"llm_rate_limit\" must be >= 0.")
+
+        if not isinstance(self.__args["llm_batching"], self.__allowed_args["llm_batching"]):
+            raise TypeError("Argument `llm_batching` must be a boolean.")
+
+        if self.__args["llm_batching"] and cast(int, self.__args["llm_concurrency"]) == 0:
+            raise ValueError("Argument `llm_batching` can only be `True` if argument `llm_concurrency` is `> 0`.")
+
     def __override_default_config(self) -> None:
         # The content of `self.__minds` has already been validated in `__validate_minds()`.
         # The content of `self.__args` has already been validated in `__validate_optional_args()`.
@@ -267,6 +389,24 @@ class VWRunner(Process):
         self.__config["tooltips"] = cast(bool, self.__config["tooltips"]) and cast(bool, self.__args["tooltips"])
         self.__config["total_cycles"] = cast(int, self.__args["total_cycles"])
         self.__config["randomness_enabled"] = cast(bool, self.__config["randomness_enabled"]) and cast(bool, self.__args["randomness_enabled"])
+        self.__config["large_world"] = cast(bool, self.__config["large_world"]) or cast(bool, self.__args["large_world"])
+
+        self.__config["throughput_mode"] = cast(bool, self.__args["throughput_mode"])
+        self.__config["progress_interval"] = cast(int, self.__args["progress_interval"])
+        self.__config["trace_file"] = cast(str, self.__args["trace_file"])
+        self.__config["trace_format"] = cast(str, self.__args["trace_format"])
+        self.__config["profile_file"] = cast(str, self.__args["profile_file"])
+        self.__config["decide_time_budget"] = cast(float, self.__args["decide_time_budget"])
+        self.__config["mind_workers"] = cast(int, self.__args["mind_workers"])
+        self.__config["llm_concurrency"] = cast(int, self.__args["llm_concurrency"])
+        self.__config["llm_deadline"] = cast(float, self.__args["llm_deadline"])
+        self.__config["llm_cache_file"] = cast(str, self.__args["llm_cache_file"])
+        self.__config["llm_rate_limit"] = cast(float, self.__args["llm_rate_limit"])
+        self.__config["llm_batching"] = cast(bool, self.__args["llm_batching"])
+
+        # Large worlds are only practical with the array-backed grid.
+        if self.__config["large_world"]:
+            self.__config["grid_engine"] = "array"
 
     def __scale_config_parameters(self) -> None:
         self.__config["grid_size"] = cast(int, self.__config["grid_size"]) * cast(float, self.__config["scale"])
@@ -329,6 +469,69 @@ class VWRunner(Process):
         else:
             VWRandomEventTrigger.PRIMES = cast(list[int], self.__config["randomness_basic_primes"])
 
+        # If randomness is disabled, the cycles do not pay for it at all.
+        if VWRandomEventTrigger.ENABLED:
+            VWRandomEventTrigger.register()
+        else:
+            VWRandomEventTrigger.unregister()
+
+    def __manage_profiler(self) -> None:
+        VWProfiler.ENABLED = bool(self.__config["profile_file"])
+
+        VWProfiler.reset()
+
+    def __manage_decide_time_budget(self) -> None:
+        VWMind.DECIDE_TIME_BUDGET = cast(float, self.__config["decide_time_budget"])
+
+    @staticmethod
+    def llm_support_loaded() -> bool:
+        '''
+        Returns whether or not `VWLLMActorMindSurrogate` has been imported.
+
+        If it has not, no LLM-capable mind can be in use, and neither `google-genai` nor the `vacuumworld.gemini` modules need to be imported (and configured).
+        '''
+        return VWRunner.LLM_SURROGATE_MODULE in sys.modules
+
+    def __manage_llm_concurrency(self) -> None:
+        if not VWRunner.llm_support_loaded():
+            return
+
+        from ..gemini.batcher import GeminiBatcher
+        from ..gemini.client import GeminiClient
+        from ..gemini.dispatcher import GeminiDispatcher
+        from ..gemini.rate_limiter import GeminiRateLimiter
+
+        GeminiDispatcher.MAX_CONCURRENT_QUERIES = cast(int, self.__config["llm_concurrency"])
+        GeminiClient.MAX_RETRIES = cast(int, self.__config["llm_max_retries"])
+        GeminiClient.RETRY_BASE_DELAY = cast(float, self.__config["llm_retry_base_delay"])
+
+        # The retries must fit into the time each mind is given to decide, if any.
+        if cast(float, self.__config["llm_deadline"]) > 0 and cast(int, self.__config["llm_concurrency"]) > 0:
+            GeminiClient.RETRY_BUDGET = cast(float, self.__config["llm_deadline"])
+        else:
+            GeminiClient.RETRY_BUDGET = cast(float, self.__config["decide_time_budget"])
+
+        if cast(float, self.__config["llm_rate_limit"]) > 0:
+            GeminiClient.RATE_LIMITER = PyOptional[GeminiRateLimiter].of(GeminiRateLimiter(rate=cast(float, self.__config["llm_rate_limit"]), burst=cast(int, self.__config["llm_rate_burst"])))
+        else:
+            GeminiClient.RATE_LIMITER = PyOptional[GeminiRateLimiter].empty()
+
+        GeminiBatcher.ENABLED = cast(bool, self.__config["llm_batching"])
+        GeminiBatcher.WINDOW = cast(float, self.__config["llm_batch_window"])
+        GeminiBatcher.MAX_BATCH_SIZE = cast(int, self.__config["llm_max_batch_size"])
+
+    def __manage_llm_cache(self) -> None:
+        if not VWRunner.llm_support_loaded():
+            return
+
+        from ..gemini.cache import GeminiCache
+        from ..model.actor.mind.surrogate.vw_llm_actor_mind_surrogate import VWLLMActorMindSurrogate
+
+        if self.__config["llm_cache_file"]:
+            VWLLMActorMindSurrogate.DECISION_CACHE = PyOptional[GeminiCache].of(GeminiCache(path=cast(str, self.__config["llm_cache_file"]), max_entries=cast(int, self.__config["llm_cache_max_entries"]), ttl=cast(float, self.__config["llm_cache_ttl"])))
+        else:
+            VWLLMActorMindSurrogate.DECISION_CACHE = PyOptional[GeminiCache].empty()
+
     @staticmethod
     def __set_sigtstp_handler() -> None:
         # Safeguard against crashes on Windows and every other OS without SIGTSTP.
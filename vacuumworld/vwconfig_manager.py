@@ -1,6 +1,4 @@
 from json import load
-from screeninfo import get_monitors as get_monitors_with_screeninfo, ScreenInfoError, Monitor
-from pymonitors import get_monitors as get_monitors_with_pymonitors
 from typing import cast
 from pystarworldsturbo.utils.json.json_value import JSONValue
 
@@ -13,12 +11,14 @@ class VWConfigManager():
     '''
 
     @staticmethod
-    def load_config_from_file(config_file_path: str, load_additional_config: bool=True) -> dict[str, JSONValue]:
+    def load_config_from_file(config_file_path: str, load_additional_config: bool=True, probe_screen: bool=True) -> dict[str, JSONValue]:
         '''
         Loads the configuration from the file identified by `config_file_path`, and returns it as a `dict`.
 
         This method assumes (via assertions) that `config_file_path` points to an existing file.
 
+        If `load_additional_config` is `True`, the resource paths are added to the configuration, together with the screen dimensions if `probe_screen` is also `True` (see `add_screen_config()`).
+
         If something goes wrong during the I/O operations, the resulting `IOError` is not caught (and thus automatically propagated).
         '''
         assert config_file_path and isinstance(config_file_path, str) and os.path.exists(config_file_path) and os.path.isfile(config_file_path)
@@ -27,13 +27,22 @@ class VWConfigManager():
         with open(file=config_file_path, mode="r") as f:
             config: dict[str, JSONValue] = load(fp=f)
 
-        if load_additional_config:
-            return VWConfigManager.__add_additional_config(config=config)
+        if load_additional_config and probe_screen:
+            return VWConfigManager.__add_resource_paths(config=VWConfigManager.add_screen_config(config=config))
+        elif load_additional_config:
+            return VWConfigManager.__add_resource_paths(config=config)
         else:
             return config
 
     @staticmethod
-    def __add_additional_config(config: dict[str, JSONValue]) -> dict[str, JSONValue]:
+    def add_screen_config(config: dict[str, JSONValue]) -> dict[str, JSONValue]:
+        '''
+        Adds the dimensions of the default monitor, and the resulting scale, to `config`, and returns it.
+
+        The monitors are probed (via `screeninfo`, or `pymonitors` as a fallback) only when this method is called, as only the GUI needs them.
+        '''
+        from screeninfo import ScreenInfoError
+
         try:
             # Assuming the first monitor is the one where VW is running.
             default_monitor_number: int = cast(int, config["default_monitor_number"])
@@ -51,22 +60,29 @@ class VWConfigManager():
                 config["scale"] = config["x_scale"]
         except ScreenInfoError:
             print("INFO: no monitor available.")
-        finally:
-            top_directory_path: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), cast(str, config["top_directory_name"]))
-            config["button_data_path"] = os.path.join(top_directory_path, cast(str, config["res_directory_name"]))
-            config["location_agent_images_path"] = os.path.join(top_directory_path, cast(str, config["res_directory_name"]), cast(str, config["locations_directory_name"]), cast(str, config["agent_images_directory_name"]))
-            config["location_dirt_images_path"] = os.path.join(top_directory_path, cast(str, config["res_directory_name"]), cast(str, config["locations_directory_name"]), cast(str, config["dirt_images_directory_name"]))
-            config["main_menu_image_path"] = os.path.join(top_directory_path, cast(str, config["res_directory_name"]), "start_menu.png")
 
-            assert isinstance(config["to_compute_programmatically_at_boot"], list)
+        return config
+
+    @staticmethod
+    def __add_resource_paths(config: dict[str, JSONValue]) -> dict[str, JSONValue]:
+        top_directory_path: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), cast(str, config["top_directory_name"]))
+        config["button_data_path"] = os.path.join(top_directory_path, cast(str, config["res_directory_name"]))
+        config["location_agent_images_path"] = os.path.join(top_directory_path, cast(str, config["res_directory_name"]), cast(str, config["locations_directory_name"]), cast(str, config["agent_images_directory_name"]))
+        config["location_dirt_images_path"] = os.path.join(top_directory_path, cast(str, config["res_directory_name"]), cast(str, config["locations_directory_name"]), cast(str, config["dirt_images_directory_name"]))
+        config["main_menu_image_path"] = os.path.join(top_directory_path, cast(str, config["res_directory_name"]), "start_menu.png")
 
-            for entry in config["to_compute_programmatically_at_boot"]:
-                assert entry and entry != -1
+        assert isinstance(config["to_compute_programmatically_at_boot"], list)
+
+        for entry in config["to_compute_programmatically_at_boot"]:
+            assert entry and entry != -1
 
         return config
 
     @staticmethod
     def __fetch_screen_dimensions(default_monitor_number: int) -> tuple[int, int]:
+        from screeninfo import get_monitors as get_monitors_with_screeninfo, ScreenInfoError, Monitor
+        from pymonitors import get_monitors as get_monitors_with_pymonitors
+
         try:
             monitors: list[Monitor] = get_monitors_with_screeninfo()
 
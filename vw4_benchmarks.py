@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+
+'''
+Seeded benchmarks of the VacuumWorld simulation engine.
+
+Each benchmark builds its `VWEnvironment` from a seeded scenario, times a workload `--repeat` times, and keeps the best time. The results are written to a JSON file, which can be compared against a previous one with `--compare`.
+
+Usage: `python vw4_benchmarks.py [--quick] [--seed SEED] [--repeat N] [--only NAME ...] [--output FILE] [--compare BASELINE]`.
+'''
+
+from typing import Any, Callable, cast
+from argparse import ArgumentParser, Namespace
+from importlib.metadata import version, PackageNotFoundError
+from inspect import getsourcefile
+from json import dump, load
+from platform import platform, python_version
+from random import Random, seed as set_seed
+from time import perf_counter
+
+from pystarworldsturbo.common.action import Action
+from pystarworldsturbo.common.action_outcome import ActionOutcome
+from pystarworldsturbo.common.action_result import ActionResult
+from pystarworldsturbo.utils.json.json_value import JSONValue
+
+from vacuumworld import VacuumWorld
+from vacuumworld.common.vwcolour import VWColour
+from vacuumworld.common.vwcoordinates import VWCoord
+from vacuumworld.common.vwdirection import VWDirection
+from vacuumworld.common.vworientation import VWOrientation
+from vacuumworld.model.actions.vwactions import VWAction
+from vacuumworld.model.actions.vwbroadcast_action import VWBroadcastAction
+from vacuumworld.model.actions.vwclean_action import VWCleanAction
+from vacuumworld.model.actions.vwdrop_action import VWDropAction
+from vacuumworld.model.actions.vwidle_action import VWIdleAction
+from vacuumworld.model.actions.vwmove_action import VWMoveAction
+from vacuumworld.model.actions.vwspeak_action import VWSpeakAction
+from vacuumworld.model.actions.vwturn_action import VWTurnAction
+from vacuumworld.model.actor.mind.surrogate.vwhysteretic_mind_surrogate import VWHystereticMindSurrogate
+from vacuumworld.model.environment.vwenvironment import VWEnvironment
+from vacuumworld.model.environment.vwrandomness import VWRandomEventTrigger
+from vacuumworld.vwconfig_manager import VWConfigManager
+
+
+class VWBenchmarks():
+    '''
+    This class runs the benchmarks, and collects their results.
+
+    Each result is a `dict` with the name of the benchmark, its parameters, the number of operations of the workload, the best time (in seconds) of the workload, and the resulting operations per second.
+    '''
+    NAMES: list[str] = ["evolve", "perception", "executors", "messaging", "serialisation"]
+    CLEANING_AGENT_COLOURS: list[VWColour] = [VWColour.green, VWColour.orange, VWColour.white]
+    DIRT_COLOURS: list[VWColour] = [VWColour.green, VWColour.orange]
+
+    def __init__(self, seed: int, repeat: int, quick: bool) -> None:
+        self.__seed: int = seed
+        self.__repeat: int = repeat
+        self.__quick: bool = quick
+        self.__config: dict[str, JSONValue] = VWConfigManager.load_config_from_file(config_file_path=VacuumWorld.CONFIG_FILE_PATH, load_additional_config=False)
+        self.__results: list[dict[str, Any]] = []
+
+        VWRandomEventTrigger.ENABLED = False
+
+    def run(self, names: list[str]) -> list[dict[str, Any]]:
+        '''
+        Runs the benchmarks whose names are in `names` (in the order of `NAMES`), and returns all the results collected so far.
+        '''
+        benchmarks: dict[str, Callable[[], None]] = {
+            "evolve": self.__benchmark_evolve,
+            "perception": self.__benchmark_perception,
+            "executors": self.__benchmark_executors,
+            "messaging": self.__benchmark_messaging,
+            "serialisation": self.__benchmark_serialisation
+        }
+
+        for name in VWBenchmarks.NAMES:
+            if name in names:
+                benchmarks[name]()
+
+        return self.__results
+
+    def generate_scenario(self, grid_dim: int, actor_density: float, dirt_density: float, users: int=0) -> dict[str, JSONValue]:
+        '''
+        Returns the JSON representation of a `VWEnvironment` of `grid_dim` x `grid_dim` locations, listing only the non-default ones.
+
+        A fraction `actor_density` of the locations has a cleaning agent (`VWHystereticMindSurrogate`), and a fraction `dirt_density` has a `VWDirt`. The first `users` actors are `VWUser` objects instead.
+
+        The scenario only depends on the seed of this `VWBenchmarks` and on the arguments.
+        '''
+        rng: Random = Random(f"{self.__seed}-{grid_dim}-{actor_density}-{dirt_density}-{users}")
+        number_of_actors: int = max(1, int(grid_dim * grid_dim * actor_density))
+        number_of_dirts: int = int(grid_dim * grid_dim * dirt_density)
+        mind_file: str = cast(str, getsourcefile(VWHystereticMindSurrogate))
+        locations: dict[int, dict[str, Any]] = {}
+
+        for i, cell in enumerate(rng.sample(range(grid_dim * grid_dim), number_of_actors)):
+            colour: VWColour = VWColour.user if i < users else VWBenchmarks.CLEANING_AGENT_COLOURS[i % len(VWBenchmarks.CLEANING_AGENT_COLOURS)]
+            actor: dict[str, Any] = {"colour": str(colour), "orientation": str(rng.choice(list(VWOrientation)))}
+
+            if colour != VWColour.user:
+                actor |= {"surrogate_mind_file": mind_file, "surrogate_mind_class_name": VWHystereticMindSurrogate.__name__}
+
+            locations.setdefault(cell, {})["actor"] = actor
+
+        for cell in rng.sample(range(grid_dim * grid_dim), number_of_dirts):
+            locations.setdefault(cell, {})["dirt"] = {"colour": str(rng.choice(VWBenchmarks.DIRT_COLOURS))}
+
+        return {"grid_dim": grid_dim, "locations": [VWBenchmarks.__location_to_json(coord=VWCoord(x=cell % grid_dim, y=cell // grid_dim), grid_dim=grid_dim) | content for cell, content in sorted(locations.items())]}
+
+    def get_config(self, grid_dim: int, grid_engine: str) -> dict[str, JSONValue]:
+        '''
+        Returns the configuration for a grid of `grid_dim` x `grid_dim` locations stored by `grid_engine`. Grids larger than `max_environment_dim` are large worlds.
+        '''
+        return self.__config | {"grid_engine": grid_engine, "large_world": grid_dim > cast(int, self.__config["max_environment_dim"])}
+
+    def __load(self, scenario: dict[str, JSONValue], grid_engine: str="dict", total_cycles: int=0) -> VWEnvironment:
+        set_seed(self.__seed)
+
+        return VWEnvironment.from_json(data=scenario, config=self.get_config(grid_dim=cast(int, scenario["grid_dim"]), grid_engine=grid_engine) | {"total_cycles": total_cycles})
+
+    def __benchmark_evolve(self) -> None:
+        grid_dims: list[int] = [8, 32] if self.__quick else [8, 13, 32, 64]
+        actor_densities: list[float] = [0.05] if self.__quick else [0.05, 0.2]
+        cycles: int = 5 if self.__quick else 20
+
+        for grid_dim in grid_dims:
+            for actor_density in actor_densities:
+                for grid_engine in self.__get_grid_engines(grid_dim=grid_dim):
+                    scenario: dict[str, JSONValue] = self.generate_scenario(grid_dim=grid_dim, actor_density=actor_density, dirt_density=0.1)
+
+                    self.__measure(name="evolve", params={"grid_dim": grid_dim, "actor_density": actor_density, "grid_engine": grid_engine}, operations=cycles, setup=lambda: self.__load(scenario=scenario, grid_engine=grid_engine, total_cycles=cycles), workload=VWBenchmarks.__evolve)
+
+    def __benchmark_perception(self) -> None:
+        grid_dims: list[int] = [13] if self.__quick else [13, 64]
+
+        for grid_dim in grid_dims:
+            for grid_engine in self.__get_grid_engines(grid_dim=grid_dim):
+                env: VWEnvironment = self.__load(scenario=self.generate_scenario(grid_dim=grid_dim, actor_density=0.2, dirt_density=0.1), grid_engine=grid_engine)
+
+                self.__measure(name="perception", params={"grid_dim": grid_dim, "grid_engine": grid_engine}, operations=len(env.get_actors()), setup=lambda: env, workload=VWBenchmarks.__perceive)
+
+    def __benchmark_executors(self) -> None:
+        # Each `VWAction` is attempted once by every `VWActor`, whatever its outcome. A quarter of the `VWActor` objects are `VWUser` objects, so that `VWDropAction` can succeed.
+        scenario: dict[str, JSONValue] = self.generate_scenario(grid_dim=13, actor_density=0.2, dirt_density=0.3, users=8)
+        action_factories: dict[str, Callable[[str, list[str]], VWAction]] = {
+            VWIdleAction.__name__: lambda actor_id, recipients: VWIdleAction(),
+            VWTurnAction.__name__: lambda actor_id, recipients: VWTurnAction(direction=VWDirection.left),
+            VWMoveAction.__name__: lambda actor_id, recipients: VWMoveAction(),
+            VWCleanAction.__name__: lambda actor_id, recipients: VWCleanAction(),
+            VWDropAction.__name__: lambda actor_id, recipients: VWDropAction(dirt_colour=VWColour.green),
+            VWSpeakAction.__name__: lambda actor_id, recipients: VWSpeakAction(message="Hello!", recipients=recipients[:1], sender_id=actor_id),
+            VWBroadcastAction.__name__: lambda actor_id, recipients: VWBroadcastAction(message="Hello!", sender_id=actor_id)
+        }
+
+        number_of_actors: int = len(self.__load(scenario=scenario).get_actors())
+
+        for action_name, action_factory in action_factories.items():
+            # A fresh `VWEnvironment` for each repetition, as the `VWAction` objects change it.
+            self.__measure(name="executors", params={"action": action_name}, operations=number_of_actors, setup=lambda: VWBenchmarks.__create_actions(env=self.__load(scenario=scenario), action_factory=action_factory), workload=VWBenchmarks.__execute)
+
+    def __benchmark_messaging(self) -> None:
+        numbers_of_recipients: list[int] = [10, 100] if self.__quick else [10, 100, 1000]
+
+        for number_of_recipients in numbers_of_recipients:
+            grid_dim: int = max(8, int((4 * number_of_recipients) ** 0.5) + 1)
+            env: VWEnvironment = self.__load(scenario=self.generate_scenario(grid_dim=grid_dim, actor_density=(number_of_recipients + 1) / (grid_dim * grid_dim), dirt_density=0.0))
+            actor_ids: list[str] = list(env.get_actors())
+            sender_id: str = actor_ids[0]
+            messages: int = 10
+
+            self.__measure(name="messaging", params={"action": VWSpeakAction.__name__, "recipients": number_of_recipients}, operations=messages, setup=lambda: (env, [VWBenchmarks.__with_actor_id(action=VWSpeakAction(message="Hello!", recipients=actor_ids[1:], sender_id=sender_id), actor_id=sender_id) for _ in range(messages)]), workload=VWBenchmarks.__execute)
+            self.__measure(name="messaging", params={"action": VWBroadcastAction.__name__, "recipients": number_of_recipients}, operations=messages, setup=lambda: (env, [VWBenchmarks.__with_actor_id(action=VWBroadcastAction(message="Hello!", sender_id=sender_id), actor_id=sender_id) for _ in range(messages)]), workload=VWBenchmarks.__execute)
+
+    def __benchmark_serialisation(self) -> None:
+        grid_dims: list[int] = [13] if self.__quick else [13, 64]
+
+        for grid_dim in grid_dims:
+            for grid_engine in self.__get_grid_engines(grid_dim=grid_dim):
+                env: VWEnvironment = self.__load(scenario=self.generate_scenario(grid_dim=grid_dim, actor_density=0.2, dirt_density=0.1), grid_engine=grid_engine)
+                data: dict[str, JSONValue] = env.to_json()
+                config: dict[str, JSONValue] = self.get_config(grid_dim=grid_dim, grid_engine=grid_engine)
+
+                self.__measure(name="to_json", params={"grid_dim": grid_dim, "grid_engine": grid_engine}, operations=1, setup=lambda: env, workload=VWEnvironment.to_json)
+                self.__measure(name="from_json", params={"grid_dim": grid_dim, "grid_engine": grid_engine}, operations=1, setup=lambda: (data, config), workload=lambda args: VWEnvironment.from_json(data=args[0], config=args[1]))
+
+    def __get_grid_engines(self, grid_dim: int) -> list[str]:
+        # Large worlds can only be stored by a `VWArrayAmbient`.
+        return ["array"] if grid_dim > cast(int, self.__config["max_environment_dim"]) else ["dict", "array"]
+
+    def __measure(self, name: str, params: dict[str, Any], operations: int, setup: Callable[[], Any], workload: Callable[[Any], Any]) -> None:
+        best: float = float("inf")
+
+        for _ in range(self.__repeat):
+            set_seed(self.__seed)
+
+            argument: Any = setup()
+            start: float = perf_counter()
+
+            workload(argument)
+
+            best = min(best, perf_counter() - start)
+
+        self.__results.append({"benchmark": name, "params": params, "operations": operations, "seconds": best, "operations_per_second": operations / best if best > 0 else 0.0})
+
+        print(f"{name:<14} {VWBenchmarks.describe_params(params=params):<50} {operations / best if best > 0 else 0.0:>14.1f} ops/s")
+
+    @staticmethod
+    def describe_params(params: dict[str, Any]) -> str:
+        '''
+        Returns a compact, order-independent description of `params`.
+        '''
+        return ",".join(f"{k}={v}" for k, v in sorted(params.items()))
+
+    @staticmethod
+    def __location_to_json(coord: VWCoord, grid_dim: int) -> dict[str, Any]:
+        return {"coords": {"x": coord.get_x(), "y": coord.get_y()}, "wall": {str(orientation): present for orientation, present in VWEnvironment.generate_wall_from_coordinates(coord=coord, grid_size=grid_dim).items()}}
+
+    @staticmethod
+    def __evolve(env: VWEnvironment) -> None:
+        while env.can_evolve():
+            env.evolve()
+
+    @staticmethod
+    def __perceive(env: VWEnvironment) -> None:
+        for actor_id in env.get_actors():
+            env.generate_perception_for_actor(actor_id=actor_id, action_type=VWIdleAction, action_result=ActionResult(outcome=ActionOutcome.success))
+
+    @staticmethod
+    def __create_actions(env: VWEnvironment, action_factory: Callable[[str, list[str]], VWAction]) -> tuple[VWEnvironment, list[Action]]:
+        actor_ids: list[str] = list(env.get_actors())
+
+        return env, [VWBenchmarks.__with_actor_id(action=action_factory(actor_id, [other for other in actor_ids if other != actor_id]), actor_id=actor_id) for actor_id in actor_ids]
+
+    @staticmethod
+    def __with_actor_id(action: VWAction, actor_id: str) -> VWAction:
+        action.set_actor_id(actor_id)
+
+        return action
+
+    @staticmethod
+    def __execute(args: tuple[VWEnvironment, list[Action]]) -> None:
+        env, actions = args
+
+        for action in actions:
+            env.get_executor_for(action=action).or_else_raise().execute(env=env, action=action)
+
+
+def compare(results: list[dict[str, Any]], baseline: list[dict[str, Any]]) -> None:
+    '''
+    Prints the change in operations per second of each result with respect to the matching result (same benchmark and parameters) of `baseline`.
+    '''
+    baseline_by_key: dict[tuple[str, str], float] = {(result["benchmark"], VWBenchmarks.describe_params(params=result["params"])): result["operations_per_second"] for result in baseline}
+
+    print("\nComparison with the baseline:\n")
+
+    for result in results:
+        key: tuple[str, str] = (result["benchmark"], VWBenchmarks.describe_params(params=result["params"]))
+
+        if key in baseline_by_key and baseline_by_key[key] > 0:
+            print(f"{key[0]:<14} {key[1]:<50} {100 * (result['operations_per_second'] / baseline_by_key[key] - 1):>+8.1f}%")
+        else:
+            print(f"{key[0]:<14} {key[1]:<50} {'new':>9}")
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description="Seeded benchmarks of the VacuumWorld simulation engine.")
+
+    parser.add_argument("--seed", type=int, default=0, help="the seed of the scenarios and of the runs.")
+    parser.add_argument("--repeat", type=int, default=3, help="the number of times each workload is timed (the best time is kept).")
+    parser.add_argument("--quick", action="store_true", help="only run the smaller workloads.")
+    parser.add_argument("--only", nargs="+", choices=VWBenchmarks.NAMES, default=VWBenchmarks.NAMES, help="the benchmarks to run.")
+    parser.add_argument("--output", default="benchmarks.json", help="the JSON file to write the results to.")
+    parser.add_argument("--compare", default="", help="a JSON file written by a previous run, to compare the results against.")
+
+    args: Namespace = parser.parse_args()
+
+    if args.repeat <= 0:
+        parser.error("--repeat must be > 0.")
+
+    results: list[dict[str, Any]] = VWBenchmarks(seed=args.seed, repeat=args.repeat, quick=args.quick).run(names=args.only)
+
+    try:
+        vw_version: str = version("vacuumworld")
+    except PackageNotFoundError:
+        vw_version = "unknown"
+
+    with open(args.output, "w") as f:
+        dump({"vacuumworld_version": vw_version, "python_version": python_version(), "platform": platform(), "seed": args.seed, "repeat": args.repeat, "quick": args.quick, "results": results}, f, indent=4)
+
+    print(f"\nResults written to {args.output}.")
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            compare(results=results, baseline=load(f)["results"])
+
+
+if __name__ == "__main__":
+    main()